@@ -0,0 +1,244 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+# @Author: Jialiang Shi
+"""
+Benchmarks of the client against a local fake Gerrit (tests.fakeserver).
+
+The fake server runs in a subprocess, so its CPU time and allocations do not count
+against the client. Every scenario is measured twice: once for throughput and latency,
+once under tracemalloc for the peak memory of the client.
+
+.. code-block:: bash
+
+    python -m benchmarks.bench_client
+    python -m benchmarks.bench_client --changes 5000 --scenario search_pagination --json out.json
+"""
+import argparse
+import contextlib
+import json
+import os
+import subprocess
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+import requests
+
+from gerrit import GerritClient
+from gerrit.utils.common import decode_response, iter_decode_response
+from gerrit.utils.metrics import MetricsRegistry
+
+SCENARIOS: Dict[str, Callable[["Run"], None]] = {}
+
+
+def scenario(func: Callable[["Run"], None]) -> Callable[["Run"], None]:
+    SCENARIOS[func.__name__] = func
+    return func
+
+
+class Run:
+    """
+    The client, parameters and measurements of one scenario run.
+    """
+
+    def __init__(self, client: GerritClient, url: str, args: argparse.Namespace) -> None:
+        self.client = client
+        self.url = url
+        self.args = args
+        self.latencies: List[float] = []
+        self.items = 0
+
+    @contextlib.contextmanager
+    def op(self, items: int = 1) -> Iterator[None]:
+        start = time.perf_counter()
+        yield
+        self.latencies.append(time.perf_counter() - start)
+        self.items += items
+
+
+@scenario
+def search_pagination(run: Run) -> None:
+    """Iterate all open changes, page by page."""
+    for _ in range(run.args.repeat):
+        count = 0
+        with run.op(0):
+            for _ in run.client.changes.iter_search(
+                "is:open", options=["CURRENT_REVISION"], page_size=run.args.page_size
+            ):
+                count += 1
+        run.items += count
+
+
+@scenario
+def hydration(run: Run) -> None:
+    """Build change, revision and project objects from GET requests."""
+    numbers = [
+        change["_number"]
+        for change in run.client.changes.search("status:open", limit=run.args.hydrate)
+    ]
+    for _ in range(run.args.repeat):
+        for number in numbers:
+            with run.op():
+                change = run.client.changes.get(number)
+                change.get_revision().get_commit()
+                run.client.projects.get(change.project)
+
+
+@scenario
+def decode(run: Run) -> None:
+    """Decode a large change query response, at once and streamed."""
+    response = requests.get(
+        f"{run.url}/changes/",
+        params={"q": "status:open", "n": run.args.page_size * 4, "o": ["ALL_REVISIONS", "ALL_FILES"]},
+        timeout=60,
+    )
+    response.raise_for_status()
+    count = len(decode_response(response))
+    for _ in range(run.args.repeat * 5):
+        with run.op(count):
+            decode_response(response)
+        with run.op(count):
+            for _ in iter_decode_response(response):
+                pass
+
+
+@scenario
+def bulk_mutations(run: Run) -> None:
+    """Create, review and submit changes, and add reviewers."""
+    for i in range(run.args.mutations):
+        with run.op():
+            change = run.client.changes.create(
+                {"project": "project-1", "branch": "master", "subject": f"Benchmark change {i}"}
+            )
+        change = run.client.changes.get(change["id"])
+        with run.op():
+            change.set_topic(f"bench-{i % 10}")
+        with run.op():
+            change.reviewers.add({"reviewer": "user1"})
+        with run.op():
+            change.get_revision().set_review({"labels": {"Code-Review": 2}})
+        with run.op():
+            change.submit()
+
+
+def _percentile(latencies: List[float], percentile: float) -> float:
+    if not latencies:
+        return 0.0
+    ordered = sorted(latencies)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * percentile / 100))]
+
+
+@contextlib.contextmanager
+def fake_server(args: argparse.Namespace) -> Iterator[str]:
+    """
+    Start a seeded fake Gerrit in a subprocess and yield its url.
+    """
+    command = [
+        sys.executable, "-m", "tests.fakeserver", "--port", "0",
+        "--changes", str(args.changes), "--projects", str(args.projects),
+        "--latency", str(args.latency), "--seed", str(args.seed),
+    ]
+    # the fake Gerrit lives in the test suite, which is not installed
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    process = subprocess.Popen(  # pylint: disable=consider-using-with
+        command, stdout=subprocess.PIPE, text=True, cwd=root
+    )
+    try:
+        line = process.stdout.readline()
+        if not line.startswith("Serving"):
+            raise RuntimeError(f"The fake Gerrit did not start: {line!r}")
+        yield line.split()[-1]
+    finally:
+        process.terminate()
+        process.wait()
+
+
+def measure(name: str, url: str, args: argparse.Namespace) -> Dict[str, Any]:
+    """
+    Run a scenario for timing, then again under tracemalloc for its peak memory.
+    """
+    metrics = MetricsRegistry()
+    run = Run(GerritClient(base_url=url, metrics=metrics), url, args)
+    start = time.perf_counter()
+    SCENARIOS[name](run)
+    seconds = time.perf_counter() - start
+
+    peak = None
+    if args.memory:
+        memory_run = Run(GerritClient(base_url=url), url, args)
+        tracemalloc.start()
+        try:
+            SCENARIOS[name](memory_run)
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    series = metrics.snapshot().values()
+    return {
+        "scenario": name,
+        "ops": len(run.latencies),
+        "items": run.items,
+        "seconds": seconds,
+        "items_per_second": run.items / seconds if seconds else 0.0,
+        "latency": {
+            "p50": _percentile(run.latencies, 50),
+            "p95": _percentile(run.latencies, 95),
+            "p99": _percentile(run.latencies, 99),
+            "max": max(run.latencies, default=0.0),
+        },
+        "peak_memory": peak,
+        "requests": sum(entry["count"] for entry in series),
+        "response_bytes": sum(entry["response_bytes"] for entry in series),
+    }
+
+
+def format_table(results: List[Dict[str, Any]]) -> str:
+    header = (
+        f"{'scenario':<18} {'ops':>6} {'items':>8} {'seconds':>8} {'items/s':>10} "
+        f"{'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'peak KiB':>9} {'requests':>8}"
+    )
+    lines = [header, "-" * len(header)]
+    for result in results:
+        latency = result["latency"]
+        peak = "-" if result["peak_memory"] is None else f"{result['peak_memory'] / 1024:.0f}"
+        lines.append(
+            f"{result['scenario']:<18} {result['ops']:>6} {result['items']:>8} "
+            f"{result['seconds']:>8.3f} {result['items_per_second']:>10.1f} "
+            f"{latency['p50'] * 1000:>8.2f} {latency['p95'] * 1000:>8.2f} {latency['p99'] * 1000:>8.2f} "
+            f"{peak:>9} {result['requests']:>8}"
+        )
+    return "\n".join(lines)
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--scenario", action="append", choices=sorted(SCENARIOS),
+                        help="run only this scenario, may be repeated")
+    parser.add_argument("--changes", type=int, default=2000, help="changes seeded in the fake Gerrit")
+    parser.add_argument("--projects", type=int, default=10)
+    parser.add_argument("--page-size", type=int, default=100)
+    parser.add_argument("--hydrate", type=int, default=100, help="changes hydrated per repetition")
+    parser.add_argument("--mutations", type=int, default=50, help="changes created and submitted")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds added to every response")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--no-memory", dest="memory", action="store_false",
+                        help="skip the tracemalloc pass")
+    parser.add_argument("--json", help="also write the results to this file")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+    args = parse_args(argv)
+    with fake_server(args) as url:
+        results = [measure(name, url, args) for name in args.scenario or SCENARIOS]
+    print(format_table(results))
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"args": vars(args), "results": results}, f, indent=2)
+    return results
+
+
+if __name__ == "__main__":
+    main()
@@ -10,11 +10,17 @@ from gerrit.accounts.gpg_keys import GerritAccountGPGKeys
 
 
 class GerritAccount(GerritBase):
-    def __init__(self, account: Any, gerrit: GerritClient) -> None:
+    def __init__(
+        self,
+        account: Any,
+        gerrit: GerritClient,
+        data: Any = None,
+        lazy: bool = False,
+    ) -> None:
         self.account = account
         self.gerrit = gerrit
         self.endpoint = f"/accounts/{self.account}"
-        super().__init__()
+        super().__init__(data=data, lazy=lazy)
 
     def __str__(self) -> str:
         return str(self.account)
@@ -261,11 +267,18 @@ class GerritAccount(GerritBase):
     def groups(self) -> List[Any]:
         """
         Lists all groups that contain the specified user as a member.
+        The groups are built from the GroupInfo entries of the response,
+        use :func:`gerrit.utils.gerritbase.poll_all` to re-fetch them.
 
         :return:
         """
+        from gerrit.groups.group import GerritGroup
+
         result = self.gerrit.get(self.endpoint + "/groups")
-        return [self.gerrit.groups.get(item.get("id")) for item in result]
+        return [
+            GerritGroup(group_id=item.get("id"), gerrit=self.gerrit, data=item)
+            for item in result
+        ]
 
     def get_avatar(self) -> Any:
         """
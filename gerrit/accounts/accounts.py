@@ -2,7 +2,7 @@
 # -*- coding:utf-8 -*-
 # @Author: Jialiang Shi
 import logging
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterator, List, Optional
 import requests
 from gerrit import GerritClient
 from gerrit.utils.exceptions import (
@@ -11,6 +11,8 @@ from gerrit.utils.exceptions import (
     ConflictError,
     GerritAPIException,
 )
+from gerrit.utils.pagination import page_sizing, paginate
+from gerrit.utils.tracing import traced
 
 
 logger = logging.getLogger(__name__)
@@ -65,6 +67,39 @@ class GerritAccounts:
 
         return self.gerrit.get(endpoint, params=params)
 
+    def iter_search(
+        self,
+        query: str,
+        page_size: Optional[int] = None,
+        skip: int = 0,
+        detailed: bool = False,
+        all_emails: bool = False,
+    ) -> Iterator[Any]:
+        """
+        Queries accounts visible to the caller and yields them one at a time,
+        following ``_more_accounts`` to fetch further pages on demand.
+
+        :param query: Query string
+        :param page_size: Int value, the number of accounts fetched per request,
+                          tuned to the server by the page sizer of the client if None
+        :param skip: Int value that allows to skip the given
+                     number of accounts from the beginning of the list
+        :param detailed: boolean value, if True then full name,
+                         preferred email, username and avatars for each account
+                         will be added to the output result
+        :param all_emails: boolean value, if True then all registered emails
+                           for each account will be added to the output result
+        :return:
+        """
+        yield from paginate(
+            lambda limit, start: self.search(
+                query, limit=limit, skip=start, detailed=detailed, all_emails=all_emails
+            ),
+            **page_sizing(self.gerrit, page_size, "/accounts/"),
+            skip=skip,
+            more_key="_more_accounts",
+        )
+
     def get(self, account: Any) -> Any:
         """
         Returns an account
@@ -81,13 +116,14 @@ class GerritAccounts:
             account_ = result.get("_account_id")
             if account_ is None:
                 raise ValueError("Account ID not found")
-            return GerritAccount(account=account_, gerrit=self.gerrit)
+            return GerritAccount(account=account_, gerrit=self.gerrit, data=result)
         except requests.exceptions.HTTPError as error:
             if error.response.status_code == 404:
                 message = f"Account {account} does not exist"
                 raise AccountNotFoundError(message)
             raise GerritAPIException from error
 
+    @traced
     def create(self, username: str, input_: Dict[str, Any]) -> Any:
         """
         Creates a new account.
@@ -110,8 +146,10 @@ class GerritAccounts:
           https://gerrit-review.googlesource.com/Documentation/rest-api-accounts.html#account-input
         :return:
         """
+        from gerrit.accounts.account import GerritAccount
+
         try:
-            self.gerrit.put(
+            result = self.gerrit.put(
                 self.endpoint + f"/{username}",
                 json=input_,
                 headers=self.gerrit.default_headers,
@@ -120,4 +158,9 @@ class GerritAccounts:
             message = f"Account {username} already exists"
             logger.error(message)
             raise AccountAlreadyExistsError(message)
+
+        if isinstance(result, dict) and result.get("_account_id") is not None:
+            return GerritAccount(
+                account=result.get("_account_id"), gerrit=self.gerrit, data=result
+            )
         return self.get(username)
@@ -11,18 +11,26 @@ from gerrit.utils.exceptions import (
     AccountEmailAlreadyExistsError,
     GerritAPIException,
 )
+from gerrit.utils.tracing import traced
 
 
 logger = logging.getLogger(__name__)
 
 
 class GerritAccountEmail(GerritBase):
-    def __init__(self, email: str, account: Any, gerrit: GerritClient) -> None:
+    def __init__(
+        self,
+        email: str,
+        account: Any,
+        gerrit: GerritClient,
+        data: Any = None,
+        lazy: bool = False,
+    ) -> None:
         self.email = email
         self.account = account
         self.gerrit = gerrit
         self.endpoint = f"/accounts/{self.account}/emails/{self.email}"
-        super().__init__()
+        super().__init__(data=data, lazy=lazy)
 
     def __str__(self) -> str:
         return self.email
@@ -59,6 +67,7 @@ class GerritAccountEmails:
         result = self.gerrit.get(self.endpoint)
         return result
 
+    @traced
     def create(self, email: str, input_: Optional[Dict[str, Any]] = None) -> Any:
         """
         Registers a new email address for the user.
@@ -105,7 +114,7 @@ class GerritAccountEmails:
 
             email_ = result.get("email")
             return GerritAccountEmail(
-                email=email_, account=self.account, gerrit=self.gerrit
+                email=email_, account=self.account, gerrit=self.gerrit, data=result
             )
         except requests.exceptions.HTTPError as error:
             if error.response.status_code == 404:
@@ -113,6 +122,7 @@ class GerritAccountEmails:
                 raise AccountEmailNotFoundError(message)
             raise GerritAPIException from error
 
+    @traced
     def set_preferred(self, email: str) -> None:
         """
         Sets an email address as preferred email address for an account.
@@ -123,6 +133,7 @@ class GerritAccountEmails:
         self.get(email)
         self.gerrit.put(self.endpoint + f"/{email}/preferred")
 
+    @traced
     def delete(self, email: str) -> None:
         """
         Deletes an email address of an account.
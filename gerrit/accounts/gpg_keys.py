@@ -7,17 +7,25 @@ import requests
 from gerrit import GerritClient
 from gerrit.utils.gerritbase import GerritBase
 from gerrit.utils.exceptions import GPGKeyNotFoundError, GerritAPIException
+from gerrit.utils.tracing import traced
 
 logger = logging.getLogger(__name__)
 
 
 class GerritAccountGPGKey(GerritBase):
-    def __init__(self, id: str, account: Any, gerrit: GerritClient) -> None:
+    def __init__(
+        self,
+        id: str,
+        account: Any,
+        gerrit: GerritClient,
+        data: Any = None,
+        lazy: bool = False,
+    ) -> None:
         self.id = id
         self.account = account
         self.gerrit = gerrit
         self.endpoint = f"/accounts/{self.account}/gpgkeys/{self.id}"
-        super().__init__()
+        super().__init__(data=data, lazy=lazy)
 
     def __str__(self) -> str:
         return self.id
@@ -63,7 +71,9 @@ class GerritAccountGPGKeys:
             result = self.gerrit.get(self.endpoint + f"/{id_}")
 
             id = result.get("id")
-            return GerritAccountGPGKey(id=id, account=self.account, gerrit=self.gerrit)
+            return GerritAccountGPGKey(
+                id=id, account=self.account, gerrit=self.gerrit, data=result
+            )
         except requests.exceptions.HTTPError as error:
             if error.response.status_code == 404:
                 message = f"GPG key {id_} does not exist"
@@ -123,6 +133,7 @@ class GerritAccountGPGKeys:
             self.endpoint, json=input_, headers=self.gerrit.default_headers
         )
 
+    @traced
     def delete(self, id_: str) -> None:
         """
         Deletes a GPG key of a user.
@@ -7,17 +7,25 @@ import requests
 from gerrit import GerritClient
 from gerrit.utils.gerritbase import GerritBase
 from gerrit.utils.exceptions import SSHKeyNotFoundError, GerritAPIException
+from gerrit.utils.tracing import traced
 
 logger = logging.getLogger(__name__)
 
 
 class GerritAccountSSHKey(GerritBase):
-    def __init__(self, seq: int, account: Any, gerrit: GerritClient) -> None:
+    def __init__(
+        self,
+        seq: int,
+        account: Any,
+        gerrit: GerritClient,
+        data: Any = None,
+        lazy: bool = False,
+    ) -> None:
         self.seq = seq
         self.account = account
         self.gerrit = gerrit
         self.endpoint = f"/accounts/{self.account}/sshkeys"
-        super().__init__()
+        super().__init__(data=data, lazy=lazy)
 
     def __str__(self) -> str:
         return str(self.seq)
@@ -58,7 +66,7 @@ class GerritAccountSSHKeys:
 
             seq = result.get("seq")
             return GerritAccountSSHKey(
-                seq=seq, account=self.account, gerrit=self.gerrit
+                seq=seq, account=self.account, gerrit=self.gerrit, data=result
             )
         except requests.exceptions.HTTPError as error:
             if error.response.status_code == 404:
@@ -79,6 +87,7 @@ class GerritAccountSSHKeys:
         )
         return result
 
+    @traced
     def delete(self, seq: int) -> None:
         """
         Deletes an SSH key of a user.
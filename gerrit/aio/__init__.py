@@ -0,0 +1,6 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+# @Author: Jialiang Shi
+from gerrit.aio.base import AsyncGerritClient
+
+__all__ = ["AsyncGerritClient"]
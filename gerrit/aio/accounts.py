@@ -0,0 +1,93 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+# @Author: Jialiang Shi
+import logging
+from typing import Any, Dict, List
+import requests
+from gerrit.utils.exceptions import (
+    AccountNotFoundError,
+    AccountAlreadyExistsError,
+    ConflictError,
+    GerritAPIException,
+)
+
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncGerritAccounts:
+    def __init__(self, gerrit: Any) -> None:
+        self.gerrit = gerrit
+        self.endpoint = "/accounts"
+
+    async def search(
+        self,
+        query: str,
+        limit: int = 25,
+        skip: int = 0,
+        detailed: bool = False,
+        suggested: bool = False,
+        all_emails: bool = False,
+    ) -> List[Any]:
+        """
+        Queries accounts visible to the caller.
+        The parameters are the same as for :meth:`gerrit.accounts.accounts.GerritAccounts.search`.
+
+        :return:
+        """
+        option = list(
+            filter(
+                None,
+                ["DETAILS" if detailed else None, "ALL_EMAILS" if all_emails else None],
+            )
+        )
+        params = {k: v for k, v in (("n", limit), ("S", skip)) if v is not None}
+        if option:
+            params["o"] = option
+
+        endpoint = self.endpoint + "/?"
+        if suggested:
+            endpoint += "suggest&"
+        endpoint += f"q={query}"
+
+        return await self.gerrit.get(endpoint, params=params)
+
+    async def get(self, account: Any) -> Any:
+        """
+        Returns an account
+
+        :param account: username or email or _account_id or 'self'
+        :return: the AccountInfo entity,
+          https://gerrit-review.googlesource.com/Documentation/rest-api-accounts.html#account-info
+        """
+        try:
+            result = await self.gerrit.get(self.endpoint + f"/{account}/")
+            if result.get("_account_id") is None:
+                raise ValueError("Account ID not found")
+            return result
+        except requests.exceptions.HTTPError as error:
+            if error.response.status_code == 404:
+                message = f"Account {account} does not exist"
+                raise AccountNotFoundError(message)
+            raise GerritAPIException from error
+
+    async def create(self, username: str, input_: Dict[str, Any]) -> Any:
+        """
+        Creates a new account.
+
+        :param username: account username
+        :param input_: the AccountInput entity,
+          https://gerrit-review.googlesource.com/Documentation/rest-api-accounts.html#account-input
+        :return:
+        """
+        try:
+            await self.gerrit.put(
+                self.endpoint + f"/{username}",
+                json=input_,
+                headers=self.gerrit.default_headers,
+            )
+        except ConflictError:
+            message = f"Account {username} already exists"
+            logger.error(message)
+            raise AccountAlreadyExistsError(message)
+        return await self.get(username)
@@ -0,0 +1,262 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+# @Author: Jialiang Shi
+import logging
+import netrc
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple, Union
+from gerrit.aio.requester import AsyncRequester
+from gerrit.utils.bulk import BulkExecutor, BulkResult, BulkResults, Operation
+from gerrit.utils.common import decode_response, strip_trailing_slash
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncGerritClient:
+    """
+    asyncio wrapper for the Gerrit V3.x REST API.
+
+    All HTTP helpers and facade methods are coroutines. Requests share one pooled
+    connector, so a single event loop can keep hundreds of requests in flight.
+
+    .. code-block:: python
+
+        async with AsyncGerritClient(base_url="https://yourgerrit", username='******', password='xxxxx') as client:
+            changes = await client.changes.search("is:open")
+
+    """
+
+    default_headers: Dict[str, str] = {"Content-Type": "application/json; charset=UTF-8"}
+
+    def __init__(
+        self,
+        base_url: str,
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+        use_netrc: bool = False,
+        ssl_verify: Union[bool, str] = True,
+        cert: Optional[Union[str, Tuple[str, str]]] = None,
+        cookies: Optional[Dict[str, str]] = None,
+        timeout: int = 60,
+        max_connections: int = 100,
+        session: Optional[Any] = None,
+        auth_suffix: str = "/a",
+    ) -> None:
+        self._base_url = strip_trailing_slash(base_url)
+
+        if use_netrc:
+            password = self.get_password_from_netrc_file()
+
+        auth = (username, password) if username and password else None
+
+        self.requester = AsyncRequester(
+            base_url=base_url,
+            session=session,
+            timeout=timeout,
+            auth=auth,
+            cookies=cookies,
+            ssl_verify=ssl_verify,
+            cert=cert,
+            max_connections=max_connections,
+        )
+
+        has_auth = auth is not None or (
+            session is not None and getattr(session, "auth", None) is not None
+        )
+        if has_auth:
+            self.auth_suffix = auth_suffix
+        else:
+            self.auth_suffix = ""
+
+    async def __aenter__(self) -> "AsyncGerritClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """
+        Close the underlying HTTP connection pool.
+
+        :return:
+        """
+        await self.requester.close()
+
+    def get_password_from_netrc_file(self) -> str:
+        """
+        Providing the password form .netrc file for getting Host name.
+        :return: The related password from .netrc file as a string.
+        """
+
+        netrc_client = netrc.netrc()
+        auth_tokens = netrc_client.authenticators(self._base_url)
+        if not auth_tokens:
+            raise ValueError(
+                f"The '{self._base_url}' host name is not found in netrc file."
+            )
+        return auth_tokens[2]
+
+    def get_endpoint_url(self, endpoint: str) -> str:
+        """
+        Return the complete url including host and port for a given endpoint.
+        :param endpoint: service endpoint as str
+        :return: complete url (including host and port) as str
+        """
+        return f"{self._base_url}{self.auth_suffix}{endpoint}"
+
+    @property
+    def access(self) -> Any:
+        """
+        Access related REST APIs
+
+        :return:
+        """
+        from gerrit.aio.access import AsyncGerritAccess
+        return AsyncGerritAccess(gerrit=self)
+
+    @property
+    def config(self) -> Any:
+        """
+        Config related REST APIs
+
+        :return:
+        """
+        from gerrit.aio.config import AsyncGerritConfig
+        return AsyncGerritConfig(gerrit=self)
+
+    @property
+    def projects(self) -> Any:
+        """
+        Project related REST APIs
+        :return:
+        """
+        from gerrit.aio.projects import AsyncGerritProjects
+        return AsyncGerritProjects(gerrit=self)
+
+    @property
+    def changes(self) -> Any:
+        """
+        Change related REST APIs
+
+        :return:
+        """
+        from gerrit.aio.changes import AsyncGerritChanges
+        return AsyncGerritChanges(gerrit=self)
+
+    @property
+    def accounts(self) -> Any:
+        """
+        Account related REST APIs
+
+        :return:
+        """
+        from gerrit.aio.accounts import AsyncGerritAccounts
+        return AsyncGerritAccounts(gerrit=self)
+
+    @property
+    def groups(self) -> Any:
+        """
+        Group related REST APIs
+
+        :return:
+        """
+        from gerrit.aio.groups import AsyncGerritGroups
+        return AsyncGerritGroups(gerrit=self)
+
+    @property
+    def plugins(self) -> Any:
+        """
+        Plugin related REST APIs
+
+        :return:
+        """
+        from gerrit.aio.plugins import AsyncGerritPlugins
+        return AsyncGerritPlugins(gerrit=self)
+
+    @property
+    def version(self) -> Any:
+        """
+        get the version of the Gerrit server, must be awaited.
+
+        :return:
+        """
+        return self.config.get_version()
+
+    @property
+    def server(self) -> Any:
+        """
+        get the information about the Gerrit server configuration, must be awaited.
+
+        :return:
+        """
+        return self.config.get_server_info()
+
+    async def bulk(
+        self,
+        operations: Iterable[Operation],
+        max_workers: int = 8,
+        progress: Optional[Callable[[BulkResult, int, int], Any]] = None,
+    ) -> BulkResults:
+        """
+        Run many coroutine operations concurrently, at most max_workers at once,
+        and return per-item results instead of stopping at the first failure.
+
+        .. code-block:: python
+
+            results = await client.bulk(
+                [(number, functools.partial(abandon, number)) for number in numbers], max_workers=16
+            )
+
+        :param operations: callables returning awaitables, or (key, callable) pairs
+        :param max_workers: maximum number of operations running at once
+        :param progress: called with each result, the number of finished operations and the total
+        :return: a :class:`gerrit.utils.bulk.BulkResult` per operation, in order
+        """
+        return await BulkExecutor(max_workers=max_workers, progress=progress).run_async(operations)
+
+    async def get(self, endpoint: str, **kwargs: Any) -> Any:
+        """
+        Send HTTP GET to the endpoint.
+
+        :param endpoint: The endpoint to send to.
+        :return:
+        """
+        url = self.get_endpoint_url(endpoint)
+        logger.debug("Sending GET request to %s", url)
+        response = await self.requester.get(url, **kwargs)
+        return decode_response(response)
+
+    async def post(self, endpoint: str, **kwargs: Any) -> Any:
+        """
+        Send HTTP POST to the endpoint.
+
+        :param endpoint: The endpoint to send to.
+        :return:
+        """
+        url = self.get_endpoint_url(endpoint)
+        logger.debug("Sending POST request to %s", url)
+        response = await self.requester.post(url, **kwargs)
+        return decode_response(response)
+
+    async def put(self, endpoint: str, **kwargs: Any) -> Any:
+        """
+        Send HTTP PUT to the endpoint.
+
+        :param endpoint: The endpoint to send to.
+        :return:
+        """
+        url = self.get_endpoint_url(endpoint)
+        logger.debug("Sending PUT request to %s", url)
+        response = await self.requester.put(url, **kwargs)
+        return decode_response(response)
+
+    async def delete(self, endpoint: str) -> Any:
+        """
+        Send HTTP DELETE to the endpoint.
+
+        :param endpoint: The endpoint to send to.
+        :return:
+        """
+        url = self.get_endpoint_url(endpoint)
+        logger.debug("Sending DELETE request to %s", url)
+        response = await self.requester.delete(url)
+        return decode_response(response)
@@ -0,0 +1,93 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+# @Author: Jialiang Shi
+import logging
+from typing import Any, Dict, List, Optional
+import requests
+from gerrit.utils.exceptions import ChangeNotFoundError, GerritAPIException
+
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncGerritChanges:
+    def __init__(self, gerrit: Any) -> None:
+        self.gerrit = gerrit
+        self.endpoint = "/changes"
+
+    async def search(
+        self,
+        query: str,
+        options: Optional[List[str]] = None,
+        limit: int = 25,
+        skip: int = 0,
+    ) -> List[Any]:
+        """
+        Queries changes visible to the caller.
+
+        .. code-block:: python
+
+            query = "is:open+owner:self+is:mergeable"
+            result = await client.changes.search(query=query, options=["LABELS"])
+
+        :param query: Query string, it can contain multiple search operators
+                      concatenated by '+' character
+        :param options: List of options to fetch additional data about changes
+        :param limit: Int value that allows to limit the number of changes
+                      to be included in the output results
+        :param skip: Int value that allows to skip the given number of
+                     changes from the beginning of the list
+        :return:
+        """
+        params = {
+            k: v
+            for k, v in (("o", options), ("n", limit), ("S", skip))
+            if v is not None
+        }
+
+        return await self.gerrit.get(self.endpoint + f"/?q={query}", params=params)
+
+    async def get(self, id_: str) -> Any:
+        """
+        Retrieves a change.
+
+        :param id_: change id
+        :return: the ChangeInfo entity,
+          https://gerrit-review.googlesource.com/Documentation/rest-api-changes.html#change-info
+        """
+        try:
+            return await self.gerrit.get(self.endpoint + f"/{id_}/")
+        except requests.exceptions.HTTPError as error:
+            if error.response.status_code == 404:
+                message = f"Change {id_} does not exist"
+                if isinstance(id_, str) and id_.startswith("I"):
+                    res = await self.search(query=f"change: {id_}")
+                    if len(res) > 0:
+                        change_ids = [item.get("id") for item in res]
+                        message = f"Change {id_} query multiple changes: {', '.join(change_ids)}, which one do you want?"
+
+                logger.error(message)
+                raise ChangeNotFoundError(message)
+            raise GerritAPIException from error
+
+    async def create(self, input_: Dict[str, Any]) -> Any:
+        """
+        create a change
+
+        :param input_: the ChangeInput entity,
+          https://gerrit-review.googlesource.com/Documentation/rest-api-changes.html#change-input
+        :return:
+        """
+        return await self.gerrit.post(
+            self.endpoint + "/", json=input_, headers=self.gerrit.default_headers
+        )
+
+    async def delete(self, id_: str) -> None:
+        """
+        Deletes a change.
+
+        :param id_: change id
+        :return:
+        """
+        await self.get(id_)
+        await self.gerrit.delete(self.endpoint + f"/{id_}")
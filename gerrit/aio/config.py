@@ -0,0 +1,203 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+# @Author: Jialiang Shi
+from typing import Any, Dict, List, Optional
+
+
+class AsyncGerritConfig:
+    def __init__(self, gerrit: Any) -> None:
+        self.gerrit = gerrit
+        self.endpoint = "/config/server"
+
+    async def get_version(self) -> Any:
+        """
+        get the version of the Gerrit server.
+
+        :return:
+        """
+        return await self.gerrit.get(self.endpoint + "/version")
+
+    async def get_server_info(self) -> Any:
+        """
+        get the information about the Gerrit server configuration.
+
+        :return:
+        """
+        return await self.gerrit.get(self.endpoint + "/info")
+
+    async def check_consistency(self, input_: Dict[str, Any]) -> Any:
+        """
+        Runs consistency checks and returns detected problems.
+
+        :param input_: the ConsistencyCheckInput entity,
+          https://gerrit-review.googlesource.com/Documentation/rest-api-config.html#consistency-check-input
+        :return:
+        """
+        return await self.gerrit.post(
+            self.endpoint + "/check.consistency",
+            json=input_,
+            headers=self.gerrit.default_headers,
+        )
+
+    async def reload_config(self) -> Any:
+        """
+        Reloads the gerrit.config configuration.
+
+        :return:
+        """
+        return await self.gerrit.post(self.endpoint + "/reload")
+
+    async def confirm_email(self, input_: Dict[str, Any]) -> None:
+        """
+        Confirms that the user owns an email address.
+
+        :param input_: the EmailConfirmationInput entity,
+          https://gerrit-review.googlesource.com/Documentation/rest-api-config.html#email-confirmation-input
+        :return:
+        """
+        await self.gerrit.put(
+            self.endpoint + "/email.confirm",
+            json=input_,
+            headers=self.gerrit.default_headers,
+        )
+
+    async def list_caches(self) -> List[Any]:
+        """
+        Lists the caches of the server. Caches defined by plugins are included.
+
+        :return:
+        """
+        result = await self.gerrit.get(self.endpoint + "/caches")
+        caches = []
+        for key, value in result.items():
+            cache = value
+            cache.update({"name": key})
+            caches.append(cache)
+
+        return caches
+
+    async def flush_cache(self, name: str) -> None:
+        """
+        Flushes a cache.
+
+        :param name: cache name
+        :return:
+        """
+        await self.gerrit.post(self.endpoint + f"/caches/{name}/flush")
+
+    async def get_summary(self, option: Optional[str] = None) -> Any:
+        """
+        Retrieves a summary of the current server state.
+
+        :param option: query option.such as jvm or gc
+        :return:
+        """
+        endpoint = self.endpoint + "/summary"
+        if option is not None:
+            endpoint += f"?{option}"
+        return await self.gerrit.get(endpoint)
+
+    async def list_capabilities(self) -> Any:
+        """
+        Lists the capabilities that are available in the system.
+
+        :return:
+        """
+        return await self.gerrit.get(self.endpoint + "/capabilities")
+
+    async def list_tasks(self) -> Any:
+        """
+        Lists the tasks from the background work queues that the Gerrit daemon
+        is currently performing, or will perform in the near future.
+
+        :return:
+        """
+        return await self.gerrit.get(self.endpoint + "/tasks")
+
+    async def get_top_menus(self) -> Any:
+        """
+        Returns the list of additional top menu entries.
+
+        :return:
+        """
+        return await self.gerrit.get(self.endpoint + "/top-menus")
+
+    async def get_default_user_preferences(self) -> Any:
+        """
+        Returns the default user preferences for the server.
+
+        :return:
+        """
+        return await self.gerrit.get(self.endpoint + "/preferences")
+
+    async def set_default_user_preferences(self, input_: Dict[str, Any]) -> Any:
+        """
+        Sets the default user preferences for the server.
+
+        :param input_: the PreferencesInput entity,
+          https://gerrit-review.googlesource.com/Documentation/rest-api-accounts.html#preferences-input
+        :return:
+        """
+        return await self.gerrit.put(
+            self.endpoint + "/preferences",
+            json=input_,
+            headers=self.gerrit.default_headers,
+        )
+
+    async def get_default_diff_preferences(self) -> Any:
+        """
+        Returns the default diff preferences for the server.
+
+        :return:
+        """
+        return await self.gerrit.get(self.endpoint + "/preferences.diff")
+
+    async def set_default_diff_preferences(self, input_: Dict[str, Any]) -> Any:
+        """
+        Sets the default diff preferences for the server.
+
+        :param input_: the DiffPreferencesInput entity,
+          https://gerrit-review.googlesource.com/Documentation/rest-api-accounts.html#diff-preferences-input
+        :return:
+        """
+        return await self.gerrit.put(
+            self.endpoint + "/preferences.diff",
+            json=input_,
+            headers=self.gerrit.default_headers,
+        )
+
+    async def get_default_edit_preferences(self) -> Any:
+        """
+        Returns the default edit preferences for the server.
+
+        :return:
+        """
+        return await self.gerrit.get(self.endpoint + "/preferences.edit")
+
+    async def set_default_edit_preferences(self, input_: Dict[str, Any]) -> Any:
+        """
+        Sets the default edit preferences for the server.
+
+        :param input_: the EditPreferencesInfo entity,
+          https://gerrit-review.googlesource.com/Documentation/rest-api-accounts.html#edit-preferences-input
+        :return:
+        """
+        return await self.gerrit.put(
+            self.endpoint + "/preferences.edit",
+            json=input_,
+            headers=self.gerrit.default_headers,
+        )
+
+    async def index_changes(self, input_: Dict[str, Any]) -> None:
+        """
+        Index a set of changes
+
+        :param input_: the IndexChangesInput entity,
+          https://gerrit-review.googlesource.com/Documentation/rest-api-config.html#index-changes-input
+        :return:
+        """
+        await self.gerrit.post(
+            self.endpoint + "/index.changes",
+            json=input_,
+            headers=self.gerrit.default_headers,
+        )
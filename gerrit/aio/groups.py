@@ -0,0 +1,101 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+# @Author: Jialiang Shi
+import logging
+from typing import Any, Dict, List, Optional
+import requests
+from gerrit.utils.common import params_creator
+from gerrit.utils.exceptions import (
+    GroupNotFoundError,
+    GroupAlreadyExistsError,
+    ConflictError,
+    GerritAPIException,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncGerritGroups:
+    def __init__(self, gerrit: Any) -> None:
+        self.gerrit = gerrit
+        self.endpoint = "/groups"
+
+    async def list(
+        self,
+        pattern_dispatcher: Optional[Dict[str, Any]] = None,
+        options: Optional[List[str]] = None,
+        limit: int = 25,
+        skip: int = 0,
+    ) -> Any:
+        """
+        Lists the groups accessible by the caller.
+        The parameters are the same as for :meth:`gerrit.groups.groups.GerritGroups.list`.
+
+        :return:
+        """
+        params = params_creator(
+            (("o", options), ("n", limit), ("S", skip)),
+            {"match": "m", "regex": "r"},
+            pattern_dispatcher,
+        )
+
+        return await self.gerrit.get(self.endpoint + "/", params=params)
+
+    async def search(self, query: str, options: Optional[List[str]] = None, limit: int = 25, skip: int = 0) -> List[Any]:
+        """
+        Query Groups
+
+        :param query:
+        :param options: Additional fields can be obtained by adding o parameters
+        :param limit: Int value that allows to limit the number of groups
+                      to be included in the output results
+        :param skip: Int value that allows to skip the given
+                     number of groups from the beginning of the list
+        :return:
+        """
+        endpoint = self.endpoint + f"/?query={query}"
+
+        params = {
+            k: v
+            for k, v in (("o", options), ("limit", limit), ("start", skip))
+            if v is not None
+        }
+
+        return await self.gerrit.get(endpoint, params=params)
+
+    async def get(self, id_: Any) -> Any:
+        """
+        Retrieves a group.
+
+        :param id_: group id, or group_id, or group name
+        :return: the GroupInfo entity,
+          https://gerrit-review.googlesource.com/Documentation/rest-api-groups.html#group-info
+        """
+        try:
+            return await self.gerrit.get(self.endpoint + f"/{id_}/")
+        except requests.exceptions.HTTPError as error:
+            if error.response.status_code == 404:
+                message = f"Group {id_} does not exist"
+                raise GroupNotFoundError(message)
+            raise GerritAPIException from error
+
+    async def create(self, name: str, input_: Dict[str, Any]) -> Any:
+        """
+        Creates a new Gerrit internal group.
+
+        :param name: group name
+        :param input_: the GroupInput entity,
+          https://gerrit-review.googlesource.com/Documentation/rest-api-groups.html#group-input
+        :return:
+        """
+        try:
+            await self.gerrit.put(
+                self.endpoint + f"/{name}",
+                json=input_,
+                headers=self.gerrit.default_headers,
+            )
+        except ConflictError:
+            message = f"Group {name} already exists"
+            logger.error(message)
+            raise GroupAlreadyExistsError(message)
+        return await self.get(name)
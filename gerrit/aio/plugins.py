@@ -0,0 +1,85 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+# @Author: Jialiang Shi
+from typing import Any, Dict, Optional
+from gerrit.utils.common import params_creator
+
+
+class AsyncGerritPlugins:
+    def __init__(self, gerrit: Any) -> None:
+        self.gerrit = gerrit
+        self.endpoint = "/plugins"
+
+    async def list(
+        self,
+        is_all: bool = False,
+        limit: int = 25,
+        skip: int = 0,
+        pattern_dispatcher: Optional[Dict[str, Any]] = None,
+    ) -> Any:
+        """
+        Lists the plugins installed on the Gerrit server.
+        The parameters are the same as for :meth:`gerrit.plugins.plugins.GerritPlugins.list`.
+
+        :return:
+        """
+        params = params_creator(
+            (("n", limit), ("S", skip)),
+            {"prefix": "p", "match": "m", "regex": "r"},
+            pattern_dispatcher,
+        )
+        params["all"] = int(is_all)
+
+        return await self.gerrit.get(self.endpoint + "/", params=params)
+
+    async def get(self, id_: str) -> Any:
+        """
+        Retrieves the status of a plugin.
+
+        :param id_: plugin id
+        :return: the PluginInfo entity,
+          https://gerrit-review.googlesource.com/Documentation/rest-api-plugins.html#plugin-info
+        """
+        return await self.gerrit.get(self.endpoint + f"/{id_}/gerrit~status")
+
+    async def install(self, id_: str, input_: Dict[str, Any]) -> Any:
+        """
+        Installs a new plugin on the Gerrit server.
+
+        :param id_: plugin id
+        :param input_: the PluginInput entity,
+          https://gerrit-review.googlesource.com/Documentation/rest-api-plugins.html#plugin-input
+        :return:
+        """
+        return await self.gerrit.put(
+            self.endpoint + f"/{id_}.jar",
+            json=input_,
+            headers=self.gerrit.default_headers,
+        )
+
+    async def enable(self, id_: str) -> Any:
+        """
+        Enables a plugin on the Gerrit server.
+
+        :param id_: plugin id
+        :return:
+        """
+        return await self.gerrit.post(self.endpoint + f"/{id_}/gerrit~enable")
+
+    async def disable(self, id_: str) -> Any:
+        """
+        Disables a plugin on the Gerrit server.
+
+        :param id_: plugin id
+        :return:
+        """
+        return await self.gerrit.post(self.endpoint + f"/{id_}/gerrit~disable")
+
+    async def reload(self, id_: str) -> Any:
+        """
+        Reloads a plugin on the Gerrit server.
+
+        :param id_: plugin id
+        :return:
+        """
+        return await self.gerrit.post(self.endpoint + f"/{id_}/gerrit~reload")
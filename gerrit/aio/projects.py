@@ -0,0 +1,125 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+# @Author: Jialiang Shi
+import logging
+from typing import Any, Dict, List, Optional, Union
+from urllib.parse import quote_plus
+import requests
+from gerrit.utils.common import params_creator
+from gerrit.utils.exceptions import (
+    ProjectNotFoundError,
+    ProjectAlreadyExistsError,
+    ConflictError,
+    GerritAPIException,
+)
+
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncGerritProjects:
+    def __init__(self, gerrit: Any) -> None:
+        self.gerrit = gerrit
+        self.endpoint = "/projects"
+
+    async def list(
+        self,
+        is_all: bool = False,
+        limit: int = 25,
+        skip: int = 0,
+        pattern_dispatcher: Union[Dict, None] = None,
+        project_type: Optional[str] = None,
+        description: bool = False,
+        branch: Optional[str] = None,
+        state: Optional[str] = None,
+    ) -> Any:
+        """
+        Get list of all available projects accessible by the caller.
+        The parameters are the same as for :meth:`gerrit.projects.projects.GerritProjects.list`.
+
+        :return:
+        """
+        if is_all and state:
+            raise ValueError("is_all can not be used together with the state option.")
+
+        pattern_types = {"prefix": "p", "match": "m", "regex": "r"}
+        tuples = (
+            ("n", limit),
+            ("S", skip),
+            ("type", project_type),
+            ("b", branch),
+            ("state", state),
+        )
+        params = params_creator(tuples, pattern_types, pattern_dispatcher)
+        if is_all:
+            del params["n"]
+            del params["S"]
+            params["all"] = int(is_all)
+        params["d"] = int(description)
+
+        return await self.gerrit.get(self.endpoint + "/", params=params)
+
+    async def search(self, query: str, limit: int = 25, skip: int = 0) -> List:
+        """
+        Queries projects visible to the caller.
+
+        :param query:
+        :param limit: Int value that allows to limit the number of projects
+                      to be included in the output results
+        :param skip: Int value that allows to skip the given
+                     number of projects from the beginning of the list
+        :return:
+        """
+        params = {k: v for k, v in (("limit", limit), ("start", skip)) if v is not None}
+
+        return await self.gerrit.get(self.endpoint + f"/?query={query}", params=params)
+
+    async def get(self, name: str) -> Any:
+        """
+        Retrieves a project.
+
+        :param name: the name of the project
+        :return: the ProjectInfo entity,
+          https://gerrit-review.googlesource.com/Documentation/rest-api-projects.html#project-info
+        """
+        try:
+            return await self.gerrit.get(self.endpoint + f"/{quote_plus(name)}")
+        except requests.exceptions.HTTPError as error:
+            if error.response.status_code == 404:
+                message = f"Project {name} does not exist"
+                raise ProjectNotFoundError(message)
+            raise GerritAPIException from error
+
+    async def create(self, project_name: str, input_: Dict[str, Any]) -> Any:
+        """
+        Creates a new project.
+
+        :param project_name: the name of the project
+        :param input_: the ProjectInput entity,
+          https://gerrit-review.googlesource.com/Documentation/rest-api-projects.html#project-input
+
+        :return:
+        """
+        try:
+            await self.gerrit.put(
+                self.endpoint + f"/{quote_plus(project_name)}",
+                json=input_,
+                headers=self.gerrit.default_headers,
+            )
+        except ConflictError:
+            message = f"Project {project_name} already exists"
+            logger.error(message)
+            raise ProjectAlreadyExistsError(message)
+        return await self.get(project_name)
+
+    async def delete(self, project_name: str) -> None:
+        """
+        Delete the project, requires delete-project plugin
+
+        :param project_name: project name
+        :return:
+        """
+        await self.get(project_name)
+        await self.gerrit.post(
+            self.endpoint + f"/{quote_plus(project_name)}/delete-project~delete"
+        )
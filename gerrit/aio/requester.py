@@ -0,0 +1,208 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+# @Author: Jialiang Shi
+import ssl
+import urllib.parse as urlparse
+from typing import Any, Dict, List, Optional, Tuple, Union
+import requests
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+from gerrit.utils.requester import Requester
+
+try:
+    import aiohttp
+    from yarl import URL
+except ImportError:  # pragma: no cover
+    aiohttp = None
+    URL = None
+
+
+class AsyncRequester:
+    """
+    A class which carries out HTTP requests on an asyncio event loop.
+    Connections are pooled by a single ``aiohttp.ClientSession``, so one event loop
+    can keep many requests in flight at the same time.
+
+    Responses are read completely and handed back as ``requests.Response`` objects,
+    so that ``decode_response`` and ``Requester.confirm_status`` work unchanged.
+    """
+
+    def __init__(self, **kwargs: Any) -> None:
+        """
+        :param kwargs:
+        """
+        if aiohttp is None:
+            raise ImportError(
+                "aiohttp is required for asyncio support, "
+                "install it with: pip install python-gerrit-api[async]"
+            )
+
+        timeout = 10
+        base_url: Optional[str] = kwargs.get("base_url")
+        self.base_scheme: Optional[str] = urlparse.urlsplit(base_url).scheme if base_url else None
+        self.session: Optional[Any] = kwargs.get("session")
+        self.timeout: int = kwargs.get("timeout", timeout)
+        self.auth: Optional[Tuple[str, str]] = kwargs.get("auth")
+        self.cookies: Optional[Dict[str, str]] = kwargs.get("cookies")
+        self.ssl_verify: Union[bool, str] = kwargs.get("ssl_verify", True)
+        self.cert: Optional[Union[str, Tuple[str, str]]] = kwargs.get("cert")
+        self.max_connections: int = kwargs.get("max_connections", 100)
+        self._owns_session = self.session is None
+
+    def _ssl_context(self) -> Any:
+        """
+        Build the ssl argument for the connector from ssl_verify and cert.
+        """
+        if self.ssl_verify is False:
+            return False
+
+        if self.ssl_verify is True and self.cert is None:
+            return None
+
+        cafile = self.ssl_verify if isinstance(self.ssl_verify, str) else None
+        context = ssl.create_default_context(cafile=cafile)
+        if isinstance(self.cert, str):
+            context.load_cert_chain(self.cert)
+        elif self.cert is not None:
+            context.load_cert_chain(*self.cert)
+        return context
+
+    def _basic_auth(self) -> str:
+        """
+        Encode the Authorization header value of the credentials.
+        """
+        encode = getattr(aiohttp, "encode_basic_auth", None)
+        if encode is not None:
+            return encode(*self.auth)
+        # older aiohttp
+        return aiohttp.BasicAuth(*self.auth).encode()
+
+    def get_session(self) -> Any:
+        """
+        Return the pooled client session, creating it on first use.
+        The session must be created inside a running event loop.
+        """
+        if self.session is None or self.session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.max_connections, ssl=self._ssl_context()
+            )
+            headers = {"Authorization": self._basic_auth()} if self.auth else None
+            self.session = aiohttp.ClientSession(
+                connector=connector, headers=headers, cookies=self.cookies
+            )
+            self._owns_session = True
+        return self.session
+
+    async def close(self) -> None:
+        """
+        Close the session if it was created by this requester.
+        """
+        if self._owns_session and self.session is not None and not self.session.closed:
+            await self.session.close()
+
+    def _update_url_scheme(self, url: str) -> str:
+        """
+        Updates scheme of given url to the one used in Gerrit base_url.
+        """
+        if self.base_scheme and not url.startswith(f"{self.base_scheme}://"):
+            url_split = urlparse.urlsplit(url)
+            url = urlparse.urlunsplit(
+                [
+                    self.base_scheme,
+                    url_split.netloc,
+                    url_split.path,
+                    url_split.query,
+                    url_split.fragment,
+                ]
+            )
+        return url
+
+    @staticmethod
+    def _prepare_url(
+        url: str,
+        params: Optional[Union[Dict[str, Any], List[Tuple[str, Any]]]] = None,
+    ) -> str:
+        """
+        Merge params into the url exactly like requests does, so list values
+        (e.g. repeated ``o`` options) and queries embedded in the endpoint behave
+        the same as with the synchronous client.
+        """
+        if params and not isinstance(params, (dict, list)):
+            raise ValueError(f"Params must be a dict, got {repr(params)}")
+
+        prepared = requests.models.PreparedRequest()
+        prepared.prepare_url(url, params)
+        return prepared.url
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Union[Dict[str, Any], List[Tuple[str, Any]]]] = None,
+        data: Optional[Any] = None,
+        json: Optional[Any] = None,
+        headers: Optional[Dict[str, str]] = None,
+        allow_redirects: bool = True,
+        raise_for_status: bool = True,
+    ) -> requests.Response:
+        """
+        :param method:
+        :param url:
+        :param params:
+        :param data:
+        :param json:
+        :param headers:
+        :param allow_redirects:
+        :param raise_for_status:
+        :return:
+        """
+        if headers is not None and not isinstance(headers, dict):
+            raise ValueError(f"headers must be a dict, got {repr(headers)}")
+
+        if data and json:
+            raise ValueError("Cannot use data and json together")
+
+        headers = dict(headers or {})
+        if Requester.AUTH_COOKIE:
+            headers.update({"Cookie": Requester.AUTH_COOKIE})
+
+        full_url = self._prepare_url(self._update_url_scheme(url), params)
+        request_kwargs: Dict[str, Any] = {
+            "headers": headers,
+            "allow_redirects": allow_redirects,
+            "timeout": aiohttp.ClientTimeout(total=self.timeout),
+        }
+        if data:
+            request_kwargs["data"] = data
+        if json:
+            request_kwargs["json"] = json
+
+        session = self.get_session()
+        async with session.request(
+            method, URL(full_url, encoded=True), **request_kwargs
+        ) as resp:
+            body = await resp.read()
+
+        response = requests.Response()
+        response.status_code = resp.status
+        response.reason = resp.reason
+        response.url = str(resp.url)
+        response.headers = CaseInsensitiveDict(resp.headers)
+        response.encoding = get_encoding_from_headers(response.headers)
+        response._content = body  # pylint: disable=protected-access
+
+        if raise_for_status:
+            Requester.confirm_status(response)
+        return response
+
+    async def get(self, url: str, **kwargs: Any) -> requests.Response:
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url: str, **kwargs: Any) -> requests.Response:
+        return await self.request("POST", url, **kwargs)
+
+    async def put(self, url: str, **kwargs: Any) -> requests.Response:
+        return await self.request("PUT", url, **kwargs)
+
+    async def delete(self, url: str, **kwargs: Any) -> requests.Response:
+        return await self.request("DELETE", url, **kwargs)
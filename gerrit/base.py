@@ -3,12 +3,25 @@
 # @Author: Jialiang Shi
 import logging
 import netrc
-from typing import Any, Dict, Optional, Tuple, Union
+import threading
+from typing import Any, Callable, Dict, Hashable, Iterable, Iterator, List, Optional, Tuple, Union
 import requests
 from requests.adapters import HTTPAdapter
 from requests import Session
 from gerrit.utils.requester import Requester
-from gerrit.utils.common import decode_response, strip_trailing_slash
+from gerrit.utils.blobcache import auth_identity, is_immutable
+from gerrit.utils.bulk import BulkExecutor, BulkResult, BulkResults, Operation
+from gerrit.utils.cache import ResponseCache
+from gerrit.utils.common import (
+    decode_response,
+    iter_decode_response,
+    strip_trailing_slash,
+)
+from gerrit.utils.pagination import AdaptivePageSizer
+from gerrit.utils.routing import ReplicaRouter
+from gerrit.utils.singleflight import SingleFlight
+from gerrit.utils.streaming import iter_response_content
+from gerrit.utils.tracing import Tracer
 
 logger = logging.getLogger(__name__)
 
@@ -21,7 +34,10 @@ class GerritClient:
 
     default_headers: Dict[str, str] = {"Content-Type": "application/json; charset=UTF-8"}
 
-    def __init__(
+    # every keyword is an optional, independent component of the client (cache, retry,
+    # rate limiter, governor, router, hedging, page sizer, ...); they are kept flat so
+    # existing callers keep working, hence the many locals
+    def __init__(  # pylint: disable=too-many-locals
         self,
         base_url: str,
         username: Optional[str] = None,
@@ -35,6 +51,21 @@ class GerritClient:
         max_retries: Optional[int] = None,
         session: Optional[Session] = None,
         auth_suffix: str = "/a",
+        cache: Optional[Any] = None,
+        etag_cache: Optional[Any] = None,
+        blob_cache: Optional[Any] = None,
+        coalesce_requests: bool = False,
+        retry: Optional[Any] = None,
+        rate_limiter: Optional[Any] = None,
+        governor: Optional[Any] = None,
+        circuit_breaker: Optional[Any] = None,
+        hedging: Optional[Any] = None,
+        replicas: Optional[List[str]] = None,
+        pin_after_write: float = 0.0,
+        metrics: Optional[Any] = None,
+        tracer: Optional[Any] = None,
+        requester_class: Callable[..., Any] = Requester,
+        page_sizer: Optional[Any] = None,
     ) -> None:
         self._base_url = strip_trailing_slash(base_url)
 
@@ -67,16 +98,43 @@ class GerritClient:
 
         self.session = session
 
-        self.requester = Requester(
+        self.router = None
+        if replicas:
+            self.router = ReplicaRouter(
+                self._base_url,
+                replicas,
+                pin_after_write=pin_after_write,
+                session=self.session,
+                timeout=timeout,
+            )
+
+        self.requester = requester_class(
             base_url=base_url,
             session=self.session,
             timeout=timeout,
+            retry=retry,
+            rate_limiter=rate_limiter,
+            governor=governor,
+            circuit_breaker=circuit_breaker,
+            hedging=hedging,
+            router=self.router,
+            metrics=metrics,
+            tracer=tracer,
         )
         if self.session.auth is not None:
             self.auth_suffix = auth_suffix
         else:
             self.auth_suffix = ""
 
+        self.metrics = metrics
+        self.tracer = tracer
+        self.cache = cache
+        self.etag_cache = etag_cache
+        self.blob_cache = blob_cache
+        self.single_flight = SingleFlight() if coalesce_requests else None
+        self.page_sizer = page_sizer if page_sizer is not None else AdaptivePageSizer()
+        self._local = threading.local()
+
     def get_password_from_netrc_file(self) -> str:
         """
         Providing the password form .netrc file for getting Host name.
@@ -186,6 +244,113 @@ class GerritClient:
         """
         return self.config.get_server_info()
 
+    def add_hook(
+        self,
+        before: Optional[Callable[[Any], Any]] = None,
+        after: Optional[Callable[[Any], Any]] = None,
+        error: Optional[Callable[[Any, BaseException], Any]] = None,
+    ) -> None:
+        """
+        Register request lifecycle callbacks, creating a tracer if the client has none.
+        They are called with the :class:`gerrit.utils.tracing.Span` of every facade
+        operation and HTTP request.
+
+        .. code-block:: python
+
+            client.add_hook(
+                after=lambda span: print(span.name, span.duration, span.requests),
+                error=lambda span, exc: print(span.name, "failed:", exc),
+            )
+
+        :param before: called with the span when it starts
+        :param after: called with the span when it finishes successfully
+        :param error: called with the span and the exception when it fails
+        :return:
+        """
+        if self.tracer is None:
+            self.tracer = Tracer()
+            self.requester.tracer = self.tracer
+        self.tracer.add_hook(before=before, after=after, error=error)
+
+    def bulk(
+        self,
+        operations: Iterable[Operation],
+        max_workers: int = 8,
+        progress: Optional[Callable[[BulkResult, int, int], Any]] = None,
+    ) -> BulkResults:
+        """
+        Run many operations on a bounded thread pool, within the rate limiter of the client,
+        and return per-item results instead of stopping at the first failure.
+
+        .. code-block:: python
+
+            results = client.bulk(
+                [(change.number, change.submit) for change in changes],
+                max_workers=8,
+                progress=lambda result, done, total: print(f"{done}/{total}", result.key, result.ok),
+            )
+            print(len(results.succeeded), results.errors())
+
+        :param operations: callables, or (key, callable) pairs
+        :param max_workers: maximum number of operations running at once
+        :param progress: called with each result, the number of finished operations and the total
+        :return: a :class:`gerrit.utils.bulk.BulkResult` per operation, in order
+        """
+        return BulkExecutor(max_workers=max_workers, progress=progress).run(operations)
+
+    def last_response_bytes(self) -> Optional[int]:
+        """
+        The body size of the last GET response received by the calling thread, once:
+        the value is reset by the call. None if no request was sent since, e.g. because
+        the response was served from a cache.
+
+        :return:
+        """
+        nbytes = getattr(self._local, "response_bytes", None)
+        self._local.response_bytes = None
+        return nbytes
+
+    def _cache_hit(self, endpoint: str, cache: str) -> None:
+        if self.metrics is not None:
+            self.metrics.cache_hit(endpoint, cache)
+        span = self.tracer.current() if self.tracer is not None else None
+        if span is not None:
+            span.set_attribute("cache_hits", span.attributes.get("cache_hits", 0) + 1)
+
+    def _invalidate_cache(self, endpoint: str) -> None:
+        # a failed or timed out mutation may still have been applied
+        if self.cache is not None:
+            self.cache.invalidate(endpoint)
+        # GETs sent from now on must not join a read started before the mutation
+        if self.single_flight is not None:
+            self.single_flight.forget()
+
+    def _conditional_get(self, url: str, endpoint: str, **kwargs: Any) -> Any:
+        etag_key = self.etag_cache.make_key(
+            endpoint, kwargs.get("params"), kwargs.get("headers")
+        )
+        etag = self.etag_cache.lookup(etag_key)
+        if etag is not None:
+            kwargs["headers"] = dict(kwargs.get("headers") or {}, **{"If-None-Match": etag})
+
+        logger.debug("Sending GET request to %s", url)
+        response = self.requester.get(url, **kwargs)
+        self._local.response_bytes = len(response.content)
+        if etag is not None and response.status_code == 304:
+            found, result = self.etag_cache.not_modified_value(etag_key)
+            if found:
+                logger.debug("%s not modified, serving stored response", url)
+                self._cache_hit(endpoint, "etag")
+                return result
+            # the stored response was evicted meanwhile, fetch it unconditionally
+            kwargs["headers"].pop("If-None-Match")
+            response = self.requester.get(url, **kwargs)
+            self._local.response_bytes = len(response.content)
+
+        result = decode_response(response)
+        self.etag_cache.store(etag_key, response.headers.get("ETag"), result)
+        return result
+
     def get(self, endpoint: str, **kwargs: Any) -> Any:
         """
         Send HTTP GET to the endpoint.
@@ -193,12 +358,104 @@ class GerritClient:
         :param endpoint: The endpoint to send to.
         :return:
         """
+        cacheable = set(kwargs) <= {"params", "headers"}
+        params, headers = kwargs.get("params"), kwargs.get("headers")
+
+        cache_key = None
+        if self.cache is not None and cacheable:
+            cache_key = self.cache.make_key(endpoint, params, headers)
+            hit, result = self.cache.lookup(cache_key)
+            if hit:
+                logger.debug("Serving GET %s from cache", endpoint)
+                self._cache_hit(endpoint, "response")
+                return result
+
+        blob_key = None
+        if self.blob_cache is not None and cacheable and is_immutable(endpoint, params):
+            blob_key = self.blob_cache.make_key(
+                self._base_url + endpoint, params, headers, identity=auth_identity(self.session)
+            )
+            hit, result = self.blob_cache.lookup(blob_key)
+            if hit:
+                logger.debug("Serving GET %s from blob cache", endpoint)
+                self._cache_hit(endpoint, "blob")
+                if cache_key is not None:
+                    self.cache.store(cache_key, endpoint, result)
+                return result
+
+        if self.single_flight is not None and cacheable:
+            return self.single_flight.do(
+                ResponseCache.make_key(endpoint, params, headers),
+                lambda: self._fetch(endpoint, cache_key, blob_key, **kwargs),
+            )
+        return self._fetch(endpoint, cache_key, blob_key, **kwargs)
+
+    def _fetch(
+        self,
+        endpoint: str,
+        cache_key: Optional[Hashable],
+        blob_key: Optional[str],
+        **kwargs: Any,
+    ) -> Any:
         url = self.get_endpoint_url(endpoint)
-        logger.debug("Sending GET request to %s", url)
-        response = self.requester.get(url, **kwargs)
-        result = decode_response(response)
+        if self.etag_cache is not None and set(kwargs) <= {"params", "headers"}:
+            result = self._conditional_get(url, endpoint, **kwargs)
+        else:
+            logger.debug("Sending GET request to %s", url)
+            response = self.requester.get(url, **kwargs)
+            self._local.response_bytes = len(response.content)
+            result = decode_response(response)
+
+        if cache_key is not None:
+            self.cache.store(cache_key, endpoint, result)
+        if blob_key is not None:
+            self.blob_cache.store(blob_key, result)
         return result
 
+    def iter_json(self, endpoint: str, **kwargs: Any) -> Iterator[Any]:
+        """
+        Send HTTP GET to the endpoint and yield the elements of the JSON array
+        it returns while the body is still being downloaded.
+        Memory use stays bounded by the size of one element, not of the response.
+
+        .. code-block:: python
+
+            params = {"q": "project:foo", "o": "ALL_REVISIONS"}
+            for change in client.iter_json("/changes/", params=params):
+                print(change["_number"])
+
+        :param endpoint: The endpoint to send to.
+        :return:
+        """
+        url = self.get_endpoint_url(endpoint)
+        logger.debug("Sending streamed GET request to %s", url)
+        response = self.requester.get(url, stream=True, **kwargs)
+        try:
+            yield from iter_decode_response(response)
+        finally:
+            response.close()
+
+    def iter_content(self, endpoint: str, chunk_size: int = 64 * 1024, **kwargs: Any) -> Iterator[bytes]:
+        """
+        Send HTTP GET to the endpoint and return an iterator over the raw body,
+        which is downloaded chunk by chunk while it is iterated.
+        The request is sent right away, so HTTP errors are raised by this call.
+
+        .. code-block:: python
+
+            with open("patch.zip", "wb") as f:
+                for chunk in client.iter_content("/changes/123/revisions/current/patch?zip"):
+                    f.write(chunk)
+
+        :param endpoint: The endpoint to send to.
+        :param chunk_size: number of bytes read at a time
+        :return:
+        """
+        url = self.get_endpoint_url(endpoint)
+        logger.debug("Sending streamed GET request to %s", url)
+        response = self.requester.get(url, stream=True, **kwargs)
+        return iter_response_content(response, chunk_size)
+
     def post(self, endpoint: str, **kwargs: Any) -> Any:
         """
         Send HTTP POST to the endpoint.
@@ -208,7 +465,10 @@ class GerritClient:
         """
         url = self.get_endpoint_url(endpoint)
         logger.debug("Sending POST request to %s", url)
-        response = self.requester.post(url, **kwargs)
+        try:
+            response = self.requester.post(url, **kwargs)
+        finally:
+            self._invalidate_cache(endpoint)
         result = decode_response(response)
         return result
 
@@ -221,7 +481,10 @@ class GerritClient:
         """
         url = self.get_endpoint_url(endpoint)
         logger.debug("Sending PUT request to %s", url)
-        response = self.requester.put(url, **kwargs)
+        try:
+            response = self.requester.put(url, **kwargs)
+        finally:
+            self._invalidate_cache(endpoint)
         result = decode_response(response)
         return result
 
@@ -234,5 +497,8 @@ class GerritClient:
         """
         url = self.get_endpoint_url(endpoint)
         logger.debug("Sending DELETE request to %s", url)
-        response = self.requester.delete(url)
+        try:
+            response = self.requester.delete(url)
+        finally:
+            self._invalidate_cache(endpoint)
         return decode_response(response)
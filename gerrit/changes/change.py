@@ -2,21 +2,31 @@
 # -*- coding:utf-8 -*-
 # @Author: Jialiang Shi
 from typing import Any, Dict, List, Optional, Union
+from urllib.parse import quote_plus
 from gerrit import GerritClient
 from gerrit.utils.gerritbase import GerritBase
 from gerrit.changes.reviewers import GerritChangeReviewers
 from gerrit.changes.revision import GerritChangeRevision
 from gerrit.changes.edit import GerritChangeEdit
 from gerrit.changes.messages import GerritChangeMessages
+from gerrit.projects.project import GerritProject
+from gerrit.projects.branches import GerritProjectBranch
 from gerrit.utils.exceptions import ChangeEditNotFoundError
+from gerrit.utils.tracing import traced
 
 
 class GerritChange(GerritBase):
-    def __init__(self, id: str, gerrit: GerritClient) -> None:
+    def __init__(
+        self,
+        id: str,
+        gerrit: GerritClient,
+        data: Any = None,
+        lazy: bool = False,
+    ) -> None:
         self.id = id
         self.gerrit = gerrit
         self.endpoint = f"/changes/{self.id}"
-        super().__init__()
+        super().__init__(data=data, lazy=lazy)
 
         self.revisions: Dict[str, str] = {}
         self.current_revision_number = 0
@@ -725,7 +735,7 @@ class GerritChange(GerritBase):
         if not result:
             raise ChangeEditNotFoundError("Change edit does not exist")
 
-        return GerritChangeEdit(change=self.id, gerrit=self.gerrit)
+        return GerritChangeEdit(change=self.id, gerrit=self.gerrit, data=result)
 
     def create_empty_edit(self) -> Any:
         """
@@ -765,6 +775,7 @@ class GerritChange(GerritBase):
             return self.revisions[number]
         return None
 
+    @traced
     def get_revision(self, revision_id: Union[str, int] = "current") -> Any:
         """
         Get one revision by revision SHA or integer number.
@@ -775,7 +786,7 @@ class GerritChange(GerritBase):
                             Zero means current revision.
                             -N means the current revision number X minus N, so if the current
                             revision is 50, and -1 is given, the revision 49 will be retrieved.
-        :return:
+        :return: the revision, its commit is only fetched once one of its attributes is read
         """
         if isinstance(revision_id, int):
             if len(self.revisions.keys()) == 0:
@@ -787,7 +798,27 @@ class GerritChange(GerritBase):
                 return None
 
         return GerritChangeRevision(
-            gerrit=self.gerrit, change=self.id, revision=revision_id
+            gerrit=self.gerrit, change=self.id, revision=revision_id, lazy=True
+        )
+
+    def get_project(self) -> GerritProject:
+        """
+        Get the project of the change.
+        The project is only fetched once one of its attributes is read.
+
+        :return:
+        """
+        return GerritProject(project_id=quote_plus(self.project), gerrit=self.gerrit, lazy=True)
+
+    def get_branch(self) -> GerritProjectBranch:
+        """
+        Get the destination branch of the change.
+        The branch is only fetched once one of its attributes is read.
+
+        :return:
+        """
+        return GerritProjectBranch(
+            name=self.branch, project=quote_plus(self.project), gerrit=self.gerrit, lazy=True
         )
 
     def get_attention_set(self) -> Any:
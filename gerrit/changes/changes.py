@@ -1,18 +1,27 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 # @Author: Jialiang Shi
+import datetime
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Sequence
 import requests
+from requests.utils import requote_uri
 from gerrit import GerritClient
 from gerrit.changes.change import GerritChange
 from gerrit.utils.exceptions import ChangeNotFoundError, GerritAPIException
+from gerrit.utils.pagination import page_sizing, paginate, paginate_keyset
+from gerrit.utils.sharding import Shard, iter_shards, time_shards
+from gerrit.utils.tracing import traced
 
 
 logger = logging.getLogger(__name__)
 
 
 class GerritChanges:
+    # conservative bound on the request line, proxies in front of Gerrit often reject
+    # anything over 8 KiB and some over 4 KiB
+    MAX_URL_LENGTH: int = 4000
+
     def __init__(self, gerrit: GerritClient) -> None:
         self.gerrit = gerrit
         self.endpoint = "/changes"
@@ -49,6 +58,208 @@ class GerritChanges:
 
         return self.gerrit.get(self.endpoint + f"/?q={query}", params=params)
 
+    def _query_batches(self, queries: Sequence[str], params: Dict[str, Any], max_url_length: int) -> List[List[str]]:
+        base = len(requote_uri(self.gerrit.get_endpoint_url(self.endpoint + "/?")))
+        base += len(requests.Request("GET", "http://h/", params=params).prepare().url) - len("http://h/")
+        batches: List[List[str]] = []
+        length = base
+        for query in queries:
+            size = len(requote_uri(f"&q={query}"))
+            if not batches or length + size > max_url_length:
+                batches.append([])
+                length = base
+            batches[-1].append(query)
+            length += size
+        return batches
+
+    @traced
+    def search_many(
+        self,
+        queries: Sequence[str],
+        options: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        max_url_length: Optional[int] = None,
+    ) -> List[List[Any]]:
+        """
+        Runs several change queries, packed into as few requests as the URL length allows,
+        and returns the results of each query in order. Gerrit answers a request with
+        several ``q`` parameters with one result list per query.
+
+        .. code-block:: python
+
+            open_, merged, mine = client.changes.search_many(
+                ["is:open", "status:merged -age:1d", "owner:self is:open"], options=["LABELS"], limit=10
+            )
+
+        :param queries: Query strings, in the syntax of :meth:`search`
+        :param options: List of options to fetch additional data about changes, for all queries
+        :param limit: Int value that allows to limit the number of changes of each query,
+                      defaults to the server limit
+        :param max_url_length: maximum length of a request url, defaults to MAX_URL_LENGTH
+        :return: a list of changes per query, the last change of a list carries
+                 ``_more_changes`` if the query has more results
+        """
+        params = {k: v for k, v in (("o", options), ("n", limit)) if v is not None}
+        unique = list(dict.fromkeys(queries))
+        results: Dict[str, List[Any]] = {}
+        for batch in self._query_batches(unique, params, max_url_length or self.MAX_URL_LENGTH):
+            query_string = "&".join(f"q={query}" for query in batch)
+            response = self.gerrit.get(self.endpoint + f"/?{query_string}", params=params)
+            if len(batch) == 1:
+                response = [response]
+            results.update(zip(batch, response))
+        return [results[query] for query in queries]
+
+    def stream_search(
+        self,
+        query: str,
+        options: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        skip: int = 0,
+    ) -> Iterator[Any]:
+        """
+        Queries changes visible to the caller in a single request and yields them
+        while the response is being downloaded, so large results such as
+        ``o=ALL_REVISIONS`` queries are never held in memory at once.
+
+        .. code-block:: python
+
+            for change in client.changes.stream_search("project:foo", options=["ALL_REVISIONS"]):
+                print(change["_number"])
+
+        :param query: Query string, it can contain multiple search operators
+                      concatenated by '+' character
+        :param options: List of options to fetch additional data about changes
+        :param limit: Int value that allows to limit the number of changes
+                      to be included in the output results, defaults to the server limit
+        :param skip: Int value that allows to skip the given number of
+                     changes from the beginning of the list
+        :return:
+        """
+        params = {
+            k: v
+            for k, v in (("o", options), ("n", limit), ("S", skip))
+            if v is not None
+        }
+
+        yield from self.gerrit.iter_json(self.endpoint + f"/?q={query}", params=params)
+
+    def iter_search(
+        self,
+        query: str,
+        options: Optional[List[str]] = None,
+        page_size: Optional[int] = None,
+        skip: int = 0,
+        keyset: bool = False,
+    ) -> Iterator[Any]:
+        """
+        Queries changes visible to the caller and yields them one at a time,
+        following ``_more_changes`` to fetch further pages on demand.
+
+        With ``keyset=True`` further pages are fetched with a ``before:`` operand on the
+        ``updated`` timestamp of the last change instead of an ``S`` offset, so every page
+        costs the server the same however deep the scan is. Use it to walk large result sets.
+
+        .. code-block:: python
+
+            for change in client.changes.iter_search("status:merged", page_size=500):
+                print(change["_number"])
+
+            for change in client.changes.iter_search("project:foo", page_size=500, keyset=True):
+                print(change["_number"])
+
+        :param query: Query string, it can contain multiple search operators
+                      concatenated by '+' character
+        :param options: List of options to fetch additional data about changes
+        :param page_size: Int value, the number of changes fetched per request,
+                          tuned to the server by the page sizer of the client if None
+        :param skip: Int value that allows to skip the given number of
+                     changes from the beginning of the list, not supported with keyset
+        :param keyset: page with before: on the updated timestamp instead of offsets
+        :return:
+        """
+        if keyset:
+            if skip:
+                raise ValueError("skip is not supported with keyset pagination")
+            yield from paginate_keyset(
+                lambda before, limit, start: self.search(
+                    f"({query}) before:{before}" if before else query,
+                    options=options,
+                    limit=limit,
+                    skip=start,
+                ),
+                **page_sizing(self.gerrit, page_size, "/changes/"),
+            )
+            return
+
+        yield from paginate(
+            lambda limit, start: self.search(query, options=options, limit=limit, skip=start),
+            **page_sizing(self.gerrit, page_size, "/changes/"),
+            skip=skip,
+            more_key="_more_changes",
+        )
+
+    def sharded_search(
+        self,
+        query: str,
+        options: Optional[List[str]] = None,
+        since: Optional[datetime.datetime] = None,
+        until: Optional[datetime.datetime] = None,
+        shards: int = 4,
+        projects: Optional[Sequence[str]] = None,
+        max_workers: int = 4,
+        ordered: bool = False,
+        limit: int = 500,
+    ) -> Iterator[Any]:
+        """
+        Queries all changes matching a query with concurrent requests, for full exports.
+        The query is split into disjoint shards by ``after:``/``before:`` windows of the
+        ``updated`` timestamp and by ``project:``; a shard with more than ``limit`` changes
+        is split further. Every change is yielded once.
+
+        .. code-block:: python
+
+            import datetime
+
+            since = datetime.datetime(2020, 1, 1, tzinfo=datetime.timezone.utc)
+            for change in client.changes.sharded_search("status:merged", since=since, shards=16,
+                                                        max_workers=8):
+                print(change["_number"])
+
+        :param query: Query string, it can contain multiple search operators
+                      concatenated by '+' character
+        :param options: List of options to fetch additional data about changes
+        :param since: the oldest updated time of the changes, if known; the range from since
+                      to until is split into shards up front, otherwise shards are split as
+                      they fill up
+        :param until: the newest updated time of the changes, defaults to now
+        :param shards: the number of time windows the range is split into up front
+        :param projects: the projects to query, each gets its own shards
+        :param max_workers: maximum number of requests in flight
+        :param ordered: yield changes most recently updated first, once all are fetched,
+                        instead of as they arrive
+        :param limit: Int value, the number of changes fetched per request, at most the
+                      query limit of the server
+        :return:
+        """
+        until = until or datetime.datetime.now(datetime.timezone.utc)
+        if since is not None:
+            initial = time_shards(since, until, shards, projects=projects)
+        else:
+            initial = [Shard(project, None, until) for project in (projects or [None])]
+
+        yield from iter_shards(
+            lambda shard_query, page_size, start: self.search(
+                shard_query, options=options, limit=page_size, skip=start
+            ),
+            query,
+            initial,
+            limit=limit,
+            max_workers=max_workers,
+            ordered=ordered,
+        )
+
+    @traced
     def get(self, id_: str) -> Any:
         """
         Retrieves a change.
@@ -61,7 +272,7 @@ class GerritChanges:
             result = self.gerrit.get(endpoint)
 
             change_id = result.get("id")
-            return GerritChange(id=change_id, gerrit=self.gerrit)
+            return GerritChange(id=change_id, gerrit=self.gerrit, data=result)
         except requests.exceptions.HTTPError as error:
             if error.response.status_code == 404:
                 message = f"Change {id_} does not exist"
@@ -99,6 +310,7 @@ class GerritChanges:
         )
         return result
 
+    @traced
     def delete(self, id_: str) -> None:
         """
         Deletes a change.
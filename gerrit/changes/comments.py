@@ -7,7 +7,15 @@ from gerrit.utils.gerritbase import GerritBase
 
 
 class GerritChangeRevisionComment(GerritBase):
-    def __init__(self, id: str, change: str, revision: str, gerrit: GerritClient) -> None:
+    def __init__(
+        self,
+        id: str,
+        change: str,
+        revision: str,
+        gerrit: GerritClient,
+        data: Any = None,
+        lazy: bool = False,
+    ) -> None:
         self.id = id
         self.change = change
         self.revision = revision
@@ -15,7 +23,7 @@ class GerritChangeRevisionComment(GerritBase):
         self.endpoint = (
             f"/changes/{self.change}/revisions/{self.revision}/comments/{self.id}"
         )
-        super().__init__()
+        super().__init__(data=data, lazy=lazy)
 
     def __str__(self) -> str:
         return self.id
@@ -86,5 +94,9 @@ class GerritChangeRevisionComments:
 
         id = result.get("id")
         return GerritChangeRevisionComment(
-            id=id, change=self.change, revision=self.revision, gerrit=self.gerrit
+            id=id,
+            change=self.change,
+            revision=self.revision,
+            gerrit=self.gerrit,
+            data=result,
         )
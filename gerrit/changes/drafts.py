@@ -7,7 +7,15 @@ from gerrit.utils.gerritbase import GerritBase
 
 
 class GerritChangeRevisionDraft(GerritBase):
-    def __init__(self, id: str, change: str, revision: str, gerrit: GerritClient) -> None:
+    def __init__(
+        self,
+        id: str,
+        change: str,
+        revision: str,
+        gerrit: GerritClient,
+        data: Any = None,
+        lazy: bool = False,
+    ) -> None:
         self.id = id
         self.change = change
         self.revision = revision
@@ -15,7 +23,7 @@ class GerritChangeRevisionDraft(GerritBase):
         self.endpoint = (
             f"/changes/{self.change}/revisions/{self.revision}/drafts/{self.id}"
         )
-        super().__init__()
+        super().__init__(data=data, lazy=lazy)
 
     def __str__(self) -> str:
         return self.id
@@ -87,7 +95,11 @@ class GerritChangeRevisionDrafts:
 
         id = result.get("id")
         return GerritChangeRevisionDraft(
-            id=id, change=self.change, revision=self.revision, gerrit=self.gerrit
+            id=id,
+            change=self.change,
+            revision=self.revision,
+            gerrit=self.gerrit,
+            data=result,
         )
 
     def create(self, input_: Dict[str, Any]) -> Any:
@@ -8,12 +8,18 @@ from gerrit.utils.gerritbase import GerritBase
 
 
 class GerritChangeEdit(GerritBase):
-    def __init__(self, change: str, gerrit: GerritClient) -> None:
+    def __init__(
+        self,
+        change: str,
+        gerrit: GerritClient,
+        data: Any = None,
+        lazy: bool = False,
+    ) -> None:
         self.change = change
         self.gerrit = gerrit
         self.endpoint = f"/changes/{self.change}/edit"
 
-        super().__init__()
+        super().__init__(data=data, lazy=lazy)
 
     def __str__(self) -> str:
         return f"change {self.change} edit"
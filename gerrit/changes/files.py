@@ -2,11 +2,12 @@
 # -*- coding:utf-8 -*-
 # @Author: Jialiang Shi
 import logging
-from typing import Any, Dict, Iterator, List, Optional
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional
 from base64 import b64decode
 from urllib.parse import quote_plus
 import requests
 from gerrit import GerritClient
+from gerrit.utils.streaming import iter_b64decode, iter_unzip, stream_to
 from gerrit.utils.exceptions import (
     UnknownFile,
     FileContentNotFoundError,
@@ -72,6 +73,46 @@ class GerritChangeRevisionFile:
         """
         return self.gerrit.get(self.endpoint + "/download")
 
+    def stream_content(
+        self, fileobj: Optional[BinaryIO] = None, chunk_size: int = 64 * 1024
+    ) -> Any:
+        """
+        Streams the content of a file from a certain revision, base64 decoded chunk by chunk.
+
+        :param fileobj: a file object opened for binary writing
+        :param chunk_size: number of bytes read at a time
+        :return: the number of bytes written if fileobj is given, else an iterator over the chunks
+        """
+        try:
+            chunks = self.gerrit.iter_content(self.endpoint + "/content", chunk_size=chunk_size)
+        except requests.exceptions.HTTPError as error:
+            if error.response.status_code == 404:
+                message = f"Revision File {self.path} content does not exist"
+                logger.error(message)
+                raise FileContentNotFoundError(message)
+            raise GerritAPIException from error
+        return stream_to(iter_b64decode(chunks), fileobj)
+
+    def stream_download(
+        self,
+        fileobj: Optional[BinaryIO] = None,
+        unzip: bool = False,
+        chunk_size: int = 64 * 1024,
+    ) -> Any:
+        """
+        Streams the safe download of a file from a certain revision, see download_content.
+        With unzip, a file which the server wrapped in a ZIP archive is unpacked on the fly.
+
+        :param fileobj: a file object opened for binary writing
+        :param unzip: unpack the single entry of the ZIP archive
+        :param chunk_size: number of bytes read at a time
+        :return: the number of bytes written if fileobj is given, else an iterator over the chunks
+        """
+        chunks = self.gerrit.iter_content(self.endpoint + "/download", chunk_size=chunk_size)
+        if unzip:
+            chunks = iter_unzip(chunks)
+        return stream_to(chunks, fileobj)
+
     def get_diff(self, intraline: bool = False) -> Any:
         """
         Gets the diff of a file from a certain revision.
@@ -7,12 +7,19 @@ from gerrit.utils.gerritbase import GerritBase
 
 
 class GerritChangeMessage(GerritBase):
-    def __init__(self, id: str, change: str, gerrit: GerritClient) -> None:
+    def __init__(
+        self,
+        id: str,
+        change: str,
+        gerrit: GerritClient,
+        data: Any = None,
+        lazy: bool = False,
+    ) -> None:
         self.id = id
         self.change = change
         self.gerrit = gerrit
         self.endpoint = f"/changes/{self.change}/messages/{self.id}"
-        super().__init__()
+        super().__init__(data=data, lazy=lazy)
 
     def __str__(self) -> str:
         return self.id
@@ -72,4 +79,6 @@ class GerritChangeMessages:
         """
         result = self.gerrit.get(self.endpoint + f"/{id_}")
         id_ = result.get("id")
-        return GerritChangeMessage(id=id_, change=self.change, gerrit=self.gerrit)
+        return GerritChangeMessage(
+            id=id_, change=self.change, gerrit=self.gerrit, data=result
+        )
@@ -11,17 +11,25 @@ from gerrit.utils.exceptions import (
     ReviewerAlreadyExistsError,
     GerritAPIException,
 )
+from gerrit.utils.tracing import traced
 
 logger = logging.getLogger(__name__)
 
 
 class GerritChangeReviewer(GerritBase):
-    def __init__(self, account: str, change: str, gerrit: GerritClient) -> None:
+    def __init__(
+        self,
+        account: str,
+        change: str,
+        gerrit: GerritClient,
+        data: Any = None,
+        lazy: bool = False,
+    ) -> None:
         self.account = account
         self.change = change
         self.gerrit = gerrit
         self.endpoint = f"/changes/{self.change}/reviewers/{self.account}"
-        super().__init__()
+        super().__init__(data=data, lazy=lazy)
 
     def __str__(self) -> str:
         return str(self.account)
@@ -123,7 +131,7 @@ class GerritChangeReviewers:
 
             account = result[0].get("_account_id")
             return GerritChangeReviewer(
-                account=account, change=self.change, gerrit=self.gerrit
+                account=account, change=self.change, gerrit=self.gerrit, data=result
             )
         except requests.exceptions.HTTPError as error:
             if error.response.status_code == 404:
@@ -131,6 +139,7 @@ class GerritChangeReviewers:
                 raise ReviewerNotFoundError(message)
             raise GerritAPIException from error
 
+    @traced
     def add(self, input_: Dict[str, Any]) -> Any:
         """
         Adds one user or all members of one group as reviewer to the change.
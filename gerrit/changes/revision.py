@@ -3,26 +3,37 @@
 # @Author: Jialiang Shi
 from base64 import b64decode
 from urllib.parse import quote_plus
-from typing import Any, Dict, List, Optional
+from typing import Any, BinaryIO, Dict, List, Optional
 from gerrit import GerritClient
+from gerrit.utils.gerritbase import GerritBase
+from gerrit.utils.streaming import iter_b64decode, iter_unzip, stream_to
 from gerrit.changes.drafts import GerritChangeRevisionDrafts
 from gerrit.changes.comments import GerritChangeRevisionComments
 from gerrit.changes.files import GerritChangeRevisionFiles
 
 
-class GerritChangeRevision:
-    def __init__(self, gerrit: GerritClient, change: str, revision: str = "current") -> None:
+class GerritChangeRevision(GerritBase):
+    def __init__(
+        self,
+        gerrit: GerritClient,
+        change: str,
+        revision: str = "current",
+        data: Any = None,
+        lazy: bool = True,
+    ) -> None:
         self.change = change
         self.revision = revision
         self.gerrit = gerrit
         self.endpoint = f"/changes/{self.change}/revisions/{self.revision}"
-
-    def __repr__(self) -> str:
-        return f"<{self.__class__.__module__}.{self.__class__.__name__} {str(self)}>"
+        super().__init__(data=data, lazy=lazy)
 
     def __str__(self) -> str:
         return str(self.revision)
 
+    def _poll(self) -> Any:
+        # a revision has no resource of its own, its attributes are those of its commit
+        return self.gerrit.get(self.endpoint + "/commit")
+
     def get_commit(self) -> Dict[str, Any]:
         """
         Retrieves a parsed commit of a revision.
@@ -227,6 +238,46 @@ class GerritChangeRevision:
             return b64decode(result).decode("utf-8")
         return result
 
+    def stream_patch(
+        self,
+        zip_: bool = False,
+        path: Optional[str] = None,
+        fileobj: Optional[BinaryIO] = None,
+        chunk_size: int = 64 * 1024,
+    ) -> Any:
+        """
+        Streams the formatted patch for one revision as plain text bytes, without keeping
+        the whole patch in memory. The base64 response is decoded chunk by chunk, with zip_
+        the ZIP archive is downloaded instead and its single entry is unpacked on the fly.
+
+        .. code-block:: python
+
+            with open("change.diff", "wb") as f:
+                revision.stream_patch(zip_=True, fileobj=f)
+
+        :param zip_: download the patch as a ZIP archive
+        :param path: only the diff of the file that the path refers to
+        :param fileobj: a file object opened for binary writing
+        :param chunk_size: number of bytes read at a time
+        :return: the number of bytes written if fileobj is given, else an iterator over the chunks
+        """
+        endpoint = self.endpoint + "/patch"
+
+        query_params = []
+        if zip_:
+            query_params.append("zip")
+
+        if path:
+            query_params.append(f"path={quote_plus(path)}")
+
+        if query_params:
+            endpoint += "?" + "&".join(query_params)
+
+        chunks = self.gerrit.iter_content(endpoint, chunk_size=chunk_size)
+        if zip_:
+            return stream_to(iter_unzip(chunks), fileobj)
+        return stream_to(iter_b64decode(chunks), fileobj)
+
     def submit_preview(self) -> Any:
         """
         need fix bug
@@ -9,11 +9,17 @@ from gerrit.groups.subgroups import GerritGroupSubGroups
 
 
 class GerritGroup(GerritBase):
-    def __init__(self, group_id: str, gerrit: GerritClient) -> None:
+    def __init__(
+        self,
+        group_id: str,
+        gerrit: GerritClient,
+        data: Any = None,
+        lazy: bool = False,
+    ) -> None:
         self.id = group_id
         self.gerrit = gerrit
         self.endpoint = f"/groups/{self.id}"
-        super().__init__()
+        super().__init__(data=data, lazy=lazy)
 
     def __str__(self) -> str:
         return self.id
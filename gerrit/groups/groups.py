@@ -2,17 +2,19 @@
 # -*- coding:utf-8 -*-
 # @Author: Jialiang Shi
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 import requests
 from gerrit import GerritClient
 from gerrit.groups.group import GerritGroup
 from gerrit.utils.common import params_creator
+from gerrit.utils.pagination import page_sizing, paginate
 from gerrit.utils.exceptions import (
     GroupNotFoundError,
     GroupAlreadyExistsError,
     ConflictError,
     GerritAPIException,
 )
+from gerrit.utils.tracing import traced
 
 logger = logging.getLogger(__name__)
 
@@ -53,6 +55,34 @@ class GerritGroups:
 
         return self.gerrit.get(self.endpoint + "/", params=params)
 
+    def iter_list(
+        self,
+        pattern_dispatcher: Optional[Dict[str, Any]] = None,
+        options: Optional[List[str]] = None,
+        page_size: Optional[int] = None,
+        skip: int = 0,
+    ) -> Iterator[Any]:
+        """
+        Lists the groups accessible by the caller, one GroupInfo at a time.
+        Pages are fetched on demand, the group name is stored in the ``name`` field.
+
+        :param pattern_dispatcher: Dict of pattern type with respective
+                     pattern value: {('match'|'regex') : value}
+        :param options: Additional fields, see :meth:`list`
+        :param page_size: Int value, the number of groups fetched per request,
+                          tuned to the server by the page sizer of the client if None
+        :param skip: Int value that allows to skip the given
+                     number of groups from the beginning of the list
+        :return:
+        """
+        yield from paginate(
+            lambda limit, start: self.list(
+                pattern_dispatcher=pattern_dispatcher, options=options, limit=limit, skip=start
+            ),
+            **page_sizing(self.gerrit, page_size, "/groups/"),
+            skip=skip,
+        )
+
     def search(self, query: str, options: Optional[List[str]] = None, limit: int = 25, skip: int = 0) -> List[Any]:
         """
         Query Groups
@@ -79,6 +109,28 @@ class GerritGroups:
 
         return self.gerrit.get(endpoint, params=params)
 
+    def iter_search(
+        self, query: str, options: Optional[List[str]] = None, page_size: Optional[int] = None, skip: int = 0
+    ) -> Iterator[Any]:
+        """
+        Query Groups and yield them one at a time,
+        following ``_more_groups`` to fetch further pages on demand.
+
+        :param query:
+        :param options: Additional fields, see :meth:`search`
+        :param page_size: Int value, the number of groups fetched per request,
+                          tuned to the server by the page sizer of the client if None
+        :param skip: Int value that allows to skip the given
+                     number of groups from the beginning of the list
+        :return:
+        """
+        yield from paginate(
+            lambda limit, start: self.search(query, options=options, limit=limit, skip=start),
+            **page_sizing(self.gerrit, page_size, "/groups/?query"),
+            skip=skip,
+            more_key="_more_groups",
+        )
+
     def get(self, id_: Any) -> Any:
         """
         Retrieves a group.
@@ -91,13 +143,14 @@ class GerritGroups:
             res = self.gerrit.get(endpoint)
 
             group_id = res.get("id")
-            return GerritGroup(group_id=group_id, gerrit=self.gerrit)
+            return GerritGroup(group_id=group_id, gerrit=self.gerrit, data=res)
         except requests.exceptions.HTTPError as error:
             if error.response.status_code == 404:
                 message = f"Group {id_} does not exist"
                 raise GroupNotFoundError(message)
             raise GerritAPIException from error
 
+    @traced
     def create(self, name: str, input_: Dict[str, Any]) -> Any:
         """
         Creates a new Gerrit internal group.
@@ -118,7 +171,7 @@ class GerritGroups:
         :return:
         """
         try:
-            self.gerrit.put(
+            result = self.gerrit.put(
                 self.endpoint + f"/{name}",
                 json=input_,
                 headers=self.gerrit.default_headers,
@@ -127,4 +180,9 @@ class GerritGroups:
             message = f"Group {name} already exists"
             logger.error(message)
             raise GroupAlreadyExistsError(message)
+
+        if isinstance(result, dict) and result.get("id"):
+            return GerritGroup(
+                group_id=result.get("id"), gerrit=self.gerrit, data=result
+            )
         return self.get(name)
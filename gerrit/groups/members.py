@@ -5,11 +5,14 @@ import logging
 from typing import Any, Dict, List
 import requests
 from gerrit import GerritClient
+from gerrit.accounts.account import GerritAccount
+from gerrit.utils.gerritbase import poll_all
 from gerrit.utils.exceptions import (
     GroupMemberNotFoundError,
     GroupMemberAlreadyExistsError,
     GerritAPIException,
 )
+from gerrit.utils.tracing import traced
 
 logger = logging.getLogger(__name__)
 
@@ -20,20 +23,29 @@ class GerritGroupMembers:
         self.gerrit = gerrit
         self.endpoint = f"/groups/{self.id}/members"
 
-    def list(self) -> List[Any]:
+    def list(self, refresh: bool = False, max_workers: int = 8) -> List[Any]:
         """
         Lists the direct members of a Gerrit internal group.
         This endpoint is only allowed for Gerrit internal groups;
         attempting to call on a non-internal group will return 405 Method Not Allowed.
 
+        The accounts are built from the AccountInfo entries of the listing,
+        no request is sent per member unless refresh is set.
+
+        :param refresh: re-fetch every member from the accounts endpoint
+        :param max_workers: maximum number of concurrent requests when refreshing
         :return:
         """
         result = self.gerrit.get(self.endpoint)
 
-        accounts = []
-        for item in result:
-            account_id = item.get("_account_id")
-            accounts.append(self.gerrit.accounts.get(account_id))
+        accounts = [
+            GerritAccount(
+                account=item.get("_account_id"), gerrit=self.gerrit, data=item
+            )
+            for item in result
+        ]
+        if refresh:
+            poll_all(accounts, max_workers=max_workers)
 
         return accounts
 
@@ -49,13 +61,14 @@ class GerritGroupMembers:
         try:
             result = self.gerrit.get(self.endpoint + f"/{account}")
             account_id = result.get("_account_id")
-            return self.gerrit.accounts.get(account_id)
+            return GerritAccount(account=account_id, gerrit=self.gerrit, data=result)
         except requests.exceptions.HTTPError as error:
             if error.response.status_code == 404:
                 message = f"Group member {account} does not exist"
                 raise GroupMemberNotFoundError(message)
             raise GerritAPIException from error
 
+    @traced
     def add(self, account: Any) -> Any:
         """
         Adds a user as member to a Gerrit internal group.
@@ -96,6 +109,7 @@ class GerritGroupMembers:
             self.endpoint, json=input_, headers=self.gerrit.default_headers
         )
 
+    @traced
     def remove(self, account: Any) -> None:
         """
         Removes a user from a Gerrit internal group.
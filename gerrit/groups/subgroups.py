@@ -3,6 +3,7 @@
 # @Author: Jialiang Shi
 from typing import Any, Dict, List
 from gerrit import GerritClient
+from gerrit.utils.gerritbase import poll_all
 
 
 class GerritGroupSubGroups:
@@ -11,19 +12,28 @@ class GerritGroupSubGroups:
         self.gerrit = gerrit
         self.endpoint = f"/groups/{self.id}/groups"
 
-    def list(self) -> List[Any]:
+    def list(self, refresh: bool = False, max_workers: int = 8) -> List[Any]:
         """
         Lists the direct subgroups of a group.
         This endpoint is only allowed for Gerrit internal groups;
         attempting to call on a non-internal group will return 405 Method Not Allowed.
 
+        The groups are built from the GroupInfo entries of the listing,
+        no request is sent per subgroup unless refresh is set.
+
+        :param refresh: re-fetch every subgroup from the groups endpoint
+        :param max_workers: maximum number of concurrent requests when refreshing
         :return:
         """
+        from gerrit.groups.group import GerritGroup
+
         result = self.gerrit.get(self.endpoint + "/")
-        subgroups = []
-        for item in result:
-            group_id = item.get("id")
-            subgroups.append(self.gerrit.groups.get(group_id))
+        subgroups = [
+            GerritGroup(group_id=item.get("id"), gerrit=self.gerrit, data=item)
+            for item in result
+        ]
+        if refresh:
+            poll_all(subgroups, max_workers=max_workers)
 
         return subgroups
 
@@ -36,10 +46,12 @@ class GerritGroupSubGroups:
         :param subgroup: subgroup id or name
         :return:
         """
+        from gerrit.groups.group import GerritGroup
+
         result = self.gerrit.get(self.endpoint + f"/{subgroup}")
 
         subgroup_id = result.get("id")
-        return self.gerrit.groups.get(subgroup_id)
+        return GerritGroup(group_id=subgroup_id, gerrit=self.gerrit, data=result)
 
     def add(self, subgroup: Any) -> Any:
         """
@@ -50,10 +62,12 @@ class GerritGroupSubGroups:
         :param subgroup: subgroup id or name
         :return:
         """
+        from gerrit.groups.group import GerritGroup
+
         result = self.gerrit.put(self.endpoint + f"/{subgroup}")
 
         subgroup_id = result.get("id")
-        return self.gerrit.groups.get(subgroup_id)
+        return GerritGroup(group_id=subgroup_id, gerrit=self.gerrit, data=result)
 
     def add_subgroups(self, input_: Dict[str, Any]) -> Any:
         """
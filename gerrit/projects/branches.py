@@ -4,10 +4,12 @@
 import logging
 from base64 import b64decode
 from urllib.parse import quote_plus, unquote_plus
-from typing import Any, Dict, List, Optional
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional
 import requests
 from gerrit import GerritClient
 from gerrit.utils.common import params_creator
+from gerrit.utils.pagination import page_sizing, paginate
+from gerrit.utils.streaming import iter_b64decode, stream_to
 from gerrit.utils.gerritbase import GerritBase
 from gerrit.utils.exceptions import (
     BranchNotFoundError,
@@ -15,17 +17,25 @@ from gerrit.utils.exceptions import (
     ConflictError,
     GerritAPIException,
 )
+from gerrit.utils.tracing import traced
 
 logger = logging.getLogger(__name__)
 
 
 class GerritProjectBranch(GerritBase):
-    def __init__(self, name: str, project: str, gerrit: GerritClient) -> None:
+    def __init__(
+        self,
+        name: str,
+        project: str,
+        gerrit: GerritClient,
+        data: Any = None,
+        lazy: bool = False,
+    ) -> None:
         self.name = name
         self.project = project
         self.gerrit = gerrit
         self.endpoint = f"/projects/{self.project}/branches/{quote_plus(self.name)}"
-        super().__init__()
+        super().__init__(data=data, lazy=lazy)
 
     def __str__(self) -> str:
         return self.name
@@ -44,6 +54,23 @@ class GerritProjectBranch(GerritBase):
             return b64decode(result).decode("utf-8")
         return result
 
+    def stream_file_content(
+        self, file: str, fileobj: Optional[BinaryIO] = None, chunk_size: int = 64 * 1024
+    ) -> Any:
+        """
+        Streams the content of a file from the HEAD revision of a certain branch,
+        base64 decoded chunk by chunk.
+
+        :param file: the file path
+        :param fileobj: a file object opened for binary writing
+        :param chunk_size: number of bytes read at a time
+        :return: the number of bytes written if fileobj is given, else an iterator over the chunks
+        """
+        chunks = self.gerrit.iter_content(
+            self.endpoint + f"/files/{quote_plus(file)}/content", chunk_size=chunk_size
+        )
+        return stream_to(iter_b64decode(chunks), fileobj)
+
     def is_mergeable(self, input_: Dict[str, Any]) -> Any:
         """
         Gets whether the source is mergeable with the target branch.
@@ -116,6 +143,27 @@ class GerritProjectBranches:
 
         return self.gerrit.get(self.endpoint + "/", params=params)
 
+    def iter_list(
+        self, pattern_dispatcher: Optional[Dict[str, Any]] = None, page_size: Optional[int] = None, skip: int = 0
+    ) -> Iterator[Any]:
+        """
+        List the branches of a project one at a time, fetching further pages on demand.
+
+        :param pattern_dispatcher: Dict of pattern type with respective
+               pattern value: {('match'|'regex') : value}
+        :param page_size: The number of branches fetched per request,
+               tuned to the server by the page sizer of the client if None.
+        :param skip: Skip the given number of branches from the beginning of the list.
+        :return:
+        """
+        yield from paginate(
+            lambda limit, start: self.list(
+                pattern_dispatcher=pattern_dispatcher, limit=limit, skip=start
+            ),
+            **page_sizing(self.gerrit, page_size, "/projects/{project}/branches/"),
+            skip=skip,
+        )
+
     def get(self, name: str) -> Any:
         """
         get a branch by ref
@@ -129,7 +177,7 @@ class GerritProjectBranches:
             ref = result.get("ref")
             name = ref.replace(self.branch_prefix, "")
             return GerritProjectBranch(
-                name=name, project=self.project, gerrit=self.gerrit
+                name=name, project=self.project, gerrit=self.gerrit, data=result
             )
         except requests.exceptions.HTTPError as error:
             if error.response.status_code == 404:
@@ -137,6 +185,7 @@ class GerritProjectBranches:
                 raise BranchNotFoundError(message)
             raise GerritAPIException from error
 
+    @traced
     def create(self, name: str, input_: Dict[str, Any]) -> Any:
         """
         Creates a new branch.
@@ -168,6 +217,7 @@ class GerritProjectBranches:
 
         return self.get(name)
 
+    @traced
     def delete(self, name: str) -> None:
         """
         Delete a branch.
@@ -9,12 +9,19 @@ from gerrit.utils.gerritbase import GerritBase
 
 
 class GerritProjectCommit(GerritBase):
-    def __init__(self, commit: str, project: str, gerrit: GerritClient) -> None:
+    def __init__(
+        self,
+        commit: str,
+        project: str,
+        gerrit: GerritClient,
+        data: Any = None,
+        lazy: bool = False,
+    ) -> None:
         self.commit = commit
         self.project = project
         self.gerrit = gerrit
         self.endpoint = f"/projects/{self.project}/commits/{self.commit}"
-        super().__init__()
+        super().__init__(data=data, lazy=lazy)
 
     def __str__(self) -> str:
         return self.commit
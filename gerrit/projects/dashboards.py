@@ -1,22 +1,77 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 # @Author: Jialiang Shi
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
+from urllib.parse import unquote
 from gerrit import GerritClient
 from gerrit.utils.gerritbase import GerritBase
 
 
 class GerritProjectDashboard(GerritBase):
-    def __init__(self, id: str, project: str, gerrit: GerritClient) -> None:
+    def __init__(
+        self,
+        id: str,
+        project: str,
+        gerrit: GerritClient,
+        data: Any = None,
+        lazy: bool = False,
+    ) -> None:
         self.id = id
         self.project = project
         self.gerrit = gerrit
         self.endpoint = f"/projects/{self.project}/dashboards/{self.id}"
-        super().__init__()
+        super().__init__(data=data, lazy=lazy)
 
     def __str__(self) -> str:
         return str(self.id)
 
+    def _resolve(self, query: str, branch: Optional[str]) -> str:
+        """
+        Replace the ``${project}`` and, if the branch is known, the ``${branch}`` tokens of a query.
+        """
+        query = query.replace("${project}", unquote(self.project))
+        if branch is not None:
+            query = query.replace("${branch}", branch)
+        return query
+
+    def load(
+        self,
+        options: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        branch: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Runs the queries of all sections of the dashboard, in as few requests as possible.
+        The ``foreach`` query of the dashboard is added to every section query, the
+        ``${project}`` tokens are replaced with the project and the ``${branch}`` tokens
+        with ``branch``, if it is given.
+
+        .. code-block:: python
+
+            dashboard = project.dashboards.get('master:closed')
+            for section in dashboard.load(options=["LABELS"], limit=25, branch="master"):
+                print(section["name"], len(section["changes"]))
+
+        :param options: List of options to fetch additional data about changes
+        :param limit: Int value that allows to limit the number of changes of each section
+        :param branch: the branch substituted for ``${branch}``
+        :return: the sections, each with name, query and the changes it matches
+        """
+        data = self.to_dict() or {}
+        foreach = self._resolve(data.get("foreach") or "", branch)
+        sections = []
+        for section in data.get("sections") or []:
+            query = self._resolve(section["query"], branch)
+            sections.append(
+                {"name": section.get("name"), "query": f"({query}) ({foreach})" if foreach else query}
+            )
+        results = self.gerrit.changes.search_many(
+            [section["query"] for section in sections], options=options, limit=limit
+        )
+        for section, changes in zip(sections, results):
+            section["changes"] = changes
+        return sections
+
     def set(self, input_: Dict[str, Any]) -> Any:
         """
         Updates a project dashboard.
@@ -98,7 +153,7 @@ class GerritProjectDashboards:
 
         dashboard_id = result.get("id")
         return GerritProjectDashboard(
-            id=dashboard_id, project=self.project, gerrit=self.gerrit
+            id=dashboard_id, project=self.project, gerrit=self.gerrit, data=result
         )
 
     def delete(self, id_: str) -> None:
@@ -7,12 +7,19 @@ from gerrit.utils.gerritbase import GerritBase
 
 
 class GerritProjectLabel(GerritBase):
-    def __init__(self, name: str, project: str, gerrit: GerritClient) -> None:
+    def __init__(
+        self,
+        name: str,
+        project: str,
+        gerrit: GerritClient,
+        data: Any = None,
+        lazy: bool = False,
+    ) -> None:
         self.name = name
         self.project = project
         self.gerrit = gerrit
         self.endpoint = f"/projects/{self.project}/labels/{self.name}"
-        super().__init__()
+        super().__init__(data=data, lazy=lazy)
 
     def __str__(self) -> str:
         return self.name
@@ -79,7 +86,9 @@ class GerritProjectLabels:
         result = self.gerrit.get(self.endpoint + f"/{name}")
 
         name = result.get("name")
-        return GerritProjectLabel(name=name, project=self.project, gerrit=self.gerrit)
+        return GerritProjectLabel(
+            name=name, project=self.project, gerrit=self.gerrit, data=result
+        )
 
     def create(self, name: str, input_: Dict[str, Any]) -> Any:
         """
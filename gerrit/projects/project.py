@@ -20,11 +20,17 @@ logger = logging.getLogger(__name__)
 
 
 class GerritProject(GerritBase):
-    def __init__(self, project_id: str, gerrit: GerritClient) -> None:
+    def __init__(
+        self,
+        project_id: str,
+        gerrit: GerritClient,
+        data: Any = None,
+        lazy: bool = False,
+    ) -> None:
         self.id = project_id
         self.gerrit = gerrit
         self.endpoint = f"/projects/{self.id}"
-        super().__init__()
+        super().__init__(data=data, lazy=lazy)
 
     def __str__(self) -> str:
         return self.id
@@ -425,7 +431,7 @@ class GerritProject(GerritBase):
 
             commit = result.get("commit")
             return GerritProjectCommit(
-                commit=commit, project=self.id, gerrit=self.gerrit
+                commit=commit, project=self.id, gerrit=self.gerrit, data=result
             )
         except requests.exceptions.HTTPError as error:
             if error.response.status_code == 404:
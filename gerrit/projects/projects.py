@@ -2,18 +2,20 @@
 # -*- coding:utf-8 -*-
 # @Author: Jialiang Shi
 import logging
-from typing import Any, Union, Dict, List, Optional
+from typing import Any, Union, Dict, Iterator, List, Optional
 from urllib.parse import quote_plus
 import requests
 from gerrit import GerritClient
 from gerrit.projects.project import GerritProject
 from gerrit.utils.common import params_creator
+from gerrit.utils.pagination import page_sizing, paginate
 from gerrit.utils.exceptions import (
     ProjectNotFoundError,
     ProjectAlreadyExistsError,
     ConflictError,
     GerritAPIException,
 )
+from gerrit.utils.tracing import traced
 
 
 logger = logging.getLogger(__name__)
@@ -78,6 +80,49 @@ class GerritProjects:
 
         return self.gerrit.get(self.endpoint + "/", params=params)
 
+    def iter_list(
+        self,
+        page_size: Optional[int] = None,
+        skip: int = 0,
+        pattern_dispatcher: Union[Dict, None] = None,
+        project_type: Optional[str] = None,
+        description: bool = False,
+        branch: Optional[str] = None,
+        state: Optional[str] = None,
+    ) -> Iterator[Any]:
+        """
+        Get all available projects accessible by the caller, one ProjectInfo at a time.
+        Pages are fetched on demand, the project name is stored in the ``name`` field.
+
+        :param page_size: Int value, the number of projects fetched per request,
+                          tuned to the server by the page sizer of the client if None
+        :param skip: Int value that allows to skip the given
+                     number of projects from the beginning of the list
+        :param pattern_dispatcher: Dict of pattern type with respective
+                     pattern value: {('prefix'|'match'|'regex') : value}
+        :param project_type: string value for type of projects to be fetched
+                            ('code'|'permissions'|'all')
+        :param description: boolean value, if True then description will be
+                            added to the output result
+        :param branch: Limit the results to the projects having the specified branch
+                       and include the sha1 of the branch in the results.
+        :param state: Get all projects with the given state.
+        :return:
+        """
+        yield from paginate(
+            lambda limit, start: self.list(
+                limit=limit,
+                skip=start,
+                pattern_dispatcher=pattern_dispatcher,
+                project_type=project_type,
+                description=description,
+                branch=branch,
+                state=state,
+            ),
+            **page_sizing(self.gerrit, page_size, "/projects/"),
+            skip=skip,
+        )
+
     def search(self, query: str, limit: int = 25, skip: int = 0) -> List:
         """
         Queries projects visible to the caller. The query string must be provided by the
@@ -104,6 +149,24 @@ class GerritProjects:
 
         return self.gerrit.get(self.endpoint + f"/?query={query}", params=params)
 
+    def iter_search(self, query: str, page_size: Optional[int] = None, skip: int = 0) -> Iterator[Any]:
+        """
+        Queries projects visible to the caller and yields them one at a time,
+        fetching further pages on demand.
+
+        :param query: see :meth:`search`
+        :param page_size: Int value, the number of projects fetched per request,
+                          tuned to the server by the page sizer of the client if None
+        :param skip: Int value that allows to skip the given
+                     number of projects from the beginning of the list
+        :return:
+        """
+        yield from paginate(
+            lambda limit, start: self.search(query, limit=limit, skip=start),
+            **page_sizing(self.gerrit, page_size, "/projects/?query"),
+            skip=skip,
+        )
+
     def get(self, name: str) -> Any:
         """
         Retrieves a project.
@@ -114,13 +177,14 @@ class GerritProjects:
         try:
             res = self.gerrit.get(self.endpoint + f"/{quote_plus(name)}")
             project_id = res.get("id")
-            return GerritProject(project_id=project_id, gerrit=self.gerrit)
+            return GerritProject(project_id=project_id, gerrit=self.gerrit, data=res)
         except requests.exceptions.HTTPError as error:
             if error.response.status_code == 404:
                 message = f"Project {name} does not exist"
                 raise ProjectNotFoundError(message)
             raise GerritAPIException from error
 
+    @traced
     def create(self, project_name: str, input_: Dict[str, Any]) -> Any:
         """
         Creates a new project.
@@ -143,7 +207,7 @@ class GerritProjects:
         :return:
         """
         try:
-            self.gerrit.put(
+            result = self.gerrit.put(
                 self.endpoint + f"/{quote_plus(project_name)}",
                 json=input_,
                 headers=self.gerrit.default_headers,
@@ -152,8 +216,14 @@ class GerritProjects:
             message = f"Project {project_name} already exists"
             logger.error(message)
             raise ProjectAlreadyExistsError(message)
+
+        if isinstance(result, dict) and result.get("id"):
+            return GerritProject(
+                project_id=result.get("id"), gerrit=self.gerrit, data=result
+            )
         return self.get(project_name)
 
+    @traced
     def delete(self, project_name: str) -> None:
         """
         Delete the project, requires delete-project plugin
@@ -7,12 +7,19 @@ from gerrit.utils.gerritbase import GerritBase
 
 
 class GerritProjectSubmitRequirement(GerritBase):
-    def __init__(self, name: str, project: str, gerrit: GerritClient) -> None:
+    def __init__(
+        self,
+        name: str,
+        project: str,
+        gerrit: GerritClient,
+        data: Any = None,
+        lazy: bool = False,
+    ) -> None:
         self.name = name
         self.project = project
         self.gerrit = gerrit
         self.endpoint = f"/projects/{self.project}/submit_requirements/{self.name}"
-        super().__init__()
+        super().__init__(data=data, lazy=lazy)
 
     def __str__(self) -> str:
         return self.name
@@ -74,7 +81,7 @@ class GerritProjectSubmitRequirements:
         result = self.gerrit.get(self.endpoint + f"/{name}")
         sr_name = result.get("name")
         return GerritProjectSubmitRequirement(
-            name=sr_name, project=self.project, gerrit=self.gerrit
+            name=sr_name, project=self.project, gerrit=self.gerrit, data=result
         )
 
     def create(self, name: str, input_: Dict[str, Any]) -> Any:
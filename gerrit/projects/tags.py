@@ -3,10 +3,11 @@
 # @Author: Jialiang Shi
 import logging
 from urllib.parse import quote_plus
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 import requests
 from gerrit import GerritClient
 from gerrit.utils.common import params_creator
+from gerrit.utils.pagination import page_sizing, paginate
 from gerrit.utils.gerritbase import GerritBase
 from gerrit.utils.exceptions import (
     TagNotFoundError,
@@ -14,18 +15,26 @@ from gerrit.utils.exceptions import (
     ConflictError,
     GerritAPIException,
 )
+from gerrit.utils.tracing import traced
 
 
 logger = logging.getLogger(__name__)
 
 
 class GerritProjectTag(GerritBase):
-    def __init__(self, name: str, project: str, gerrit: GerritClient) -> None:
+    def __init__(
+        self,
+        name: str,
+        project: str,
+        gerrit: GerritClient,
+        data: Any = None,
+        lazy: bool = False,
+    ) -> None:
         self.name = name
         self.project = project
         self.gerrit = gerrit
         self.endpoint = f"/projects/{self.project}/tags/{quote_plus(self.name)}"
-        super().__init__()
+        super().__init__(data=data, lazy=lazy)
 
     def __str__(self) -> str:
         return self.name
@@ -64,6 +73,27 @@ class GerritProjectTags:
         )
         return self.gerrit.get(self.endpoint + "/", params=params)
 
+    def iter_list(
+        self, pattern_dispatcher: Optional[Dict[str, Any]] = None, page_size: Optional[int] = None, skip: int = 0
+    ) -> Iterator[Any]:
+        """
+        List the tags of a project one at a time, fetching further pages on demand.
+
+        :param pattern_dispatcher: Dict of pattern type with respective
+               pattern value: {('match'|'regex') : value}
+        :param page_size: The number of tags fetched per request,
+               tuned to the server by the page sizer of the client if None.
+        :param skip: Skip the given number of tags from the beginning of the list.
+        :return:
+        """
+        yield from paginate(
+            lambda limit, start: self.list(
+                pattern_dispatcher=pattern_dispatcher, limit=limit, skip=start
+            ),
+            **page_sizing(self.gerrit, page_size, "/projects/{project}/tags/"),
+            skip=skip,
+        )
+
     def get(self, name: str) -> Any:
         """
         get a tag by ref
@@ -76,13 +106,16 @@ class GerritProjectTags:
 
             ref = result.get("ref")
             name = ref.replace(self.tag_prefix, "")
-            return GerritProjectTag(name=name, project=self.project, gerrit=self.gerrit)
+            return GerritProjectTag(
+                name=name, project=self.project, gerrit=self.gerrit, data=result
+            )
         except requests.exceptions.HTTPError as error:
             if error.response.status_code == 404:
                 message = f"Tag {name} does not exist"
                 raise TagNotFoundError(message)
             raise GerritAPIException from error
 
+    @traced
     def create(self, name: str, input_: Dict[str, Any]) -> Any:
         """
         Creates a new tag on the project.
@@ -115,6 +148,7 @@ class GerritProjectTags:
 
         return self.get(name)
 
+    @traced
     def delete(self, name: str) -> None:
         """
         Delete a tag.
@@ -7,14 +7,21 @@ from gerrit.utils.gerritbase import GerritBase
 
 
 class GerritProjectWebHook(GerritBase):
-    def __init__(self, name: str, project: str, gerrit: GerritClient) -> None:
+    def __init__(
+        self,
+        name: str,
+        project: str,
+        gerrit: GerritClient,
+        data: Any = None,
+        lazy: bool = False,
+    ) -> None:
         self.name = name
         self.project = project
         self.gerrit = gerrit
         self.endpoint = (
             f"/config/server/webhooks~projects/{self.project}/remotes/{self.name}"
         )
-        super().__init__()
+        super().__init__(data=data, lazy=lazy)
 
     def __str__(self) -> str:
         return self.name
@@ -77,7 +84,9 @@ class GerritProjectWebHooks:
         """
         result = self.gerrit.get(self.endpoint + f"/{name}")
         name = result.get("name")
-        return GerritProjectWebHook(name=name, project=self.project, gerrit=self.gerrit)
+        return GerritProjectWebHook(
+            name=name, project=self.project, gerrit=self.gerrit, data=result
+        )
 
     def delete(self, name: str) -> None:
         """
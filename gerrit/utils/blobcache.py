@@ -0,0 +1,279 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+# @Author: Jialiang Shi
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+import urllib.parse as urlparse
+import zlib
+from typing import Any, Dict, Optional, Tuple
+from gerrit.utils.cache import ResponseCache
+from gerrit.utils.common import endpoint_segments
+
+SHA1_PATTERN = re.compile(r"^[0-9a-f]{40}$")
+
+_REVISION = r"/changes/[^/]+/revisions/[0-9a-f]{40}"
+_COMMIT = r"/projects/[^/]+/commits/[0-9a-f]{40}"
+
+IMMUTABLE_ENDPOINTS = [
+    re.compile(_REVISION + r"/(commit|patch|files)"),
+    re.compile(_REVISION + r"/files/[^/]+/(content|download)"),
+    re.compile(_COMMIT),
+    re.compile(_COMMIT + r"/files"),
+    re.compile(_COMMIT + r"/files/[^/]+/content"),
+]
+
+# query parameters whose answer depends on the calling user rather than the commit
+MUTABLE_PARAMS = {"reviewed", "q"}
+
+
+def is_immutable(endpoint: str, params: Optional[Any] = None) -> bool:
+    """
+    Check whether an endpoint addresses content at a fixed commit SHA-1,
+    e.g. /changes/123/revisions/<sha1>/files/README/content.
+
+    :param endpoint: the endpoint, may contain a query string
+    :param params: query params as a dict or a list of tuples
+    :return:
+    """
+    path = "/" + "/".join(endpoint_segments(endpoint))
+    if not any(pattern.fullmatch(path) for pattern in IMMUTABLE_ENDPOINTS):
+        return False
+
+    names = set(urlparse.parse_qs(urlparse.urlsplit(endpoint).query, keep_blank_values=True))
+    if isinstance(params, dict):
+        names.update(params)
+    elif params:
+        names.update(name for name, _ in params)
+    return not names & MUTABLE_PARAMS
+
+
+def auth_identity(session: Any) -> str:
+    """
+    The identity requests of a session are sent as: the username of its basic auth,
+    else a fingerprint of its cookies, else "anonymous".
+
+    :param session: the requests session
+    :return:
+    """
+    auth = session.auth
+    username = auth[0] if isinstance(auth, tuple) else getattr(auth, "username", None)
+    if isinstance(username, str) and username:
+        return f"user:{username}"
+    cookies = sorted(f"{cookie.name}={cookie.value}" for cookie in session.cookies or ())
+    if cookies:
+        return "cookies:" + hashlib.sha256("\n".join(cookies).encode("utf-8")).hexdigest()
+    return "anonymous"
+
+
+def default_path() -> str:
+    """
+    The default location of the cache database, below ~/.cache.
+
+    :return:
+    """
+    return os.path.join(os.path.expanduser("~"), ".cache", "python-gerrit-api", "blobs.sqlite3")
+
+
+class BlobCache:
+    """
+    A persistent, content-addressed cache for responses which never change,
+    i.e. commits, patches, file lists and file contents at a fixed commit SHA-1.
+
+    Responses are stored zlib-compressed in a SQLite database, identical contents
+    are stored only once. When the stored size exceeds ``max_bytes`` the least recently
+    used contents are evicted. The database survives process restarts, so it can be
+    shared by CI jobs running on the same machine. Keys include the identity of the
+    client, so users sharing a database never read each other's responses.
+
+    .. code-block:: python
+
+        from gerrit import GerritClient
+        from gerrit.utils.blobcache import BlobCache
+
+        client = GerritClient(base_url="https://yourgerrit", username='******', password='xxxxx',
+                              blob_cache=BlobCache("/var/cache/ci/gerrit.sqlite3"))
+        revision = client.changes.get(change_id).get_revision(sha1)
+        revision.get_commit()     # fetched and stored on disk
+        revision.get_commit()     # served from disk, also by the next process
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        max_bytes: int = 256 * 1024 * 1024,
+        compress_level: int = 6,
+    ) -> None:
+        """
+        :param path: the database file, defaults to ~/.cache/python-gerrit-api/blobs.sqlite3;
+          ":memory:" keeps the cache in memory
+        :param max_bytes: maximum size of the stored (compressed) contents
+        :param compress_level: zlib compression level, 0-9
+        """
+        if max_bytes <= 0:
+            raise ValueError(f"max_bytes must be positive, got {max_bytes}")
+
+        self.path = path or default_path()
+        self.max_bytes = max_bytes
+        self.compress_level = compress_level
+        if self.path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS entries (key TEXT PRIMARY KEY, digest TEXT NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS blobs ("
+            "digest TEXT PRIMARY KEY, data BLOB NOT NULL, "
+            "size INTEGER NOT NULL, accessed REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS blobs_accessed ON blobs (accessed)")
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def make_key(
+        url: str,
+        params: Optional[Any] = None,
+        headers: Optional[Dict[str, str]] = None,
+        identity: Optional[str] = None,
+    ) -> str:
+        """
+        Build the cache key of a request. The url should include the server and the
+        identity should be given, so one database can be shared by several servers and users.
+
+        :param url: the url or the server qualified endpoint
+        :param params: query params as a dict or a list of tuples
+        :param headers: request headers
+        :param identity: the identity the request is sent as, see auth_identity
+        :return:
+        """
+        key = json.dumps([identity, ResponseCache.make_key(url, params, headers)])
+        return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+    def lookup(self, key: str) -> Tuple[bool, Any]:
+        """
+        Look a response up.
+
+        :param key: the key built by make_key
+        :return: a (hit, value) tuple
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT blobs.digest, blobs.data FROM entries "
+                "JOIN blobs ON blobs.digest = entries.digest WHERE entries.key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return False, None
+
+            self._conn.execute(
+                "UPDATE blobs SET accessed = ? WHERE digest = ?", (time.time(), row[0])
+            )
+            self.hits += 1
+
+        return True, json.loads(zlib.decompress(row[1]).decode("utf-8"))
+
+    def store(self, key: str, value: Any) -> None:
+        """
+        Store a decoded response.
+
+        :param key: the key built by make_key
+        :param value: the decoded response, a JSON value or text
+        :return:
+        """
+        payload = json.dumps(value, separators=(",", ":")).encode("utf-8")
+        digest = hashlib.sha256(payload).hexdigest()
+        data = zlib.compress(payload, self.compress_level)
+        if len(data) > self.max_bytes:
+            return
+
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                self._conn.execute(
+                    "INSERT INTO blobs (digest, data, size, accessed) VALUES (?, ?, ?, ?) "
+                    "ON CONFLICT (digest) DO UPDATE SET accessed = excluded.accessed",
+                    (digest, data, len(data), time.time()),
+                )
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO entries (key, digest) VALUES (?, ?)", (key, digest)
+                )
+                self._evict()
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def _evict(self) -> None:
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM blobs").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        rows = self._conn.execute("SELECT digest, size FROM blobs ORDER BY accessed").fetchall()
+        for digest, size in rows:
+            if total <= self.max_bytes:
+                break
+            self._conn.execute("DELETE FROM blobs WHERE digest = ?", (digest,))
+            self._conn.execute("DELETE FROM entries WHERE digest = ?", (digest,))
+            total -= size
+            self.evictions += 1
+
+    @property
+    def size(self) -> int:
+        """
+        The stored (compressed) size in bytes.
+
+        :return:
+        """
+        with self._lock:
+            return self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM blobs").fetchone()[0]
+
+    def clear(self) -> None:
+        """
+        Drop all entries.
+
+        :return:
+        """
+        with self._lock:
+            self._conn.execute("DELETE FROM entries")
+            self._conn.execute("DELETE FROM blobs")
+
+    def close(self) -> None:
+        """
+        Close the database.
+
+        :return:
+        """
+        with self._lock:
+            self._conn.close()
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """
+        Hit/miss statistics of the cache.
+
+        :return:
+        """
+        with self._lock:
+            entries, blobs = self._conn.execute(
+                "SELECT (SELECT COUNT(*) FROM entries), (SELECT COUNT(*) FROM blobs)"
+            ).fetchone()
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": entries,
+            "blobs": blobs,
+            "bytes": self.size,
+            "max_bytes": self.max_bytes,
+        }
@@ -0,0 +1,224 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+# @Author: Jialiang Shi
+import asyncio
+import contextvars
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+Operation = Union[Callable[[], Any], Tuple[Hashable, Callable[[], Any]]]
+
+
+class BulkResult:
+    """
+    The outcome of one operation of a bulk run: its return value or the exception it raised,
+    when it started relative to the start of the run and how long it took, in seconds.
+    """
+
+    def __init__(
+        self,
+        index: int,
+        key: Hashable,
+        value: Any = None,
+        error: Optional[BaseException] = None,
+        started: float = 0.0,
+        duration: float = 0.0,
+    ) -> None:
+        self.index = index
+        self.key = key
+        self.value = value
+        self.error = error
+        self.started = started
+        self.duration = duration
+
+    def __repr__(self) -> str:
+        outcome = "ok" if self.ok else f"error={self.error!r}"
+        return f"<BulkResult {self.key!r} {outcome} {self.duration:.3f}s>"
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "key": self.key,
+            "ok": self.ok,
+            "error": None if self.ok else f"{type(self.error).__name__}: {self.error}",
+            "started": self.started,
+            "duration": self.duration,
+        }
+
+
+class BulkResults(list):
+    """
+    The results of a bulk run, in the order of the operations.
+    """
+
+    @property
+    def succeeded(self) -> List[BulkResult]:
+        return [result for result in self if result.ok]
+
+    @property
+    def failed(self) -> List[BulkResult]:
+        return [result for result in self if not result.ok]
+
+    @property
+    def ok(self) -> bool:
+        return all(result.ok for result in self)
+
+    def values(self) -> Dict[Hashable, Any]:
+        """
+        The return values of the successful operations, by key.
+
+        :return:
+        """
+        return {result.key: result.value for result in self if result.ok}
+
+    def errors(self) -> Dict[Hashable, BaseException]:
+        """
+        The exceptions of the failed operations, by key.
+
+        :return:
+        """
+        return {result.key: result.error for result in self if not result.ok}
+
+
+def _normalize(operations: Iterable[Operation]) -> List[Tuple[Hashable, Callable[[], Any]]]:
+    normalized = []
+    for index, operation in enumerate(operations):
+        if isinstance(operation, tuple):
+            key, func = operation
+        else:
+            key, func = index, operation
+        if not callable(func):
+            raise TypeError(f"Operation {key!r} is not callable: {func!r}")
+        normalized.append((key, func))
+    return normalized
+
+
+class BulkExecutor:
+    """
+    Run many independent operations, such as reviews, abandons or submits of a list of changes,
+    on a bounded pool of threads, or concurrently on the event loop of an async client.
+    Every operation runs to completion: failures are collected per item instead of stopping
+    the run.
+
+    Operations are callables without arguments, or ``(key, callable)`` pairs to name them.
+    Their requests go through the client as usual, so the rate limiter, concurrency governor,
+    retries and circuit breaker of the client apply to them. Operations run in a copy of the
+    caller's context, so their tracing spans nest under the caller's span.
+
+    .. code-block:: python
+
+        from gerrit.utils.bulk import BulkExecutor
+
+        changes = [client.changes.get(number) for number in numbers]
+        results = BulkExecutor(max_workers=8).run(
+            (change.number, change.abandon) for change in changes
+        )
+        for result in results.failed:
+            print(result.key, result.error)
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 8,
+        progress: Optional[Callable[[BulkResult, int, int], Any]] = None,
+    ) -> None:
+        """
+        :param max_workers: maximum number of operations running at once
+        :param progress: called with each result, the number of finished operations and the total
+        """
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be at least 1, got {max_workers}")
+        self.max_workers = max_workers
+        self.progress = progress
+        self._lock = threading.Lock()
+        self._done = 0
+
+    def _finished(self, result: BulkResult, total: int) -> None:
+        with self._lock:
+            self._done += 1
+            done = self._done
+        if result.ok:
+            logger.debug("Bulk operation %r done in %.3fs", result.key, result.duration)
+        else:
+            logger.warning("Bulk operation %r failed: %s", result.key, result.error)
+        if self.progress is not None:
+            try:
+                self.progress(result, done, total)
+            except Exception:  # pylint: disable=broad-except
+                logger.exception("Bulk progress callback failed")
+
+    def run(self, operations: Iterable[Operation]) -> BulkResults:
+        """
+        Run the operations on a thread pool and wait for all of them.
+
+        :param operations: callables, or (key, callable) pairs
+        :return: a result per operation, in the order of the operations
+        """
+        operations = _normalize(operations)
+        self._done = 0
+        origin = time.monotonic()
+
+        def call(index: int, key: Hashable, func: Callable[[], Any]) -> BulkResult:
+            start = time.monotonic()
+            result = BulkResult(index, key, started=start - origin)
+            try:
+                result.value = func()
+            except Exception as error:  # pylint: disable=broad-except
+                result.error = error
+            result.duration = time.monotonic() - start
+            return result
+
+        results: List[Optional[BulkResult]] = [None] * len(operations)
+        if self.max_workers == 1 or len(operations) <= 1:
+            for index, (key, func) in enumerate(operations):
+                results[index] = call(index, key, func)
+                self._finished(results[index], len(operations))
+            return BulkResults(results)
+
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(operations))) as executor:
+            futures = [
+                executor.submit(contextvars.copy_context().run, call, index, key, func)
+                for index, (key, func) in enumerate(operations)
+            ]
+            for future in as_completed(futures):
+                result = future.result()
+                results[result.index] = result
+                self._finished(result, len(operations))
+        return BulkResults(results)
+
+    async def run_async(self, operations: Iterable[Operation]) -> BulkResults:
+        """
+        Run coroutine operations, such as the methods of an AsyncGerritClient facade,
+        concurrently on the running event loop and wait for all of them.
+
+        :param operations: callables returning awaitables, or (key, callable) pairs
+        :return: a result per operation, in the order of the operations
+        """
+        operations = _normalize(operations)
+        self._done = 0
+        origin = time.monotonic()
+        semaphore = asyncio.Semaphore(self.max_workers)
+
+        async def call(index: int, key: Hashable, func: Callable[[], Any]) -> BulkResult:
+            async with semaphore:
+                start = time.monotonic()
+                result = BulkResult(index, key, started=start - origin)
+                try:
+                    result.value = await func()
+                except Exception as error:  # pylint: disable=broad-except
+                    result.error = error
+                result.duration = time.monotonic() - start
+            self._finished(result, len(operations))
+            return result
+
+        return BulkResults(
+            await asyncio.gather(*(call(index, key, func) for index, (key, func) in enumerate(operations)))
+        )
@@ -0,0 +1,334 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+# @Author: Jialiang Shi
+import copy
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+from gerrit.utils.common import endpoint_family, endpoint_segments
+
+
+class ResponseCache:
+    """
+    An in-memory cache of decoded GET responses for :class:`gerrit.GerritClient`.
+
+    Entries are keyed by endpoint, params and headers and expire after a TTL which is
+    chosen by the endpoint family (the first path segment, e.g. ``config`` or ``changes``).
+    The number of entries is bounded, the least recently used entry is evicted first.
+
+    Any POST/PUT/DELETE sent through the client invalidates the cached entries of the
+    resource it touched (e.g. everything below ``/changes/123`` for
+    ``/changes/123/revisions/1/review``) and the listings of its collection
+    (e.g. ``/changes/?q=...``). A resource cached under another identifier
+    (a change number instead of its Change-Id) is only refreshed by its TTL.
+
+    .. code-block:: python
+
+        from gerrit import GerritClient
+        from gerrit.utils.cache import ResponseCache
+
+        cache = ResponseCache(max_entries=2048, ttls={"config": 600, "changes": 0})
+        client = GerritClient(base_url="https://yourgerrit", username='******', password='xxxxx',
+                              cache=cache)
+        client.server          # fetched
+        client.server          # served from the cache
+        cache.stats            # {'hits': 1, 'misses': 1, ...}
+
+    A cache can be replaced by any object implementing ``lookup``, ``store`` and ``invalidate``.
+    """
+
+    DEFAULT_TTLS: Dict[str, float] = {
+        "config": 300.0,
+        "plugins": 300.0,
+        "access": 60.0,
+        "projects": 60.0,
+        "groups": 60.0,
+        "accounts": 60.0,
+        "changes": 10.0,
+    }
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        default_ttl: float = 30.0,
+        ttls: Optional[Dict[str, float]] = None,
+    ) -> None:
+        """
+        :param max_entries: maximum number of cached responses
+        :param default_ttl: TTL in seconds for endpoint families missing from ttls
+        :param ttls: TTL in seconds per endpoint family, merged over DEFAULT_TTLS;
+          a TTL of 0 disables caching for that family
+        """
+        if max_entries <= 0:
+            raise ValueError(f"max_entries must be positive, got {max_entries}")
+
+        self.max_entries = max_entries
+        self.default_ttl = default_ttl
+        self.ttls: Dict[str, float] = dict(self.DEFAULT_TTLS)
+        if ttls:
+            self.ttls.update(ttls)
+
+        # key -> (expires_at, path segments, value)
+        self._entries: "OrderedDict[Hashable, Tuple[float, List[str], Any]]" = OrderedDict()
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    @staticmethod
+    def make_key(
+        endpoint: str,
+        params: Optional[Any] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Hashable:
+        """
+        Build the cache key of a request.
+
+        :param endpoint: the endpoint, e.g. /changes/123
+        :param params: query params as a dict or a list of tuples
+        :param headers: request headers
+        :return:
+        """
+        if isinstance(params, dict):
+            params = params.items()
+        params_key = tuple(
+            sorted(
+                (str(k), str(item))
+                for k, v in (params or ())
+                for item in (v if isinstance(v, (list, tuple)) else [v])
+            )
+        )
+        headers_key = tuple(sorted((k.lower(), v) for k, v in (headers or {}).items()))
+        return endpoint, params_key, headers_key
+
+    def ttl_for(self, endpoint: str) -> float:
+        """
+        Return the TTL in seconds for an endpoint.
+
+        :param endpoint: the endpoint
+        :return:
+        """
+        return self.ttls.get(endpoint_family(endpoint), self.default_ttl)
+
+    def lookup(self, key: Hashable) -> Tuple[bool, Any]:
+        """
+        Look a response up.
+
+        :param key: the key built by make_key
+        :return: a (hit, value) tuple; value is a copy of the cached response
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] <= time.monotonic():
+                del self._entries[key]
+                entry = None
+
+            if entry is None:
+                self.misses += 1
+                return False, None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            value = entry[2]
+
+        return True, copy.deepcopy(value)
+
+    def store(self, key: Hashable, endpoint: str, value: Any) -> None:
+        """
+        Store a decoded response.
+
+        :param key: the key built by make_key
+        :param endpoint: the endpoint the response was fetched from
+        :param value: the decoded response
+        :return:
+        """
+        ttl = self.ttl_for(endpoint)
+        if ttl <= 0:
+            return
+
+        entry = (time.monotonic() + ttl, endpoint_segments(endpoint), copy.deepcopy(value))
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, endpoint: str) -> int:
+        """
+        Drop the entries made stale by a mutation of endpoint: every entry below its
+        resource (the first two path segments) and the listings of its collection.
+
+        :param endpoint: the endpoint which was modified
+        :return: the number of dropped entries
+        """
+        segments = endpoint_segments(endpoint)
+        if not segments:
+            return 0
+
+        resource = segments[:2]
+        with self._lock:
+            stale = [
+                key
+                for key, (_, entry_segments, _) in self._entries.items()
+                if entry_segments[: len(resource)] == resource
+                or entry_segments == segments[:1]
+            ]
+            for key in stale:
+                del self._entries[key]
+            self.invalidations += len(stale)
+
+        return len(stale)
+
+    def clear(self) -> None:
+        """
+        Drop all entries.
+
+        :return:
+        """
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """
+        Hit/miss statistics of the cache.
+
+        :return:
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+                "size": len(self._entries),
+                "max_entries": self.max_entries,
+            }
+
+
+class ETagCache:
+    """
+    A store of ETags and the decoded bodies they belong to, used by
+    :class:`gerrit.GerritClient` to send conditional GET requests.
+
+    When an entry exists for a request, ``If-None-Match`` is sent with the stored ETag;
+    a ``304 Not Modified`` answer is then served from the stored decoded body, so the
+    body is neither downloaded nor parsed again. Gerrit sends ETags for e.g. change
+    detail and revision actions.
+
+    .. code-block:: python
+
+        from gerrit import GerritClient
+        from gerrit.utils.cache import ETagCache
+
+        client = GerritClient(base_url="https://yourgerrit", username='******', password='xxxxx',
+                              etag_cache=ETagCache())
+        change = client.changes.get('myProject~stable~I10394472cbd17dd12454f229e4f6de00b143a444')
+        change.get_detail()   # downloaded, ETag stored
+        change.get_detail()   # 304 Not Modified, served from the stored body
+    """
+
+    def __init__(self, max_entries: int = 1024) -> None:
+        """
+        :param max_entries: maximum number of stored ETags
+        """
+        if max_entries <= 0:
+            raise ValueError(f"max_entries must be positive, got {max_entries}")
+
+        self.max_entries = max_entries
+        # key -> (etag, value)
+        self._entries: "OrderedDict[Hashable, Tuple[str, Any]]" = OrderedDict()
+        self._lock = threading.RLock()
+        self.not_modified = 0
+        self.modified = 0
+
+    make_key = staticmethod(ResponseCache.make_key)
+
+    def lookup(self, key: Hashable) -> Optional[str]:
+        """
+        Return the stored ETag of a request.
+
+        :param key: the key built by make_key
+        :return: the ETag, or None
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def not_modified_value(self, key: Hashable) -> Tuple[bool, Any]:
+        """
+        Return the stored body of a request answered with 304 Not Modified.
+
+        :param key: the key built by make_key
+        :return: a (found, value) tuple; value is a copy of the stored body
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return False, None
+            self.not_modified += 1
+            value = entry[1]
+
+        return True, copy.deepcopy(value)
+
+    def store(self, key: Hashable, etag: Optional[str], value: Any) -> None:
+        """
+        Store the ETag and decoded body of a response, or drop the stale entry
+        if the response has no ETag.
+
+        :param key: the key built by make_key
+        :param etag: the ETag response header
+        :param value: the decoded response
+        :return:
+        """
+        with self._lock:
+            if key in self._entries:
+                self.modified += 1
+
+            if not etag:
+                self._entries.pop(key, None)
+                return
+
+            self._entries[key] = (etag, copy.deepcopy(value))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """
+        Drop all entries.
+
+        :return:
+        """
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """
+        Revalidation statistics: responses served from the store (not_modified)
+        and stored entries which had changed on the server (modified).
+
+        :return:
+        """
+        with self._lock:
+            return {
+                "not_modified": self.not_modified,
+                "modified": self.modified,
+                "size": len(self._entries),
+                "max_entries": self.max_entries,
+            }
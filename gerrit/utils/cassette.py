@@ -0,0 +1,420 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+# @Author: Jialiang Shi
+import base64
+import datetime
+import gzip
+import hashlib
+import io
+import json
+import threading
+import time
+import urllib.parse as urlparse
+from typing import Any, Callable, Dict, IO, List, Optional, Tuple, Union
+import requests
+from requests.structures import CaseInsensitiveDict
+from gerrit.utils.exceptions import UnrecordedRequestError
+from gerrit.utils.requester import Requester
+
+CASSETTE_VERSION = 1
+
+# response headers worth replaying, the others are transport details or secrets
+RECORDED_HEADERS = (
+    "Content-Type",
+    "Content-Disposition",
+    "ETag",
+    "Retry-After",
+    "X-FYI-Content-Encoding",
+    "X-FYI-Content-Type",
+)
+
+
+def _open(path: str, mode: str) -> IO[str]:
+    if path.endswith(".gz"):
+        return gzip.open(path, mode + "t", encoding="utf-8")  # type: ignore[return-value]
+    return open(path, mode, encoding="utf-8")  # pylint: disable=consider-using-with
+
+
+def request_key(method: str, url: str) -> str:
+    """
+    The key requests are matched on: the method and the path with its query parameters
+    sorted, so the scheme, host and parameter order do not matter.
+
+    :param method: the HTTP method
+    :param url: the url, with its query string
+    :return:
+    """
+    split = urlparse.urlsplit(url)
+    query = urlparse.urlencode(sorted(urlparse.parse_qsl(split.query, keep_blank_values=True)))
+    return f"{method.upper()} {split.path}" + (f"?{query}" if query else "")
+
+
+def body_digest(body: Any) -> Optional[str]:
+    """
+    A digest of a request body, recorded instead of the body which may hold secrets.
+
+    :param body: the body, bytes, text or None
+    :return:
+    """
+    if not body:
+        return None
+    if isinstance(body, str):
+        body = body.encode("utf-8")
+    if not isinstance(body, bytes):
+        return None
+    return hashlib.sha1(body).hexdigest()  # nosec
+
+
+class Cassette:
+    """
+    Recorded request/response pairs, stored as JSON lines, gzip-compressed if the file
+    name ends with .gz. Request bodies are stored as digests and only the headers in
+    RECORDED_HEADERS are kept, but response bodies are stored as they are.
+    """
+
+    def __init__(self, interactions: Optional[List[Dict[str, Any]]] = None) -> None:
+        """
+        :param interactions: the recorded interactions
+        """
+        self.interactions: List[Dict[str, Any]] = list(interactions or [])
+        self._lock = threading.Lock()
+        self._index: Optional[Dict[str, List[Dict[str, Any]]]] = None
+        self._played: Dict[int, bool] = {}
+
+    @classmethod
+    def load(cls, path: str) -> "Cassette":
+        """
+        Read a cassette file.
+
+        :param path: the path
+        :return:
+        """
+        with _open(path, "r") as f:
+            lines = [json.loads(line) for line in f if line.strip()]
+        if lines and lines[0].get("version") not in (None, CASSETTE_VERSION):
+            raise ValueError(f"Unsupported cassette version {lines[0].get('version')}")
+        return cls([line for line in lines if "key" in line])
+
+    def save(self, path: str) -> None:
+        """
+        Write the cassette to a file.
+
+        :param path: the path, compressed if it ends with .gz
+        :return:
+        """
+        with self._lock:
+            interactions = list(self.interactions)
+        with _open(path, "w") as f:
+            f.write(json.dumps({"version": CASSETTE_VERSION}) + "\n")
+            for interaction in interactions:
+                f.write(json.dumps(interaction, separators=(",", ":")) + "\n")
+
+    def record(self, method: str, response: requests.Response, body: Any = None) -> None:
+        """
+        Record a response and the request it answers.
+
+        :param method: the HTTP method
+        :param response: the response, its content is read
+        :param body: the request body
+        :return:
+        """
+        content = response.content or b""
+        try:
+            text, encoding = content.decode("utf-8"), None
+        except UnicodeDecodeError:
+            text, encoding = base64.b64encode(content).decode("ascii"), "base64"
+        interaction = {
+            "key": request_key(method, response.url),
+            "body": body_digest(body),
+            "status": response.status_code,
+            "reason": response.reason,
+            "headers": {
+                name: response.headers[name] for name in RECORDED_HEADERS if name in response.headers
+            },
+            "content": text,
+            "elapsed": response.elapsed.total_seconds() if response.elapsed else 0.0,
+        }
+        if encoding:
+            interaction["encoding"] = encoding
+        with self._lock:
+            self.interactions.append(interaction)
+            self._index = None
+
+    def match(self, method: str, url: str, body: Any = None,
+              allow_repeats: bool = True) -> Tuple[Optional[Dict[str, Any]], bool]:
+        """
+        Find the interaction answering a request: the first one not played yet with the
+        same key, preferring one with the same body, else the last one played.
+
+        :param method: the HTTP method
+        :param url: the url
+        :param body: the request body
+        :param allow_repeats: replay the last played interaction when all were played
+        :return: the interaction or None, and whether it was played before
+        """
+        key, digest = request_key(method, url), body_digest(body)
+        with self._lock:
+            if self._index is None:
+                self._index = {}
+                for interaction in self.interactions:
+                    self._index.setdefault(interaction["key"], []).append(interaction)
+            candidates = self._index.get(key, [])
+            unplayed = [i for i in candidates if not self._played.get(id(i))]
+            chosen = next((i for i in unplayed if i["body"] == digest), None)
+            if chosen is None and unplayed:
+                chosen = unplayed[0]
+            if chosen is not None:
+                self._played[id(chosen)] = True
+                return chosen, False
+            if allow_repeats and candidates:
+                return candidates[-1], True
+            return None, False
+
+    def rewind(self) -> None:
+        """
+        Make every interaction playable again.
+
+        :return:
+        """
+        with self._lock:
+            self._played.clear()
+
+
+def build_response(interaction: Dict[str, Any], method: str, url: str, body: Any = None) -> requests.Response:
+    """
+    Rebuild a requests Response from a recorded interaction.
+
+    :param interaction: the interaction
+    :param method: the HTTP method of the request
+    :param url: the url of the request
+    :param body: the request body
+    :return:
+    """
+    if interaction.get("encoding") == "base64":
+        content = base64.b64decode(interaction["content"])
+    else:
+        content = interaction["content"].encode("utf-8")
+
+    response = requests.Response()
+    response.status_code = interaction["status"]
+    response.reason = interaction.get("reason") or ""
+    response.headers = CaseInsensitiveDict(interaction.get("headers") or {})
+    response.headers["Content-Length"] = str(len(content))
+    response.url = url
+    response.raw = io.BytesIO(content)
+    response.elapsed = datetime.timedelta(seconds=interaction.get("elapsed") or 0.0)
+    content_type = response.headers.get("Content-Type", "")
+    if "charset=" in content_type:
+        response.encoding = content_type.split("charset=")[-1].split(";")[0].strip()
+    response.request = requests.Request(method.upper(), url).prepare()
+    response.request.body = body
+    return response
+
+
+def _prepared_url(url: str, params: Any) -> str:
+    return requests.Request("GET", url, params=params).prepare().url or url
+
+
+def _request_body(kwargs: Dict[str, Any]) -> Any:
+    if kwargs.get("json") is not None:
+        return json.dumps(kwargs["json"]).encode("utf-8")
+    return kwargs.get("data")
+
+
+class _RecordingSession:
+    def __init__(self, session: Any, cassette: Cassette) -> None:
+        self._session = session
+        self._cassette = cassette
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._session, name)
+
+    def _send(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        response = getattr(self._session, method)(url, **kwargs)
+        body = response.request.body if response.request is not None else _request_body(kwargs)
+        self._cassette.record(method, response, body)
+        return response
+
+    def get(self, url: str, **kwargs: Any) -> requests.Response:
+        return self._send("get", url, **kwargs)
+
+    def post(self, url: str, **kwargs: Any) -> requests.Response:
+        return self._send("post", url, **kwargs)
+
+    def put(self, url: str, **kwargs: Any) -> requests.Response:
+        return self._send("put", url, **kwargs)
+
+    def delete(self, url: str, **kwargs: Any) -> requests.Response:
+        return self._send("delete", url, **kwargs)
+
+
+class RecordingRequester(Requester):
+    """
+    A Requester which sends requests as usual and records every attempt, i.e. the real
+    request/response pairs, to a cassette replayed by :class:`ReplayRequester`.
+    Recorded response bodies are stored as they are, so mind what the cassette is shared with.
+
+    .. code-block:: python
+
+        import functools
+        from gerrit import GerritClient
+        from gerrit.utils.cassette import RecordingRequester
+
+        client = GerritClient(base_url="https://yourgerrit", username='******', password='xxxxx',
+                              requester_class=functools.partial(RecordingRequester, "trace.jsonl.gz"))
+        client.changes.search("is:open")
+        client.requester.save()
+    """
+
+    def __init__(self, cassette: Union[str, Cassette], **kwargs: Any) -> None:
+        """
+        :param cassette: the path the cassette is saved to, or a Cassette
+        :param kwargs: the keyword arguments of Requester
+        """
+        super().__init__(**kwargs)
+        self.path = cassette if isinstance(cassette, str) else None
+        self.cassette = cassette if isinstance(cassette, Cassette) else Cassette()
+        self.session = _RecordingSession(self.session or requests.Session(), self.cassette)
+
+    def save(self, path: Optional[str] = None) -> None:
+        """
+        Write the cassette.
+
+        :param path: the path, defaults to the one given when the requester was created
+        :return:
+        """
+        path = path or self.path
+        if path is None:
+            raise ValueError("No cassette path given")
+        self.cassette.save(path)
+
+
+class _ReplaySession:
+    def __init__(self, requester: "ReplayRequester") -> None:
+        self._requester = requester
+
+    def _send(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        return self._requester.play(method, _prepared_url(url, kwargs.get("params")), _request_body(kwargs))
+
+    def get(self, url: str, **kwargs: Any) -> requests.Response:
+        return self._send("get", url, **kwargs)
+
+    def post(self, url: str, **kwargs: Any) -> requests.Response:
+        return self._send("post", url, **kwargs)
+
+    def put(self, url: str, **kwargs: Any) -> requests.Response:
+        return self._send("put", url, **kwargs)
+
+    def delete(self, url: str, **kwargs: Any) -> requests.Response:
+        return self._send("delete", url, **kwargs)
+
+
+class ReplayRequester(Requester):
+    """
+    A Requester which answers requests from a cassette recorded by :class:`RecordingRequester`,
+    without touching the network. Retries, rate limits, caches, metrics and tracing work
+    as they do live, so request counts, bytes and CPU time of two client versions can be
+    compared on the same traffic.
+
+    Each request is answered by the first unplayed recording with the same method, path and
+    query, preferring the same body; once all were played the last one is repeated.
+    A request never recorded raises UnrecordedRequestError.
+
+    Latency is simulated with ``latency`` seconds per request, or the recorded durations with
+    ``realtime=True``, plus the transfer time of the body at ``bandwidth`` bytes per second.
+
+    .. code-block:: python
+
+        import functools
+        from gerrit import GerritClient
+        from gerrit.utils.cassette import ReplayRequester
+
+        client = GerritClient(base_url="https://yourgerrit", username='******', password='xxxxx',
+                              requester_class=functools.partial(ReplayRequester, "trace.jsonl.gz",
+                                                                latency=0.02, bandwidth=10e6))
+        client.changes.search("is:open")
+        print(client.requester.stats)
+    """
+
+    def __init__(
+        self,
+        cassette: Union[str, Cassette],
+        latency: float = 0.0,
+        bandwidth: Optional[float] = None,
+        realtime: bool = False,
+        allow_repeats: bool = True,
+        sleep: Callable[[float], Any] = time.sleep,
+        **kwargs: Any,
+    ) -> None:
+        """
+        :param cassette: the path of a cassette, or a Cassette
+        :param latency: seconds added to every response
+        :param bandwidth: bytes per second the response bodies are delivered at, unlimited if None
+        :param realtime: wait for the recorded duration of every response instead of latency
+        :param allow_repeats: repeat the last recording of a request once all were played
+        :param sleep: the sleep function
+        :param kwargs: the keyword arguments of Requester
+        """
+        super().__init__(**kwargs)
+        if bandwidth is not None and bandwidth <= 0:
+            raise ValueError(f"bandwidth must be positive, got {bandwidth}")
+        self.cassette = cassette if isinstance(cassette, Cassette) else Cassette.load(cassette)
+        self.latency = latency
+        self.bandwidth = bandwidth
+        self.realtime = realtime
+        self.allow_repeats = allow_repeats
+        self.sleep = sleep
+        self.session = _ReplaySession(self)  # type: ignore[assignment]
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.repeats = 0
+        self.misses = 0
+        self.bytes = 0
+        self.delay = 0.0
+
+    def play(self, method: str, url: str, body: Any = None) -> requests.Response:
+        """
+        Answer a request from the cassette.
+
+        :param method: the HTTP method
+        :param url: the url, with its query string
+        :param body: the request body
+        :return:
+        :raises: UnrecordedRequestError if the request was never recorded
+        """
+        interaction, repeated = self.cassette.match(method, url, body, self.allow_repeats)
+        if interaction is None:
+            with self._lock:
+                self.misses += 1
+            raise UnrecordedRequestError(f"No recording for {request_key(method, url)}")
+
+        response = build_response(interaction, method, url, body)
+        size = int(response.headers["Content-Length"])
+        delay = interaction.get("elapsed", 0.0) if self.realtime else self.latency
+        if self.bandwidth:
+            delay += size / self.bandwidth
+        with self._lock:
+            self.requests += 1
+            self.repeats += int(repeated)
+            self.bytes += size
+            self.delay += delay
+        if delay > 0:
+            self.sleep(delay)
+        return response
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """
+        Requests answered, of which repeated, requests never recorded, response bytes
+        and injected delay in seconds.
+
+        :return:
+        """
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "repeats": self.repeats,
+                "misses": self.misses,
+                "bytes": self.bytes,
+                "delay": self.delay,
+            }
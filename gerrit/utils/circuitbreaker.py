@@ -0,0 +1,192 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+# @Author: Jialiang Shi
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, FrozenSet, Hashable, Optional
+from gerrit.utils.exceptions import CircuitOpenError
+
+logger = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half-open"
+
+
+class _Circuit:
+    def __init__(self) -> None:
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.trips = 0
+        self.rejected = 0
+
+
+class CircuitBreaker:
+    """
+    Fails requests fast while a Gerrit server is down, instead of letting every caller
+    wait for its connection or timeout error.
+
+    A circuit is kept per host, or per host and endpoint family with ``per_family=True``
+    (e.g. to isolate ``changes`` queries while the index is rebuilding):
+
+    * closed: requests are sent; ``failure_threshold`` consecutive failures open it.
+    * open: requests raise :class:`gerrit.utils.exceptions.CircuitOpenError` right away.
+    * half-open: every ``recovery_timeout`` seconds one request is let through as a probe,
+      while the others keep failing fast. A successful probe closes the circuit,
+      a failed one opens it for another ``recovery_timeout``.
+
+    Failures are connection errors, timeouts and the statuses in ``failure_statuses``;
+    any other response, including 4xx, shows the server is up.
+
+    .. code-block:: python
+
+        from gerrit import GerritClient
+        from gerrit.utils.circuitbreaker import CircuitBreaker
+
+        client = GerritClient(base_url="https://yourgerrit", username='******', password='xxxxx',
+                              circuit_breaker=CircuitBreaker(failure_threshold=5, recovery_timeout=30))
+    """
+
+    FAILURE_STATUSES: FrozenSet[int] = frozenset({502, 503, 504})
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+        per_family: bool = False,
+        failure_statuses: Optional[FrozenSet[int]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        :param failure_threshold: consecutive failures which open a circuit
+        :param recovery_timeout: seconds a circuit stays open before a probe is let through
+        :param per_family: keep a circuit per host and endpoint family instead of per host
+        :param failure_statuses: statuses counted as failures, defaults to FAILURE_STATUSES
+        :param clock: a monotonic clock
+        """
+        if failure_threshold <= 0:
+            raise ValueError(f"failure_threshold must be positive, got {failure_threshold}")
+
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.per_family = per_family
+        self.failure_statuses = frozenset(
+            self.FAILURE_STATUSES if failure_statuses is None else failure_statuses
+        )
+        self.clock = clock
+        self._circuits: Dict[Hashable, _Circuit] = {}
+        self._lock = threading.Lock()
+
+    def key_for(self, host: str, family: str) -> Hashable:
+        """
+        Return the circuit key of a request.
+
+        :param host: the host, e.g. review.example.com
+        :param family: the endpoint family, e.g. changes
+        :return:
+        """
+        return (host, family) if self.per_family else host
+
+    def state(self, key: Hashable) -> str:
+        """
+        Return the state of a circuit: closed, open or half-open.
+
+        :param key: the key built by key_for
+        :return:
+        """
+        with self._lock:
+            circuit = self._circuits.get(key)
+            return circuit.state if circuit is not None else CLOSED
+
+    def before(self, key: Hashable) -> None:
+        """
+        Check a request may be sent, called before sending it.
+
+        :param key: the key built by key_for
+        :return:
+        :raises: CircuitOpenError if the circuit is open
+        """
+        with self._lock:
+            circuit = self._circuits.setdefault(key, _Circuit())
+            if circuit.state == CLOSED:
+                return
+
+            now = self.clock()
+            elapsed = now - circuit.opened_at
+            if elapsed >= self.recovery_timeout:
+                # open long enough, or the previous probe never reported back
+                circuit.state = HALF_OPEN
+                circuit.opened_at = now
+                logger.info("Circuit %s half-open, sending a probe request", key)
+                return
+
+            circuit.rejected += 1
+            state = circuit.state
+        raise CircuitOpenError(
+            f"Circuit {key} is {state}, retry in {self.recovery_timeout - elapsed:.1f}s"
+        )
+
+    def is_failure(self, status: Optional[int]) -> bool:
+        """
+        Classify the outcome of a request.
+
+        :param status: the status code, None if the request failed without a response
+        :return:
+        """
+        return status is None or status in self.failure_statuses
+
+    def record(self, key: Hashable, status: Optional[int]) -> None:
+        """
+        Record the outcome of a request, called after it was sent.
+
+        :param key: the key built by key_for
+        :param status: the status code, None if the request failed without a response
+        :return:
+        """
+        with self._lock:
+            circuit = self._circuits.setdefault(key, _Circuit())
+            if not self.is_failure(status):
+                if circuit.state != CLOSED:
+                    logger.info("Circuit %s closed", key)
+                circuit.state = CLOSED
+                circuit.failures = 0
+                return
+
+            circuit.failures += 1
+            if circuit.state == HALF_OPEN or circuit.failures >= self.failure_threshold:
+                if circuit.state == CLOSED:
+                    circuit.trips += 1
+                    logger.warning(
+                        "Circuit %s opened after %d failures", key, circuit.failures
+                    )
+                circuit.state = OPEN
+                circuit.opened_at = self.clock()
+
+    def reset(self) -> None:
+        """
+        Close all circuits.
+
+        :return:
+        """
+        with self._lock:
+            self._circuits.clear()
+
+    @property
+    def stats(self) -> Dict[Any, Dict[str, Any]]:
+        """
+        State, consecutive failures, trips and rejected requests per circuit.
+
+        :return:
+        """
+        with self._lock:
+            return {
+                key: {
+                    "state": circuit.state,
+                    "failures": circuit.failures,
+                    "trips": circuit.trips,
+                    "rejected": circuit.rejected,
+                }
+                for key, circuit in self._circuits.items()
+            }
@@ -1,8 +1,19 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 # @Author: Jialiang Shi
+import codecs
 import json
-from typing import Any, Dict, Optional, Tuple
+import urllib.parse as urlparse
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+MAGIC_JSON_PREFIX = b")]}'"
+_WHITESPACE = b" \t\n\r"
+_UTF8_ENCODINGS = {"utf-8", "utf8", "utf_8"}
 
 
 def strip_trailing_slash(url: str) -> str:
@@ -16,33 +27,201 @@ def strip_trailing_slash(url: str) -> str:
     return url
 
 
+def endpoint_segments(endpoint: str) -> List[str]:
+    """
+    split the path of an endpoint (or url) into its segments,
+    the authentication prefix ``/a`` is dropped
+    :param endpoint: endpoint, e.g. /changes/123/revisions/current
+    :return: the segments, e.g. ['changes', '123', 'revisions', 'current']
+    """
+    path = urlparse.urlsplit(endpoint).path
+    segments = [segment for segment in path.split("/") if segment]
+    if segments and segments[0] == "a":
+        segments = segments[1:]
+    return segments
+
+
+def endpoint_family(endpoint: str) -> str:
+    """
+    return the family of an endpoint, i.e. its top level REST collection
+    :param endpoint: endpoint, e.g. /changes/123/revisions/current
+    :return: the family, e.g. changes
+    """
+    segments = endpoint_segments(endpoint)
+    return segments[0] if segments else ""
+
+
+def media_type(response: Any) -> str:
+    """
+    return the media type of a response, without parameters and lowercased
+    :param response: the response
+    :return: the media type, e.g. application/json
+    """
+    return response.headers.get("content-type", "").split(";")[0].strip().lower()
+
+
+def loads_json(data: Any) -> Any:
+    """
+    Decode a JSON document with orjson if it is installed, else with the json module.
+    :param data: UTF-8 encoded bytes, a memoryview or a str
+    :return:
+    """
+    if orjson is not None:
+        return orjson.loads(data)  # pylint: disable=no-member
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    return json.loads(data)
+
+
 def decode_response(response: Any) -> Any:
     """Strip off Gerrit's magic prefix and decode a response.
+    JSON bodies are decoded straight from the response bytes, the magic prefix and
+    whitespace are skipped through a memoryview instead of copying the body to text.
     :returns:
         Decoded JSON content as a dict, or raw text if content could not be
         decoded as JSON.
     :raises:
         requests.HTTPError if the response contains an HTTP error status code.
     """
-    magic_json_prefix = ")]}'\n"
-    content_type = response.headers.get("content-type", "")
+    content = response.content or b""
+    encoding = response.encoding or "utf-8"
+
+    if media_type(response) != "application/json":
+        return content.strip().decode(encoding)
+
+    view = memoryview(content)
+    start, end = 0, len(view)
+    while start < end and view[start] in _WHITESPACE:
+        start += 1
+    if start == end:
+        return ""
+    if view[start:start + len(MAGIC_JSON_PREFIX)] == MAGIC_JSON_PREFIX:
+        start += len(MAGIC_JSON_PREFIX)
 
-    content = response.content.strip()
-    if response.encoding:
-        content = content.decode(response.encoding)
+    if encoding.lower() not in _UTF8_ENCODINGS:
+        # the JSON decoders only read UTF-8 bytes, other charsets are decoded first
+        body = view[start:].tobytes().decode(encoding)
     else:
-        content = content.decode("utf-8")
-    if not content:
-        return content
-    if content_type.split(";")[0] != "application/json":
-        return content
-    if content.startswith(magic_json_prefix):
-        index = len(magic_json_prefix)
-        content = content[index:]
+        body = view[start:]
     try:
-        return json.loads(content)
+        return loads_json(body)
     except ValueError:
-        raise ValueError(f"Invalid json content: {content}")
+        text = bytes(view[start:]).decode(encoding, errors="replace").strip()
+        raise ValueError(f"Invalid json content: {text}")
+
+
+class _TextStream:
+    """
+    The decoded text of a streamed response, read chunk by chunk into a buffer;
+    the text before ``pos`` was consumed and is dropped on the next read.
+    """
+
+    def __init__(self, response: Any, chunk_size: int) -> None:
+        self.chunks = response.iter_content(chunk_size=chunk_size)
+        self.text_decoder = codecs.getincrementaldecoder(response.encoding or "utf-8")()
+        self.buffer, self.pos, self.finished = "", 0, False
+
+    def fill(self) -> bool:
+        # append the next chunk to the buffer, drop what was consumed already
+        if self.finished:
+            return False
+        chunk = next(self.chunks, None)
+        if chunk is None:
+            self.finished = True
+            self.buffer = self.buffer[self.pos:] + self.text_decoder.decode(b"", final=True)
+        else:
+            self.buffer = self.buffer[self.pos:] + self.text_decoder.decode(chunk)
+        self.pos = 0
+        return True
+
+    def rest(self) -> str:
+        # read to the end, return the text not consumed yet
+        while self.fill():
+            pass
+        return self.buffer[self.pos:]
+
+    def skip_whitespace(self) -> bool:
+        # advance to the next non-whitespace character, False at the end of the body
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos].isspace():
+                self.pos += 1
+            if self.pos < len(self.buffer):
+                return True
+            if not self.fill():
+                return False
+
+    def next_char(self) -> str:
+        # the next non-whitespace character, the end of an array must not be reached
+        if not self.skip_whitespace():
+            raise ValueError("Invalid json content: unterminated array")
+        return self.buffer[self.pos]
+
+    def decode(self, decoder: json.JSONDecoder) -> Any:
+        # an element is complete once it decodes and is followed by more input;
+        # a partial element is retried only after the pending text has doubled
+        wanted = 0
+        while True:
+            pending = len(self.buffer) - self.pos
+            if pending >= wanted or self.finished:
+                try:
+                    item, end = decoder.raw_decode(self.buffer, self.pos)
+                    if end < len(self.buffer) or self.finished:
+                        self.pos = end
+                        return item
+                except ValueError:
+                    if self.finished:
+                        raise ValueError(f"Invalid json content: {self.buffer[self.pos:self.pos + 100]}")
+                wanted = 2 * pending
+            self.fill()
+
+
+def iter_decode_response(response: Any, chunk_size: int = 64 * 1024) -> Iterator[Any]:
+    """Decode a JSON array response incrementally, yielding its elements one at a time.
+    The body is consumed with ``response.iter_content``, so paired with a
+    ``stream=True`` request only the element being decoded is kept in memory.
+    A response which is not a JSON array is decoded completely and yielded once.
+
+    :param response: the response, preferably requested with stream=True
+    :param chunk_size: number of bytes read at a time
+    :return:
+    """
+    magic_json_prefix = ")]}'"
+    stream = _TextStream(response, chunk_size)
+
+    if media_type(response) != "application/json":
+        yield stream.rest().strip()
+        return
+
+    if not stream.skip_whitespace():
+        return
+    while len(stream.buffer) - stream.pos < len(magic_json_prefix) and stream.fill():
+        pass
+    if stream.buffer.startswith(magic_json_prefix, stream.pos):
+        stream.pos += len(magic_json_prefix)
+        if not stream.skip_whitespace():
+            return
+
+    if stream.buffer[stream.pos] != "[":
+        text = stream.rest()
+        try:
+            yield loads_json(text)
+        except ValueError:
+            raise ValueError(f"Invalid json content: {text}")
+        return
+
+    stream.pos += 1
+    decoder = json.JSONDecoder()
+    if stream.next_char() == "]":
+        return
+    while True:
+        yield stream.decode(decoder)
+        char = stream.next_char()
+        if char == "]":
+            return
+        if char != ",":
+            raise ValueError(f"Invalid json content: {stream.buffer[stream.pos:stream.pos + 100]}")
+        stream.pos += 1
+        stream.next_char()
 
 
 def params_creator(
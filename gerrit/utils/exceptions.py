@@ -23,6 +23,19 @@ class ServerError(GerritAPIException):
     """
 
 
+class CircuitOpenError(GerritAPIException):
+    """
+    The circuit breaker of the server (or endpoint family) is open, the request failed fast
+    without being sent
+    """
+
+
+class UnrecordedRequestError(GerritAPIException):
+    """
+    A request replayed from a cassette was never recorded
+    """
+
+
 class UnauthorizedError(GerritAPIException):
     """
     401 Unauthorized
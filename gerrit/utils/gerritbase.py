@@ -2,10 +2,13 @@
 # -*- coding:utf-8 -*-
 # @Author: Jialiang Shi
 import logging
-from typing import Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, List, Sequence, TypeVar
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T", bound="GerritBase")
+
 
 class GerritBase:
     """
@@ -13,12 +16,21 @@ class GerritBase:
     inherited from
     """
 
-    def __init__(self, pull: bool = True) -> None:
+    def __init__(self, pull: bool = True, data: Any = None, lazy: bool = False) -> None:
         """
         Initialize and populate this resource object from the Gerrit API.
+
+        :param pull: fetch the resource from the Gerrit API immediately
+        :param data: an already fetched payload of this resource, used instead of fetching it
+        :param lazy: defer fetching until an attribute that is not set yet is accessed
         """
         self._data: Any = None
-        if pull:
+        self._lazy = False
+        if data is not None:
+            self._populate(data)
+        elif lazy:
+            self._lazy = True
+        elif pull:
             self.poll()
 
     def __repr__(self) -> str:
@@ -27,8 +39,24 @@ class GerritBase:
     def __str__(self) -> str:
         raise NotImplementedError
 
+    def __getattr__(self, name: str) -> Any:
+        # Only called when normal attribute lookup fails, i.e. for fields of a
+        # lazy object that have not been fetched yet.
+        if name.startswith("__") or not self.__dict__.get("_lazy"):
+            raise AttributeError(
+                f"{self.__class__.__name__!r} object has no attribute {name!r}"
+            )
+        self.poll()
+        return getattr(self, name)
+
     def poll(self) -> None:
-        data = self._poll()
+        self._lazy = False
+        self._populate(self._poll())
+
+    def _populate(self, data: Any) -> None:
+        if isinstance(data, list) and data:
+            data = data[0]
+
         self._data = data
 
         if isinstance(self._data, dict):
@@ -52,6 +80,8 @@ class GerritBase:
         """
         Print out all the data in this object for debugging.
         """
+        if self._lazy:
+            self.poll()
         return self._data
 
     def __eq__(self, other: object) -> bool:
@@ -65,3 +95,30 @@ class GerritBase:
 
     def __hash__(self) -> int:
         return hash(self.endpoint)  # pylint: disable=no-member
+
+
+def poll_all(objects: Sequence[T], max_workers: int = 8) -> List[T]:
+    """
+    Re-fetch a list of resource objects concurrently, e.g. to get the full detail
+    of objects that were built from the entries of a list endpoint.
+
+    .. code-block:: python
+
+        members = group.members.list(refresh=True)
+        # or
+        groups = poll_all(account.groups, max_workers=16)
+
+    :param objects: resource objects to refresh
+    :param max_workers: maximum number of requests in flight
+    :return: the same objects, refreshed in place
+    """
+    objects = list(objects)
+    if len(objects) <= 1 or max_workers <= 1:
+        for obj in objects:
+            obj.poll()
+        return objects
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(objects))) as executor:
+        # list() re-raises the first exception of a failed poll
+        list(executor.map(lambda obj: obj.poll(), objects))
+    return objects
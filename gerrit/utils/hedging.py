@@ -0,0 +1,217 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+# @Author: Jialiang Shi
+import contextvars
+import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class HedgingPolicy:
+    """
+    Hedged GET requests for :class:`gerrit.utils.requester.Requester`: when a GET has not
+    answered after the ``percentile`` latency of its endpoint family, a duplicate is sent
+    and whichever response arrives first is used.
+
+    The request is sent from a thread of its own, so hedging never limits the number of
+    GETs in flight and the delay is not stretched by queueing; only the duplicate is sent
+    from a thread pool. The duplicate uses another pooled connection, and another replica
+    when replicas are configured. The losing request cannot be interrupted in flight; its
+    response is closed as soon as it arrives. Hedging is capped by ``budget``: every
+    request earns that fraction of a hedge, so at most about ``budget`` of all requests
+    are sent twice.
+
+    .. code-block:: python
+
+        from gerrit import GerritClient
+        from gerrit.utils.hedging import HedgingPolicy
+
+        client = GerritClient(base_url="https://yourgerrit", username='******', password='xxxxx',
+                              hedging=HedgingPolicy(percentile=95, budget=0.05))
+    """
+
+    def __init__(
+        self,
+        percentile: float = 95.0,
+        budget: float = 0.05,
+        min_samples: int = 20,
+        window: int = 500,
+        min_delay: float = 0.01,
+        max_burst: float = 10.0,
+        max_workers: int = 16,
+    ) -> None:
+        """
+        :param percentile: the latency percentile after which a duplicate is sent
+        :param budget: the fraction of requests which may be hedged
+        :param min_samples: latencies needed per endpoint family before hedging starts
+        :param window: number of recent latencies kept per endpoint family
+        :param min_delay: the minimum delay before a duplicate is sent, in seconds
+        :param max_burst: the maximum number of hedges saved up for a burst
+        :param max_workers: the size of the thread pool sending the duplicates
+        """
+        if not 0 < percentile < 100:
+            raise ValueError(f"percentile must be between 0 and 100, got {percentile}")
+        if not 0 <= budget <= 1:
+            raise ValueError(f"budget must be between 0 and 1, got {budget}")
+
+        self.percentile = percentile
+        self.budget = budget
+        self.min_samples = min_samples
+        self.window = window
+        self.min_delay = min_delay
+        self.max_burst = max_burst
+        self.max_workers = max_workers
+
+        self._samples: Dict[str, Deque[float]] = {}
+        self._tokens = 0.0
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self.requests = 0
+        self.hedged = 0
+        self.hedge_wins = 0
+
+    def record(self, key: str, latency: float) -> None:
+        """
+        Record the latency of a request.
+
+        :param key: the endpoint family
+        :param latency: the latency in seconds
+        :return:
+        """
+        with self._lock:
+            samples = self._samples.get(key)
+            if samples is None:
+                samples = self._samples[key] = deque(maxlen=self.window)
+            samples.append(latency)
+
+    def threshold(self, key: str) -> Optional[float]:
+        """
+        The delay after which a request of an endpoint family is hedged.
+
+        :param key: the endpoint family
+        :return: the delay in seconds, or None while too few latencies are known
+        """
+        with self._lock:
+            samples = sorted(self._samples.get(key, ()))
+        if len(samples) < self.min_samples:
+            return None
+        index = min(len(samples) - 1, int(len(samples) * self.percentile / 100))
+        return max(self.min_delay, samples[index])
+
+    def _take_token(self) -> bool:
+        with self._lock:
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            self.hedged += 1
+            return True
+
+    def _pool(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="gerrit-hedge"
+                )
+            return self._executor
+
+    def _timed(self, key: str, send: Callable[[], Any]) -> Any:
+        start = time.monotonic()
+        response = send()
+        self.record(key, time.monotonic() - start)
+        return response
+
+    @staticmethod
+    def _discard(future: "Future[Any]") -> None:
+        if not future.cancelled() and future.exception() is None:
+            future.result().close()
+
+    def _start(self, key: str, send: Callable[[], Any]) -> "Future[Any]":
+        # a thread per request instead of the pool, so requests never wait for a worker
+        future: "Future[Any]" = Future()
+        context = contextvars.copy_context()
+
+        def run() -> None:
+            # like ThreadPoolExecutor, every error is handed over to the caller
+            try:
+                future.set_result(context.run(self._timed, key, send))
+            except BaseException as error:  # pylint: disable=broad-except
+                future.set_exception(error)
+
+        threading.Thread(target=run, name="gerrit-hedge-request", daemon=True).start()
+        return future
+
+    def call(self, key: str, send: Callable[[], Any]) -> Any:
+        """
+        Send a request, and a duplicate if it is slower than the threshold of its family.
+
+        :param key: the endpoint family
+        :param send: sends the request and returns the response
+        :return: the first response
+        """
+        with self._lock:
+            self.requests += 1
+            self._tokens = min(self.max_burst, self._tokens + self.budget)
+
+        delay = self.threshold(key)
+        if delay is None:
+            return self._timed(key, send)
+
+        first = self._start(key, send)
+        done, _ = wait([first], timeout=delay)
+        if done or not self._take_token():
+            return first.result()
+
+        logger.debug("Hedging a %s request after %.3fs", key, delay)
+        hedge = self._pool().submit(contextvars.copy_context().run, self._timed, key, send)
+        futures = [first, hedge]
+        pending = set(futures)
+        errors: List[BaseException] = []
+        winner = None
+        while pending and winner is None:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    winner = future
+                    break
+                errors.append(future.exception())
+
+        if winner is None:
+            raise errors[0]
+        for future in futures:
+            if future is not winner:
+                future.add_done_callback(self._discard)
+        if winner is hedge:
+            with self._lock:
+                self.hedge_wins += 1
+        return winner.result()
+
+    def close(self) -> None:
+        """
+        Shut the thread pool down.
+
+        :return:
+        """
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """
+        Number of requests, hedged requests and hedges which answered first.
+
+        :return:
+        """
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "hedged": self.hedged,
+                "hedge_wins": self.hedge_wins,
+                "tokens": self._tokens,
+            }
@@ -0,0 +1,305 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+# @Author: Jialiang Shi
+import bisect
+import re
+import threading
+import urllib.parse as urlparse
+from typing import Any, Dict, List, Optional, Tuple
+from gerrit.utils.common import endpoint_segments
+
+# collection -> placeholder of the identifier following it
+ENDPOINT_PLACEHOLDERS: Dict[str, str] = {
+    "changes": "{id}",
+    "revisions": "{rev}",
+    "files": "{path}",
+    "comments": "{comment}",
+    "drafts": "{draft}",
+    "robotcomments": "{comment}",
+    "reviewers": "{account}",
+    "votes": "{label}",
+    "messages": "{message}",
+    "edit": "{path}",
+    "projects": "{project}",
+    "branches": "{branch}",
+    "tags": "{tag}",
+    "commits": "{commit}",
+    "dashboards": "{dashboard}",
+    "labels": "{label}",
+    "children": "{project}",
+    "submit_requirements": "{name}",
+    "accounts": "{account}",
+    "emails": "{email}",
+    "sshkeys": "{key}",
+    "gpgkeys": "{key}",
+    "groups": "{group}",
+    "members": "{account}",
+    "plugins": "{plugin}",
+    "caches": "{cache}",
+    "tasks": "{task}",
+}
+
+_ID_PATTERN = re.compile(r"^(\d+|[0-9a-f]{40}|I[0-9a-f]{40})$")
+
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0,
+)
+
+
+def endpoint_template(endpoint: str) -> str:
+    """
+    Normalize an endpoint (or url) to its template, replacing identifiers by placeholders,
+    e.g. /a/changes/123/revisions/current/files/a%2Fb.py/diff?intraline becomes
+    /changes/{id}/revisions/{rev}/files/{path}/diff.
+
+    :param endpoint: the endpoint or url
+    :return:
+    """
+    segments = endpoint_segments(endpoint)
+    trailing_slash = bool(segments) and urlparse.urlsplit(endpoint).path.endswith("/")
+    template = []
+    placeholder = None
+    for segment in segments:
+        if placeholder is not None:
+            template.append(placeholder)
+            placeholder = None
+            continue
+        placeholder = ENDPOINT_PLACEHOLDERS.get(segment)
+        template.append("{id}" if placeholder is None and _ID_PATTERN.match(segment) else segment)
+    return "/" + "/".join(template) + ("/" if trailing_slash else "")
+
+
+def status_class(status: Optional[int]) -> str:
+    """
+    The class of a status code, e.g. 2xx, or error for a request without a response.
+
+    :param status: the status code
+    :return:
+    """
+    return f"{status // 100}xx" if status else "error"
+
+
+class _Series:
+    def __init__(self, buckets: int) -> None:
+        self.count = 0
+        self.statuses: Dict[str, int] = {}
+        self.bucket_counts = [0] * (buckets + 1)
+        self.latency_sum = 0.0
+        self.request_bytes = 0
+        self.response_bytes = 0
+        self.retries = 0
+        self.cache_hits: Dict[str, int] = {}
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+class MetricsRegistry:
+    """
+    Per-endpoint metrics of :class:`gerrit.GerritClient`: request count by status class,
+    a latency histogram, request and response bytes, retries and cache hits, recorded
+    against normalized endpoint templates such as ``/changes/{id}/revisions/{rev}/files``.
+
+    Every HTTP attempt is recorded by the Requester, including retries and hedges;
+    responses served by the response, ETag or blob cache are counted as cache hits.
+
+    .. code-block:: python
+
+        from gerrit import GerritClient
+        from gerrit.utils.metrics import MetricsRegistry
+
+        metrics = MetricsRegistry()
+        client = GerritClient(base_url="https://yourgerrit", username='******', password='xxxxx',
+                              metrics=metrics)
+        client.changes.search("is:open")
+        metrics.snapshot()["GET /changes/"]["count"]
+        print(metrics.to_prometheus())
+    """
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS, prefix: str = "gerrit_client") -> None:
+        """
+        :param buckets: upper bounds of the latency histogram buckets, in seconds
+        :param prefix: the prefix of the Prometheus metric names
+        """
+        self.buckets = tuple(sorted(buckets))
+        self.prefix = prefix
+        self._series: Dict[Tuple[str, str], _Series] = {}
+        self._lock = threading.Lock()
+
+    def _get(self, method: str, endpoint: str) -> _Series:
+        key = (method.upper(), endpoint_template(endpoint))
+        series = self._series.get(key)
+        if series is None:
+            series = self._series[key] = _Series(len(self.buckets))
+        return series
+
+    def observe(
+        self,
+        method: str,
+        endpoint: str,
+        status: Optional[int],
+        latency: float,
+        request_bytes: int = 0,
+        response_bytes: int = 0,
+    ) -> None:
+        """
+        Record an HTTP request.
+
+        :param method: the HTTP method
+        :param endpoint: the endpoint or url
+        :param status: the status code, None if the request failed without a response
+        :param latency: the duration in seconds
+        :param request_bytes: the size of the request body
+        :param response_bytes: the size of the response body
+        :return:
+        """
+        klass = status_class(status)
+        with self._lock:
+            series = self._get(method, endpoint)
+            series.count += 1
+            series.statuses[klass] = series.statuses.get(klass, 0) + 1
+            series.bucket_counts[bisect.bisect_left(self.buckets, latency)] += 1
+            series.latency_sum += latency
+            series.request_bytes += request_bytes
+            series.response_bytes += response_bytes
+
+    def retry(self, method: str, endpoint: str) -> None:
+        """
+        Record a retried request.
+
+        :param method: the HTTP method
+        :param endpoint: the endpoint or url
+        :return:
+        """
+        with self._lock:
+            self._get(method, endpoint).retries += 1
+
+    def cache_hit(self, endpoint: str, cache: str, method: str = "GET") -> None:
+        """
+        Record a response served without a request, or by a 304 Not Modified.
+
+        :param endpoint: the endpoint or url
+        :param cache: the cache, e.g. response, etag or blob
+        :param method: the HTTP method
+        :return:
+        """
+        with self._lock:
+            series = self._get(method, endpoint)
+            series.cache_hits[cache] = series.cache_hits.get(cache, 0) + 1
+
+    def reset(self) -> None:
+        """
+        Drop all metrics.
+
+        :return:
+        """
+        with self._lock:
+            self._series.clear()
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """
+        The metrics as a dict keyed by "METHOD template".
+
+        :return:
+        """
+        snapshot = {}
+        with self._lock:
+            for (method, template), series in sorted(self._series.items()):
+                snapshot[f"{method} {template}"] = {
+                    "method": method,
+                    "endpoint": template,
+                    "count": series.count,
+                    "status": dict(series.statuses),
+                    "latency": {
+                        "sum": series.latency_sum,
+                        "avg": series.latency_sum / series.count if series.count else 0.0,
+                        "buckets": dict(
+                            zip(self.buckets + (float("inf"),), self._cumulative(series))
+                        ),
+                    },
+                    "request_bytes": series.request_bytes,
+                    "response_bytes": series.response_bytes,
+                    "retries": series.retries,
+                    "cache_hits": dict(series.cache_hits),
+                }
+        return snapshot
+
+    @staticmethod
+    def _cumulative(series: _Series) -> List[int]:
+        total, counts = 0, []
+        for count in series.bucket_counts:
+            total += count
+            counts.append(total)
+        return counts
+
+    def to_prometheus(self) -> str:
+        """
+        The metrics in the Prometheus text exposition format.
+
+        :return:
+        """
+        p = self.prefix
+        lines: Dict[str, List[str]] = {
+            "requests": [
+                f"# HELP {p}_requests_total HTTP requests sent, by endpoint template and status class.",
+                f"# TYPE {p}_requests_total counter",
+            ],
+            "latency": [
+                f"# HELP {p}_request_duration_seconds HTTP request latency.",
+                f"# TYPE {p}_request_duration_seconds histogram",
+            ],
+            "request_bytes": [
+                f"# HELP {p}_request_bytes_total Bytes sent in request bodies.",
+                f"# TYPE {p}_request_bytes_total counter",
+            ],
+            "response_bytes": [
+                f"# HELP {p}_response_bytes_total Bytes received in response bodies.",
+                f"# TYPE {p}_response_bytes_total counter",
+            ],
+            "retries": [
+                f"# HELP {p}_retries_total Requests sent again by the retry policy.",
+                f"# TYPE {p}_retries_total counter",
+            ],
+            "cache_hits": [
+                f"# HELP {p}_cache_hits_total Responses served from a client cache.",
+                f"# TYPE {p}_cache_hits_total counter",
+            ],
+        }
+        with self._lock:
+            for (method, template), series in sorted(self._series.items()):
+                labels = f'method="{_escape(method)}",endpoint="{_escape(template)}"'
+                for klass, count in sorted(series.statuses.items()):
+                    lines["requests"].append(
+                        f'{p}_requests_total{{{labels},status="{klass}"}} {count}'
+                    )
+                if series.count:
+                    bounds = [_format_bound(b) for b in self.buckets] + ["+Inf"]
+                    for bound, count in zip(bounds, self._cumulative(series)):
+                        lines["latency"].append(
+                            f'{p}_request_duration_seconds_bucket{{{labels},le="{bound}"}} {count}'
+                        )
+                    lines["latency"].append(
+                        f"{p}_request_duration_seconds_sum{{{labels}}} {series.latency_sum}"
+                    )
+                    lines["latency"].append(
+                        f"{p}_request_duration_seconds_count{{{labels}}} {series.count}"
+                    )
+                    lines["request_bytes"].append(
+                        f"{p}_request_bytes_total{{{labels}}} {series.request_bytes}"
+                    )
+                    lines["response_bytes"].append(
+                        f"{p}_response_bytes_total{{{labels}}} {series.response_bytes}"
+                    )
+                if series.retries:
+                    lines["retries"].append(f"{p}_retries_total{{{labels}}} {series.retries}")
+                for cache, count in sorted(series.cache_hits.items()):
+                    lines["cache_hits"].append(
+                        f'{p}_cache_hits_total{{{labels},cache="{_escape(cache)}"}} {count}'
+                    )
+
+        return "\n".join(line for group in lines.values() for line in group) + "\n"
+
+
+def _format_bound(bound: float) -> str:
+    return repr(float(bound))
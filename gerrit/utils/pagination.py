@@ -0,0 +1,304 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+# @Author: Jialiang Shi
+import datetime
+import threading
+import time
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+
+def page_items(page: Any, key_name: str = "name") -> List[Any]:
+    """
+    Normalize one page of results to a list.
+    Endpoints that answer with a map (e.g. projects or groups listings) are turned
+    into a list of entities, the map key is stored under ``key_name``.
+
+    :param page: decoded response of one page
+    :param key_name: the field to store map keys in
+    :return:
+    """
+    if not page:
+        return []
+
+    if isinstance(page, dict):
+        items = []
+        for key, value in page.items():
+            value.update({key_name: key})
+            items.append(value)
+        return items
+
+    return list(page)
+
+
+class AdaptivePageSizer:
+    """
+    Page sizes for paginated list and search endpoints, tuned per endpoint from the
+    response time and size of every page: a page faster and smaller than the targets
+    makes the next page larger, a slower or larger one makes it smaller, by at most
+    ``max_step`` at a time. A client keeps one for its lifetime, so the next scan of an
+    endpoint starts from the size tuned by the previous one.
+
+    .. code-block:: python
+
+        from gerrit import GerritClient
+        from gerrit.utils.pagination import AdaptivePageSizer
+
+        client = GerritClient(base_url="https://yourgerrit", username='******', password='xxxxx',
+                              page_sizer=AdaptivePageSizer(target_latency=0.5, maximum=1000))
+        for change in client.changes.iter_search("status:merged"):
+            print(change["_number"])
+        print(client.page_sizer.sizes)
+    """
+
+    def __init__(
+        self,
+        initial: int = 25,
+        minimum: int = 10,
+        maximum: int = 500,
+        target_latency: float = 1.0,
+        target_bytes: int = 2 * 1024 * 1024,
+        max_step: float = 2.0,
+    ) -> None:
+        """
+        :param initial: the page size of an endpoint not tuned yet
+        :param minimum: the smallest page size
+        :param maximum: the largest page size, at most the query limit of the server
+        :param target_latency: the response time aimed at per page, in seconds
+        :param target_bytes: the response size aimed at per page, in bytes
+        :param max_step: the largest factor a page size changes by from one page to the next
+        """
+        if not 0 < minimum <= initial <= maximum:
+            raise ValueError(f"expected 0 < minimum <= initial <= maximum, got {minimum}, {initial}, {maximum}")
+        if max_step <= 1:
+            raise ValueError(f"max_step must be greater than 1, got {max_step}")
+        self.initial = initial
+        self.minimum = minimum
+        self.maximum = maximum
+        self.target_latency = target_latency
+        self.target_bytes = target_bytes
+        self.max_step = max_step
+        self._lock = threading.Lock()
+        self._sizes: Dict[str, int] = {}
+
+    def size(self, endpoint: str) -> int:
+        """
+        The page size to request next from an endpoint.
+
+        :param endpoint: the endpoint, e.g. /changes/
+        :return:
+        """
+        with self._lock:
+            return self._sizes.get(endpoint, self.initial)
+
+    def record(
+        self, endpoint: str, requested: int, returned: int, seconds: float, nbytes: Optional[int] = None
+    ) -> int:
+        """
+        Tune the page size of an endpoint from a page fetched from it.
+        A page which came back short is only used to shrink the size, it says nothing about
+        larger pages.
+
+        :param endpoint: the endpoint
+        :param requested: the page size requested
+        :param returned: the number of results returned
+        :param seconds: the response time
+        :param nbytes: the response size, if known
+        :return: the new page size
+        """
+        factor = self.max_step
+        if seconds > 0:
+            factor = min(factor, self.target_latency / seconds)
+        if nbytes:
+            factor = min(factor, self.target_bytes / nbytes)
+        factor = max(factor, 1 / self.max_step)
+        # hold steady near the targets rather than oscillate around them
+        if 0.8 <= factor <= 1.25 or (factor > 1 and returned < requested):
+            return self.size(endpoint)
+
+        size = min(self.maximum, max(self.minimum, int(requested * factor)))
+        with self._lock:
+            self._sizes[endpoint] = size
+        return size
+
+    @property
+    def sizes(self) -> Dict[str, int]:
+        """
+        The tuned page size per endpoint.
+
+        :return:
+        """
+        with self._lock:
+            return dict(self._sizes)
+
+
+def page_sizing(gerrit: Any, page_size: Optional[int], endpoint: str) -> Dict[str, Any]:
+    """
+    The paginate arguments for a page size given by the caller, or adaptive page sizes
+    with the page sizer of the client if it is None.
+
+    :param gerrit: the client
+    :param page_size: the page size, or None
+    :param endpoint: the key the page size is tuned for
+    :return:
+    """
+    sizer = getattr(gerrit, "page_sizer", None)
+    if page_size is not None or not isinstance(sizer, AdaptivePageSizer):
+        return {"page_size": page_size or 25}
+    return {
+        "page_size": sizer.size(endpoint),
+        "sizer": sizer,
+        "endpoint": endpoint,
+        "measure_bytes": gerrit.last_response_bytes,
+    }
+
+
+def _fetch_sized(
+    fetch_page: Callable[[int, int], Any],
+    page_size: int,
+    skip: int,
+    sizer: Optional[AdaptivePageSizer],
+    endpoint: str,
+    measure_bytes: Optional[Callable[[], Optional[int]]],
+) -> Any:
+    if sizer is None:
+        return fetch_page(page_size, skip)
+    if measure_bytes is not None:
+        measure_bytes()
+    start = time.monotonic()
+    page = fetch_page(page_size, skip)
+    seconds = time.monotonic() - start
+    nbytes = measure_bytes() if measure_bytes is not None else None
+    # a page served from a cache says nothing about the server
+    if measure_bytes is None or nbytes is not None:
+        sizer.record(endpoint, page_size, len(page or ()), seconds, nbytes)
+    return page
+
+
+def paginate(
+    fetch_page: Callable[[int, int], Any],
+    page_size: int = 25,
+    skip: int = 0,
+    more_key: Optional[str] = None,
+    key_name: str = "name",
+    sizer: Optional["AdaptivePageSizer"] = None,
+    endpoint: str = "",
+    measure_bytes: Optional[Callable[[], Optional[int]]] = None,
+) -> Iterator[Any]:
+    """
+    Yield results one at a time from a paginated list/search endpoint.
+
+    If ``more_key`` is given (e.g. ``_more_changes``), paging continues as long as the
+    last entity of a page carries that flag; the flag is removed from the yielded entity.
+    Otherwise paging continues while pages come back full.
+
+    :param fetch_page: callable taking (limit, skip) and returning one decoded page
+    :param page_size: number of results to request per page
+    :param skip: number of results to skip from the beginning of the list
+    :param more_key: name of the "more results" flag set on the last entity of a page
+    :param key_name: the field to store map keys in, for map shaped responses
+    :param sizer: an AdaptivePageSizer choosing the size of every page instead of page_size
+    :param endpoint: the key the sizer tunes the page size for
+    :param measure_bytes: callable returning the size of the last response, for the sizer
+    :return:
+    """
+    if page_size <= 0:
+        raise ValueError(f"page_size must be positive, got {page_size}")
+
+    while True:
+        if sizer is not None:
+            page_size = sizer.size(endpoint)
+        items = page_items(_fetch_sized(fetch_page, page_size, skip, sizer, endpoint, measure_bytes),
+                           key_name=key_name)
+        if not items:
+            return
+
+        if more_key is not None:
+            more = bool(items[-1].pop(more_key, False))
+        else:
+            more = len(items) >= page_size
+
+        skip += len(items)
+        yield from items
+
+        if not more:
+            return
+
+
+def keyset_boundary(updated: str) -> str:
+    """
+    The ``before:`` operand for a keyset page following a change updated at ``updated``:
+    the timestamp rounded up to the millisecond, the precision of Gerrit queries, in UTC.
+
+    :param updated: an ``updated`` timestamp, e.g. 2013-02-21 11:16:36.775000000
+    :return: e.g. "2013-02-21 11:16:36.775 -0000"
+    """
+    clock, _, fraction = updated.partition(".")
+    moment = datetime.datetime.strptime(clock, "%Y-%m-%d %H:%M:%S")
+    fraction = (fraction + "000000000")[:9]
+    milliseconds = int(fraction[:3]) + (1 if int(fraction[3:]) else 0)
+    moment += datetime.timedelta(milliseconds=milliseconds)
+    return f'"{moment.strftime("%Y-%m-%d %H:%M:%S")}.{moment.microsecond // 1000:03d} -0000"'
+
+
+def paginate_keyset(
+    fetch_page: Callable[[Optional[str], int, int], Any],
+    page_size: int = 500,
+    more_key: str = "_more_changes",
+    key: str = "_number",
+    time_key: str = "updated",
+    sizer: Optional[AdaptivePageSizer] = None,
+    endpoint: str = "",
+    measure_bytes: Optional[Callable[[], Optional[int]]] = None,
+) -> Iterator[Any]:
+    """
+    Yield changes one at a time from a query ordered by ``updated``, most recent first,
+    advancing with a ``before:`` boundary instead of an ever growing ``S`` offset, so the
+    server never re-evaluates and skips the rows of the previous pages.
+
+    ``before:`` is inclusive, so every page repeats the changes updated at the boundary;
+    they are recognized by ``key`` and skipped. When a whole page ends at the boundary
+    again, paging continues with an offset within that boundary.
+
+    :param fetch_page: callable taking (before, limit, skip) and returning one decoded page,
+                       before is None for the first page or a quoted ``before:`` operand
+    :param page_size: number of results to request per page
+    :param more_key: name of the "more results" flag set on the last entity of a page
+    :param key: the field identifying an entity
+    :param time_key: the field the results are ordered by
+    :param sizer: an AdaptivePageSizer choosing the size of every page instead of page_size
+    :param endpoint: the key the sizer tunes the page size for
+    :param measure_bytes: callable returning the size of the last response, for the sizer
+    :return:
+    """
+    if page_size <= 0:
+        raise ValueError(f"page_size must be positive, got {page_size}")
+
+    before: Optional[str] = None
+    skip = 0
+    # keys of the yielded entities which the next page may return again, by timestamp
+    boundary: Dict[Any, str] = {}
+    while True:
+        if sizer is not None:
+            page_size = sizer.size(endpoint)
+        items = page_items(_fetch_sized(
+            lambda limit, start: fetch_page(before, limit, start), page_size, skip, sizer, endpoint, measure_bytes
+        ))
+        if not items:
+            return
+
+        more = bool(items[-1].pop(more_key, False))
+        for item in items:
+            if item[key] not in boundary:
+                boundary[item[key]] = item[time_key]
+                yield item
+
+        if not more:
+            return
+
+        oldest = items[-1][time_key]
+        if keyset_boundary(oldest) == before:
+            # the whole page shares the boundary timestamp, step over it
+            skip += len(items)
+        else:
+            before, skip = keyset_boundary(oldest), 0
+        boundary = {k: t for k, t in boundary.items() if t >= oldest}
@@ -0,0 +1,352 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+# @Author: Jialiang Shi
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Tuple, Union
+
+Rate = Union[float, Tuple[float, float]]
+
+HTTP_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "POST", "PUT", "PATCH", "DELETE"})
+
+
+class TokenBucket:
+    """
+    A thread-safe token bucket: tokens are refilled at ``rate`` per second up to ``burst``,
+    every request takes one token and waits until one is available.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        """
+        :param rate: tokens per second
+        :param burst: bucket size, defaults to max(1, rate)
+        :param clock: a monotonic clock
+        :param sleep: the function used to wait
+        """
+        if rate <= 0:
+            raise ValueError(f"rate must be positive, got {rate}")
+
+        self.rate = float(rate)
+        self.burst = float(burst if burst is not None else max(1.0, rate))
+        self.clock = clock
+        self.sleep = sleep
+        self._tokens = self.burst
+        self._updated = clock()
+        self._lock = threading.Lock()
+        self.waited = 0.0
+
+    def _reserve(self, tokens: float) -> float:
+        # take the tokens, possibly going into debt, and return how long to wait for them
+        with self._lock:
+            now = self.clock()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= tokens
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+            self.waited += wait
+            return wait
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """
+        Take tokens from the bucket, waiting until they are available.
+        Waiting callers are served in the order they arrived.
+
+        :param tokens: number of tokens
+        :return: the time waited in seconds
+        """
+        wait = self._reserve(tokens)
+        if wait > 0:
+            self.sleep(wait)
+        return wait
+
+
+class RateLimiter:
+    """
+    Client-side request rate limits for :class:`gerrit.utils.requester.Requester`,
+    one token bucket per method and/or endpoint family (the first path segment).
+
+    ``rates`` maps a key to a rate in requests per second, or a (rate, burst) tuple.
+    A key is a method (``"POST"``), an endpoint family (``"changes"``) or both
+    (``"GET changes"``); a request is counted against the most specific matching
+    bucket only, falling back to the ``rate`` applying to all other requests.
+
+    A limiter is thread-safe and can be shared by several clients, so all workers of a
+    process stay below the per-user quota of the server together.
+
+    .. code-block:: python
+
+        from gerrit import GerritClient
+        from gerrit.utils.ratelimit import RateLimiter
+
+        limiter = RateLimiter(rate=20, rates={"POST": 2, "GET changes": (10, 20)})
+        client = GerritClient(base_url="https://yourgerrit", username='******', password='xxxxx',
+                              rate_limiter=limiter)
+    """
+
+    def __init__(
+        self,
+        rate: Optional[float] = None,
+        burst: Optional[float] = None,
+        rates: Optional[Dict[str, Rate]] = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        """
+        :param rate: requests per second of requests matching no key of rates, None is unlimited
+        :param burst: bucket size for rate
+        :param rates: rate or (rate, burst) per method, endpoint family or "METHOD family"
+        :param clock: a monotonic clock
+        :param sleep: the function used to wait
+        """
+        self.default: Optional[TokenBucket] = (
+            TokenBucket(rate, burst, clock=clock, sleep=sleep) if rate is not None else None
+        )
+        self.buckets: Dict[str, TokenBucket] = {}
+        for key, value in (rates or {}).items():
+            key_rate, key_burst = value if isinstance(value, tuple) else (value, None)
+            self.buckets[self._normalize(key)] = TokenBucket(
+                key_rate, key_burst, clock=clock, sleep=sleep
+            )
+
+    @staticmethod
+    def _normalize(key: str) -> str:
+        parts = key.split()
+        if len(parts) == 2:
+            return f"{parts[0].upper()} {parts[1]}"
+        return key.upper() if key.upper() in HTTP_METHODS else key
+
+    def bucket_for(self, method: str, family: str) -> Optional[TokenBucket]:
+        """
+        Return the bucket a request is counted against.
+
+        :param method: the HTTP method
+        :param family: the endpoint family, e.g. changes
+        :return: the bucket, or None if the request is not limited
+        """
+        method = method.upper()
+        for key in (f"{method} {family}", family, method):
+            bucket = self.buckets.get(key)
+            if bucket is not None:
+                return bucket
+        return self.default
+
+    def acquire(self, method: str, family: str) -> float:
+        """
+        Wait until a request may be sent.
+
+        :param method: the HTTP method
+        :param family: the endpoint family, e.g. changes
+        :return: the time waited in seconds
+        """
+        bucket = self.bucket_for(method, family)
+        if bucket is None:
+            return 0.0
+        return bucket.acquire()
+
+    @property
+    def stats(self) -> Dict[str, float]:
+        """
+        Total time waited per bucket, in seconds.
+
+        :return:
+        """
+        stats = {key: bucket.waited for key, bucket in self.buckets.items()}
+        if self.default is not None:
+            stats["*"] = self.default.waited
+        return stats
+
+
+class LatencyBaseline:
+    """
+    Detects rising latency per endpoint family for :class:`ConcurrencyGovernor`: the
+    smoothed latency of a family is compared with its baseline, which follows the lowest
+    smoothed latency and rises slowly toward the current one.
+    """
+
+    def __init__(self, tolerance: Optional[float] = 3.0, smoothing: float = 0.2, decay: float = 0.01) -> None:
+        """
+        :param tolerance: latency above this multiple of the baseline counts as overload,
+          None ignores latency
+        :param smoothing: weight of a new sample in the smoothed latency
+        :param decay: weight of the smoothed latency in the baseline when it is above the baseline
+        """
+        self.tolerance = tolerance
+        self.smoothing = smoothing
+        self.decay = decay
+        self.latency: Dict[str, float] = {}
+        self.baseline: Dict[str, float] = {}
+
+    def overloaded(self, key: str, latency: float) -> bool:
+        """
+        Record a latency and check whether the family is overloaded.
+
+        :param key: the endpoint family
+        :param latency: the duration of the request in seconds
+        :return:
+        """
+        smoothed = self.latency.get(key)
+        smoothed = latency if smoothed is None else smoothed + self.smoothing * (latency - smoothed)
+        self.latency[key] = smoothed
+        baseline = self.baseline.get(key)
+        if baseline is None or smoothed < baseline:
+            baseline = smoothed
+        else:
+            baseline += self.decay * (smoothed - baseline)
+        self.baseline[key] = baseline
+        return self.tolerance is not None and baseline > 0 and smoothed > self.tolerance * baseline
+
+
+class ConcurrencyGovernor:
+    """
+    Limits the number of requests in flight with AIMD (additive increase, multiplicative
+    decrease), like TCP congestion control.
+
+    Each successful response raises the limit by ``increase / limit``, i.e. by ``increase``
+    per full window of requests. A 429 or 503 response, a connection error or a smoothed
+    latency above ``latency_tolerance`` times the baseline multiplies the limit by
+    ``decrease_factor``, at most once per ``cooldown`` seconds. Latency and baseline are kept
+    per endpoint family, so a slow endpoint is not compared with a fast one; the baseline
+    follows the lowest smoothed latency and rises slowly toward the current one, so it keeps
+    up with a server which became slower for good. The server is kept busy
+    while healthy, and backed off as soon as it pushes back.
+
+    .. code-block:: python
+
+        from gerrit import GerritClient
+        from gerrit.utils.ratelimit import ConcurrencyGovernor
+
+        governor = ConcurrencyGovernor(initial=8, max_limit=32)
+        client = GerritClient(base_url="https://yourgerrit", username='******', password='xxxxx',
+                              governor=governor)
+    """
+
+    OVERLOAD_STATUSES = frozenset({429, 503})
+
+    def __init__(
+        self,
+        initial: int = 8,
+        min_limit: int = 1,
+        max_limit: int = 64,
+        increase: float = 1.0,
+        decrease_factor: float = 0.5,
+        latency_tolerance: Optional[float] = 3.0,
+        cooldown: float = 1.0,
+        smoothing: float = 0.2,
+        baseline_decay: float = 0.01,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        :param initial: initial number of requests in flight
+        :param min_limit: lower bound of the limit
+        :param max_limit: upper bound of the limit
+        :param increase: additive increase per window of successful requests
+        :param decrease_factor: multiplicative decrease on overload, between 0 and 1
+        :param latency_tolerance: latency above this multiple of the baseline counts as
+          overload, None ignores latency
+        :param cooldown: minimum seconds between two decreases
+        :param smoothing: weight of a new sample in the smoothed latency
+        :param baseline_decay: weight of the smoothed latency in the baseline when it is
+          above the baseline
+        :param clock: a monotonic clock
+        """
+        if not 1 <= min_limit <= initial <= max_limit:
+            raise ValueError("limits must satisfy 1 <= min_limit <= initial <= max_limit")
+        if not 0 < decrease_factor < 1:
+            raise ValueError(f"decrease_factor must be between 0 and 1, got {decrease_factor}")
+
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.increase = increase
+        self.decrease_factor = decrease_factor
+        self.cooldown = cooldown
+        self.latency_baseline = LatencyBaseline(latency_tolerance, smoothing, baseline_decay)
+        self.clock = clock
+
+        self._limit = float(initial)
+        self._in_flight = 0
+        self._condition = threading.Condition()
+        self._last_decrease: Optional[float] = None
+        self.increases = 0
+        self.decreases = 0
+
+    @property
+    def limit(self) -> int:
+        """
+        The current number of requests allowed in flight.
+
+        :return:
+        """
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        """
+        The number of requests in flight.
+
+        :return:
+        """
+        return self._in_flight
+
+    def acquire(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for a free slot.
+
+        :param timeout: maximum seconds to wait, None waits forever
+        :return: True if a slot was taken
+        """
+        with self._condition:
+            if not self._condition.wait_for(lambda: self._in_flight < int(self._limit), timeout):
+                return False
+            self._in_flight += 1
+            return True
+
+    def release(self, status: Optional[int], latency: float, key: str = "*") -> None:
+        """
+        Free a slot and adjust the limit to the outcome of the request.
+
+        :param status: the status code, None if the request failed without a response
+        :param latency: the duration of the request in seconds
+        :param key: the endpoint family of the request
+        :return:
+        """
+        with self._condition:
+            self._in_flight -= 1
+            if self._overloaded(status, latency, key):
+                now = self.clock()
+                if self._last_decrease is None or now - self._last_decrease >= self.cooldown:
+                    self._last_decrease = now
+                    self._limit = max(float(self.min_limit), self._limit * self.decrease_factor)
+                    self.decreases += 1
+            elif self._limit < self.max_limit:
+                self._limit = min(float(self.max_limit), self._limit + self.increase / self._limit)
+                self.increases += 1
+            self._condition.notify_all()
+
+    def _overloaded(self, status: Optional[int], latency: float, key: str) -> bool:
+        if status is None or status in self.OVERLOAD_STATUSES:
+            return True
+        return self.latency_baseline.overloaded(key, latency)
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """
+        The current limit, requests in flight, adjustments made, and the smoothed latency
+        and baseline per endpoint family.
+
+        :return:
+        """
+        with self._condition:
+            return {
+                "limit": self.limit,
+                "in_flight": self._in_flight,
+                "increases": self.increases,
+                "decreases": self.decreases,
+                "latency": dict(self.latency_baseline.latency),
+                "baseline": dict(self.latency_baseline.baseline),
+            }
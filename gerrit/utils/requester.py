@@ -1,9 +1,12 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 # @Author: Jialiang Shi
+import time
 import urllib.parse as urlparse
 from typing import Any, Dict, List, Optional, Tuple, Union
 from requests import Response, Session
+from gerrit.utils.common import endpoint_family
+from gerrit.utils.metrics import endpoint_template
 from gerrit.utils.exceptions import (
     NotAllowedError,
     ValidationError,
@@ -36,8 +39,17 @@ class Requester:
         timeout = 10
         base_url: Optional[str] = kwargs.get("base_url")
         self.base_scheme: Optional[str] = urlparse.urlsplit(base_url).scheme if base_url else None
+        self.base_path: str = urlparse.urlsplit(base_url).path.rstrip("/") if base_url else ""
         self.session: Optional[Session] = kwargs.get("session")
         self.timeout: int = kwargs.get("timeout", timeout)
+        self.retry: Optional[Any] = kwargs.get("retry")
+        self.rate_limiter: Optional[Any] = kwargs.get("rate_limiter")
+        self.governor: Optional[Any] = kwargs.get("governor")
+        self.circuit_breaker: Optional[Any] = kwargs.get("circuit_breaker")
+        self.router: Optional[Any] = kwargs.get("router")
+        self.hedging: Optional[Any] = kwargs.get("hedging")
+        self.metrics: Optional[Any] = kwargs.get("metrics")
+        self.tracer: Optional[Any] = kwargs.get("tracer")
 
     def _update_url_scheme(self, url: str) -> str:
         """
@@ -56,6 +68,142 @@ class Requester:
             )
         return url
 
+    def endpoint_of(self, url: str) -> str:
+        """
+        Return the path of a url relative to the Gerrit base_url, e.g. /a/changes/123.
+        """
+        path = urlparse.urlsplit(url).path
+        if self.base_path and path.startswith(self.base_path + "/"):
+            path = path[len(self.base_path):]
+        return path
+
+    def _request(
+        self, method: str, url: str, request_kwargs: Dict[str, Any], raise_for_status: bool
+    ) -> Response:
+        """
+        Send a request and check its status, in an http span if a tracer is set.
+        """
+        if self.tracer is None:
+            return self._perform(method, url, request_kwargs, raise_for_status)
+
+        endpoint = self.endpoint_of(url)
+        with self.tracer.span(
+            f"{method.upper()} {endpoint_template(endpoint)}",
+            kind="http",
+            method=method.upper(),
+            endpoint=endpoint,
+        ) as span:
+            return self._perform(method, url, request_kwargs, raise_for_status, span)
+
+    def _perform(
+        self,
+        method: str,
+        url: str,
+        request_kwargs: Dict[str, Any],
+        raise_for_status: bool,
+        span: Optional[Any] = None,
+    ) -> Response:
+        """
+        Send a request, hedged if it is a GET and a hedging policy is set, and check its status.
+        """
+        if method == "get" and self.hedging is not None:
+            family = endpoint_family(self.endpoint_of(url))
+            response = self.hedging.call(family, lambda: self._send(method, url, request_kwargs))
+        else:
+            response = self._send(method, url, request_kwargs)
+        if span is not None:
+            span.set_attribute("status", response.status_code)
+        if raise_for_status:
+            self.confirm_status(response)
+        return response
+
+    def _send(self, method: str, url: str, request_kwargs: Dict[str, Any]) -> Response:
+        """
+        Send a request through the session, retried according to the retry policy if one is set.
+        """
+        send = getattr(self.session, method)
+        url = self._update_url_scheme(url)
+
+        attempts = 0
+
+        def attempt(**overrides: Any) -> Response:
+            nonlocal attempts
+            attempts += 1
+            if attempts > 1 and self.metrics is not None:
+                self.metrics.retry(method, self.endpoint_of(url))
+            return self._attempt(send, method.upper(), url, dict(request_kwargs, **overrides))
+
+        if self.retry is None:
+            return attempt()
+        return self.retry.call(method.upper(), url, attempt, timeout=request_kwargs.get("timeout"))
+
+    def _attempt(self, send: Any, method: str, url: str, request_kwargs: Dict[str, Any]) -> Response:
+        """
+        Send one attempt, to the node chosen by the replica router if one is set.
+        """
+        if self.router is None:
+            return self._dispatch(send, method, url, request_kwargs)
+        return self.router.send(
+            method, url, lambda target: self._dispatch(send, method, target, request_kwargs)
+        )
+
+    def _dispatch(self, send: Any, method: str, url: str, request_kwargs: Dict[str, Any]) -> Response:
+        """
+        Send one attempt, unless the circuit breaker is open, within the rate limit
+        and concurrency limit if they are set.
+        """
+        family = endpoint_family(self.endpoint_of(url))
+        circuit = None
+        if self.circuit_breaker is not None:
+            circuit = self.circuit_breaker.key_for(urlparse.urlsplit(url).netloc, family)
+            self.circuit_breaker.before(circuit)
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire(method, family)
+        if self.governor is None and circuit is None and self.metrics is None:
+            return send(url, **request_kwargs)
+
+        if self.governor is not None:
+            self.governor.acquire()
+        start, response = time.monotonic(), None
+        try:
+            response = send(url, **request_kwargs)
+            return response
+        finally:
+            # status stays None if the attempt failed without a response
+            status = response.status_code if response is not None else None
+            latency = time.monotonic() - start
+            if self.governor is not None:
+                self.governor.release(status, latency, family)
+            if circuit is not None:
+                self.circuit_breaker.record(circuit, status)
+            if self.metrics is not None:
+                self._observe(method, url, response, latency, request_kwargs.get("stream", False))
+
+    def _observe(
+        self, method: str, url: str, response: Optional[Response], latency: float, stream: bool
+    ) -> None:
+        """
+        Record an attempt in the metrics registry.
+        """
+        request_bytes = response_bytes = 0
+        if response is not None:
+            body = getattr(response.request, "body", None)
+            if isinstance(body, (bytes, str)):
+                request_bytes = len(body)
+            length = response.headers.get("Content-Length")
+            if length is not None and length.isdigit():
+                response_bytes = int(length)
+            elif not stream and isinstance(response.content, bytes):
+                response_bytes = len(response.content)
+        self.metrics.observe(
+            method,
+            self.endpoint_of(url),
+            response.status_code if response is not None else None,
+            latency,
+            request_bytes,
+            response_bytes,
+        )
+
     def get_request_dict(
         self,
         params: Optional[Union[Dict[str, Any], List[Tuple[str, Any]]]] = None,
@@ -131,10 +279,7 @@ class Requester:
             stream=stream,
             **kwargs,
         )
-        response = self.session.get(self._update_url_scheme(url), **request_kwargs)
-        if raise_for_status:
-            self.confirm_status(response)
-        return response
+        return self._request("get", url, request_kwargs, raise_for_status)
 
     def post(
         self,
@@ -169,10 +314,7 @@ class Requester:
             allow_redirects=allow_redirects,
             **kwargs,
         )
-        response = self.session.post(self._update_url_scheme(url), **request_kwargs)
-        if raise_for_status:
-            self.confirm_status(response)
-        return response
+        return self._request("post", url, request_kwargs, raise_for_status)
 
     def put(
         self,
@@ -207,10 +349,7 @@ class Requester:
             allow_redirects=allow_redirects,
             **kwargs,
         )
-        response = self.session.put(self._update_url_scheme(url), **request_kwargs)
-        if raise_for_status:
-            self.confirm_status(response)
-        return response
+        return self._request("put", url, request_kwargs, raise_for_status)
 
     def delete(
         self,
@@ -231,10 +370,7 @@ class Requester:
         request_kwargs = self.get_request_dict(
             headers=headers, allow_redirects=allow_redirects, **kwargs
         )
-        response = self.session.delete(self._update_url_scheme(url), **request_kwargs)
-        if raise_for_status:
-            self.confirm_status(response)
-        return response
+        return self._request("delete", url, request_kwargs, raise_for_status)
 
     @staticmethod
     def confirm_status(res: Response) -> None:  # pylint: disable=too-many-branches
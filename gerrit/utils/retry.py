@@ -0,0 +1,331 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+# @Author: Jialiang Shi
+import logging
+import random
+import re
+import threading
+import time
+import urllib.parse as urlparse
+from datetime import timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Pattern, Tuple
+import requests
+
+logger = logging.getLogger(__name__)
+
+# endpoints which must not be sent twice, a replay could submit or vote again
+NEVER_REPLAY_ENDPOINTS: List[Pattern[str]] = [
+    re.compile(r"/(submit|review|revert|revert_submission|cherrypick|rebase|merge)/?$"),
+]
+
+
+def parse_retry_after(value: Optional[str], now: Optional[float] = None) -> Optional[float]:
+    """
+    Parse a Retry-After header, given in seconds or as an HTTP date.
+
+    :param value: the header value
+    :param now: the current unix time, defaults to time.time()
+    :return: the delay in seconds, or None if the header is missing or invalid
+    """
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError, IndexError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    now = time.time() if now is None else now
+    return max(0.0, when.timestamp() - now)
+
+
+class RetryPolicy:
+    """
+    Decides whether, and when, :class:`gerrit.utils.requester.Requester` sends a request again.
+
+    * Connection errors, timeouts and the statuses in ``retry_statuses`` (429, 502, 503
+      and 504 by default) are retried for idempotent methods (GET, HEAD, OPTIONS, PUT, DELETE).
+    * POST is only retried when the server rejected it without processing it (429, or 503
+      with a Retry-After header) or the connection could not be established.
+    * Requests other than GET, HEAD and OPTIONS to endpoints matching ``never_replay``
+      (``/submit``, ``/review``, ...) are never retried.
+    * The delay grows exponentially with full jitter, ``uniform(0, min(max_backoff,
+      backoff_factor * 2 ** retry))``; a Retry-After header replaces it, capped at
+      ``max_backoff`` as well.
+    * No retry is started which would end after ``deadline`` seconds from the first
+      attempt, and the timeout of each attempt is capped by the remaining budget.
+
+    Each attempt is reported to ``on_attempt`` as a dict with ``method``, ``url``, ``attempt``,
+    ``status``, ``error``, ``elapsed``, ``delay`` and ``retry`` keys.
+
+    .. code-block:: python
+
+        from gerrit import GerritClient
+        from gerrit.utils.retry import RetryPolicy
+
+        client = GerritClient(base_url="https://yourgerrit", username='******', password='xxxxx',
+                              retry=RetryPolicy(total=5, deadline=120))
+    """
+
+    RETRY_STATUSES: FrozenSet[int] = frozenset({429, 502, 503, 504})
+    IDEMPOTENT_METHODS: FrozenSet[str] = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+    SAFE_METHODS: FrozenSet[str] = frozenset({"GET", "HEAD", "OPTIONS"})
+
+    def __init__(
+        self,
+        total: int = 3,
+        backoff_factor: float = 0.5,
+        max_backoff: float = 30.0,
+        deadline: Optional[float] = None,
+        retry_statuses: Optional[FrozenSet[int]] = None,
+        retry_methods: Optional[FrozenSet[str]] = None,
+        respect_retry_after: bool = True,
+        never_replay: Optional[List[Pattern[str]]] = None,
+        on_attempt: Optional[Callable[[Dict[str, Any]], None]] = None,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        """
+        :param total: maximum number of retries, the first attempt not counted
+        :param backoff_factor: base delay in seconds
+        :param max_backoff: cap of the delay in seconds, Retry-After included
+        :param deadline: total time budget in seconds for all attempts of a request
+        :param retry_statuses: retried status codes, defaults to RETRY_STATUSES
+        :param retry_methods: idempotent methods, defaults to IDEMPOTENT_METHODS
+        :param respect_retry_after: wait as long as the Retry-After header asks, up to max_backoff
+        :param never_replay: endpoint patterns which are never retried, except for
+          GET, HEAD and OPTIONS requests, defaults to NEVER_REPLAY_ENDPOINTS
+        :param on_attempt: called with the metrics of every attempt
+        :param sleep: the function used to wait
+        """
+        if total < 0:
+            raise ValueError(f"total must not be negative, got {total}")
+        if deadline is not None and deadline <= 0:
+            raise ValueError(f"deadline must be positive, got {deadline}")
+
+        self.total = total
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.deadline = deadline
+        self.retry_statuses = frozenset(
+            self.RETRY_STATUSES if retry_statuses is None else retry_statuses
+        )
+        self.retry_methods = frozenset(
+            m.upper() for m in (self.IDEMPOTENT_METHODS if retry_methods is None else retry_methods)
+        )
+        self.respect_retry_after = respect_retry_after
+        self.never_replay = NEVER_REPLAY_ENDPOINTS if never_replay is None else never_replay
+        self.on_attempt = on_attempt
+        self.sleep = sleep
+
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.attempts = 0
+        self.retries = 0
+        self.gave_up = 0
+
+    def is_replayable(self, method: str, url: str) -> bool:
+        """
+        Check whether a request may be sent again at all.
+
+        :param method: the HTTP method
+        :param url: the url
+        :return:
+        """
+        if method.upper() in self.SAFE_METHODS:
+            return True
+        path = urlparse.urlsplit(url).path
+        return not any(pattern.search(path) for pattern in self.never_replay)
+
+    def should_retry(
+        self,
+        method: str,
+        url: str,
+        response: Optional[Any] = None,
+        error: Optional[BaseException] = None,
+    ) -> bool:
+        """
+        Classify the outcome of an attempt.
+
+        :param method: the HTTP method
+        :param url: the url
+        :param response: the response, if one was received
+        :param error: the exception raised by the attempt, if any
+        :return: True if the outcome is transient and the request may be sent again
+        """
+        if not self.is_replayable(method, url):
+            return False
+
+        idempotent = method.upper() in self.retry_methods
+        if error is not None:
+            # a request which timed out connecting was never sent
+            return isinstance(error, requests.exceptions.ConnectTimeout) or (
+                idempotent
+                and isinstance(error, (requests.exceptions.ConnectionError, requests.exceptions.Timeout))
+            )
+
+        status = response.status_code
+        # a non-idempotent request is only retried if it was rejected before it was processed
+        return status in self.retry_statuses and (
+            idempotent or status == 429 or (status == 503 and "Retry-After" in response.headers)
+        )
+
+    def backoff(self, retry: int) -> float:
+        """
+        The delay before a retry, exponential with full jitter.
+
+        :param retry: the number of the retry, starting at 0
+        :return: the delay in seconds
+        """
+        return random.uniform(0, min(self.max_backoff, self.backoff_factor * (2 ** retry)))
+
+    def delay(self, retry: int, response: Optional[Any] = None) -> float:
+        """
+        The delay before a retry; a Retry-After header of the response takes precedence,
+        up to ``max_backoff``.
+
+        :param retry: the number of the retry, starting at 0
+        :param response: the response of the failed attempt
+        :return: the delay in seconds
+        """
+        if response is not None and self.respect_retry_after:
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            if retry_after is not None:
+                return min(retry_after, self.max_backoff)
+        return self.backoff(retry)
+
+    def _remaining(self, start: float) -> Optional[float]:
+        """
+        The time left of the deadline of a request, None without a deadline.
+        """
+        if self.deadline is None:
+            return None
+        return self.deadline - (time.monotonic() - start)
+
+    def _next_delay(
+        self,
+        method: str,
+        url: str,
+        attempt: int,
+        outcome: Tuple[Optional[Any], Optional[BaseException]],
+        start: float,
+    ) -> Optional[float]:
+        """
+        The delay before the next attempt, None if the request is not retried.
+        """
+        response, error = outcome
+        if attempt >= self.total or not self.should_retry(method, url, response, error):
+            return None
+        delay = self.delay(attempt, response)
+        remaining = self._remaining(start)
+        if remaining is not None and delay >= remaining:
+            return None
+        return delay
+
+    def call(self, method: str, url: str, send: Callable[..., Any], timeout: Optional[float] = None) -> Any:
+        """
+        Send a request, retrying it according to the policy.
+
+        :param method: the HTTP method
+        :param url: the url
+        :param send: sends one attempt, called with a ``timeout`` keyword argument
+        :param timeout: the timeout of one attempt
+        :return: the response of the last attempt
+        """
+        start = time.monotonic()
+        with self._lock:
+            self.requests += 1
+
+        attempt = 0
+        response, error = None, None
+        while True:
+            remaining = self._remaining(start)
+            if remaining is not None and remaining <= 0 and attempt:
+                # the budget was spent waiting, the last outcome stands
+                logger.debug("Deadline of %s %s spent, not retrying", method, url)
+                with self._lock:
+                    self.gave_up += 1
+                break
+            if remaining is not None:
+                timeout = remaining if timeout is None else min(timeout, remaining)
+
+            if response is not None:
+                response.close()
+            attempt_start = time.monotonic()
+            response, error = None, None
+            try:
+                response = send(timeout=timeout)
+            except requests.exceptions.RequestException as exc:
+                error = exc
+            elapsed = time.monotonic() - attempt_start
+
+            delay = self._next_delay(method, url, attempt, (response, error), start)
+            self._report(method, url, attempt, response, error, elapsed, delay or 0.0, delay is not None)
+            if delay is None:
+                break
+
+            logger.debug(
+                "Retrying %s %s in %.2fs (attempt %d: %s)",
+                method,
+                url,
+                delay,
+                attempt + 1,
+                error if error is not None else response.status_code,
+            )
+            self.sleep(delay)
+            attempt += 1
+
+        if error is not None:
+            raise error
+        return response
+
+    def _report(
+        self,
+        method: str,
+        url: str,
+        attempt: int,
+        response: Optional[Any],
+        error: Optional[BaseException],
+        elapsed: float,
+        delay: float,
+        retry: bool,
+    ) -> None:
+        failed = error is not None or response.status_code >= 400
+        with self._lock:
+            self.attempts += 1
+            if retry:
+                self.retries += 1
+            elif failed and attempt:
+                self.gave_up += 1
+
+        if self.on_attempt is not None:
+            self.on_attempt(
+                {
+                    "method": method.upper(),
+                    "url": url,
+                    "attempt": attempt + 1,
+                    "status": response.status_code if response is not None else None,
+                    "error": type(error).__name__ if error is not None else None,
+                    "elapsed": elapsed,
+                    "delay": delay,
+                    "retry": retry,
+                }
+            )
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """
+        Number of requests, attempts, retries and of retried requests which still failed.
+
+        :return:
+        """
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "attempts": self.attempts,
+                "retries": self.retries,
+                "gave_up": self.gave_up,
+            }
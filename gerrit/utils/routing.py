@@ -0,0 +1,265 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+# @Author: Jialiang Shi
+import itertools
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+import requests
+from gerrit.utils.common import strip_trailing_slash
+from gerrit.utils.exceptions import CircuitOpenError
+
+logger = logging.getLogger(__name__)
+
+
+class _Node:
+    def __init__(self, base_url: str) -> None:
+        self.base_url = base_url
+        self.healthy = True
+        self.down_since = 0.0
+        self.outstanding = 0
+        self.requests = 0
+        self.failures = 0
+
+
+class _HealthCheck:
+    def __init__(self, endpoint: str, session: Optional[Any], timeout: float) -> None:
+        self.endpoint = endpoint
+        self.session = session
+        self.timeout = timeout
+        self.thread: Optional[threading.Thread] = None
+        self.stop = threading.Event()
+
+    def probe(self, base_url: str) -> bool:
+        session = self.session if self.session is not None else requests
+        try:
+            response = session.get(base_url + self.endpoint, timeout=self.timeout)
+        except requests.exceptions.RequestException:
+            return False
+        return response.status_code < 500
+
+
+class ReplicaRouter:
+    """
+    Routes the GET requests of :class:`gerrit.GerritClient` to read replicas and everything
+    else to the primary.
+
+    * GETs go to the healthy replica with the fewest requests in flight, round robin
+      among equals, and to the primary if no replica is healthy.
+    * A replica which fails a request (connection error, timeout, open circuit or one of
+      ``failure_statuses``) is marked down and the request is sent to the primary instead.
+      It gets requests again after ``retry_interval`` seconds, or as soon as a health check
+      succeeds.
+    * With ``pin_after_write``, GETs go to the primary for that many seconds after a
+      mutation, so a caller reads its own writes despite replication lag.
+
+    .. code-block:: python
+
+        from gerrit import GerritClient
+
+        client = GerritClient(base_url="https://primary.yourgerrit", username='******',
+                              password='xxxxx',
+                              replicas=["https://replica1.yourgerrit", "https://replica2.yourgerrit"],
+                              pin_after_write=5)
+        client.changes.search("is:open")     # served by a replica
+    """
+
+    FAILURE_STATUSES = frozenset({502, 503, 504})
+
+    def __init__(
+        self,
+        primary: str,
+        replicas: List[str],
+        pin_after_write: float = 0.0,
+        retry_interval: float = 30.0,
+        health_endpoint: str = "/config/server/version",
+        session: Optional[Any] = None,
+        timeout: float = 10,
+        failure_statuses: Optional[frozenset] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        :param primary: the base url of the primary
+        :param replicas: the base urls of the replicas
+        :param pin_after_write: seconds GETs stay on the primary after a mutation
+        :param retry_interval: seconds a failed replica is skipped
+        :param health_endpoint: the endpoint probed by check_health
+        :param session: the session used by check_health
+        :param timeout: the timeout of a health check
+        :param failure_statuses: statuses which mark a replica down, defaults to FAILURE_STATUSES
+        :param clock: a monotonic clock
+        """
+        self.primary = strip_trailing_slash(primary)
+        self.nodes: List[_Node] = [_Node(strip_trailing_slash(url)) for url in replicas]
+        self.pin_after_write = pin_after_write
+        self.retry_interval = retry_interval
+        self.health_check = _HealthCheck(health_endpoint, session, timeout)
+        self.failure_statuses = frozenset(
+            self.FAILURE_STATUSES if failure_statuses is None else failure_statuses
+        )
+        self.clock = clock
+
+        self._lock = threading.Lock()
+        self._round_robin = itertools.count()
+        self._last_write: Optional[float] = None
+        self.primary_reads = 0
+        self.fallbacks = 0
+
+    def _available(self, node: _Node, now: float) -> bool:
+        return node.healthy or now - node.down_since >= self.retry_interval
+
+    def choose(self, method: str) -> Optional[_Node]:
+        """
+        Choose the replica for a request.
+
+        :param method: the HTTP method
+        :return: the replica, or None for the primary
+        """
+        if method.upper() != "GET":
+            return None
+
+        now = self.clock()
+        with self._lock:
+            if self._last_write is not None and now - self._last_write < self.pin_after_write:
+                self.primary_reads += 1
+                return None
+
+            candidates = [node for node in self.nodes if self._available(node, now)]
+            if not candidates:
+                self.primary_reads += 1
+                return None
+
+            start = next(self._round_robin) % len(candidates)
+            rotated = candidates[start:] + candidates[:start]
+            node = min(rotated, key=lambda n: n.outstanding)
+            node.outstanding += 1
+            node.requests += 1
+            return node
+
+    def send(self, method: str, url: str, send: Callable[[str], Any]) -> Any:
+        """
+        Send a request to the chosen node, falling back to the primary if a replica fails.
+
+        :param method: the HTTP method
+        :param url: the url on the primary
+        :param send: sends the request to the url it is called with
+        :return: the response
+        """
+        if not url.startswith(self.primary + "/") and url != self.primary:
+            return send(url)
+
+        node = self.choose(method)
+        if node is None:
+            try:
+                return send(url)
+            finally:
+                if method.upper() != "GET":
+                    with self._lock:
+                        self._last_write = self.clock()
+
+        failed = True
+        try:
+            response = send(node.base_url + url[len(self.primary):])
+            failed = response.status_code in self.failure_statuses
+            if not failed:
+                return response
+            response.close()
+        except (requests.exceptions.RequestException, CircuitOpenError) as error:
+            logger.warning("Replica %s failed: %s", node.base_url, error)
+        finally:
+            with self._lock:
+                node.outstanding -= 1
+                if failed:
+                    node.failures += 1
+                    node.healthy = False
+                    node.down_since = self.clock()
+                    self.fallbacks += 1
+                else:
+                    node.healthy = True
+
+        logger.info("Falling back to the primary for %s", url)
+        return send(url)
+
+    def mark(self, base_url: str, healthy: bool) -> None:
+        """
+        Mark a replica up or down.
+
+        :param base_url: the base url of the replica
+        :param healthy: the health
+        :return:
+        """
+        base_url = strip_trailing_slash(base_url)
+        with self._lock:
+            for node in self.nodes:
+                if node.base_url == base_url:
+                    node.healthy = healthy
+                    if not healthy:
+                        node.down_since = self.clock()
+
+    def check_health(self) -> Dict[str, bool]:
+        """
+        Probe the health endpoint of every replica and mark it up or down.
+
+        :return: the health per replica
+        """
+        result = {}
+        for node in list(self.nodes):
+            healthy = self.health_check.probe(node.base_url)
+            self.mark(node.base_url, healthy)
+            result[node.base_url] = healthy
+        return result
+
+    def start_health_checks(self, interval: float = 10.0) -> None:
+        """
+        Run check_health every interval seconds in a daemon thread.
+
+        :param interval: seconds between two checks
+        :return:
+        """
+        check = self.health_check
+        if check.thread is not None and check.thread.is_alive():
+            return
+        check.stop.clear()
+
+        def run() -> None:
+            while not check.stop.wait(interval):
+                self.check_health()
+
+        check.thread = threading.Thread(target=run, name="gerrit-health-check", daemon=True)
+        check.thread.start()
+
+    def stop_health_checks(self) -> None:
+        """
+        Stop the health check thread.
+
+        :return:
+        """
+        check = self.health_check
+        check.stop.set()
+        if check.thread is not None:
+            check.thread.join()
+            check.thread = None
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """
+        Requests, requests in flight, failures and health per replica, reads served by
+        the primary and fallbacks to the primary.
+
+        :return:
+        """
+        with self._lock:
+            return {
+                "replicas": {
+                    node.base_url: {
+                        "healthy": node.healthy,
+                        "outstanding": node.outstanding,
+                        "requests": node.requests,
+                        "failures": node.failures,
+                    }
+                    for node in self.nodes
+                },
+                "primary_reads": self.primary_reads,
+                "fallbacks": self.fallbacks,
+            }
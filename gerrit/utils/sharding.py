@@ -0,0 +1,240 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+# @Author: Jialiang Shi
+import datetime
+import logging
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Callable, Iterator, List, Optional, Sequence, Set, Tuple
+
+from gerrit.utils.pagination import page_items, paginate
+
+logger = logging.getLogger(__name__)
+
+MILLISECOND = datetime.timedelta(milliseconds=1)
+
+
+def parse_updated(updated: str) -> datetime.datetime:
+    """
+    Parse an ``updated`` timestamp of a change, e.g. 2013-02-21 11:16:36.775000000.
+
+    :param updated: the timestamp, in UTC
+    :return: an aware datetime, to the microsecond
+    """
+    clock, _, fraction = updated.partition(".")
+    moment = datetime.datetime.strptime(clock, "%Y-%m-%d %H:%M:%S")
+    moment += datetime.timedelta(microseconds=int((fraction + "000000")[:6]))
+    return moment.replace(tzinfo=datetime.timezone.utc)
+
+
+def format_query_time(moment: datetime.datetime) -> str:
+    """
+    Format a datetime as the quoted operand of ``after:``/``before:``, to the millisecond.
+
+    :param moment: the datetime, naive datetimes are taken as UTC
+    :return: e.g. "2013-02-21 11:16:36.775 -0000"
+    """
+    if moment.tzinfo is not None:
+        moment = moment.astimezone(datetime.timezone.utc)
+    return f'"{moment.strftime("%Y-%m-%d %H:%M:%S")}.{moment.microsecond // 1000:03d} -0000"'
+
+
+def _ceil_ms(moment: datetime.datetime) -> datetime.datetime:
+    rest = moment.microsecond % 1000
+    return moment + datetime.timedelta(microseconds=1000 - rest) if rest else moment
+
+
+class Shard:
+    """
+    A disjoint part of a change query: an optional project and a window of the ``updated``
+    timestamp. Both bounds are inclusive, neighbouring shards share their boundary millisecond.
+    """
+
+    def __init__(
+        self,
+        project: Optional[str] = None,
+        after: Optional[datetime.datetime] = None,
+        before: Optional[datetime.datetime] = None,
+    ) -> None:
+        """
+        :param project: the project, or None for all projects
+        :param after: the lower bound, or None for no bound
+        :param before: the upper bound, or None for no bound
+        """
+        self.project = project
+        self.after = after
+        self.before = before
+
+    def __repr__(self) -> str:
+        return f"<Shard project={self.project} after={self.after} before={self.before}>"
+
+    def query(self, query: str) -> str:
+        """
+        The query restricted to the shard.
+
+        :param query: the query
+        :return:
+        """
+        terms = [f"({query})"]
+        if self.project is not None:
+            terms.append(f'project:"{self.project}"')
+        if self.after is not None:
+            terms.append(f"after:{format_query_time(self.after)}")
+        if self.before is not None:
+            terms.append(f"before:{format_query_time(self.before)}")
+        return " ".join(terms) if len(terms) > 1 else query
+
+    def remainder(self, oldest: datetime.datetime, parts: int = 2) -> List["Shard"]:
+        """
+        Split the part of the shard older than ``oldest`` into smaller shards.
+
+        :param oldest: the updated timestamp of the oldest change fetched from the shard
+        :param parts: the number of shards
+        :return: the shards, or an empty list if the rest is too short to be split
+        """
+        before = _ceil_ms(oldest)
+        if self.after is None:
+            # unknown lower bound: a window as long as the part already fetched, then the rest
+            span = max((self.before or before) - before, MILLISECOND)
+            return [Shard(self.project, before - span, before), Shard(self.project, None, before - span)]
+        step = (before - self.after) / parts
+        if step < MILLISECOND:
+            return []
+        bounds = [self.after + step * i for i in range(parts)] + [before]
+        return [Shard(self.project, bounds[i], bounds[i + 1]) for i in range(parts)]
+
+
+def time_shards(
+    since: datetime.datetime,
+    until: datetime.datetime,
+    shards: int,
+    projects: Optional[Sequence[str]] = None,
+) -> List[Shard]:
+    """
+    Split a time range, and optionally a list of projects, into shards.
+
+    :param since: the start of the range
+    :param until: the end of the range
+    :param shards: the number of windows the range is split into
+    :param projects: the projects, each gets its own windows
+    :return:
+    """
+    if shards < 1:
+        raise ValueError(f"shards must be at least 1, got {shards}")
+    step = (until - since) / shards
+    bounds = [since + step * i for i in range(shards)] + [until]
+    return [
+        Shard(project, bounds[i], bounds[i + 1])
+        for project in (projects or [None])
+        for i in range(shards)
+    ]
+
+
+def _fetch_shard(
+    fetch_page: Callable[[str, int, int], Any],
+    query: str,
+    shard: Shard,
+    limit: int,
+    more_key: str,
+) -> Tuple[List[Any], List[Shard]]:
+    """
+    Fetch the first page of a shard.
+
+    :return: the changes, and the shards the rest of the window was split into
+    """
+    items = page_items(fetch_page(shard.query(query), limit, 0))
+    if not items or not items[-1].pop(more_key, False):
+        return items, []
+    rest = shard.remainder(parse_updated(items[-1]["updated"]))
+    if rest:
+        logger.debug("Splitting %s into %d shards", shard, len(rest))
+        return items, rest
+    # too short to be split, page through the rest
+    remainder = Shard(shard.project, shard.after, _ceil_ms(parse_updated(items[-1]["updated"])))
+    items.extend(
+        paginate(
+            lambda page_size, start: fetch_page(remainder.query(query), page_size, start),
+            page_size=limit,
+            more_key=more_key,
+        )
+    )
+    return items, []
+
+
+def _fetch_shards(
+    fetch_page: Callable[[str, int, int], Any],
+    query: str,
+    shards: Sequence[Shard],
+    limit: int,
+    max_workers: int,
+    more_key: str,
+) -> Iterator[List[Any]]:
+    """
+    Fetch shards concurrently, and the shards they are split into.
+
+    :return: the changes of every fetch, as the fetches complete
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending = {
+            executor.submit(_fetch_shard, fetch_page, query, shard, limit, more_key) for shard in shards
+        }
+        try:
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    items, rest = future.result()
+                    pending |= {
+                        executor.submit(_fetch_shard, fetch_page, query, shard, limit, more_key)
+                        for shard in rest
+                    }
+                    yield items
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+def iter_shards(
+    fetch_page: Callable[[str, int, int], Any],
+    query: str,
+    shards: Sequence[Shard],
+    limit: int = 500,
+    max_workers: int = 4,
+    ordered: bool = False,
+    key: str = "_number",
+    more_key: str = "_more_changes",
+) -> Iterator[Any]:
+    """
+    Fetch the shards of a change query concurrently and yield their changes once each.
+
+    Every shard is fetched with one request of ``limit`` changes. When a shard has more
+    changes than that, the rest of its window is split into smaller shards which are
+    fetched in turn, so shard sizes adapt to the density of the changes; a window too short
+    to be split is paged with offsets instead.
+
+    :param fetch_page: callable taking (query, limit, skip) and returning one decoded page
+    :param query: the query
+    :param shards: the initial shards
+    :param limit: the number of changes requested per shard, at most the server query limit
+    :param max_workers: maximum number of requests in flight
+    :param ordered: yield the changes most recently updated first, after all shards were
+                    fetched, instead of as they arrive
+    :param key: the field identifying a change
+    :param more_key: name of the "more results" flag set on the last entity of a page
+    :return:
+    """
+    if max_workers < 1:
+        raise ValueError(f"max_workers must be at least 1, got {max_workers}")
+
+    seen: Set[Any] = set()
+    collected: List[Any] = []
+    for items in _fetch_shards(fetch_page, query, shards, limit, max_workers, more_key):
+        for item in items:
+            if item[key] in seen:
+                continue
+            seen.add(item[key])
+            if ordered:
+                collected.append(item)
+            else:
+                yield item
+
+    if ordered:
+        yield from sorted(collected, key=lambda item: (item["updated"], item[key]), reverse=True)
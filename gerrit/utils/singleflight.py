@@ -0,0 +1,97 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+# @Author: Jialiang Shi
+import copy
+import threading
+from typing import Any, Callable, Dict, Hashable, Optional
+
+
+class _Call:
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+        self.shared = 0
+
+
+class SingleFlight:
+    """
+    Coalesce concurrent identical calls: while a call for a key is in flight, other
+    threads asking for the same key wait for it and share its result instead of
+    starting their own call. Every caller receives its own copy of a shared result,
+    and a failure is raised in every caller.
+
+    Used by :class:`gerrit.GerritClient` with ``coalesce_requests=True`` to share one
+    HTTP round trip between threads that GET the same endpoint at the same time.
+
+    .. code-block:: python
+
+        flight = SingleFlight()
+        result = flight.do(("/changes/123", ()), lambda: fetch("/changes/123"))
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        self.calls = 0
+        self.shared = 0
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """
+        Run fn, unless a call for key is already in flight, then wait for its result.
+
+        :param key: identifies identical calls
+        :param fn: the call
+        :return: the result of fn
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                call.shared += 1
+                self.shared += 1
+                leader = False
+            else:
+                call = _Call()
+                self._calls[key] = call
+                self.calls += 1
+                leader = True
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return copy.deepcopy(call.result)
+
+        try:
+            call.result = fn()
+        except BaseException as error:  # pylint: disable=broad-except
+            call.error = error
+            raise
+        finally:
+            with self._lock:
+                if self._calls.get(key) is call:
+                    del self._calls[key]
+                shared = call.shared
+            call.done.set()
+
+        return copy.deepcopy(call.result) if shared else call.result
+
+    def forget(self) -> None:
+        """
+        Stop sharing the calls in flight, callers arriving later start new calls.
+        Waiting callers still receive the result of the call they joined.
+
+        :return:
+        """
+        with self._lock:
+            self._calls.clear()
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """
+        Number of calls made and of callers which shared another call.
+
+        :return:
+        """
+        with self._lock:
+            return {"calls": self.calls, "shared": self.shared, "in_flight": len(self._calls)}
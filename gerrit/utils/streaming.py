@@ -0,0 +1,189 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+# @Author: Jialiang Shi
+import struct
+import zlib
+from base64 import b64decode
+from typing import Any, BinaryIO, Iterable, Iterator, Optional, Union
+
+ZIP_LOCAL_HEADER = struct.Struct("<4sHHHHHIIIHH")
+ZIP_LOCAL_HEADER_SIGNATURE = b"PK\x03\x04"
+ZIP_DATA_DESCRIPTOR_SIGNATURE = b"PK\x07\x08"
+
+_ZIP_ENCRYPTED = 0x1
+_ZIP_DATA_DESCRIPTOR = 0x8
+_ZIP_STORED = 0
+_ZIP_DEFLATED = 8
+_BASE64_WHITESPACE = b" \t\r\n"
+
+
+def iter_response_content(response: Any, chunk_size: int = 64 * 1024) -> Iterator[bytes]:
+    """
+    Yield the body of a response in chunks, the response is closed afterwards.
+
+    :param response: the response, requested with stream=True
+    :param chunk_size: number of bytes read at a time
+    :return:
+    """
+    try:
+        for chunk in response.iter_content(chunk_size=chunk_size):
+            if chunk:
+                yield chunk
+    finally:
+        response.close()
+
+
+def iter_b64decode(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    """
+    Decode a base64 encoded stream chunk by chunk. Line breaks are ignored, a chunk
+    boundary may fall anywhere in the stream.
+
+    :param chunks: the base64 encoded chunks
+    :return:
+    """
+    pending = b""
+    for chunk in chunks:
+        data = pending + bytes(chunk).translate(None, _BASE64_WHITESPACE)
+        cut = len(data) - len(data) % 4
+        pending = data[cut:]
+        if cut:
+            yield b64decode(data[:cut])
+    if pending:
+        raise ValueError(f"Invalid base64 content: truncated quantum {pending!r}")
+
+
+class _ChunkReader:
+    """Read exact byte counts from an iterator of chunks."""
+
+    def __init__(self, chunks: Iterable[bytes]) -> None:
+        self._chunks = iter(chunks)
+        self._buffer = b""
+
+    def read(self, size: int) -> bytes:
+        parts = [self._buffer]
+        length = len(self._buffer)
+        while length < size:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                break
+            parts.append(bytes(chunk))
+            length += len(chunk)
+        data = b"".join(parts)
+        self._buffer = data[size:]
+        return data[:size]
+
+    def read_some(self, limit: Optional[int] = None) -> bytes:
+        data = self._buffer
+        if not data:
+            data = bytes(next(self._chunks, b""))
+        if limit is not None and len(data) > limit:
+            data, self._buffer = data[:limit], data[limit:]
+        else:
+            self._buffer = b""
+        return data
+
+    def unread(self, data: bytes) -> None:
+        self._buffer = data + self._buffer
+
+
+def _iter_deflated(reader: _ChunkReader) -> Iterator[bytes]:
+    decompressor = zlib.decompressobj(-zlib.MAX_WBITS)
+    while not decompressor.eof:
+        data = reader.read_some()
+        if not data:
+            raise ValueError("Invalid zip content: truncated entry")
+        output = decompressor.decompress(data)
+        if output:
+            yield output
+    reader.unread(decompressor.unused_data)
+
+
+def _iter_stored(reader: _ChunkReader, size: int) -> Iterator[bytes]:
+    remaining = size
+    while remaining:
+        data = reader.read_some(remaining)
+        if not data:
+            raise ValueError("Invalid zip content: truncated entry")
+        remaining -= len(data)
+        yield data
+
+
+def _read_descriptor_crc(reader: _ChunkReader) -> int:
+    # the signature of the data descriptor is optional
+    descriptor = reader.read(4)
+    if descriptor == ZIP_DATA_DESCRIPTOR_SIGNATURE:
+        descriptor = reader.read(4)
+    if len(descriptor) < 4:
+        raise ValueError("Invalid zip content: missing data descriptor")
+    return struct.unpack("<I", descriptor)[0]
+
+
+def iter_unzip(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    """
+    Unpack the first entry of a ZIP archive while it is downloaded, e.g. the patch of
+    ``/patch?zip`` or the file of an unsafe ``/download``. Stored and deflated entries
+    are supported; the CRC-32 of the entry is checked once it has been read.
+
+    :param chunks: the chunks of the ZIP archive
+    :return:
+    """
+    reader = _ChunkReader(chunks)
+    header = reader.read(ZIP_LOCAL_HEADER.size)
+    if len(header) < ZIP_LOCAL_HEADER.size or not header.startswith(ZIP_LOCAL_HEADER_SIGNATURE):
+        raise ValueError("Invalid zip content: missing local file header")
+
+    (
+        _,
+        _,
+        flags,
+        method,
+        _,
+        _,
+        expected_crc,
+        compressed_size,
+        _,
+        name_length,
+        extra_length,
+    ) = ZIP_LOCAL_HEADER.unpack(header)
+    if flags & _ZIP_ENCRYPTED:
+        raise ValueError("Invalid zip content: encrypted entries are not supported")
+    reader.read(name_length + extra_length)
+
+    if method == _ZIP_DEFLATED:
+        entry = _iter_deflated(reader)
+    elif method == _ZIP_STORED:
+        if flags & _ZIP_DATA_DESCRIPTOR and not compressed_size:
+            raise ValueError("Invalid zip content: stored entry of unknown size")
+        entry = _iter_stored(reader, compressed_size)
+    else:
+        raise ValueError(f"Invalid zip content: unsupported compression method {method}")
+
+    crc = 0
+    for data in entry:
+        crc = zlib.crc32(data, crc)
+        yield data
+
+    if flags & _ZIP_DATA_DESCRIPTOR:
+        expected_crc = _read_descriptor_crc(reader)
+    if crc != expected_crc:
+        raise ValueError("Invalid zip content: CRC-32 mismatch")
+
+
+def stream_to(
+    chunks: Iterable[bytes], fileobj: Optional[BinaryIO] = None
+) -> Union[Iterator[bytes], int]:
+    """
+    Write chunks to a binary file object, or hand them back to be iterated.
+
+    :param chunks: the chunks
+    :param fileobj: a file object opened for binary writing
+    :return: the number of bytes written if fileobj is given, else an iterator over the chunks
+    """
+    if fileobj is None:
+        return iter(chunks)
+
+    written = 0
+    for chunk in chunks:
+        fileobj.write(chunk)
+        written += len(chunk)
+    return written
@@ -0,0 +1,288 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+# @Author: Jialiang Shi
+import contextlib
+import functools
+import io
+import json
+import logging
+import os
+import threading
+import time
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterator, List, Optional, TypeVar, Union
+
+logger = logging.getLogger(__name__)
+
+OPERATION = "operation"
+HTTP = "http"
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+class Span:
+    """
+    One timed step of a traced call: a facade operation such as ``GerritChanges.delete``,
+    or one HTTP request (covering its retries and hedges) sent on its behalf.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        kind: str = OPERATION,
+        parent: Optional["Span"] = None,
+        attributes: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """
+        :param name: the name of the operation, or e.g. "GET /changes/{id}" for a request
+        :param kind: operation or http
+        :param parent: the span this one is nested in
+        :param attributes: attributes of the span
+        """
+        self.name = name
+        self.kind = kind
+        self.parent = parent
+        self.attributes: Dict[str, Any] = dict(attributes or {})
+        self.children: List["Span"] = []
+        self.start = time.time()
+        self._started = time.monotonic()
+        self.duration: Optional[float] = None
+        self.error: Optional[str] = None
+
+    @property
+    def status(self) -> str:
+        """
+        ok, error, or running while the span has not finished.
+
+        :return:
+        """
+        if self.error is not None:
+            return "error"
+        return "running" if self.duration is None else "ok"
+
+    @property
+    def requests(self) -> int:
+        """
+        Number of HTTP requests sent within this span, including nested operations.
+
+        :return:
+        """
+        own = 1 if self.kind == HTTP else 0
+        return own + sum(child.requests for child in self.children)
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        """
+        Set an attribute of the span.
+
+        :param key: the key
+        :param value: the value
+        :return:
+        """
+        self.attributes[key] = value
+
+    def finish(self, error: Optional[BaseException] = None) -> None:
+        """
+        End the span.
+
+        :param error: the exception the span ended with, if any
+        :return:
+        """
+        self.duration = time.monotonic() - self._started
+        if error is not None:
+            self.error = f"{type(error).__name__}: {error}"
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        The span and its children as a dict.
+
+        :return:
+        """
+        return {
+            "name": self.name,
+            "kind": self.kind,
+            "start": self.start,
+            "duration": self.duration,
+            "status": self.status,
+            "error": self.error,
+            "requests": self.requests,
+            "attributes": dict(self.attributes),
+            "children": [child.to_dict() for child in self.children],
+        }
+
+    def __repr__(self) -> str:
+        return f"<Span {self.name} {self.status} requests={self.requests}>"
+
+
+class Tracer:
+    """
+    Lifecycle hooks and nested tracing spans for :class:`gerrit.GerritClient`.
+
+    Composite facade methods, e.g. ``GerritChanges.delete`` or ``GerritChangeReviewers.add``,
+    open an operation span; every HTTP request sent by the Requester opens an http span
+    nested in the operation which caused it. When a top level span finishes, the span tree
+    is passed to every exporter, e.g. a :class:`JsonLinesExporter`.
+
+    Hooks are called for every span: ``before(span)`` when it starts, ``after(span)`` when
+    it finishes and ``error(span, exception)`` when it fails. ``span.kind`` tells operations
+    from HTTP requests. Exceptions raised by hooks and exporters are logged, not propagated.
+
+    .. code-block:: python
+
+        from gerrit import GerritClient
+        from gerrit.utils.tracing import JsonLinesExporter, Tracer
+
+        tracer = Tracer(exporters=[JsonLinesExporter("gerrit-spans.jsonl")])
+        client = GerritClient(base_url="https://yourgerrit", username='******', password='xxxxx',
+                              tracer=tracer)
+        client.add_hook(after=lambda span: print(span.name, span.duration))
+        client.changes.delete("myProject~stable~I10394472cbd17dd12454f229e4f6de00b143a444")
+    """
+
+    def __init__(self, exporters: Optional[List[Callable[[Span], Any]]] = None) -> None:
+        """
+        :param exporters: callables receiving every finished top level span
+        """
+        self.exporters: List[Callable[[Span], Any]] = list(exporters or [])
+        self._before: List[Callable[[Span], Any]] = []
+        self._after: List[Callable[[Span], Any]] = []
+        self._error: List[Callable[[Span, BaseException], Any]] = []
+        self._current: ContextVar[Optional[Span]] = ContextVar(
+            f"gerrit_span_{id(self)}", default=None
+        )
+        self._lock = threading.Lock()
+
+    def add_hook(
+        self,
+        before: Optional[Callable[[Span], Any]] = None,
+        after: Optional[Callable[[Span], Any]] = None,
+        error: Optional[Callable[[Span, BaseException], Any]] = None,
+    ) -> None:
+        """
+        Register lifecycle callbacks.
+
+        :param before: called with the span when it starts
+        :param after: called with the span when it finishes successfully
+        :param error: called with the span and the exception when it fails
+        :return:
+        """
+        with self._lock:
+            if before is not None:
+                self._before.append(before)
+            if after is not None:
+                self._after.append(after)
+            if error is not None:
+                self._error.append(error)
+
+    def add_exporter(self, exporter: Callable[[Span], Any]) -> None:
+        """
+        Register a callable receiving every finished top level span.
+
+        :param exporter: the exporter
+        :return:
+        """
+        with self._lock:
+            self.exporters.append(exporter)
+
+    def current(self) -> Optional[Span]:
+        """
+        The innermost span open in the current thread or task.
+
+        :return:
+        """
+        return self._current.get()
+
+    @staticmethod
+    def _call(callbacks: List[Callable[..., Any]], *args: Any) -> None:
+        for callback in callbacks:
+            try:
+                callback(*args)
+            except Exception:  # pylint: disable=broad-except
+                logger.exception("Tracing callback %r failed", callback)
+
+    @contextlib.contextmanager
+    def span(self, name: str, kind: str = OPERATION, **attributes: Any) -> Iterator[Span]:
+        """
+        Open a span nested in the current one.
+
+        :param name: the name of the span
+        :param kind: operation or http
+        :param attributes: attributes of the span
+        :return:
+        """
+        parent = self._current.get()
+        span = Span(name, kind=kind, parent=parent, attributes=attributes)
+        if parent is not None:
+            parent.children.append(span)
+        token = self._current.set(span)
+        self._call(self._before, span)
+        try:
+            yield span
+        except BaseException as error:
+            span.finish(error)
+            self._call(self._error, span, error)
+            raise
+        else:
+            span.finish()
+            self._call(self._after, span)
+        finally:
+            self._current.reset(token)
+            if parent is None:
+                self._call(self.exporters, span)
+
+
+class JsonLinesExporter:
+    """
+    Writes every finished top level span, with its nested spans, as one line of JSON.
+
+    .. code-block:: python
+
+        from gerrit.utils.tracing import JsonLinesExporter, Tracer
+
+        tracer = Tracer(exporters=[JsonLinesExporter("gerrit-spans.jsonl")])
+    """
+
+    def __init__(self, target: Union[str, "os.PathLike[str]", io.TextIOBase, Any]) -> None:
+        """
+        :param target: a path, appended to, or a text file object
+        """
+        if isinstance(target, (str, os.PathLike)):
+            self._file = open(target, "a", encoding="utf-8")  # pylint: disable=consider-using-with
+            self._owned = True
+        else:
+            self._file = target
+            self._owned = False
+        self._lock = threading.Lock()
+
+    def __call__(self, span: Span) -> None:
+        line = json.dumps(span.to_dict(), default=str)
+        with self._lock:
+            self._file.write(line + "\n")
+            self._file.flush()
+
+    def close(self) -> None:
+        """
+        Close the file if it was opened by the exporter.
+
+        :return:
+        """
+        with self._lock:
+            if self._owned and not self._file.closed:
+                self._file.close()
+
+
+def traced(func: F) -> F:
+    """
+    Decorator opening an operation span around a facade method, named after its
+    qualified name, e.g. GerritChanges.delete, when the client has a tracer.
+    """
+    name = func.__qualname__
+
+    @functools.wraps(func)
+    def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+        tracer = getattr(self.gerrit, "tracer", None)
+        if not isinstance(tracer, Tracer):
+            return func(self, *args, **kwargs)
+        with tracer.span(name):
+            return func(self, *args, **kwargs)
+
+    return wrapper  # type: ignore[return-value]
@@ -1,12 +1,14 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 # @Author: Jialiang Shi
-from typing import Any, Dict, Optional, Tuple, Union
+from typing import Any, BinaryIO, Dict, Optional, Tuple, Union
 from base64 import b64decode
 import requests
 from requests.adapters import HTTPAdapter
 from gerrit.utils.requester import Requester
+from gerrit.utils.blobcache import SHA1_PATTERN, auth_identity
 from gerrit.utils.common import decode_response, strip_trailing_slash
+from gerrit.utils.streaming import iter_b64decode, iter_response_content, stream_to
 
 
 class GitilesClient:
@@ -19,6 +21,12 @@ class GitilesClient:
         cert: Optional[Union[str, Tuple[str, str]]] = None,
         timeout: int = 60,
         max_retries: Optional[int] = None,
+        blob_cache: Optional[Any] = None,
+        retry: Optional[Any] = None,
+        rate_limiter: Optional[Any] = None,
+        governor: Optional[Any] = None,
+        circuit_breaker: Optional[Any] = None,
+        hedging: Optional[Any] = None,
     ) -> None:
         self._base_url = strip_trailing_slash(base_url)
 
@@ -44,7 +52,13 @@ class GitilesClient:
             base_url=base_url,
             session=self.session,
             timeout=timeout,
+            retry=retry,
+            rate_limiter=rate_limiter,
+            governor=governor,
+            circuit_breaker=circuit_breaker,
+            hedging=hedging,
         )
+        self.blob_cache = blob_cache
 
     def get_endpoint_url(self, endpoint: str) -> str:
         """
@@ -54,15 +68,28 @@ class GitilesClient:
         """
         return f"{self._base_url}{endpoint}"
 
+    def _get(self, endpoint: str, params: Dict[str, Any], immutable: bool = False) -> Any:
+        """
+        Send HTTP GET to the endpoint and decode the response.
+        Responses of immutable endpoints are kept in the blob cache, if one is set.
+        """
+        url = self.get_endpoint_url(endpoint)
+        if not immutable or self.blob_cache is None:
+            return decode_response(self.requester.get(url, params=params))
+
+        key = self.blob_cache.make_key(url, params, identity=auth_identity(self.session))
+        hit, result = self.blob_cache.lookup(key)
+        if not hit:
+            result = decode_response(self.requester.get(url, params=params))
+            self.blob_cache.store(key, result)
+        return result
+
     def commit(self, repo: str, commit: str) -> Dict[str, Any]:
         """Retrieves a commit."""
         endpoint = f"/{repo}/+/{commit}"
         params = {"format": "JSON"}
 
-        response = self.requester.get(self.get_endpoint_url(endpoint), params=params)
-        result = decode_response(response)
-
-        return result
+        return self._get(endpoint, params, immutable=bool(SHA1_PATTERN.match(commit)))
 
     def commits(self, repo: str, ref: str, start: Optional[str] = None) -> Dict[str, Any]:
         """query commit history"""
@@ -83,10 +110,32 @@ class GitilesClient:
         endpoint = f"/{repo}/+/{ref}/{path}"
         params = {"format": format}
 
-        response = self.requester.get(self.get_endpoint_url(endpoint), params=params)
-        result = decode_response(response)
+        result = self._get(endpoint, params, immutable=bool(SHA1_PATTERN.match(ref)))
 
         if decode:
             return b64decode(result).decode("utf-8")
 
         return result
+
+    def stream_file(
+        self,
+        repo: str,
+        ref: str,
+        path: str,
+        fileobj: Optional[BinaryIO] = None,
+        chunk_size: int = 64 * 1024,
+    ) -> Any:
+        """Streams raw file content from a Gitiles repository, base64 decoded chunk by chunk.
+
+        :param repo: the repository
+        :param ref: the branch, tag or commit
+        :param path: the file path
+        :param fileobj: a file object opened for binary writing
+        :param chunk_size: number of bytes read at a time
+        :return: the number of bytes written if fileobj is given, else an iterator over the chunks
+        """
+        endpoint = f"/{repo}/+/{ref}/{path}"
+        params = {"format": "TEXT"}
+
+        response = self.requester.get(self.get_endpoint_url(endpoint), params=params, stream=True)
+        return stream_to(iter_b64decode(iter_response_content(response, chunk_size)), fileobj)
@@ -60,10 +60,10 @@ setup(
         "Topic :: Software Development",
     ],
     keywords="api gerrit client wrapper",
-    packages=find_packages(exclude=["contrib", "docs", "test*"]),
+    packages=find_packages(exclude=["benchmarks", "contrib", "docs", "test*"]),
     # https://packaging.python.org/en/latest/requirements.html
     install_requires=required,
-    extras_require={},
+    extras_require={"async": ["aiohttp"], "speedups": ["orjson"]},
     package_data={},
     # http://docs.python.org/3.4/distutils/setupscript.html#installing-additional-files # noqa
     data_files=[],
@@ -1,6 +1,7 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 # @Author: Jialiang Shi
+import json
 import pytest
 from unittest.mock import MagicMock
 
@@ -52,6 +53,35 @@ GROUP_DATA = {
 }
 
 
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+class FakeClock:
+    """A clock which only moves when a test advances ``now`` or sleeps."""
+
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+def make_response(status_code=200, data=None):
+    """Build a mock Response carrying ``data`` as a JSON body."""
+    response = MagicMock()
+    response.status_code = status_code
+    response.reason = "OK"
+    response.url = "http://example.com/"
+    response.headers = {"content-type": "application/json"}
+    response.content = (")]}'\n" + json.dumps(data if data is not None else {})).encode("utf-8")
+    response.encoding = "utf-8"
+    return response
+
+
 # ---------------------------------------------------------------------------
 # Fixtures
 # ---------------------------------------------------------------------------
@@ -0,0 +1,1465 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+# @Author: Jialiang Shi
+# pylint: disable=too-many-lines
+import base64
+import datetime
+import gzip
+import hashlib
+import json
+import logging
+import random
+import re
+import threading
+import time
+import urllib.parse as urlparse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+MAGIC_PREFIX = b")]}'\n"
+BASE_TIME = datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc).timestamp()
+QUERY_LIMIT = 500
+LABEL_VALUES = {"-2": "This shall not be submitted", "-1": "I would prefer this is not submitted as is",
+                " 0": "No score", "+1": "Looks good to me, but someone else must approve",
+                "+2": "Looks good to me, approved"}
+
+_WORDS = (
+    "fix", "add", "remove", "refactor", "update", "support", "handle", "cache", "index", "query",
+    "review", "change", "project", "branch", "account", "group", "plugin", "config", "label",
+    "submit", "rebase", "merge", "draft", "comment", "patch", "set", "file", "diff", "test", "docs",
+)
+_OPERATORS = frozenset({
+    "status", "is", "project", "projects", "branch", "owner", "reviewer", "topic", "hashtag",
+    "change", "before", "until", "after", "since", "message",
+})
+_STATUSES = frozenset({"open", "pending", "new", "mergeable", "closed", "merged", "abandoned"})
+_QUERY_TOKEN = re.compile(r'-?[\w.-]+:(?:"[^"]*"|\{[^}]*\}|\S+)|"[^"]*"|\S+')
+_CHANGE_QUERY_TOKEN = re.compile(r'[()]|-?[\w.-]+:(?:"[^"]*"|\{[^}]*\}|[^\s()]+)|"[^"]*"|[^\s()]+')
+
+
+def format_timestamp(seconds: float) -> str:
+    """
+    Format a POSIX timestamp the way Gerrit does, e.g. 2024-01-01 10:00:00.000000000.
+
+    :param seconds: the timestamp
+    :return:
+    """
+    moment = datetime.datetime.fromtimestamp(seconds, tz=datetime.timezone.utc)
+    return moment.strftime("%Y-%m-%d %H:%M:%S.") + f"{moment.microsecond * 1000:09d}"
+
+
+def parse_timestamp(value: str) -> float:
+    """
+    Parse a timestamp of a Gerrit query, e.g. 2024-01-01 or "2024-01-01 10:00:00.123 -0000".
+    Timestamps without a time zone are in UTC, the time zone of the fake server.
+
+    :param value: the timestamp, optionally quoted
+    :return: the POSIX timestamp
+    """
+    value = value.strip("\"{}'")
+    date, _, clock = value.partition(" ")
+    clock, _, zone = clock.partition(" ")
+    clock, _, fraction = clock.partition(".")
+    moment = datetime.datetime.strptime(
+        f"{date} {clock or '00:00:00'} {zone or '+0000'}", "%Y-%m-%d %H:%M:%S %z"
+    )
+    return moment.timestamp() + (float("0." + fraction) if fraction else 0.0)
+
+
+class FakeResponse:
+    def __init__(self, status: int, body: bytes = b"", content_type: Optional[str] = None,
+                 headers: Optional[Dict[str, str]] = None) -> None:
+        self.status = status
+        self.body = body
+        self.headers = dict(headers or {})
+        if content_type is not None:
+            self.headers["Content-Type"] = content_type
+
+
+class _Error(Exception):
+    def __init__(self, status: int, message: str) -> None:
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+def _route(method: str, pattern: str) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        func.route = (method, re.compile(pattern))  # type: ignore[attr-defined]
+        return func
+    return decorator
+
+
+def _sha1(*parts: Any) -> str:
+    return hashlib.sha1("-".join(str(part) for part in parts).encode("utf-8")).hexdigest()
+
+
+def _first(query: Dict[str, List[str]], key: str, default: Optional[str] = None) -> Optional[str]:
+    values = query.get(key)
+    return values[0] if values else default
+
+
+def _page(items: List[Any], query: Dict[str, List[str]], limit_key: str = "n",
+          start_key: str = "S", limit: Optional[int] = None) -> Tuple[List[Any], bool]:
+    start = int(_first(query, start_key) or 0)
+    n = _first(query, limit_key)
+    limit = min(int(n), QUERY_LIMIT) if n else (limit or QUERY_LIMIT)
+    page = items[start:start + limit]
+    return page, start + limit < len(items)
+
+
+class FakeGerrit:
+    """
+    A stateful in-memory stand-in for the Gerrit REST API, answering with the ``)]}'``
+    prefix and payloads shaped like Gerrit's, for tests and offline benchmarks of the client.
+    Serve it over HTTP with :class:`FakeGerritServer`.
+
+    Covered: change queries (several ``q``, ``n``/``S`` paging, ``o`` options and the
+    ``status``, ``is``, ``project``, ``branch``, ``owner``, ``topic``, ``hashtag``,
+    ``change``, ``before``/``after`` and ``limit`` operators, negated with ``-``), changes,
+    revisions, files, commits, reviewers, reviews, topics, hashtags, messages,
+    projects, branches, accounts, groups and group members.
+
+    Timestamps come from a logical clock which advances one second per mutation,
+    so a seeded instance always answers the same.
+
+    .. code-block:: python
+
+        from tests.fakeserver import FakeGerrit, FakeGerritServer
+
+        fake = FakeGerrit().seed(changes=1000, projects=10)
+        with FakeGerritServer(fake) as server:
+            client = GerritClient(base_url=server.url)
+            client.changes.search("is:open project:project-1")
+    """
+
+    def __init__(self, file_size: int = 2048) -> None:
+        """
+        :param file_size: approximate size in bytes of the files of seeded changes
+        """
+        self.file_size = file_size
+        self.lock = threading.RLock()
+        self.accounts: Dict[int, Dict[str, Any]] = {}
+        self.projects: Dict[str, Dict[str, Any]] = {}
+        self.groups: Dict[str, Dict[str, Any]] = {}
+        self.changes: Dict[int, Dict[str, Any]] = {}
+        self.clock = BASE_TIME
+        self._next_account = 1000000
+        self._next_change = 1
+        self._next_group = 1
+        self.routes = [
+            getattr(self, name).route + (getattr(self, name),)
+            for name in dir(type(self))
+            if hasattr(getattr(type(self), name), "route")
+        ]
+        self.routes.sort(key=lambda route: route[2].__code__.co_firstlineno)
+
+        self.self_account = self.add_account("admin", "Administrator", "admin@example.com")
+        self.add_project("All-Projects", parent=None, description="Access inherited by all other projects.")
+        self.add_project("All-Users", description="Individual user settings and preferences.")
+        self.add_group("Administrators", members=[self.self_account])
+
+    # -- state ------------------------------------------------------------------------
+
+    def tick(self) -> float:
+        """
+        Advance the logical clock by one second.
+
+        :return: the new time
+        """
+        self.clock += 1.0
+        return self.clock
+
+    def add_account(self, username: str, name: Optional[str] = None, email: Optional[str] = None) -> int:
+        """
+        Create an account.
+
+        :param username: the username
+        :param name: the full name
+        :param email: the preferred email
+        :return: the account id
+        """
+        with self.lock:
+            account_id = self._next_account
+            self._next_account += 1
+            self.accounts[account_id] = {
+                "_account_id": account_id,
+                "name": name or username.title(),
+                "email": email or f"{username}@example.com",
+                "username": username,
+                "registered_on": format_timestamp(self.tick()),
+            }
+            return account_id
+
+    def add_project(self, name: str, parent: Optional[str] = "All-Projects",
+                    description: str = "", branches: Tuple[str, ...] = ()) -> Dict[str, Any]:
+        """
+        Create a project with a root commit on every branch.
+
+        :param name: the project name
+        :param parent: the parent project
+        :param description: the description
+        :param branches: branch names, master if none are given for a code project
+        :return: the project
+        """
+        with self.lock:
+            head = _sha1("root", name)
+            if not branches and name not in ("All-Projects", "All-Users"):
+                branches = ("master",)
+            project = {
+                "name": name,
+                "parent": parent,
+                "description": description,
+                "state": "ACTIVE",
+                "branches": {f"refs/heads/{branch}": head for branch in branches},
+                "files": {head: {"README.md": f"# {name}\n".encode("utf-8")}},
+            }
+            project["branches"]["refs/meta/config"] = _sha1("config", name)
+            self.projects[name] = project
+            return project
+
+    def add_group(self, name: str, description: str = "", members: Tuple[int, ...] = ()) -> Dict[str, Any]:
+        """
+        Create a group.
+
+        :param name: the group name
+        :param description: the description
+        :param members: account ids of the members
+        :return: the group
+        """
+        with self.lock:
+            group_id = self._next_group
+            self._next_group += 1
+            uuid = _sha1("group", name)
+            group = {
+                "id": uuid,
+                "name": name,
+                "description": description,
+                "group_id": group_id,
+                "owner": name,
+                "owner_id": uuid,
+                "created_on": format_timestamp(self.tick()),
+                "members": list(members),
+            }
+            self.groups[uuid] = group
+            return group
+
+    def add_change(self, project: str, branch: str = "master", subject: str = "",
+                   owner: Optional[int] = None, status: str = "NEW", topic: str = "",
+                   files: Optional[Dict[str, bytes]] = None, patch_sets: int = 1) -> Dict[str, Any]:
+        """
+        Create a change.
+
+        :param project: the project name
+        :param branch: the destination branch
+        :param subject: the commit subject
+        :param owner: the owner account id, the calling user by default
+        :param status: NEW, MERGED or ABANDONED
+        :param topic: the topic
+        :param files: path to content of the files of every patch set
+        :param patch_sets: the number of patch sets
+        :return: the change
+        """
+        with self.lock:
+            number = self._next_change
+            self._next_change += 1
+            now = self.tick()
+            owner = owner if owner is not None else self.self_account
+            parent = self.projects[project]["branches"].get(f"refs/heads/{branch}", _sha1("root", project))
+            change = {
+                "_number": number,
+                "project": project,
+                "branch": branch,
+                "change_id": "I" + _sha1("change", number),
+                "subject": subject or f"Change {number}",
+                "status": status,
+                "topic": topic,
+                "hashtags": [],
+                "owner": owner,
+                "created": now,
+                "updated": now,
+                "submitted": now if status == "MERGED" else None,
+                "revisions": [],
+                "reviewers": {},
+                "messages": [],
+                "parent": parent,
+            }
+            for _ in range(patch_sets):
+                self._add_revision(change, dict(files or {}), owner)
+            self.changes[number] = change
+            return change
+
+    def _add_revision(self, change: Dict[str, Any], files: Dict[str, bytes], uploader: int) -> None:
+        number = len(change["revisions"]) + 1
+        sha = _sha1("revision", change["_number"], number)
+        change["revisions"].append({
+            "_number": number,
+            "sha": sha,
+            "created": self.clock,
+            "uploader": uploader,
+            "files": files,
+        })
+        self._add_message(change, uploader, f"Uploaded patch set {number}.")
+
+    def _add_message(self, change: Dict[str, Any], author: int, message: str) -> None:
+        change["messages"].append({
+            "id": _sha1("message", change["_number"], len(change["messages"])),
+            "author": author,
+            "date": self.clock,
+            "message": message,
+            "_revision_number": len(change["revisions"]),
+        })
+
+    def seed(self, changes: int = 100, projects: int = 5, accounts: int = 10, groups: int = 3,
+             files: int = 3, patch_sets: int = 2, seed: int = 0) -> "FakeGerrit":
+        """
+        Fill the server with deterministic, realistically shaped data.
+
+        :param changes: the number of changes, spread over the projects
+        :param projects: the number of projects, each with master and stable branches
+        :param accounts: the number of accounts besides the admin
+        :param groups: the number of groups
+        :param files: the number of files per patch set
+        :param patch_sets: the maximum number of patch sets per change
+        :param seed: the seed of the random generator
+        :return: self
+        """
+        rng = random.Random(seed)
+        with self.lock:
+            account_ids = [
+                self.add_account(f"user{i}", f"User {i}", f"user{i}@example.com")
+                for i in range(1, accounts + 1)
+            ] or [self.self_account]
+            for i in range(1, groups + 1):
+                self.add_group(f"group-{i}", f"Group {i}",
+                               members=tuple(rng.sample(account_ids, min(3, len(account_ids)))))
+            names = [f"project-{i}" for i in range(1, projects + 1)]
+            for name in names:
+                self.add_project(name, description=f"The {name} repository", branches=("master", "stable"))
+            for _ in range(changes):
+                self._seed_change(rng, rng.choice(names), account_ids, files, patch_sets)
+            # later mutations must not make a change look older than it is
+            self.clock = max([self.clock] + [c["updated"] for c in self.changes.values()])
+        return self
+
+    def _seed_change(self, rng: random.Random, project: str, account_ids: List[int],
+                     files: int, patch_sets: int) -> None:
+        words = " ".join(rng.choice(_WORDS) for _ in range(rng.randint(3, 8)))
+        change_files = {
+            f"src/{rng.choice(_WORDS)}/{rng.choice(_WORDS)}_{j}.py": self._file_content(rng)
+            for j in range(files)
+        }
+        change = self.add_change(
+            project,
+            branch=rng.choice(("master", "master", "stable")),
+            subject=words.capitalize(),
+            owner=rng.choice(account_ids),
+            status=rng.choices(("NEW", "MERGED", "ABANDONED"), weights=(6, 3, 1))[0],
+            topic=rng.choice(("", "", f"topic-{rng.randint(1, 20)}")),
+            files=change_files,
+            patch_sets=rng.randint(1, max(1, patch_sets)),
+        )
+        for reviewer in rng.sample(account_ids, min(2, len(account_ids))):
+            change["reviewers"][reviewer] = {"Code-Review": rng.choice((0, 1, 2))}
+        # spread the updates, so the changes are not sorted by number
+        change["updated"] += rng.randint(0, 3600 * 24)
+
+    def _file_content(self, rng: random.Random) -> bytes:
+        lines, size = [], 0
+        while size < self.file_size:
+            line = "    " + " ".join(rng.choice(_WORDS) for _ in range(rng.randint(4, 12))) + "\n"
+            lines.append(line)
+            size += len(line)
+        return "".join(lines).encode("utf-8")
+
+    # -- lookups ----------------------------------------------------------------------
+
+    def _change(self, id_: str) -> Dict[str, Any]:
+        id_ = urlparse.unquote(id_)
+        parts = id_.split("~")
+        candidates: List[Dict[str, Any]] = []
+        if len(parts) == 1 and id_.isdigit():
+            candidates = [self.changes[int(id_)]] if int(id_) in self.changes else []
+        elif len(parts) == 1:
+            candidates = [c for c in self.changes.values() if c["change_id"] == id_]
+        elif len(parts) == 2 and parts[1].isdigit():
+            change = self.changes.get(int(parts[1]))
+            candidates = [change] if change and change["project"] == parts[0] else []
+        elif len(parts) == 3:
+            candidates = [
+                c for c in self.changes.values()
+                if (c["project"], c["branch"], c["change_id"]) == tuple(parts)
+            ]
+        if len(candidates) != 1:
+            raise _Error(404, f"Not found: {id_}")
+        return candidates[0]
+
+    @staticmethod
+    def _revision(change: Dict[str, Any], id_: str) -> Dict[str, Any]:
+        id_ = urlparse.unquote(id_)
+        revisions = change["revisions"]
+        if id_ in ("current", "0"):
+            return revisions[-1]
+        if id_.isdigit() and 0 < int(id_) <= len(revisions):
+            return revisions[int(id_) - 1]
+        for revision in revisions:
+            if len(id_) >= 4 and revision["sha"].startswith(id_):
+                return revision
+        raise _Error(404, f"Not found: {id_}")
+
+    def _account_id(self, id_: str) -> int:
+        id_ = urlparse.unquote(id_)
+        if id_ == "self":
+            return self.self_account
+        if id_.isdigit() and int(id_) in self.accounts:
+            return int(id_)
+        for account_id, account in self.accounts.items():
+            if id_ in (account["username"], account["email"], account["name"]):
+                return account_id
+        raise _Error(404, f"Account '{id_}' not found")
+
+    def _project(self, name: str) -> Dict[str, Any]:
+        name = urlparse.unquote(name)
+        if name not in self.projects:
+            raise _Error(404, f"Not found: {name}")
+        return self.projects[name]
+
+    def _group(self, id_: str) -> Dict[str, Any]:
+        id_ = urlparse.unquote(id_)
+        for group in self.groups.values():
+            if id_ in (group["id"], group["name"], str(group["group_id"])):
+                return group
+        raise _Error(404, f"Group Not Found: {id_}")
+
+    @staticmethod
+    def _ref(branch: str) -> str:
+        branch = urlparse.unquote(branch)
+        return branch if branch.startswith("refs/") else f"refs/heads/{branch}"
+
+    # -- entities ---------------------------------------------------------------------
+
+    def account_info(self, account_id: int, detailed: bool = True) -> Dict[str, Any]:
+        """
+        The AccountInfo of an account.
+
+        :param account_id: the account id
+        :param detailed: include the name, email, username and avatars
+        :return:
+        """
+        account = self.accounts[account_id]
+        if not detailed:
+            return {"_account_id": account_id}
+        info = {key: account[key] for key in ("_account_id", "name", "email", "username")}
+        info["avatars"] = [
+            {"url": f"https://www.gravatar.com/avatar/{_sha1(account['email'])}?d=identicon&s=32",
+             "height": 32}
+        ]
+        return info
+
+    def change_info(self, change: Dict[str, Any], options: Tuple[str, ...] = ()) -> Dict[str, Any]:
+        """
+        The ChangeInfo of a change, with the fields requested by the query options.
+
+        :param change: the change
+        :param options: options such as CURRENT_REVISION, ALL_FILES or DETAILED_LABELS
+        :return:
+        """
+        detailed = "DETAILED_ACCOUNTS" in options
+        files = change["revisions"][-1]["files"]
+        insertions = sum(content.count(b"\n") for content in files.values())
+        votes = [vote.get("Code-Review", 0) for vote in change["reviewers"].values()]
+        approved = 2 in votes and -2 not in votes
+        info: Dict[str, Any] = {
+            "id": f"{urlparse.quote(change['project'], safe='')}~"
+                  f"{urlparse.quote(change['branch'], safe='')}~{change['change_id']}",
+            "triplet_id": f"{change['project']}~{change['branch']}~{change['change_id']}",
+            "project": change["project"],
+            "branch": change["branch"],
+            "hashtags": list(change["hashtags"]),
+            "change_id": change["change_id"],
+            "subject": change["subject"],
+            "status": change["status"],
+            "created": format_timestamp(change["created"]),
+            "updated": format_timestamp(change["updated"]),
+            "submit_type": "MERGE_IF_NECESSARY",
+            "insertions": insertions,
+            "deletions": len(change["revisions"]) - 1,
+            "total_comment_count": 0,
+            "unresolved_comment_count": 0,
+            "has_review_started": True,
+            "meta_rev_id": _sha1("meta", change["_number"], change["updated"]),
+            "_number": change["_number"],
+            "owner": self.account_info(change["owner"], detailed),
+            "current_revision_number": len(change["revisions"]),
+            "requirements": [],
+            "submit_records": [{
+                "rule_name": "gerrit~DefaultSubmitRule",
+                "status": "CLOSED" if change["status"] != "NEW" else ("OK" if approved else "NOT_READY"),
+                "labels": [{"label": "Code-Review", "status": "OK" if approved else "NEED"}],
+            }],
+        }
+        if change["topic"]:
+            info["topic"] = change["topic"]
+        if change["status"] == "NEW":
+            info["mergeable"] = True
+        if change["submitted"] is not None:
+            info["submitted"] = format_timestamp(change["submitted"])
+            info["submitter"] = self.account_info(self.self_account, detailed)
+        if "LABELS" in options or "DETAILED_LABELS" in options:
+            info["labels"] = {"Code-Review": self._label_info(change, "DETAILED_LABELS" in options)}
+        if "MESSAGES" in options:
+            info["messages"] = [self._message_info(message) for message in change["messages"]]
+
+        all_revisions = any(o in options for o in ("ALL_REVISIONS", "ALL_COMMITS", "ALL_FILES"))
+        if all_revisions or any(o in options for o in ("CURRENT_REVISION", "CURRENT_COMMIT", "CURRENT_FILES")):
+            current = change["revisions"][-1]
+            info["current_revision"] = current["sha"]
+            revisions = change["revisions"] if all_revisions else [current]
+            info["revisions"] = {
+                revision["sha"]: self._revision_info(change, revision, options, detailed)
+                for revision in revisions
+            }
+        return info
+
+    def _label_info(self, change: Dict[str, Any], detailed: bool) -> Dict[str, Any]:
+        votes = {account: vote.get("Code-Review", 0) for account, vote in change["reviewers"].items()}
+        label: Dict[str, Any] = {}
+        if 2 in votes.values():
+            label["approved"] = self.account_info(next(a for a, v in votes.items() if v == 2))
+        if -2 in votes.values():
+            label["rejected"] = self.account_info(next(a for a, v in votes.items() if v == -2))
+        if 1 in votes.values():
+            label["recommended"] = self.account_info(next(a for a, v in votes.items() if v == 1))
+        if detailed:
+            label["all"] = [dict(self.account_info(account), value=value) for account, value in votes.items()]
+            label["values"] = dict(LABEL_VALUES)
+            label["default_value"] = 0
+        return label
+
+    def _message_info(self, message: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "id": message["id"],
+            "author": self.account_info(message["author"]),
+            "real_author": self.account_info(message["author"]),
+            "date": format_timestamp(message["date"]),
+            "message": message["message"],
+            "_revision_number": message["_revision_number"],
+        }
+
+    def _revision_info(self, change: Dict[str, Any], revision: Dict[str, Any],
+                       options: Tuple[str, ...], detailed: bool) -> Dict[str, Any]:
+        current = revision is change["revisions"][-1]
+        ref = f"refs/changes/{change['_number'] % 100:02d}/{change['_number']}/{revision['_number']}"
+        info: Dict[str, Any] = {
+            "kind": "REWORK",
+            "_number": revision["_number"],
+            "created": format_timestamp(revision["created"]),
+            "uploader": self.account_info(revision["uploader"], detailed),
+            "ref": ref,
+            "fetch": {"http": {"url": f"http://localhost/{change['project']}", "ref": ref}},
+        }
+        if "ALL_COMMITS" in options or ("CURRENT_COMMIT" in options and current):
+            info["commit"] = self._commit_info(change, revision)
+        if "ALL_FILES" in options or ("CURRENT_FILES" in options and current):
+            info["files"] = self._file_infos(revision, commit_msg=False)
+        return info
+
+    def _commit_info(self, change: Dict[str, Any], revision: Dict[str, Any]) -> Dict[str, Any]:
+        person = {
+            "name": self.accounts[change["owner"]]["name"],
+            "email": self.accounts[change["owner"]]["email"],
+            "date": format_timestamp(revision["created"]),
+            "tz": 0,
+        }
+        return {
+            "commit": revision["sha"],
+            "parents": [{"commit": change["parent"], "subject": "Initial commit"}],
+            "author": person,
+            "committer": dict(person),
+            "subject": change["subject"],
+            "message": f"{change['subject']}\n\nChange-Id: {change['change_id']}\n",
+        }
+
+    @staticmethod
+    def _file_infos(revision: Dict[str, Any], commit_msg: bool = True) -> Dict[str, Any]:
+        infos = {}
+        if commit_msg:
+            infos["/COMMIT_MSG"] = {"status": "A", "lines_inserted": 7, "size_delta": 551, "size": 551}
+        for path, content in sorted(revision["files"].items()):
+            infos[path] = {
+                "lines_inserted": content.count(b"\n"),
+                "size_delta": len(content),
+                "size": len(content),
+            }
+        return infos
+
+    def project_info(self, project: Dict[str, Any], with_name: bool = True) -> Dict[str, Any]:
+        """
+        The ProjectInfo of a project.
+
+        :param project: the project
+        :param with_name: include the name, which is the map key in project listings
+        :return:
+        """
+        info: Dict[str, Any] = {"id": urlparse.quote(project["name"], safe="")}
+        if with_name:
+            info["name"] = project["name"]
+        if project["parent"]:
+            info["parent"] = project["parent"]
+        if project["description"]:
+            info["description"] = project["description"]
+        info["state"] = project["state"]
+        info["labels"] = {"Code-Review": {"values": dict(LABEL_VALUES), "default_value": 0}}
+        info["web_links"] = [{"name": "browse", "url": f"/plugins/gitiles/{info['id']}", "target": "_blank"}]
+        return info
+
+    def group_info(self, group: Dict[str, Any], members: bool = False) -> Dict[str, Any]:
+        """
+        The GroupInfo of a group.
+
+        :param group: the group
+        :param members: include the members
+        :return:
+        """
+        info = {key: value for key, value in group.items() if key != "members"}
+        info["url"] = f"#/admin/groups/uuid-{group['id']}"
+        info["options"] = {"visible_to_all": False}
+        if members:
+            info["members"] = [self.account_info(account) for account in group["members"]]
+        return info
+
+    # -- queries ----------------------------------------------------------------------
+
+    def _matches(self, change: Dict[str, Any], term: str) -> bool:
+        negate = term.startswith("-")
+        term = term.lstrip("-")
+        key, colon, value = term.partition(":")
+        value = value.strip("\"{}")
+        if not colon:
+            key, value = "text", term.strip("\"{}")
+        return self._match_operator(change, key.lower(), value) != negate
+
+    def _match_operator(self, change: Dict[str, Any], key: str, value: str) -> bool:
+        if key in ("status", "is"):
+            if value in ("open", "pending", "new", "mergeable"):
+                return change["status"] == "NEW"
+            if value == "closed":
+                return change["status"] != "NEW"
+            if value in ("merged", "abandoned"):
+                return change["status"] == value.upper()
+        elif key in ("owner", "reviewer"):
+            try:
+                account_id = self._account_id(value)
+            except _Error:
+                return False
+            return change["owner"] == account_id if key == "owner" else account_id in change["reviewers"]
+
+        matchers: Dict[str, Callable[[], bool]] = {
+            "project": lambda: change["project"] == value,
+            "projects": lambda: change["project"].startswith(value),
+            "branch": lambda: change["branch"] == value.replace("refs/heads/", "", 1),
+            "topic": lambda: change["topic"] == value,
+            "hashtag": lambda: value in change["hashtags"],
+            "change": lambda: value in (str(change["_number"]), change["change_id"]),
+            "before": lambda: change["updated"] <= parse_timestamp(value),
+            "until": lambda: change["updated"] <= parse_timestamp(value),
+            "after": lambda: change["updated"] >= parse_timestamp(value),
+            "since": lambda: change["updated"] >= parse_timestamp(value),
+            "message": lambda: value.lower() in change["subject"].lower(),
+            "text": lambda: value.lower() in change["subject"].lower() or value == change["change_id"],
+        }
+        if key not in matchers:
+            raise _Error(400, f"Unsupported operator {key}:{value}")
+        return matchers[key]()
+
+    def _parse_query(self, query: str) -> Callable[[Dict[str, Any]], bool]:
+        # operators are ANDed, AND binds tighter than OR, "-"/NOT negate, parentheses group
+        tokens = [t for t in _CHANGE_QUERY_TOKEN.findall(query) if not t.startswith("limit:")]
+        position = 0
+
+        def peek() -> Optional[str]:
+            return tokens[position] if position < len(tokens) else None
+
+        def parse_or() -> Callable[[Dict[str, Any]], bool]:
+            nonlocal position
+            branches = [parse_and()]
+            while (peek() or "").upper() == "OR":
+                position += 1
+                branches.append(parse_and())
+            return lambda change: any(branch(change) for branch in branches)
+
+        def parse_and() -> Callable[[Dict[str, Any]], bool]:
+            nonlocal position
+            parts = []
+            while peek() is not None and peek() != ")" and peek().upper() != "OR":
+                if peek().upper() == "AND":
+                    position += 1
+                    continue
+                parts.append(parse_unary())
+            return lambda change: all(part(change) for part in parts)
+
+        def parse_unary() -> Callable[[Dict[str, Any]], bool]:
+            nonlocal position
+            token = tokens[position]
+            position += 1
+            if token.upper() == "NOT" or token == "-":
+                inner = parse_unary()
+                return lambda change: not inner(change)
+            if token == "(":
+                inner = parse_or()
+                if peek() != ")":
+                    raise _Error(400, f"Unbalanced parentheses in {query}")
+                position += 1
+                return inner
+            if token == ")":
+                raise _Error(400, f"Unbalanced parentheses in {query}")
+            key, colon, value = token.lstrip("-").partition(":")
+            if colon and (key.lower() not in _OPERATORS or
+                          key.lower() in ("is", "status") and value not in _STATUSES):
+                raise _Error(400, f"Unsupported operator {token}")
+            if key.lower() in ("before", "until", "after", "since"):
+                parse_timestamp(value)
+            return lambda change: self._matches(change, token)
+
+        predicate = parse_or()
+        if position != len(tokens):
+            raise _Error(400, f"Unbalanced parentheses in {query}")
+        return predicate
+
+    def query_changes_list(self, query: str) -> List[Dict[str, Any]]:
+        """
+        The changes matching a query, most recently updated first.
+
+        :param query: the query, operators are ANDed unless joined by OR, grouped by parentheses
+        :return:
+        """
+        predicate = self._parse_query(query)
+        with self.lock:
+            found = [c for c in self.changes.values() if predicate(c)]
+        found.sort(key=lambda c: (c["updated"], c["_number"]), reverse=True)
+        return found
+
+    # -- routes -----------------------------------------------------------------------
+
+    @_route("GET", r"/config/server/version")
+    def get_version(self, _query: Dict[str, List[str]], _body: Any) -> Any:
+        return "3.9.1"
+
+    @_route("GET", r"/changes/")
+    def query_changes(self, query: Dict[str, List[str]], _body: Any) -> Any:
+        options = tuple(query.get("o", ()))
+        results = []
+        for q in query.get("q") or ["status:open"]:
+            match = re.search(r"(?:^|\s)limit:(\d+)", q)
+            found = self.query_changes_list(q)
+            page, more = _page(found, query, limit=int(match.group(1)) if match else None)
+            infos = [self.change_info(change, options) for change in page]
+            if more and infos:
+                infos[-1]["_more_changes"] = True
+            results.append(infos)
+        return results[0] if len(results) == 1 else results
+
+    @_route("POST", r"/changes/?")
+    def create_change(self, _query: Dict[str, List[str]], body: Any) -> Any:
+        body = body or {}
+        project = body.get("project")
+        if not project or project not in self.projects:
+            raise _Error(400, f"Project Not Found: {project}")
+        branch = self._ref(body.get("branch") or "")
+        if branch not in self.projects[project]["branches"]:
+            raise _Error(400, f"Branch {branch} does not exist.")
+        if not body.get("subject"):
+            raise _Error(400, "commit message must be non-empty")
+        change = self.add_change(
+            project, branch[len("refs/heads/"):], body["subject"], topic=body.get("topic") or "",
+            status=body.get("status") or "NEW",
+        )
+        return 201, self.change_info(change)
+
+    @_route("GET", r"/changes/(?P<change>[^/]+)/?")
+    def get_change(self, query: Dict[str, List[str]], _body: Any, change: str) -> Any:
+        return self.change_info(self._change(change), tuple(query.get("o", ())))
+
+    @_route("GET", r"/changes/(?P<change>[^/]+)/detail")
+    def get_change_detail(self, query: Dict[str, List[str]], _body: Any, change: str) -> Any:
+        options = ("LABELS", "DETAILED_LABELS", "DETAILED_ACCOUNTS", "MESSAGES") + tuple(query.get("o", ()))
+        return self.change_info(self._change(change), options)
+
+    @_route("DELETE", r"/changes/(?P<change>[^/]+)")
+    def delete_change(self, _query: Dict[str, List[str]], _body: Any, change: str) -> Any:
+        found = self._change(change)
+        if found["status"] == "MERGED":
+            raise _Error(409, f"Change {found['_number']} has status MERGED")
+        del self.changes[found["_number"]]
+        return 204, None
+
+    @_route("POST", r"/changes/(?P<change>[^/]+)/(?P<action>abandon|restore|submit)")
+    def change_action(self, _query: Dict[str, List[str]], body: Any, change: str, action: str) -> Any:
+        found = self._change(change)
+        expected = "ABANDONED" if action == "restore" else "NEW"
+        if found["status"] != expected:
+            raise _Error(409, f"change is {found['status'].lower()}")
+        if action == "submit":
+            votes = [vote.get("Code-Review", 0) for vote in found["reviewers"].values()]
+            if 2 not in votes or -2 in votes:
+                raise _Error(409, f"Change {found['_number']}: submit requirement 'Code-Review' is unsatisfied.")
+            found["status"] = "MERGED"
+            found["submitted"] = self.tick()
+            self.projects[found["project"]]["branches"][self._ref(found["branch"])] = found["revisions"][-1]["sha"]
+        else:
+            found["status"] = "ABANDONED" if action == "abandon" else "NEW"
+        found["updated"] = self.tick()
+        message = (body or {}).get("message")
+        summary = {"abandon": "Abandoned", "restore": "Restored", "submit": "Change has been successfully merged"}
+        self._add_message(found, self.self_account, summary[action] + (f"\n\n{message}" if message else ""))
+        return self.change_info(found)
+
+    @_route("GET", r"/changes/(?P<change>[^/]+)/topic")
+    def get_topic(self, _query: Dict[str, List[str]], _body: Any, change: str) -> Any:
+        return self._change(change)["topic"]
+
+    @_route("PUT", r"/changes/(?P<change>[^/]+)/topic")
+    def set_topic(self, _query: Dict[str, List[str]], body: Any, change: str) -> Any:
+        found = self._change(change)
+        found["topic"] = (body or {}).get("topic") or ""
+        found["updated"] = self.tick()
+        return (200, found["topic"]) if found["topic"] else (204, None)
+
+    @_route("DELETE", r"/changes/(?P<change>[^/]+)/topic")
+    def delete_topic(self, _query: Dict[str, List[str]], _body: Any, change: str) -> Any:
+        found = self._change(change)
+        found["topic"] = ""
+        found["updated"] = self.tick()
+        return 204, None
+
+    @_route("GET", r"/changes/(?P<change>[^/]+)/hashtags")
+    def get_hashtags(self, _query: Dict[str, List[str]], _body: Any, change: str) -> Any:
+        return sorted(self._change(change)["hashtags"])
+
+    @_route("POST", r"/changes/(?P<change>[^/]+)/hashtags")
+    def set_hashtags(self, _query: Dict[str, List[str]], body: Any, change: str) -> Any:
+        found = self._change(change)
+        hashtags = set(found["hashtags"]) | set((body or {}).get("add", ()))
+        found["hashtags"] = sorted(hashtags - set((body or {}).get("remove", ())))
+        found["updated"] = self.tick()
+        return found["hashtags"]
+
+    @_route("GET", r"/changes/(?P<change>[^/]+)/messages")
+    def list_messages(self, _query: Dict[str, List[str]], _body: Any, change: str) -> Any:
+        return [self._message_info(message) for message in self._change(change)["messages"]]
+
+    def _reviewer_info(self, change: Dict[str, Any], account: int) -> Dict[str, Any]:
+        vote = change["reviewers"][account].get("Code-Review", 0)
+        return dict(self.account_info(account), approvals={"Code-Review": f"{vote:+d}" if vote else " 0"})
+
+    @_route("GET", r"/changes/(?P<change>[^/]+)/reviewers/?")
+    def list_reviewers(self, _query: Dict[str, List[str]], _body: Any, change: str) -> Any:
+        found = self._change(change)
+        return [self._reviewer_info(found, account) for account in found["reviewers"]]
+
+    @_route("POST", r"/changes/(?P<change>[^/]+)/reviewers/?")
+    def add_reviewer(self, _query: Dict[str, List[str]], body: Any, change: str) -> Any:
+        found = self._change(change)
+        reviewer = str((body or {}).get("reviewer", ""))
+        try:
+            accounts = [self._account_id(reviewer)]
+        except _Error:
+            try:
+                accounts = list(self._group(reviewer)["members"])
+            except _Error:
+                return {"input": reviewer, "error": f"Account '{reviewer}' not found"}
+        for account in accounts:
+            found["reviewers"].setdefault(account, {"Code-Review": 0})
+        found["updated"] = self.tick()
+        key = "ccs" if (body or {}).get("state") == "CC" else "reviewers"
+        return {"input": reviewer, key: [self._reviewer_info(found, account) for account in accounts]}
+
+    @_route("GET", r"/changes/(?P<change>[^/]+)/reviewers/(?P<account>[^/]+)/?")
+    def get_reviewer(self, _query: Dict[str, List[str]], _body: Any, change: str, account: str) -> Any:
+        found = self._change(change)
+        account_id = self._account_id(account)
+        if account_id not in found["reviewers"]:
+            raise _Error(404, f"Not found: {urlparse.unquote(account)}")
+        return [self._reviewer_info(found, account_id)]
+
+    @_route("DELETE", r"/changes/(?P<change>[^/]+)/reviewers/(?P<account>[^/]+)")
+    def delete_reviewer(self, _query: Dict[str, List[str]], _body: Any, change: str, account: str) -> Any:
+        found = self._change(change)
+        account_id = self._account_id(account)
+        if found["reviewers"].pop(account_id, None) is None:
+            raise _Error(404, f"Not found: {urlparse.unquote(account)}")
+        found["updated"] = self.tick()
+        return 204, None
+
+    @_route("GET", r"/changes/(?P<change>[^/]+)/revisions/(?P<revision>[^/]+)/commit")
+    def get_commit(self, _query: Dict[str, List[str]], _body: Any, change: str, revision: str) -> Any:
+        found = self._change(change)
+        return self._commit_info(found, self._revision(found, revision))
+
+    @_route("GET", r"/changes/(?P<change>[^/]+)/revisions/(?P<revision>[^/]+)/files/?")
+    def list_files(self, _query: Dict[str, List[str]], _body: Any, change: str, revision: str) -> Any:
+        found = self._change(change)
+        return self._file_infos(self._revision(found, revision))
+
+    @_route("GET", r"/changes/(?P<change>[^/]+)/revisions/(?P<revision>[^/]+)/files/(?P<path>[^/]+)/content")
+    def get_file_content(self, _query: Dict[str, List[str]], _body: Any, change: str, revision: str,
+                         path: str) -> Any:
+        found = self._change(change)
+        files = self._revision(found, revision)["files"]
+        path = urlparse.unquote(path)
+        if path not in files:
+            raise _Error(404, f"Not found: {path}")
+        return FakeResponse(
+            200, base64.b64encode(files[path]), "text/plain; charset=ISO-8859-1",
+            {"X-FYI-Content-Encoding": "base64", "X-FYI-Content-Type": "text/x-python"},
+        )
+
+    @_route("POST", r"/changes/(?P<change>[^/]+)/revisions/(?P<revision>[^/]+)/review")
+    def review(self, _query: Dict[str, List[str]], body: Any, change: str, revision: str) -> Any:
+        found = self._change(change)
+        revision_info = self._revision(found, revision)
+        if found["status"] != "NEW":
+            raise _Error(409, f"change is {found['status'].lower()}")
+        labels = (body or {}).get("labels") or {}
+        for label, value in labels.items():
+            if label != "Code-Review" or int(value) not in (-2, -1, 0, 1, 2):
+                raise _Error(400, f"label \"{label}\" is not a configured label")
+            found["reviewers"].setdefault(self.self_account, {})[label] = int(value)
+        found["updated"] = self.tick()
+        votes = " ".join(f"{label}{int(value):+d}" for label, value in labels.items())
+        message = (body or {}).get("message") or ""
+        self._add_message(
+            found, self.self_account,
+            f"Patch Set {revision_info['_number']}:" + (f" {votes}" if votes else "")
+            + (f"\n\n{message}" if message else ""),
+        )
+        return {"labels": labels}
+
+    @_route("GET", r"/projects/")
+    def list_projects(self, query: Dict[str, List[str]], _body: Any) -> Any:
+        q = _first(query, "query")
+        if q is not None:
+            return self._query_projects(q, query)
+        names = sorted(self.projects)
+        prefix, match, regex = _first(query, "p"), _first(query, "m"), _first(query, "r")
+        if prefix:
+            names = [n for n in names if n.startswith(prefix)]
+        if match:
+            names = [n for n in names if match.lower() in n.lower()]
+        if regex:
+            names = [n for n in names if re.fullmatch(regex, n)]
+        state = _first(query, "state")
+        if state:
+            names = [n for n in names if self.projects[n]["state"] == state]
+        branch = _first(query, "b")
+        if branch:
+            names = [n for n in names if self._ref(branch) in self.projects[n]["branches"]]
+        if _first(query, "all") is None:
+            names, _ = _page(names, query)
+        result = {}
+        for name in names:
+            info = self.project_info(self.projects[name], with_name=False)
+            if _first(query, "d") not in ("1", "true", ""):
+                info.pop("description", None)
+            if branch:
+                info["branches"] = {branch: self.projects[name]["branches"][self._ref(branch)]}
+            result[name] = info
+        return result
+
+    def _query_projects(self, q: str, query: Dict[str, List[str]]) -> Any:
+        found = []
+        for name in sorted(self.projects):
+            project = self.projects[name]
+            ok = True
+            for term in _QUERY_TOKEN.findall(q):
+                key, _, value = term.partition(":")
+                value = value.strip("\"{}")
+                if key == "name":
+                    ok &= name == value
+                elif key == "inname":
+                    ok &= value.lower() in name.lower()
+                elif key == "state":
+                    ok &= project["state"] == value.upper()
+                elif key == "parent":
+                    ok &= project["parent"] == value
+                elif key == "description":
+                    ok &= value.lower() in project["description"].lower()
+                else:
+                    ok &= term.lower() in name.lower()
+            if ok:
+                found.append(project)
+        page, more = _page(found, query, "limit", "start")
+        infos = [self.project_info(project) for project in page]
+        if more and infos:
+            infos[-1]["_more_projects"] = True
+        return infos
+
+    @_route("GET", r"/projects/(?P<project>[^/]+)/?")
+    def get_project(self, _query: Dict[str, List[str]], _body: Any, project: str) -> Any:
+        return self.project_info(self._project(project))
+
+    @_route("PUT", r"/projects/(?P<project>[^/]+)")
+    def create_project(self, _query: Dict[str, List[str]], body: Any, project: str) -> Any:
+        name = urlparse.unquote(project)
+        if name in self.projects:
+            raise _Error(409, "Project Already Exists")
+        body = body or {}
+        parent = body.get("parent") or "All-Projects"
+        if parent not in self.projects:
+            raise _Error(422, f"Not found: {parent}")
+        branches = tuple(b.replace("refs/heads/", "", 1) for b in body.get("branches") or ["master"])
+        created = self.add_project(name, parent, body.get("description") or "", branches)
+        self.tick()
+        return 201, self.project_info(created)
+
+    @_route("POST", r"/projects/(?P<project>[^/]+)/delete-project~delete")
+    def delete_project(self, _query: Dict[str, List[str]], body: Any, project: str) -> Any:
+        name = self._project(project)["name"]
+        if any(c["project"] == name and c["status"] == "NEW" for c in self.changes.values()):
+            if not (body or {}).get("force"):
+                raise _Error(409, f"Project {name} has open changes")
+        for number in [n for n, c in self.changes.items() if c["project"] == name]:
+            del self.changes[number]
+        del self.projects[name]
+        self.tick()
+        return 204, None
+
+    def _branch_info(self, project: Dict[str, Any], ref: str) -> Dict[str, Any]:
+        info: Dict[str, Any] = {"ref": ref, "revision": project["branches"][ref]}
+        if ref.startswith("refs/heads/"):
+            info["can_delete"] = True
+        return info
+
+    @_route("GET", r"/projects/(?P<project>[^/]+)/branches/?")
+    def list_branches(self, query: Dict[str, List[str]], _body: Any, project: str) -> Any:
+        found = self._project(project)
+        refs = sorted(found["branches"])
+        match, regex = _first(query, "m"), _first(query, "r")
+        if match:
+            refs = [r for r in refs if match.lower() in r.lower()]
+        if regex:
+            refs = [r for r in refs if re.fullmatch(regex, r)]
+        infos = [{"ref": "HEAD", "revision": "master"}] + [self._branch_info(found, ref) for ref in refs]
+        return _page(infos, query)[0]
+
+    @_route("GET", r"/projects/(?P<project>[^/]+)/branches/(?P<branch>[^/]+)/?")
+    def get_branch(self, _query: Dict[str, List[str]], _body: Any, project: str, branch: str) -> Any:
+        found = self._project(project)
+        ref = self._ref(branch)
+        if ref not in found["branches"]:
+            raise _Error(404, f"Not found: {urlparse.unquote(branch)}")
+        return self._branch_info(found, ref)
+
+    @_route("PUT", r"/projects/(?P<project>[^/]+)/branches/(?P<branch>[^/]+)")
+    def create_branch(self, _query: Dict[str, List[str]], body: Any, project: str, branch: str) -> Any:
+        found = self._project(project)
+        ref = self._ref(branch)
+        if ref in found["branches"]:
+            raise _Error(409, f"branch \"{ref}\" already exists")
+        revision = (body or {}).get("revision") or "master"
+        found["branches"][ref] = found["branches"].get(self._ref(revision), revision)
+        self.tick()
+        return 201, self._branch_info(found, ref)
+
+    @_route("DELETE", r"/projects/(?P<project>[^/]+)/branches/(?P<branch>[^/]+)")
+    def delete_branch(self, _query: Dict[str, List[str]], _body: Any, project: str, branch: str) -> Any:
+        found = self._project(project)
+        if found["branches"].pop(self._ref(branch), None) is None:
+            raise _Error(404, f"Not found: {urlparse.unquote(branch)}")
+        self.tick()
+        return 204, None
+
+    @_route("GET", r"/projects/(?P<project>[^/]+)/branches/(?P<branch>[^/]+)/files/(?P<path>[^/]+)/content")
+    def get_branch_file_content(self, _query: Dict[str, List[str]], _body: Any, project: str, branch: str,
+                                path: str) -> Any:
+        found = self._project(project)
+        head = found["branches"].get(self._ref(branch))
+        files = found["files"].get(head, {})
+        merged = [c for c in self.changes.values()
+                  if c["project"] == found["name"] and c["revisions"][-1]["sha"] == head]
+        if merged:
+            files = merged[0]["revisions"][-1]["files"]
+        path = urlparse.unquote(path)
+        if path not in files:
+            raise _Error(404, f"Not found: {path}")
+        return FakeResponse(200, base64.b64encode(files[path]), "text/plain; charset=ISO-8859-1",
+                            {"X-FYI-Content-Encoding": "base64"})
+
+    @staticmethod
+    def _account_matches(account: Dict[str, Any], term: str) -> bool:
+        key, _, value = term.partition(":")
+        value = value.strip("\"{}")
+        if key in ("username", "email", "name"):
+            return account[key] == value
+        if key == "is" and value == "active":
+            return True
+        needle = term.strip("\"{}").lower()
+        return any(needle in str(account[f]).lower() for f in ("username", "email", "name"))
+
+    @_route("GET", r"/accounts/")
+    def query_accounts(self, query: Dict[str, List[str]], _body: Any) -> Any:
+        q = _first(query, "q") or ""
+        options = query.get("o", ())
+        found = [
+            account_id for account_id, account in sorted(self.accounts.items())
+            if all(self._account_matches(account, term) for term in _QUERY_TOKEN.findall(q))
+        ]
+        default = 10 if "suggest" in query else None
+        page, more = _page(found, query, limit=default)
+        infos = [self.account_info(account_id, "DETAILS" in options) for account_id in page]
+        if "ALL_EMAILS" in options:
+            for info in infos:
+                info["secondary_emails"] = []
+        if more and infos:
+            infos[-1]["_more_accounts"] = True
+        return infos
+
+    @_route("GET", r"/accounts/(?P<account>[^/]+)(?:/|/detail)?")
+    def get_account(self, _query: Dict[str, List[str]], _body: Any, account: str) -> Any:
+        account_id = self._account_id(account)
+        info = self.account_info(account_id)
+        info["registered_on"] = self.accounts[account_id]["registered_on"]
+        return info
+
+    @_route("PUT", r"/accounts/(?P<account>[^/]+)")
+    def create_account(self, _query: Dict[str, List[str]], body: Any, account: str) -> Any:
+        username = urlparse.unquote(account)
+        if any(a["username"] == username for a in self.accounts.values()):
+            raise _Error(409, f"username '{username}' already exists")
+        body = body or {}
+        account_id = self.add_account(username, body.get("name"), body.get("email"))
+        for group in body.get("groups") or ():
+            self._group(group)["members"].append(account_id)
+        return 201, self.account_info(account_id)
+
+    @staticmethod
+    def _group_matches(group: Dict[str, Any], term: str) -> bool:
+        key, _, value = term.partition(":")
+        value = value.strip("\"{}")
+        if key == "name":
+            return group["name"] == value
+        if key == "inname":
+            return value.lower() in group["name"].lower()
+        if key == "owner":
+            return group["owner"] == value
+        return term.lower() in group["name"].lower()
+
+    @_route("GET", r"/groups/")
+    def list_groups(self, query: Dict[str, List[str]], _body: Any) -> Any:
+        members = "MEMBERS" in query.get("o", ())
+        groups = sorted(self.groups.values(), key=lambda g: g["name"])
+        q = _first(query, "query")
+        if q is not None:
+            found = [
+                group for group in groups
+                if all(self._group_matches(group, term) for term in _QUERY_TOKEN.findall(q))
+            ]
+            page, more = _page(found, query, "limit", "start")
+            infos = [self.group_info(group, members) for group in page]
+            if more and infos:
+                infos[-1]["_more_groups"] = True
+            return infos
+
+        match = _first(query, "m")
+        if match:
+            groups = [g for g in groups if match.lower() in g["name"].lower()]
+        page, _ = _page(groups, query)
+        return {
+            group["name"]: {k: v for k, v in self.group_info(group, members).items() if k != "name"}
+            for group in page
+        }
+
+    @_route("GET", r"/groups/(?P<group>[^/]+)(?:/|/detail)?")
+    def get_group(self, _query: Dict[str, List[str]], _body: Any, group: str) -> Any:
+        return self.group_info(self._group(group))
+
+    @_route("PUT", r"/groups/(?P<group>[^/]+)")
+    def create_group(self, _query: Dict[str, List[str]], body: Any, group: str) -> Any:
+        name = urlparse.unquote(group)
+        if any(g["name"] == name for g in self.groups.values()):
+            raise _Error(409, f"group '{name}' already exists")
+        members = tuple(self._account_id(m) for m in (body or {}).get("members") or ())
+        created = self.add_group(name, (body or {}).get("description") or "", members)
+        return 201, self.group_info(created)
+
+    @_route("GET", r"/groups/(?P<group>[^/]+)/members/?")
+    def list_members(self, _query: Dict[str, List[str]], _body: Any, group: str) -> Any:
+        return [self.account_info(account) for account in self._group(group)["members"]]
+
+    @_route("GET", r"/groups/(?P<group>[^/]+)/members/(?P<account>[^/]+)/?")
+    def get_member(self, _query: Dict[str, List[str]], _body: Any, group: str, account: str) -> Any:
+        found, account_id = self._group(group), self._account_id(account)
+        if account_id not in found["members"]:
+            raise _Error(404, f"Not found: {urlparse.unquote(account)}")
+        return self.account_info(account_id)
+
+    @_route("PUT", r"/groups/(?P<group>[^/]+)/members/(?P<account>[^/]+)")
+    def add_member(self, _query: Dict[str, List[str]], _body: Any, group: str, account: str) -> Any:
+        found, account_id = self._group(group), self._account_id(account)
+        if account_id in found["members"]:
+            return self.account_info(account_id)
+        found["members"].append(account_id)
+        return 201, self.account_info(account_id)
+
+    @_route("DELETE", r"/groups/(?P<group>[^/]+)/members/(?P<account>[^/]+)")
+    def remove_member(self, _query: Dict[str, List[str]], _body: Any, group: str, account: str) -> Any:
+        found, account_id = self._group(group), self._account_id(account)
+        if account_id not in found["members"]:
+            raise _Error(404, f"Not found: {urlparse.unquote(account)}")
+        found["members"].remove(account_id)
+        return 204, None
+
+    # -- dispatch ---------------------------------------------------------------------
+
+    def handle(self, method: str, path: str, body: bytes = b"",
+               headers: Optional[Dict[str, str]] = None) -> FakeResponse:
+        """
+        Answer a request.
+
+        :param method: the HTTP method
+        :param path: the path and query string, with or without the /a prefix
+        :param body: the request body
+        :param headers: the request headers
+        :return:
+        """
+        headers = {key.lower(): value for key, value in (headers or {}).items()}
+        split = urlparse.urlsplit(path)
+        route_path = split.path[2:] if split.path.startswith("/a/") else split.path
+        query = urlparse.parse_qs(split.query, keep_blank_values=True)
+        try:
+            payload = json.loads(body.decode("utf-8").lstrip(")]}'")) if body.strip() else None
+        except ValueError:
+            payload = body.decode("utf-8", errors="replace")
+
+        try:
+            result = self._dispatch(method, route_path, query, payload)
+        except _Error as error:
+            return FakeResponse(error.status, f"{error.message}\n".encode("utf-8"), "text/plain; charset=UTF-8")
+        except (ValueError, TypeError, AttributeError) as error:
+            # malformed parameters or input, e.g. a bad timestamp or a non-object body
+            return FakeResponse(400, f"{error}\n".encode("utf-8"), "text/plain; charset=UTF-8")
+
+        if isinstance(result, FakeResponse):
+            return result
+        return self._render(method, result, query, headers)
+
+    def _dispatch(self, method: str, route_path: str, query: Dict[str, List[str]], payload: Any) -> Any:
+        for route_method, pattern, handler in self.routes:
+            match = pattern.fullmatch(route_path)
+            if route_method == method.upper() and match:
+                with self.lock:
+                    return handler(query, payload, **match.groupdict())
+        raise _Error(404, "Not Found")
+
+    @staticmethod
+    def _render(method: str, result: Any, query: Dict[str, List[str]], headers: Dict[str, str]) -> FakeResponse:
+        status, result = result if isinstance(result, tuple) else (200, result)
+        if status == 204:
+            return FakeResponse(204)
+
+        compact = _first(query, "pp") == "0" or "application/json" in headers.get("accept", "")
+        text = json.dumps(result, separators=(",", ":")) if compact else json.dumps(result, indent=2)
+        response = FakeResponse(status, MAGIC_PREFIX + text.encode("utf-8"), "application/json; charset=utf-8")
+        if method.upper() == "GET":
+            etag = '"' + hashlib.md5(response.body).hexdigest() + '"'  # nosec
+            response.headers["ETag"] = etag
+            if headers.get("if-none-match") == etag:
+                return FakeResponse(304, headers={"ETag": etag})
+        return response
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # headers and body are written separately, Nagle plus delayed ACKs would stall keep-alive
+    disable_nagle_algorithm = True
+    server: "_Server"
+
+    def _handle(self) -> None:
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else b""
+        server = self.server.owner
+        if server.latency:
+            time.sleep(server.latency)
+        response = server.gerrit.handle(self.command, self.path, body, dict(self.headers.items()))
+
+        payload = response.body
+        headers = dict(response.headers)
+        if server.compress and len(payload) > 512 and "gzip" in self.headers.get("Accept-Encoding", ""):
+            payload = gzip.compress(payload, compresslevel=1)
+            headers["Content-Encoding"] = "gzip"
+        self.send_response(response.status)
+        for key, value in headers.items():
+            self.send_header(key, value)
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(payload)
+        server.record(self.command, response.status, len(payload))
+
+    do_GET = do_POST = do_PUT = do_DELETE = do_HEAD = _handle
+
+    def log_message(self, format: str, *args: Any) -> None:  # pylint: disable=redefined-builtin
+        logger.debug("%s - " + format, self.address_string(), *args)
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    owner: "FakeGerritServer"
+
+
+class FakeGerritServer:
+    """
+    Serves a :class:`FakeGerrit` over HTTP on localhost, in a background thread.
+
+    .. code-block:: python
+
+        from gerrit import GerritClient
+        from tests.fakeserver import FakeGerrit, FakeGerritServer
+
+        with FakeGerritServer(FakeGerrit().seed(changes=500), latency=0.005) as server:
+            client = GerritClient(base_url=server.url)
+            for change in client.changes.iter_search("is:open", page_size=100):
+                print(change["_number"])
+            print(server.stats)
+    """
+
+    def __init__(self, gerrit: Optional[FakeGerrit] = None, host: str = "127.0.0.1", port: int = 0,
+                 latency: float = 0.0, compress: bool = True) -> None:
+        """
+        :param gerrit: the state served, an empty FakeGerrit by default
+        :param host: the interface to listen on
+        :param port: the port, a free one if 0
+        :param latency: seconds added to every response
+        :param compress: gzip responses for clients accepting gzip, as Gerrit does
+        """
+        self.gerrit = gerrit if gerrit is not None else FakeGerrit()
+        self.latency = latency
+        self.compress = compress
+        self._httpd = _Server((host, port), _Handler)
+        self._httpd.owner = self
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self.requests: Dict[str, int] = {}
+        self.statuses: Dict[int, int] = {}
+        self.bytes_sent = 0
+
+    @property
+    def url(self) -> str:
+        """
+        The base url of the server, e.g. http://127.0.0.1:54321.
+
+        :return:
+        """
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def record(self, method: str, status: int, size: int) -> None:
+        with self._lock:
+            self.requests[method] = self.requests.get(method, 0) + 1
+            self.statuses[status] = self.statuses.get(status, 0) + 1
+            self.bytes_sent += size
+
+    def reset_stats(self) -> None:
+        """
+        Reset the request counters.
+
+        :return:
+        """
+        with self._lock:
+            self.requests.clear()
+            self.statuses.clear()
+            self.bytes_sent = 0
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """
+        Requests by method and status, and bytes sent in response bodies.
+
+        :return:
+        """
+        with self._lock:
+            return {
+                "requests": sum(self.requests.values()),
+                "methods": dict(self.requests),
+                "statuses": dict(self.statuses),
+                "bytes_sent": self.bytes_sent,
+            }
+
+    def start(self) -> "FakeGerritServer":
+        """
+        Start serving in a daemon thread.
+
+        :return: self
+        """
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._httpd.serve_forever, name="fake-gerrit", daemon=True
+            )
+            self._thread.start()
+        return self
+
+    def serve_forever(self) -> None:
+        """
+        Serve in the calling thread until interrupted.
+
+        :return:
+        """
+        self._httpd.serve_forever()
+
+    def stop(self) -> None:
+        """
+        Stop serving and close the socket.
+
+        :return:
+        """
+        if self._thread is not None:
+            self._httpd.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._httpd.server_close()
+
+    def __enter__(self) -> "FakeGerritServer":
+        return self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """
+    Serve a seeded fake Gerrit until interrupted, e.g.
+    ``python -m tests.fakeserver --port 8080 --changes 5000``.
+    """
+    import argparse  # pylint: disable=import-outside-toplevel
+
+    parser = argparse.ArgumentParser(description="Serve a fake Gerrit REST API.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080, help="0 picks a free port")
+    parser.add_argument("--changes", type=int, default=1000)
+    parser.add_argument("--projects", type=int, default=10)
+    parser.add_argument("--accounts", type=int, default=50)
+    parser.add_argument("--groups", type=int, default=10)
+    parser.add_argument("--files", type=int, default=3, help="files per patch set")
+    parser.add_argument("--file-size", type=int, default=2048, help="bytes per file")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds added to every response")
+    args = parser.parse_args(argv)
+
+    fake = FakeGerrit(file_size=args.file_size).seed(
+        changes=args.changes, projects=args.projects, accounts=args.accounts,
+        groups=args.groups, files=args.files, seed=args.seed,
+    )
+    server = FakeGerritServer(fake, host=args.host, port=args.port, latency=args.latency)
+    print(f"Serving fake Gerrit on {server.url}", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -21,6 +21,19 @@ logger = logging.getLogger(__name__)
 
 class TestGerritAccounts:
 
+    def test_iter_search_follows_more_accounts(self, mock_gerrit):
+        mock_gerrit.get.side_effect = [
+            [{"_account_id": 1, "_more_accounts": True}],
+            [{"_account_id": 2}],
+        ]
+
+        from gerrit.accounts.accounts import GerritAccounts
+        accounts = GerritAccounts(gerrit=mock_gerrit)
+        result = list(accounts.iter_search(query="name:John", page_size=1, detailed=True))
+        assert result == [{"_account_id": 1}, {"_account_id": 2}]
+        _, kwargs = mock_gerrit.get.call_args
+        assert kwargs["params"] == {"n": 1, "S": 1, "o": ["DETAILS"]}
+
     def test_search_accounts(self, mock_gerrit):
         mock_gerrit.get.return_value = [ACCOUNT_DATA]
 
@@ -79,8 +92,8 @@ class TestGerritAccounts:
             accounts.get(account="nobody")
 
     def test_create_account(self, mock_gerrit):
-        # put() succeeds; accounts.get() calls gerrit.get() twice (get + poll)
-        mock_gerrit.get.side_effect = [ACCOUNT_DATA, ACCOUNT_DATA]
+        # put() returns no AccountInfo; falls back to accounts.get → a single gerrit.get
+        mock_gerrit.get.side_effect = [ACCOUNT_DATA]
 
         from gerrit.accounts.accounts import GerritAccounts
         accounts = GerritAccounts(gerrit=mock_gerrit)
@@ -209,6 +222,15 @@ class TestGerritAccount:
         groups = mock_account.groups
         assert len(groups) > 0
 
+    def test_get_groups_builds_groups_from_listing(self, mock_account):
+        mock_account.gerrit.get.reset_mock()
+        mock_account.gerrit.get.return_value = [{"id": "abc", "name": "Developers"}]
+        groups = mock_account.groups
+        assert groups[0].id == "abc"
+        assert groups[0].name == "Developers"
+        mock_account.gerrit.get.assert_called_once()
+        mock_account.gerrit.groups.get.assert_not_called()
+
     def test_get_avatar(self, mock_account):
         mock_account.gerrit.get.return_value = b"\x89PNG\r\n..."
         avatar = mock_account.get_avatar()
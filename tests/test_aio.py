@@ -0,0 +1,197 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Unit tests for gerrit.aio — requests go to an in-process aiohttp server.
+"""
+import asyncio
+import json
+import pytest
+
+from tests.conftest import CHANGE_DATA, ACCOUNT_DATA, PROJECT_DATA, GROUP_DATA
+
+aiohttp = pytest.importorskip("aiohttp")
+from aiohttp import web  # noqa: E402
+from aiohttp.test_utils import TestServer  # noqa: E402
+
+
+def _json_response(data, status=200):
+    body = ")]}'\n" + json.dumps(data)
+    return web.Response(status=status, text=body, content_type="application/json")
+
+
+def _make_app(calls):
+    async def changes_query(request):
+        calls.append(("GET", request.path_qs))
+        return _json_response([CHANGE_DATA])
+
+    async def change(request):
+        calls.append((request.method, request.path_qs))
+        if request.match_info["id"] == "missing":
+            return web.Response(status=404, reason="Not Found")
+        if request.method == "DELETE":
+            return web.Response(status=204)
+        return _json_response(CHANGE_DATA)
+
+    async def create_change(request):
+        payload = await request.json()
+        calls.append(("POST", request.path_qs, payload))
+        return _json_response(dict(CHANGE_DATA, subject=payload["subject"]), status=201)
+
+    async def account(request):
+        calls.append(("GET", request.path_qs))
+        return _json_response(ACCOUNT_DATA)
+
+    async def project(request):
+        calls.append(("GET", request.path_qs))
+        return _json_response(PROJECT_DATA)
+
+    async def group(request):
+        calls.append(("GET", request.path_qs))
+        return _json_response(GROUP_DATA)
+
+    async def version(request):
+        calls.append(("GET", request.path_qs, request.headers.get("Authorization")))
+        return _json_response("3.8.0")
+
+    async def access(request):
+        calls.append(("GET", request.path_qs))
+        return _json_response({p: {} for p in request.query.getall("project")})
+
+    app = web.Application()
+    app.router.add_get("/a/changes/", changes_query)
+    app.router.add_post("/a/changes/", create_change)
+    app.router.add_route("*", "/a/changes/{id}/", change)
+    app.router.add_route("DELETE", "/a/changes/{id}", change)
+    app.router.add_get("/a/accounts/{id}/", account)
+    app.router.add_get("/a/projects/{name}", project)
+    app.router.add_get("/a/groups/{id}/", group)
+    app.router.add_get("/a/config/server/version", version)
+    app.router.add_get("/a/access/", access)
+    return app
+
+
+def _run(scenario):
+    """Start the fake server, run scenario(client, calls) and return its result."""
+    from gerrit.aio import AsyncGerritClient
+
+    async def main():
+        calls = []
+        server = TestServer(_make_app(calls))
+        await server.start_server()
+        try:
+            base_url = str(server.make_url("")).rstrip("/")
+            async with AsyncGerritClient(base_url=base_url, username="admin", password="secret") as client:
+                return await scenario(client, calls)
+        finally:
+            await server.close()
+
+    return asyncio.run(main())
+
+
+class TestAsyncGerritClient:
+
+    def test_auth_suffix(self):
+        from gerrit.aio import AsyncGerritClient
+        client = AsyncGerritClient(base_url="http://localhost:8080/", username="u", password="p")
+        assert client.get_endpoint_url("/changes/") == "http://localhost:8080/a/changes/"
+
+    def test_anonymous_has_no_auth_suffix(self):
+        from gerrit.aio import AsyncGerritClient
+        client = AsyncGerritClient(base_url="http://localhost:8080")
+        assert client.get_endpoint_url("/changes/") == "http://localhost:8080/changes/"
+
+    def test_facade_properties(self):
+        from gerrit.aio import AsyncGerritClient
+        from gerrit.aio.changes import AsyncGerritChanges
+        from gerrit.aio.projects import AsyncGerritProjects
+        from gerrit.aio.accounts import AsyncGerritAccounts
+        from gerrit.aio.groups import AsyncGerritGroups
+        from gerrit.aio.config import AsyncGerritConfig
+        from gerrit.aio.plugins import AsyncGerritPlugins
+        from gerrit.aio.access import AsyncGerritAccess
+
+        client = AsyncGerritClient(base_url="http://localhost:8080")
+        assert isinstance(client.changes, AsyncGerritChanges)
+        assert isinstance(client.projects, AsyncGerritProjects)
+        assert isinstance(client.accounts, AsyncGerritAccounts)
+        assert isinstance(client.groups, AsyncGerritGroups)
+        assert isinstance(client.config, AsyncGerritConfig)
+        assert isinstance(client.plugins, AsyncGerritPlugins)
+        assert isinstance(client.access, AsyncGerritAccess)
+
+    def test_search_changes_passes_list_options(self):
+        async def scenario(client, calls):
+            return await client.changes.search("is:open+owner:self", options=["LABELS", "CURRENT_REVISION"])
+
+        result = _run(scenario)
+        assert result == [CHANGE_DATA]
+
+    def test_search_query_string(self):
+        async def scenario(client, calls):
+            await client.changes.search("is:open", options=["LABELS", "MESSAGES"], limit=5)
+            return calls
+
+        calls = _run(scenario)
+        assert calls == [("GET", "/a/changes/?q=is:open&o=LABELS&o=MESSAGES&n=5&S=0")]
+
+    def test_get_change(self):
+        async def scenario(client, calls):
+            return await client.changes.get("1234")
+
+        assert _run(scenario) == CHANGE_DATA
+
+    def test_get_change_not_found(self):
+        from gerrit.utils.exceptions import ChangeNotFoundError
+
+        async def scenario(client, calls):
+            with pytest.raises(ChangeNotFoundError):
+                await client.changes.get("missing")
+            return True
+
+        assert _run(scenario)
+
+    def test_create_and_delete_change(self):
+        async def scenario(client, calls):
+            created = await client.changes.create({"project": "myProject", "subject": "async"})
+            await client.changes.delete("1234")
+            return created, calls
+
+        created, calls = _run(scenario)
+        assert created["subject"] == "async"
+        assert ("DELETE", "/a/changes/1234") in calls
+
+    def test_other_facades(self):
+        async def scenario(client, calls):
+            return (
+                await client.accounts.get("self"),
+                await client.projects.get("myProject"),
+                await client.groups.get(GROUP_DATA["id"]),
+                await client.version,
+                await client.access.list(["All-Projects", "myProject"]),
+            )
+
+        account, project, group, version, access = _run(scenario)
+        assert account == ACCOUNT_DATA
+        assert project == PROJECT_DATA
+        assert group == GROUP_DATA
+        assert version == "3.8.0"
+        assert set(access) == {"All-Projects", "myProject"}
+
+    def test_basic_auth_sent(self):
+        import base64
+
+        async def scenario(client, calls):
+            await client.version
+            return calls
+
+        calls = _run(scenario)
+        assert calls[-1][2] == "Basic " + base64.b64encode(b"admin:secret").decode()
+
+    def test_concurrent_requests_share_one_session(self):
+        async def scenario(client, calls):
+            results = await asyncio.gather(*[client.changes.get(str(i)) for i in range(50)])
+            return results, client.requester.session
+
+        results, session = _run(scenario)
+        assert len(results) == 50
+        assert session.closed
@@ -0,0 +1,117 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+# @Author: Jialiang Shi
+"""
+Tests for gerrit.utils.bulk and GerritClient.bulk.
+"""
+import asyncio
+import threading
+import time
+import pytest
+
+from gerrit import GerritClient
+from gerrit.utils.bulk import BulkExecutor
+from gerrit.utils.exceptions import ConflictError
+from tests.fakeserver import FakeGerrit, FakeGerritServer
+from gerrit.utils.ratelimit import RateLimiter
+from gerrit.utils.tracing import Tracer
+
+
+class TestBulkExecutor:
+
+    def test_collects_values_and_errors_in_order(self):
+        def fail():
+            raise ValueError("boom")
+
+        progress = []
+        results = BulkExecutor(max_workers=4, progress=lambda r, done, total: progress.append((done, total))).run(
+            [("a", lambda: 1), ("b", fail), lambda: 3]
+        )
+
+        assert [r.key for r in results] == ["a", "b", 2]
+        assert results.values() == {"a": 1, 2: 3}
+        assert [r.key for r in results.failed] == ["b"]
+        assert isinstance(results.errors()["b"], ValueError)
+        assert not results.ok
+        assert sorted(progress) == [(1, 3), (2, 3), (3, 3)]
+        assert results[1].to_dict()["error"] == "ValueError: boom"
+
+    def test_bounded_parallelism(self):
+        lock, running, peak = threading.Lock(), [0], [0]
+
+        def op():
+            with lock:
+                running[0] += 1
+                peak[0] = max(peak[0], running[0])
+            time.sleep(0.01)
+            with lock:
+                running[0] -= 1
+
+        results = BulkExecutor(max_workers=3).run([op] * 12)
+        assert results.ok
+        assert 1 < peak[0] <= 3
+
+    def test_failing_progress_callback(self):
+        results = BulkExecutor(progress=lambda *args: 1 / 0).run([lambda: 1, lambda: 2])
+        assert results.values() == {0: 1, 1: 2}
+
+    def test_invalid_operations(self):
+        with pytest.raises(ValueError):
+            BulkExecutor(max_workers=0)
+        with pytest.raises(TypeError):
+            BulkExecutor().run([("a", None)])
+
+    def test_spans_nest_under_caller(self):
+        spans = []
+        tracer = Tracer(exporters=[spans.append])
+
+        def op(name):
+            with tracer.span(name):
+                pass
+
+        with tracer.span("release"):
+            BulkExecutor(max_workers=2).run([lambda: op("one"), lambda: op("two")])
+
+        assert [span.name for span in spans] == ["release"]
+        assert sorted(child.name for child in spans[0].children) == ["one", "two"]
+
+    def test_run_async(self):
+        running, peak = [0], [0]
+
+        async def op(value):
+            running[0] += 1
+            peak[0] = max(peak[0], running[0])
+            await asyncio.sleep(0.01)
+            running[0] -= 1
+            if value == 3:
+                raise ValueError("three")
+            return value * 2
+
+        operations = [(i, lambda i=i: op(i)) for i in range(6)]
+        results = asyncio.run(BulkExecutor(max_workers=2).run_async(operations))
+
+        assert results.values() == {0: 0, 1: 2, 2: 4, 4: 8, 5: 10}
+        assert list(results.errors()) == [3]
+        assert peak[0] == 2
+
+
+class TestClientBulk:
+
+    def test_bulk_mutations_against_fake_server(self):
+        fake = FakeGerrit().seed(changes=20)
+        numbers = [c["_number"] for c in fake.query_changes_list("status:open")][:6]
+        with FakeGerritServer(fake) as server:
+            waits = []
+            limiter = RateLimiter(rates={"POST": (1, 1)}, sleep=waits.append)
+            client = GerritClient(base_url=server.url, rate_limiter=limiter)
+            changes = [client.changes.get(number) for number in numbers]
+            changes[0].abandon()
+
+            results = client.bulk([(change.number, change.abandon) for change in changes], max_workers=4)
+
+        assert [r.key for r in results] == numbers
+        assert [r.key for r in results.failed] == [numbers[0]]
+        assert isinstance(results[0].error, ConflictError)
+        assert all(r.value["status"] == "ABANDONED" for r in results.succeeded)
+        assert all(r.duration > 0 for r in results)
+        assert len(waits) >= len(numbers) - 1
@@ -0,0 +1,467 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Unit tests for the response caches in gerrit.utils.
+"""
+import json
+import threading
+import time
+import pytest
+import requests
+from unittest.mock import MagicMock, patch
+
+from gerrit.utils.blobcache import BlobCache, auth_identity, is_immutable
+from gerrit.utils.cache import ETagCache, ResponseCache
+from gerrit.utils.common import endpoint_family, endpoint_segments
+from gerrit.utils.singleflight import SingleFlight
+
+
+BASE_URL = "http://localhost:8080"
+
+
+def _json_response(data):
+    response = MagicMock()
+    response.status_code = 200
+    response.headers = {"content-type": "application/json"}
+    response.encoding = "utf-8"
+    response.content = (")]}'\n" + json.dumps(data)).encode("utf-8")
+    return response
+
+
+@pytest.fixture
+def client():
+    with patch("gerrit.base.requests.Session") as MockSession:
+        MockSession.return_value = MagicMock()
+
+        from gerrit.base import GerritClient
+        client = GerritClient(
+            base_url=BASE_URL, username="admin", password="secret", cache=ResponseCache()
+        )
+    client.requester.get = MagicMock(side_effect=lambda url, **kwargs: _json_response({"url": url}))
+    client.requester.post = MagicMock(return_value=_json_response({}))
+    client.requester.put = MagicMock(return_value=_json_response({}))
+    client.requester.delete = MagicMock(return_value=_json_response({}))
+    return client
+
+
+# ===========================================================================
+# endpoint helpers
+# ===========================================================================
+
+class TestEndpointHelpers:
+
+    def test_segments_drop_auth_prefix_and_query(self):
+        assert endpoint_segments("/a/changes/123/revisions/1?o=X") == [
+            "changes", "123", "revisions", "1"
+        ]
+
+    def test_segments_of_url(self):
+        assert endpoint_segments(BASE_URL + "/a/projects/p") == ["projects", "p"]
+
+    def test_family(self):
+        assert endpoint_family("/config/server/info") == "config"
+        assert endpoint_family("/changes/?q=is:open") == "changes"
+        assert endpoint_family("/") == ""
+
+
+# ===========================================================================
+# ResponseCache
+# ===========================================================================
+
+class TestResponseCache:
+
+    def test_key_ignores_param_order(self):
+        assert ResponseCache.make_key("/changes/", {"q": "x", "n": 1}) == ResponseCache.make_key(
+            "/changes/", [("n", 1), ("q", "x")]
+        )
+        assert ResponseCache.make_key("/changes/", {"o": ["A", "B"]}) != ResponseCache.make_key(
+            "/changes/", {"o": ["A"]}
+        )
+
+    def test_lookup_returns_copy(self):
+        cache = ResponseCache()
+        key = cache.make_key("/projects/p")
+        cache.store(key, "/projects/p", {"labels": {}})
+
+        hit, value = cache.lookup(key)
+        value["labels"]["Code-Review"] = {}
+        assert hit
+        assert cache.lookup(key) == (True, {"labels": {}})
+
+    def test_ttl_per_family(self):
+        cache = ResponseCache(ttls={"changes": 5, "config": 100})
+        with patch("gerrit.utils.cache.time.monotonic", return_value=1000.0):
+            cache.store("c", "/changes/1", 1)
+            cache.store("s", "/config/server/info", 2)
+        with patch("gerrit.utils.cache.time.monotonic", return_value=1010.0):
+            assert cache.lookup("c") == (False, None)
+            assert cache.lookup("s") == (True, 2)
+
+    def test_zero_ttl_disables_family(self):
+        cache = ResponseCache(ttls={"changes": 0})
+        cache.store("c", "/changes/1", 1)
+        assert len(cache) == 0
+
+    def test_lru_eviction(self):
+        cache = ResponseCache(max_entries=2)
+        cache.store("a", "/projects/a", 1)
+        cache.store("b", "/projects/b", 2)
+        cache.lookup("a")
+        cache.store("c", "/projects/c", 3)
+        assert cache.lookup("b") == (False, None)
+        assert cache.lookup("a") == (True, 1)
+        assert cache.stats["evictions"] == 1
+
+    def test_invalidate_resource_and_listings(self):
+        cache = ResponseCache()
+        for endpoint in ["/changes/1/detail", "/changes/1/revisions/2/files", "/changes/?q=x",
+                         "/changes/2/detail", "/projects/p"]:
+            cache.store(endpoint, endpoint, {})
+
+        assert cache.invalidate("/changes/1/revisions/2/review") == 3
+        assert cache.lookup("/changes/2/detail")[0]
+        assert cache.lookup("/projects/p")[0]
+
+    def test_invalid_max_entries(self):
+        with pytest.raises(ValueError):
+            ResponseCache(max_entries=0)
+
+    def test_stats(self):
+        cache = ResponseCache()
+        cache.store("a", "/projects/a", 1)
+        cache.lookup("a")
+        cache.lookup("b")
+        stats = cache.stats
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_ratio"] == 0.5
+        assert stats["size"] == 1
+
+
+class TestGerritClientCache:
+
+    def test_repeated_get_served_from_cache(self, client):
+        first = client.get("/config/server/info")
+        second = client.get("/config/server/info")
+        assert first == second
+        client.requester.get.assert_called_once()
+        assert client.cache.stats["hits"] == 1
+
+    def test_params_are_part_of_key(self, client):
+        client.get("/changes/", params={"q": "is:open"})
+        client.get("/changes/", params={"q": "is:merged"})
+        assert client.requester.get.call_count == 2
+
+    def test_streamed_get_not_cached(self, client):
+        client.get("/changes/1/revisions/1/patch", stream=True)
+        client.get("/changes/1/revisions/1/patch", stream=True)
+        assert client.requester.get.call_count == 2
+
+    @pytest.mark.parametrize("method", ["post", "put", "delete"])
+    def test_mutation_invalidates(self, client, method):
+        client.get("/changes/1/detail")
+        getattr(client, method)("/changes/1/topic")
+        client.get("/changes/1/detail")
+        assert client.requester.get.call_count == 2
+
+    def test_failed_mutation_invalidates(self, client):
+        client.get("/projects/p/config")
+        client.requester.put.side_effect = requests.exceptions.Timeout("timed out")
+        with pytest.raises(requests.exceptions.Timeout):
+            client.put("/projects/p/config", json={})
+        client.get("/projects/p/config")
+        assert client.requester.get.call_count == 2
+
+    def test_facade_reads_hit_cache(self, client):
+        client.projects.get("myProject")
+        client.projects.get("myProject")
+        client.requester.get.assert_called_once()
+
+
+# ===========================================================================
+# ETagCache / conditional requests
+# ===========================================================================
+
+def _etag_response(data, etag, status_code=200):
+    response = _json_response(data)
+    response.status_code = status_code
+    response.headers = {"content-type": "application/json", "ETag": etag}
+    if status_code == 304:
+        response.content = b""
+    return response
+
+
+@pytest.fixture
+def etag_client():
+    with patch("gerrit.base.requests.Session") as MockSession:
+        MockSession.return_value = MagicMock()
+
+        from gerrit.base import GerritClient
+        client = GerritClient(
+            base_url=BASE_URL, username="admin", password="secret", etag_cache=ETagCache()
+        )
+    return client
+
+
+class TestConditionalRequests:
+
+    def test_first_request_is_unconditional(self, etag_client):
+        etag_client.requester.get = MagicMock(return_value=_etag_response({"a": 1}, '"abc"'))
+        assert etag_client.get("/changes/1/detail") == {"a": 1}
+        assert "headers" not in etag_client.requester.get.call_args.kwargs
+        assert len(etag_client.etag_cache) == 1
+
+    def test_not_modified_served_from_store(self, etag_client):
+        etag_client.requester.get = MagicMock(side_effect=[
+            _etag_response({"a": 1}, '"abc"'),
+            _etag_response(None, '"abc"', status_code=304),
+        ])
+        first = etag_client.get("/changes/1/detail", params={"o": ["LABELS"]})
+        first["a"] = 2
+        second = etag_client.get("/changes/1/detail", params={"o": ["LABELS"]})
+
+        assert second == {"a": 1}
+        headers = etag_client.requester.get.call_args.kwargs["headers"]
+        assert headers["If-None-Match"] == '"abc"'
+        assert etag_client.etag_cache.stats["not_modified"] == 1
+
+    def test_modified_replaces_entry(self, etag_client):
+        etag_client.requester.get = MagicMock(side_effect=[
+            _etag_response({"a": 1}, '"abc"'),
+            _etag_response({"a": 2}, '"def"'),
+        ])
+        etag_client.get("/changes/1/detail")
+        assert etag_client.get("/changes/1/detail") == {"a": 2}
+        key = ETagCache.make_key("/changes/1/detail")
+        assert etag_client.etag_cache.lookup(key) == '"def"'
+        assert etag_client.etag_cache.stats["modified"] == 1
+
+    def test_not_modified_after_eviction_refetches(self, etag_client):
+        etag_client.requester.get = MagicMock(side_effect=[
+            _etag_response(None, '"abc"', status_code=304),
+            _etag_response({"a": 1}, '"abc"'),
+        ])
+        key = ETagCache.make_key("/changes/1/detail")
+        etag_client.etag_cache.store(key, '"abc"', {"a": 0})
+        with patch.object(etag_client.etag_cache, "not_modified_value", return_value=(False, None)):
+            assert etag_client.get("/changes/1/detail") == {"a": 1}
+        assert "If-None-Match" not in etag_client.requester.get.call_args.kwargs["headers"]
+
+    def test_response_without_etag_not_stored(self, etag_client):
+        response = _json_response({"a": 1})
+        etag_client.requester.get = MagicMock(return_value=response)
+        etag_client.get("/changes/1/detail")
+        assert len(etag_client.etag_cache) == 0
+
+    def test_bounded(self):
+        cache = ETagCache(max_entries=1)
+        cache.store("a", '"1"', 1)
+        cache.store("b", '"2"', 2)
+        assert cache.lookup("a") is None
+        assert cache.lookup("b") == '"2"'
+
+
+# ===========================================================================
+# BlobCache
+# ===========================================================================
+
+SHA = "76016386a0d8ecc7b6be212424978bb45959d668"
+
+
+class TestBlobCache:
+
+    @pytest.mark.parametrize("endpoint, params, expected", [
+        (f"/changes/1/revisions/{SHA}/commit", None, True),
+        (f"/changes/1/revisions/{SHA}/patch?zip", None, True),
+        (f"/changes/1/revisions/{SHA}/files/README/content", None, True),
+        (f"/changes/1/revisions/{SHA}/files/README/download", None, True),
+        (f"/changes/1/revisions/{SHA}/files", {}, True),
+        (f"/changes/1/revisions/{SHA}/files", {"reviewed": 1}, False),
+        (f"/changes/1/revisions/{SHA}/files", {"q": "src"}, False),
+        (f"/projects/p/commits/{SHA}", None, True),
+        (f"/projects/p/commits/{SHA}/files/", None, True),
+        (f"/projects/p/commits/{SHA}/files/a%2Fb/content", None, True),
+        ("/changes/1/revisions/current/commit", None, False),
+        (f"/changes/1/revisions/{SHA}/review", None, False),
+        (f"/changes/1/revisions/{SHA}/files/README/diff", None, False),
+    ])
+    def test_is_immutable(self, endpoint, params, expected):
+        assert is_immutable(endpoint, params) is expected
+
+    def test_survives_restart(self, tmp_path):
+        path = str(tmp_path / "blobs.sqlite3")
+        key = BlobCache.make_key(BASE_URL + f"/projects/p/commits/{SHA}")
+
+        cache = BlobCache(path)
+        cache.store(key, {"commit": SHA})
+        cache.close()
+
+        cache = BlobCache(path)
+        assert cache.lookup(key) == (True, {"commit": SHA})
+        assert cache.lookup(BlobCache.make_key("other")) == (False, None)
+
+    def test_identical_contents_stored_once(self):
+        cache = BlobCache(":memory:")
+        cache.store("a", "same content")
+        cache.store("b", "same content")
+        stats = cache.stats
+        assert stats["entries"] == 2
+        assert stats["blobs"] == 1
+
+    def test_compressed(self):
+        cache = BlobCache(":memory:")
+        cache.store("a", "x" * 100000)
+        assert cache.size < 1000
+
+    def test_size_cap_evicts_least_recently_used(self):
+        cache = BlobCache(":memory:", max_bytes=2500, compress_level=0)
+        with patch("gerrit.utils.blobcache.time.time", side_effect=range(100)):
+            cache.store("a", "a" * 1000)
+            cache.store("b", "b" * 1000)
+            cache.lookup("a")
+            cache.store("c", "c" * 1000)
+
+        assert cache.lookup("b") == (False, None)
+        assert cache.lookup("a")[0]
+        assert cache.lookup("c")[0]
+        assert cache.size <= 2500
+
+    def test_client_uses_blob_cache_for_immutable_endpoints(self, client):
+        client.cache = None
+        client.blob_cache = BlobCache(":memory:")
+
+        client.get(f"/changes/1/revisions/{SHA}/commit")
+        client.get(f"/changes/1/revisions/{SHA}/commit")
+        client.get("/changes/1/revisions/current/commit")
+        client.get("/changes/1/revisions/current/commit")
+        assert client.requester.get.call_count == 3
+        assert client.blob_cache.stats["hits"] == 1
+
+    def test_keys_separate_users(self, client):
+        client.cache = None
+        client.blob_cache = BlobCache(":memory:")
+        client.get(f"/changes/1/revisions/{SHA}/commit")
+
+        client.session.auth = ("other", "secret")
+        client.get(f"/changes/1/revisions/{SHA}/commit")
+        assert client.requester.get.call_count == 2
+        assert client.blob_cache.stats["hits"] == 0
+
+    def test_auth_identity(self):
+        import requests
+        session = requests.Session()
+        assert auth_identity(session) == "anonymous"
+        session.cookies.set("GerritAccount", "token")
+        cookie_identity = auth_identity(session)
+        assert cookie_identity.startswith("cookies:") and "token" not in cookie_identity
+        session.auth = requests.auth.HTTPBasicAuth("admin", "secret")
+        assert auth_identity(session) == "user:admin"
+        session.auth = ("admin", "secret")
+        assert auth_identity(session) == "user:admin"
+
+
+# ===========================================================================
+# SingleFlight / request coalescing
+# ===========================================================================
+
+class TestSingleFlight:
+
+    def _run_concurrently(self, func, count):
+        results, errors = [None] * count, []
+
+        def worker(index):
+            try:
+                results[index] = func()
+            except Exception as error:  # noqa: BLE001
+                errors.append(error)
+
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(count)]
+        for thread in threads:
+            thread.start()
+        return threads, results, errors
+
+    def test_concurrent_calls_share_one_call(self):
+        flight = SingleFlight()
+        release = threading.Event()
+        fn = MagicMock(side_effect=lambda: release.wait() and {"id": 1})
+
+        threads, results, errors = self._run_concurrently(lambda: flight.do("k", fn), 8)
+        while flight.stats["shared"] < 7:
+            time.sleep(0.001)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        fn.assert_called_once()
+        assert not errors
+        assert results == [{"id": 1}] * 8
+        assert len({id(result) for result in results}) == 8
+
+    def test_error_raised_in_every_caller(self):
+        flight = SingleFlight()
+        release = threading.Event()
+
+        def fn():
+            release.wait()
+            raise requests.exceptions.ConnectionError("down")
+
+        threads, _, errors = self._run_concurrently(lambda: flight.do("k", fn), 4)
+        while flight.stats["shared"] < 3:
+            time.sleep(0.001)
+        release.set()
+        for thread in threads:
+            thread.join()
+        assert len(errors) == 4
+
+    def test_sequential_calls_not_shared(self):
+        flight = SingleFlight()
+        fn = MagicMock(return_value=1)
+        flight.do("k", fn)
+        flight.do("k", fn)
+        assert fn.call_count == 2
+        assert flight.stats == {"calls": 2, "shared": 0, "in_flight": 0}
+
+    def test_forget_starts_new_call(self):
+        flight = SingleFlight()
+        release = threading.Event()
+        first = threading.Thread(target=flight.do, args=("k", release.wait))
+        first.start()
+        while flight.stats["in_flight"] == 0:
+            time.sleep(0.001)
+
+        flight.forget()
+        fn = MagicMock(return_value=2)
+        assert flight.do("k", fn) == 2
+        release.set()
+        first.join()
+        fn.assert_called_once()
+
+
+class TestGerritClientCoalescing:
+
+    def test_concurrent_gets_share_one_request(self, client):
+        release = threading.Event()
+        client.cache = None
+        client.single_flight = SingleFlight()
+        client.requester.get = MagicMock(
+            side_effect=lambda url, **kwargs: release.wait() and _json_response({"id": 1})
+        )
+
+        threads = [threading.Thread(target=client.get, args=("/changes/1",)) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        while client.single_flight.stats["shared"] < 4:
+            time.sleep(0.001)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        client.requester.get.assert_called_once()
+
+    def test_coalescing_enabled_by_flag(self):
+        with patch("gerrit.base.requests.Session") as MockSession:
+            MockSession.return_value = MagicMock()
+
+            from gerrit.base import GerritClient
+            client = GerritClient(base_url=BASE_URL, coalesce_requests=True)
+        assert isinstance(client.single_flight, SingleFlight)
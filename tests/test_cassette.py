@@ -0,0 +1,113 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+# @Author: Jialiang Shi
+"""
+Tests for gerrit.utils.cassette, recorded against the fake Gerrit server.
+"""
+import functools
+import pytest
+
+from gerrit import GerritClient
+from gerrit.utils.cassette import Cassette, RecordingRequester, ReplayRequester, request_key
+from gerrit.utils.exceptions import ChangeNotFoundError, UnrecordedRequestError
+from tests.fakeserver import FakeGerrit, FakeGerritServer
+from gerrit.utils.metrics import MetricsRegistry
+
+
+@pytest.fixture(scope="module")
+def server():
+    with FakeGerritServer(FakeGerrit().seed(changes=30, projects=2, accounts=3)) as server:
+        yield server
+
+
+def _workload(client):
+    assert client.version == "3.9.1"
+    numbers = [c["_number"] for c in client.changes.iter_search("is:open", page_size=5)]
+    change = client.changes.get(numbers[0])
+    change.get_revision().get_commit()
+    change.set_topic("cassette")
+    with pytest.raises(ChangeNotFoundError):
+        client.changes.get("987654")
+    return numbers
+
+
+def _record(server, path):
+    client = GerritClient(
+        base_url=server.url, requester_class=functools.partial(RecordingRequester, str(path))
+    )
+    numbers = _workload(client)
+    client.requester.save()
+    return client, numbers
+
+
+def _replay(path, **kwargs):
+    return GerritClient(
+        base_url="http://gerrit.invalid",
+        requester_class=functools.partial(ReplayRequester, str(path), **kwargs),
+    )
+
+
+class TestCassette:
+
+    def test_request_key(self):
+        assert request_key("get", "http://h:8080/a/changes/?q=x&n=5") == "GET /a/changes/?n=5&q=x"
+        assert request_key("GET", "http://h/changes/1") == "GET /changes/1"
+
+    def test_match_order_and_repeats(self):
+        cassette = Cassette([
+            {"key": "GET /x", "body": None, "status": 200, "content": "1"},
+            {"key": "GET /x", "body": None, "status": 200, "content": "2"},
+        ])
+        assert cassette.match("GET", "http://h/x")[0]["content"] == "1"
+        assert cassette.match("GET", "http://h/x")[0]["content"] == "2"
+        assert cassette.match("GET", "http://h/x") == (cassette.interactions[1], True)
+        assert cassette.match("GET", "http://h/x", allow_repeats=False) == (None, False)
+        assert cassette.match("GET", "http://h/y") == (None, False)
+        cassette.rewind()
+        assert cassette.match("GET", "http://h/x")[0]["content"] == "1"
+
+
+class TestRecordReplay:
+
+    @pytest.mark.parametrize("name", ["trace.jsonl", "trace.jsonl.gz"])
+    def test_replay_matches_recording(self, server, tmp_path, name):
+        path = tmp_path / name
+        recorded, numbers = _record(server, path)
+        assert len(Cassette.load(str(path)).interactions) == len(recorded.requester.cassette.interactions)
+
+        metrics = MetricsRegistry()
+        client = GerritClient(
+            base_url="http://gerrit.invalid",
+            metrics=metrics,
+            requester_class=functools.partial(ReplayRequester, str(path)),
+        )
+        assert _workload(client) == numbers
+        stats = client.requester.stats
+        assert stats["requests"] == len(recorded.requester.cassette.interactions)
+        assert stats["misses"] == stats["repeats"] == 0
+        assert stats["bytes"] == sum(e["response_bytes"] for e in metrics.snapshot().values())
+
+    def test_unrecorded_request(self, server, tmp_path):
+        path = tmp_path / "trace.jsonl"
+        _record(server, path)
+        client = _replay(path)
+        with pytest.raises(UnrecordedRequestError):
+            client.get("/accounts/self")
+        assert client.requester.stats["misses"] == 1
+
+    def test_injected_latency_and_bandwidth(self, server, tmp_path):
+        path = tmp_path / "trace.jsonl"
+        _record(server, path)
+        delays = []
+        client = _replay(path, latency=0.05, bandwidth=1000, sleep=delays.append)
+        version = client.version
+
+        assert version == "3.9.1"
+        assert len(delays) == 1
+        size = client.requester.stats["bytes"]
+        assert delays[0] == pytest.approx(0.05 + size / 1000)
+        assert client.requester.stats["delay"] == pytest.approx(delays[0])
+
+    def test_invalid_bandwidth(self):
+        with pytest.raises(ValueError):
+            ReplayRequester(Cassette(), bandwidth=0)
@@ -20,6 +20,38 @@ logger = logging.getLogger(__name__)
 
 class TestGerritChanges:
 
+    def test_iter_search_follows_more_changes(self, mock_gerrit):
+        mock_gerrit.get.side_effect = [
+            [{"_number": 1}, {"_number": 2, "_more_changes": True}],
+            [{"_number": 3}],
+        ]
+
+        from gerrit.changes.changes import GerritChanges
+        changes = GerritChanges(gerrit=mock_gerrit)
+        result = list(changes.iter_search(query="status:open", page_size=2))
+        assert result == [{"_number": 1}, {"_number": 2}, {"_number": 3}]
+        assert mock_gerrit.get.call_count == 2
+        _, kwargs = mock_gerrit.get.call_args
+        assert kwargs["params"]["S"] == 2
+        assert kwargs["params"]["n"] == 2
+
+    def test_iter_search_is_lazy(self, mock_gerrit):
+        mock_gerrit.get.return_value = [{"_number": 1, "_more_changes": True}]
+
+        from gerrit.changes.changes import GerritChanges
+        changes = GerritChanges(gerrit=mock_gerrit)
+        iterator = changes.iter_search(query="status:open", page_size=1)
+        assert mock_gerrit.get.call_count == 0
+        next(iterator)
+        assert mock_gerrit.get.call_count == 1
+
+    def test_iter_search_empty(self, mock_gerrit):
+        mock_gerrit.get.return_value = []
+
+        from gerrit.changes.changes import GerritChanges
+        changes = GerritChanges(gerrit=mock_gerrit)
+        assert list(changes.iter_search(query="status:open")) == []
+
     def test_search_changes(self, mock_gerrit):
         mock_gerrit.get.return_value = [CHANGE_DATA]
 
@@ -36,6 +68,88 @@ class TestGerritChanges:
         result = changes.search(query="status:open", options=["LABELS"], limit=10)
         assert isinstance(result, list)
 
+    def test_iter_search_keyset(self, mock_gerrit):
+        mock_gerrit.get.side_effect = [
+            [
+                {"_number": 5, "updated": "2024-01-01 10:00:03.000000000"},
+                {"_number": 4, "updated": "2024-01-01 10:00:02.000000000", "_more_changes": True},
+            ],
+            [
+                {"_number": 4, "updated": "2024-01-01 10:00:02.000000000"},
+                {"_number": 3, "updated": "2024-01-01 10:00:01.500000001"},
+                {"_number": 2, "updated": "2024-01-01 10:00:01.000000000"},
+            ],
+        ]
+
+        from gerrit.changes.changes import GerritChanges
+        changes = GerritChanges(gerrit=mock_gerrit)
+        result = list(changes.iter_search(query="status:open", page_size=3, keyset=True))
+
+        assert [c["_number"] for c in result] == [5, 4, 3, 2]
+        args, kwargs = mock_gerrit.get.call_args
+        assert args[0] == '/changes/?q=(status:open) before:"2024-01-01 10:00:02.000 -0000"'
+        assert kwargs["params"]["S"] == 0
+
+    def test_iter_search_keyset_steps_over_ties(self, mock_gerrit):
+        tie = "2024-01-01 10:00:00.000000000"
+        mock_gerrit.get.side_effect = [
+            [{"_number": 9, "updated": tie}, {"_number": 8, "updated": tie, "_more_changes": True}],
+            [{"_number": 9, "updated": tie}, {"_number": 8, "updated": tie, "_more_changes": True}],
+            [{"_number": 7, "updated": tie}, {"_number": 6, "updated": "2023-12-31 00:00:00.000000000"}],
+        ]
+
+        from gerrit.changes.changes import GerritChanges
+        changes = GerritChanges(gerrit=mock_gerrit)
+        result = list(changes.iter_search(query="is:open", page_size=2, keyset=True))
+
+        assert [c["_number"] for c in result] == [9, 8, 7, 6]
+        assert mock_gerrit.get.call_args.kwargs["params"]["S"] == 2
+
+    def test_keyset_boundary(self):
+        from gerrit.utils.pagination import keyset_boundary
+        assert keyset_boundary("2024-01-01 10:00:00.123000000") == '"2024-01-01 10:00:00.123 -0000"'
+        assert keyset_boundary("2024-01-01 23:59:59.999000001") == '"2024-01-02 00:00:00.000 -0000"'
+        assert keyset_boundary("2024-01-01 10:00:00") == '"2024-01-01 10:00:00.000 -0000"'
+
+    def test_search_many_packs_queries(self, mock_gerrit):
+        mock_gerrit.get_endpoint_url.return_value = "http://example.com/changes/?"
+        mock_gerrit.get.return_value = [[{"_number": 1}], [], [{"_number": 2}]]
+
+        from gerrit.changes.changes import GerritChanges
+        changes = GerritChanges(gerrit=mock_gerrit)
+        result = changes.search_many(["is:open", "is:merged", "owner:self", "is:open"], limit=5)
+
+        assert result == [[{"_number": 1}], [], [{"_number": 2}], [{"_number": 1}]]
+        mock_gerrit.get.assert_called_once_with(
+            "/changes/?q=is:open&q=is:merged&q=owner:self", params={"n": 5}
+        )
+
+    def test_search_many_splits_on_url_length(self, mock_gerrit):
+        mock_gerrit.get_endpoint_url.return_value = "http://example.com/changes/?"
+        mock_gerrit.get.side_effect = [
+            [[{"_number": 1}], [{"_number": 2}]],
+            [{"_number": 3}],
+        ]
+
+        from gerrit.changes.changes import GerritChanges
+        changes = GerritChanges(gerrit=mock_gerrit)
+        queries = ["project:" + "a" * 40, "project:" + "b" * 40, "project:" + "c" * 40]
+        result = changes.search_many(queries, options=["LABELS"], max_url_length=160)
+
+        assert result == [[{"_number": 1}], [{"_number": 2}], [{"_number": 3}]]
+        assert [call.args[0].count("q=") for call in mock_gerrit.get.call_args_list] == [2, 1]
+
+    def test_stream_search(self, mock_gerrit):
+        mock_gerrit.iter_json.return_value = iter([CHANGE_DATA])
+
+        from gerrit.changes.changes import GerritChanges
+        changes = GerritChanges(gerrit=mock_gerrit)
+        result = list(changes.stream_search("is:open", options=["ALL_REVISIONS"]))
+        assert result == [CHANGE_DATA]
+        mock_gerrit.iter_json.assert_called_once_with(
+            "/changes/?q=is:open", params={"o": ["ALL_REVISIONS"], "S": 0}
+        )
+
     def test_get_change(self, mock_gerrit):
         mock_gerrit.get.return_value = CHANGE_DATA
 
@@ -46,6 +160,41 @@ class TestGerritChanges:
         assert isinstance(change, GerritChange)
         assert change.id == CHANGE_DATA["id"]
 
+    def test_get_change_fetches_once(self, mock_gerrit):
+        mock_gerrit.get.return_value = CHANGE_DATA
+
+        from gerrit.changes.changes import GerritChanges
+        changes = GerritChanges(gerrit=mock_gerrit)
+        change = changes.get(id_="I8473b95934b5732ac55d26311a706c9c2bde9940")
+        assert change.to_dict() == CHANGE_DATA
+        mock_gerrit.get.assert_called_once()
+
+    def test_change_from_data_does_not_fetch(self, mock_gerrit):
+        from gerrit.changes.change import GerritChange
+        change = GerritChange(id=CHANGE_DATA["id"], gerrit=mock_gerrit, data=CHANGE_DATA)
+        assert change.subject == CHANGE_DATA["subject"]
+        mock_gerrit.get.assert_not_called()
+
+    def test_lazy_change_fetches_on_first_access(self, mock_gerrit):
+        mock_gerrit.get.return_value = CHANGE_DATA
+
+        from gerrit.changes.change import GerritChange
+        change = GerritChange(id=CHANGE_DATA["id"], gerrit=mock_gerrit, lazy=True)
+        mock_gerrit.get.assert_not_called()
+
+        assert change.subject == CHANGE_DATA["subject"]
+        assert change.project == CHANGE_DATA["project"]
+        mock_gerrit.get.assert_called_once_with(f"/changes/{CHANGE_DATA['id']}")
+
+    def test_lazy_change_unknown_attribute(self, mock_gerrit):
+        mock_gerrit.get.return_value = CHANGE_DATA
+
+        from gerrit.changes.change import GerritChange
+        change = GerritChange(id=CHANGE_DATA["id"], gerrit=mock_gerrit, lazy=True)
+        with pytest.raises(AttributeError):
+            change.no_such_field
+        mock_gerrit.get.assert_called_once()
+
     def test_get_change_not_found(self, mock_gerrit):
         response_mock = MagicMock()
         response_mock.status_code = 404
@@ -371,6 +520,34 @@ class TestGerritChange:
         revision = mock_change.get_revision(revision_id=1)
         assert isinstance(revision, GerritChangeRevision)
 
+    def test_get_revision_is_lazy(self, mock_change):
+        gerrit = mock_change.gerrit
+        gerrit.get.reset_mock()
+        gerrit.get.return_value = {"commit": "abc123", "subject": "Test change"}
+
+        revision = mock_change.get_revision()
+        gerrit.get.assert_not_called()
+
+        assert revision.subject == "Test change"
+        assert revision.commit == "abc123"
+        gerrit.get.assert_called_once_with(f"/changes/{CHANGE_DATA['id']}/revisions/current/commit")
+
+    def test_get_project_and_branch_are_lazy(self, mock_change):
+        gerrit = mock_change.gerrit
+        gerrit.get.reset_mock()
+        project = mock_change.get_project()
+        branch = mock_change.get_branch()
+        gerrit.get.assert_not_called()
+
+        gerrit.get.return_value = {"id": "myProject", "state": "ACTIVE"}
+        assert project.state == "ACTIVE"
+        gerrit.get.assert_called_once_with("/projects/myProject")
+
+        gerrit.get.return_value = {"ref": "refs/heads/master", "revision": "abc123"}
+        assert branch.revision == "abc123"
+        gerrit.get.assert_called_with("/projects/myProject/branches/master")
+        assert gerrit.get.call_count == 2
+
     def test_messages_property(self, mock_change):
         from gerrit.changes.messages import GerritChangeMessages
         assert isinstance(mock_change.messages, GerritChangeMessages)
@@ -444,7 +621,7 @@ class TestGerritChangeReviewers:
     def test_reviewer_list_votes(self, mock_change):
         reviewer_data = [{"_account_id": 1000096, "name": "Test User"}]
         votes_data = {"Code-Review": 2}
-        mock_change.gerrit.get.side_effect = [reviewer_data, reviewer_data, votes_data]
+        mock_change.gerrit.get.side_effect = [reviewer_data, votes_data]
 
         reviewer = mock_change.reviewers.get(account="testuser")
         votes = reviewer.list_votes()
@@ -0,0 +1,119 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+# @Author: Jialiang Shi
+"""
+Unit tests for gerrit.utils.circuitbreaker.
+"""
+import pytest
+import requests
+from unittest.mock import MagicMock
+
+from gerrit.utils.circuitbreaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker
+from gerrit.utils.exceptions import CircuitOpenError, GerritAPIException, ServerError
+from gerrit.utils.requester import Requester
+from tests.conftest import FakeClock, make_response
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def breaker(clock):
+    return CircuitBreaker(failure_threshold=3, recovery_timeout=10, clock=clock)
+
+
+class TestCircuitBreaker:
+
+    def test_opens_after_consecutive_failures(self, breaker):
+        for _ in range(2):
+            breaker.before("host")
+            breaker.record("host", 503)
+        assert breaker.state("host") == CLOSED
+        breaker.record("host", None)
+        assert breaker.state("host") == OPEN
+
+        with pytest.raises(CircuitOpenError):
+            breaker.before("host")
+        assert issubclass(CircuitOpenError, GerritAPIException)
+
+    def test_success_resets_failures(self, breaker):
+        breaker.record("host", 503)
+        breaker.record("host", 503)
+        breaker.record("host", 404)
+        breaker.record("host", 503)
+        assert breaker.state("host") == CLOSED
+
+    def test_half_open_probe_closes(self, breaker, clock):
+        for _ in range(3):
+            breaker.record("host", 502)
+        clock.now += 10
+        breaker.before("host")
+        assert breaker.state("host") == HALF_OPEN
+        with pytest.raises(CircuitOpenError):
+            breaker.before("host")  # only one probe at a time
+        breaker.record("host", 200)
+        assert breaker.state("host") == CLOSED
+        breaker.before("host")
+
+    def test_failed_probe_reopens(self, breaker, clock):
+        for _ in range(3):
+            breaker.record("host", 502)
+        clock.now += 10
+        breaker.before("host")
+        breaker.record("host", 504)
+        assert breaker.state("host") == OPEN
+        clock.now += 5
+        with pytest.raises(CircuitOpenError):
+            breaker.before("host")
+        clock.now += 5
+        breaker.before("host")
+        assert breaker.stats["host"]["trips"] == 1
+        assert breaker.stats["host"]["rejected"] == 1
+
+    def test_lost_probe_is_repeated(self, breaker, clock):
+        for _ in range(3):
+            breaker.record("host", 502)
+        clock.now += 10
+        breaker.before("host")
+        clock.now += 10
+        breaker.before("host")
+
+    def test_per_family_keys(self, clock):
+        breaker = CircuitBreaker(failure_threshold=1, per_family=True, clock=clock)
+        changes = breaker.key_for("gerrit", "changes")
+        breaker.record(changes, 503)
+        with pytest.raises(CircuitOpenError):
+            breaker.before(changes)
+        breaker.before(breaker.key_for("gerrit", "projects"))
+
+
+class TestRequesterCircuitBreaker:
+
+    def test_fails_fast_when_open(self, breaker):
+        session = MagicMock()
+        session.get.side_effect = requests.exceptions.ConnectTimeout()
+        requester = Requester(
+            base_url="http://gerrit.example.com", session=session, circuit_breaker=breaker
+        )
+
+        for _ in range(3):
+            with pytest.raises(requests.exceptions.ConnectTimeout):
+                requester.get("http://gerrit.example.com/changes/")
+        with pytest.raises(CircuitOpenError):
+            requester.get("http://gerrit.example.com/changes/")
+        assert session.get.call_count == 3
+        assert breaker.state("gerrit.example.com") == OPEN
+
+    def test_server_errors_are_recorded(self, breaker):
+        session = MagicMock()
+        session.get.return_value = make_response(503)
+        requester = Requester(
+            base_url="http://gerrit.example.com", session=session, circuit_breaker=breaker
+        )
+
+        for _ in range(3):
+            with pytest.raises(ServerError):
+                requester.get("http://gerrit.example.com/changes/")
+        assert breaker.state("gerrit.example.com") == OPEN
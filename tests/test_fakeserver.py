@@ -0,0 +1,206 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+# @Author: Jialiang Shi
+"""
+Tests for the fake Gerrit of tests/fakeserver.py, driven through the real client over HTTP.
+"""
+import json
+import pytest
+
+from gerrit import GerritClient
+from gerrit.utils.exceptions import ChangeNotFoundError, ConflictError
+from tests.fakeserver import (
+    FakeGerrit,
+    FakeGerritServer,
+    format_timestamp,
+    parse_timestamp,
+)
+
+
+@pytest.fixture(scope="module")
+def server():
+    with FakeGerritServer(FakeGerrit().seed(changes=120, projects=3, accounts=5)) as server:
+        yield server
+
+
+@pytest.fixture
+def client(server):
+    return GerritClient(base_url=server.url)
+
+
+def _decode(response):
+    assert response.body.startswith(b")]}'\n")
+    return json.loads(response.body[5:])
+
+
+class TestFakeGerrit:
+
+    def test_seed_is_deterministic(self):
+        first = FakeGerrit().seed(changes=20, seed=3).handle("GET", "/changes/?q=status:open&pp=0")
+        second = FakeGerrit().seed(changes=20, seed=3).handle("GET", "/changes/?q=status:open&pp=0")
+        assert first.body == second.body
+
+    def test_paging_and_more_flag(self):
+        fake = FakeGerrit().seed(changes=30)
+        total = len(fake.query_changes_list("status:open"))
+        page = _decode(fake.handle("GET", "/a/changes/?q=status:open&n=5"))
+        assert len(page) == 5
+        assert page[-1]["_more_changes"] is True
+        last = _decode(fake.handle("GET", f"/changes/?q=status:open&n=5&S={total - 2}"))
+        assert len(last) == 2
+        assert "_more_changes" not in last[-1]
+
+    def test_several_queries(self):
+        fake = FakeGerrit().seed(changes=30)
+        result = _decode(fake.handle("GET", "/changes/?q=status:merged&q=status:abandoned"))
+        assert len(result) == 2
+        assert {c["status"] for c in result[0]} <= {"MERGED"}
+        assert {c["status"] for c in result[1]} <= {"ABANDONED"}
+
+    def test_updated_order_and_time_operators(self):
+        fake = FakeGerrit().seed(changes=40)
+        changes = fake.query_changes_list("status:open")
+        updated = [c["updated"] for c in changes]
+        assert updated == sorted(updated, reverse=True)
+
+        middle = format_timestamp(updated[len(updated) // 2])
+        before = fake.query_changes_list(f'status:open before:"{middle}"')
+        after = fake.query_changes_list(f'status:open after:"{middle}"')
+        assert all(c["updated"] <= parse_timestamp(middle) for c in before)
+        assert all(c["updated"] >= parse_timestamp(middle) for c in after)
+        assert len(before) + len(after) == len(changes) + 1
+
+    def test_keyset_scan_with_ties(self):
+        fake = FakeGerrit().seed(changes=25)
+        tie = fake.query_changes_list("is:open")[3]["updated"]
+        for change in list(fake.changes.values())[:12]:
+            change["updated"] = tie
+        expected = [c["_number"] for c in fake.query_changes_list("status:open")]
+        with FakeGerritServer(fake) as server:
+            client = GerritClient(base_url=server.url)
+            numbers = [c["_number"] for c in client.changes.iter_search("status:open", page_size=4, keyset=True)]
+        assert sorted(numbers) == sorted(expected)
+        assert len(numbers) == len(set(numbers))
+
+    def test_or_and_parentheses(self):
+        fake = FakeGerrit().seed(changes=40)
+        merged = {c["_number"] for c in fake.query_changes_list("status:merged")}
+        abandoned = {c["_number"] for c in fake.query_changes_list("status:abandoned")}
+        in_project = {c["_number"] for c in fake.query_changes_list("project:project-1")}
+        either = {c["_number"] for c in fake.query_changes_list("status:merged OR status:abandoned")}
+        assert either == merged | abandoned
+        grouped = fake.query_changes_list("(status:merged OR status:abandoned) project:project-1")
+        assert {c["_number"] for c in grouped} == (merged | abandoned) & in_project
+        ungrouped = fake.query_changes_list("status:merged OR status:abandoned project:project-1")
+        assert {c["_number"] for c in ungrouped} == merged | (abandoned & in_project)
+        assert fake.handle("GET", "/changes/?q=(status:merged").status == 400
+
+    def test_keyset_scan_with_or_query(self):
+        fake = FakeGerrit().seed(changes=60)
+        query = "status:merged OR status:abandoned"
+        expected = [c["_number"] for c in fake.query_changes_list(query)]
+        with FakeGerritServer(fake) as server:
+            client = GerritClient(base_url=server.url)
+            numbers = [c["_number"] for c in client.changes.iter_search(query, page_size=4, keyset=True)]
+        assert numbers == expected
+
+    def test_errors_are_text(self):
+        fake = FakeGerrit()
+        response = fake.handle("GET", "/changes/424242")
+        assert response.status == 404
+        assert response.headers["Content-Type"].startswith("text/plain")
+        assert fake.handle("GET", "/changes/?q=foo:bar").status == 400
+        assert fake.handle("GET", "/changes/?q=after:yesterday").status == 400
+        assert fake.handle("PATCH", "/changes/").status == 404
+
+    def test_etag(self):
+        fake = FakeGerrit().seed(changes=1)
+        response = fake.handle("GET", "/changes/1")
+        etag = response.headers["ETag"]
+        assert fake.handle("GET", "/changes/1", headers={"If-None-Match": etag}).status == 304
+
+
+class TestFakeGerritServer:
+
+    def test_version(self, client):
+        assert client.version == "3.9.1"
+
+    def test_iter_search(self, client, server):
+        expected = len(server.gerrit.query_changes_list("is:open"))
+        numbers = [c["_number"] for c in client.changes.iter_search("is:open", page_size=10)]
+        assert len(numbers) == len(set(numbers)) == expected
+
+    def test_change_revision_and_files(self, client):
+        number = client.changes.search("is:open", limit=1)[0]["_number"]
+        change = client.changes.get(number)
+        revision = change.get_revision()
+        assert revision.get_commit()["subject"] == change.subject
+        files = revision.files
+        path = next(key for key in files.keys() if key != "/COMMIT_MSG")
+        assert len(files.get(path).get_content()) > 0
+
+    def test_search_many(self, client):
+        queries = ["status:merged", "status:abandoned", "is:open", "status:merged"]
+        results = client.changes.search_many(queries, limit=3)
+        assert [len(result) for result in results] == [3, 3, 3, 3]
+        assert results[0] == results[3]
+        assert {c["status"] for c in results[1]} == {"ABANDONED"}
+        single = client.changes.search_many(["is:open"], limit=2)
+        assert len(single) == 1 and len(single[0]) == 2
+
+    def test_iter_search_keyset(self, client, server):
+        expected = [c["_number"] for c in server.gerrit.query_changes_list("is:open")]
+        numbers = [c["_number"] for c in client.changes.iter_search("is:open", page_size=7, keyset=True)]
+        assert numbers == expected
+
+    def test_change_not_found(self, client):
+        with pytest.raises(ChangeNotFoundError):
+            client.changes.get("987654")
+
+    def test_change_workflow(self, client):
+        created = client.changes.create(
+            {"project": "project-1", "branch": "master", "subject": "Workflow"}
+        )
+        change = client.changes.get(created["id"])
+        change.set_topic("workflow")
+        change.reviewers.add({"reviewer": "user1"})
+        change.get_revision().set_review({"labels": {"Code-Review": 2}, "message": "LGTM"})
+        merged = change.submit()
+        assert merged["status"] == "MERGED"
+        with pytest.raises(ConflictError):
+            change.abandon()
+
+    def test_projects_branches_accounts_groups(self, client):
+        project = client.projects.create("fake/project", {"description": "nested"})
+        assert project.name == "fake/project"
+        assert project.branches.create("dev", {"revision": "master"}).ref == "refs/heads/dev"
+        assert "fake/project" in client.projects.list(is_all=True)
+
+        account = client.accounts.create("fakeuser", {"name": "Fake User"})
+        group = client.groups.create("fake-group", {"description": "fake"})
+        group.members.add("fakeuser")
+        assert [m.username for m in group.members.list()] == ["fakeuser"]
+        assert account.name == "Fake User"
+
+    def test_stats(self, server, client):
+        server.reset_stats()
+        client.get("/config/server/version")
+        assert server.stats["requests"] == 1
+        assert server.stats["statuses"] == {200: 1}
+
+
+class TestBenchmarks:
+
+    def test_smoke(self, tmp_path):
+        from benchmarks.bench_client import main
+
+        output = tmp_path / "results.json"
+        results = main([
+            "--changes", "30", "--repeat", "1", "--hydrate", "2", "--mutations", "1",
+            "--page-size", "10", "--no-memory", "--json", str(output),
+        ])
+        assert [r["scenario"] for r in results] == [
+            "search_pagination", "hydration", "decode", "bulk_mutations",
+        ]
+        assert all(r["items"] > 0 for r in results)
+        assert json.loads(output.read_text())["results"][0]["requests"] > 1
@@ -115,6 +115,13 @@ class TestGerritClientInit:
             mock_session.mount.assert_any_call("http://", mock_adapter)
             mock_session.mount.assert_any_call("https://", mock_adapter)
 
+    def test_retry_policy_passed_to_requester(self):
+        from gerrit.base import GerritClient
+        from gerrit.utils.retry import RetryPolicy
+        policy = RetryPolicy()
+        client = GerritClient(base_url=BASE_URL, session=MagicMock(), retry=policy)
+        assert client.requester.retry is policy
+
     def test_provided_session_used(self):
         provided_session = MagicMock()
         provided_session.auth = ("u", "p")
@@ -219,6 +226,28 @@ class TestGerritClientHTTPHelpers:
         result = basic_client.put("/projects/test/config", json={})
         assert result == {"updated": True}
 
+    def test_iter_json_streams_and_closes(self, basic_client):
+        resp = self._setup_requester(basic_client, [{"_number": 1}, {"_number": 2}])
+        resp.iter_content = MagicMock(return_value=iter([resp.content]))
+        basic_client.requester.get = MagicMock(return_value=resp)
+
+        result = list(basic_client.iter_json("/changes/", params={"q": "is:open"}))
+        assert result == [{"_number": 1}, {"_number": 2}]
+        assert basic_client.requester.get.call_args.kwargs["stream"] is True
+        resp.close.assert_called_once()
+
+    def test_iter_content_requests_eagerly(self, basic_client):
+        resp = MagicMock()
+        resp.iter_content = MagicMock(return_value=iter([b"ab", b"c"]))
+        basic_client.requester.get = MagicMock(return_value=resp)
+
+        chunks = basic_client.iter_content("/changes/1/revisions/current/patch?zip", chunk_size=2)
+        basic_client.requester.get.assert_called_once()
+        assert basic_client.requester.get.call_args.kwargs["stream"] is True
+        assert list(chunks) == [b"ab", b"c"]
+        resp.iter_content.assert_called_once_with(chunk_size=2)
+        resp.close.assert_called_once()
+
     def test_delete(self, basic_client):
         resp = MagicMock()
         resp.headers = {"content-type": "text/plain"}
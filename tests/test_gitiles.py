@@ -115,6 +115,65 @@ class TestGitilesClient:
         assert isinstance(result, str)
         assert len(result) > 0
 
+    def test_stream_file(self, mock_gitiles):
+        import io
+        mock_response = MagicMock()
+        encoded = FILE_CONTENT.encode("utf-8")
+        mock_response.iter_content.return_value = iter([encoded[:7], encoded[7:]])
+        mock_gitiles.requester.get.return_value = mock_response
+
+        target = io.BytesIO()
+        mock_gitiles.stream_file("buck", "refs/heads/master", "scripts/install.sh", fileobj=target)
+        assert target.getvalue() == b"#!/bin/bash\necho hello\n"
+        assert mock_gitiles.requester.get.call_args.kwargs["stream"] is True
+        mock_response.close.assert_called_once()
+
+    def test_commit_at_sha_uses_blob_cache(self, mock_gitiles):
+        import json
+        from gerrit.utils.blobcache import BlobCache
+
+        mock_response = MagicMock()
+        mock_response.headers = {"content-type": "application/json"}
+        mock_response.encoding = "utf-8"
+        mock_response.content = (")]}'\n" + json.dumps(COMMIT_INFO)).encode("utf-8")
+        mock_gitiles.requester.get.return_value = mock_response
+        mock_gitiles.blob_cache = BlobCache(":memory:")
+
+        sha = "baaf2895e0732228c84a07620fffe57e4ff47f03"
+        assert mock_gitiles.commit("gitiles", commit=sha) == COMMIT_INFO
+        assert mock_gitiles.commit("gitiles", commit=sha) == COMMIT_INFO
+        mock_gitiles.requester.get.assert_called_once()
+
+        mock_gitiles.commit("gitiles", commit="master")
+        mock_gitiles.commit("gitiles", commit="master")
+        assert mock_gitiles.requester.get.call_count == 3
+
+    def test_blob_cache_not_shared_between_users(self):
+        import json
+        from gitiles import GitilesClient
+        from gerrit.utils.blobcache import BlobCache
+
+        cache = BlobCache(":memory:")
+        sha = "baaf2895e0732228c84a07620fffe57e4ff47f03"
+        clients = []
+        for username in ("alice", "bob"):
+            client = GitilesClient(base_url="http://localhost:8080", username=username,
+                                   password="secret", blob_cache=cache)
+            response = MagicMock()
+            response.headers = {"content-type": "application/json"}
+            response.encoding = "utf-8"
+            response.content = (")]}'\n" + json.dumps(dict(COMMIT_INFO, message=username))).encode("utf-8")
+            client.requester = MagicMock()
+            client.requester.get.return_value = response
+            clients.append(client)
+
+        alice, bob = clients
+        assert alice.commit("gitiles", commit=sha)["message"] == "alice"
+        assert bob.commit("gitiles", commit=sha)["message"] == "bob"
+        assert alice.commit("gitiles", commit=sha)["message"] == "alice"
+        bob.requester.get.assert_called_once()
+        alice.requester.get.assert_called_once()
+
     def test_get_endpoint_url(self, mock_gitiles):
         """Test URL construction."""
         url = mock_gitiles.get_endpoint_url("/gitiles/+/abc123")
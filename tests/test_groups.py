@@ -20,6 +20,26 @@ logger = logging.getLogger(__name__)
 
 class TestGerritGroups:
 
+    def test_iter_list_groups(self, mock_gerrit):
+        mock_gerrit.get.side_effect = [{"MyGroup": dict(GROUP_DATA)}]
+
+        from gerrit.groups.groups import GerritGroups
+        groups = GerritGroups(gerrit=mock_gerrit)
+        result = list(groups.iter_list(page_size=5))
+        assert result[0]["name"] == "MyGroup"
+        assert mock_gerrit.get.call_count == 1
+
+    def test_iter_search_follows_more_groups(self, mock_gerrit):
+        mock_gerrit.get.side_effect = [
+            [{"id": "1"}, {"id": "2", "_more_groups": True}],
+            [{"id": "3"}],
+        ]
+
+        from gerrit.groups.groups import GerritGroups
+        groups = GerritGroups(gerrit=mock_gerrit)
+        result = list(groups.iter_search(query="inname:My", page_size=2))
+        assert [g["id"] for g in result] == ["1", "2", "3"]
+
     def test_list_groups(self, mock_gerrit):
         mock_gerrit.get.return_value = [GROUP_DATA]
 
@@ -74,8 +94,8 @@ class TestGerritGroups:
             groups.get(1000000000)
 
     def test_create_group(self, mock_gerrit):
-        # put() succeeds; groups.get() calls gerrit.get() twice (get + poll)
-        mock_gerrit.get.side_effect = [GROUP_DATA, GROUP_DATA]
+        # put() returns no GroupInfo; falls back to groups.get → a single gerrit.get
+        mock_gerrit.get.side_effect = [GROUP_DATA]
 
         from gerrit.groups.groups import GerritGroups
         groups = GerritGroups(gerrit=mock_gerrit)
@@ -183,6 +203,36 @@ class TestGerritGroupMembers:
         members = mock_group.members.list()
         assert len(members) >= 1
 
+    def test_list_members_builds_accounts_from_listing(self, mock_group):
+        mock_group.gerrit.get.reset_mock()
+        mock_group.gerrit.get.return_value = [
+            {"_account_id": 1000096, "name": "John Doe"},
+            {"_account_id": 1000097, "name": "Jane Roe"},
+        ]
+
+        from gerrit.accounts.account import GerritAccount
+        members = mock_group.members.list()
+        assert [m.account for m in members] == [1000096, 1000097]
+        assert all(isinstance(m, GerritAccount) for m in members)
+        assert members[1].name == "Jane Roe"
+        mock_group.gerrit.get.assert_called_once()
+        mock_group.gerrit.accounts.get.assert_not_called()
+
+    def test_list_members_refresh(self, mock_group):
+        mock_group.gerrit.get.reset_mock()
+        listing = [{"_account_id": 1000096}, {"_account_id": 1000097}]
+        details = {
+            "/accounts/1000096": {"_account_id": 1000096, "name": "John Doe"},
+            "/accounts/1000097": {"_account_id": 1000097, "name": "Jane Roe"},
+        }
+        mock_group.gerrit.get.side_effect = (
+            lambda endpoint, **kwargs: details.get(endpoint, listing)
+        )
+
+        members = mock_group.members.list(refresh=True, max_workers=2)
+        assert [m.name for m in members] == ["John Doe", "Jane Roe"]
+        assert mock_group.gerrit.get.call_count == 3
+
     def test_get_member(self, mock_group):
         mock_group.gerrit.get.return_value = {"_account_id": 1000096, "name": "Test User"}
         mock_group.gerrit.accounts.get.return_value = MagicMock(account_id=1000096)
@@ -253,6 +303,18 @@ class TestGerritGroupSubGroups:
         subgroups = mock_group.subgroup.list()
         assert len(subgroups) >= 1
 
+    def test_list_subgroups_builds_groups_from_listing(self, mock_group):
+        mock_group.gerrit.get.reset_mock()
+        mock_group.gerrit.get.return_value = [{**GROUP_DATA, "id": "sub_group_id"}]
+
+        from gerrit.groups.group import GerritGroup
+        subgroups = mock_group.subgroup.list()
+        assert isinstance(subgroups[0], GerritGroup)
+        assert subgroups[0].id == "sub_group_id"
+        assert subgroups[0].name == GROUP_DATA["name"]
+        mock_group.gerrit.get.assert_called_once()
+        mock_group.gerrit.groups.get.assert_not_called()
+
     def test_get_subgroup(self, mock_group):
         subgroup_data = {**GROUP_DATA, "id": "sub_group_id"}
         mock_group.gerrit.get.return_value = subgroup_data
@@ -0,0 +1,141 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+# @Author: Jialiang Shi
+"""
+Unit tests for gerrit.utils.hedging.
+"""
+import threading
+import time
+import pytest
+from unittest.mock import MagicMock
+
+from gerrit.utils.hedging import HedgingPolicy
+from gerrit.utils.requester import Requester
+from tests.conftest import make_response
+
+
+@pytest.fixture
+def policy():
+    policy = HedgingPolicy(percentile=90, budget=1.0, min_samples=10, min_delay=0.01)
+    for _ in range(10):
+        policy.record("changes", 0.02)
+    yield policy
+    policy.close()
+
+
+class TestHedgingPolicy:
+
+    def test_threshold_needs_samples(self):
+        policy = HedgingPolicy(min_samples=3, min_delay=0)
+        policy.record("changes", 0.1)
+        assert policy.threshold("changes") is None
+        policy.record("changes", 0.3)
+        policy.record("changes", 0.2)
+        assert policy.threshold("changes") == 0.3
+        assert policy.threshold("projects") is None
+
+    def test_fast_request_is_not_hedged(self, policy):
+        first = make_response()
+        send = MagicMock(return_value=first)
+        assert policy.call("changes", send) is first
+        send.assert_called_once()
+        assert policy.stats["hedged"] == 0
+
+    def test_slow_request_is_hedged_and_loser_closed(self, policy):
+        release = threading.Event()
+        closed = threading.Event()
+        slow, hedge = make_response(), make_response()
+        slow.close.side_effect = lambda: closed.set()
+        calls = []
+
+        def send():
+            calls.append(threading.current_thread())
+            if len(calls) == 1:
+                release.wait(5)
+                return slow
+            return hedge
+
+        start = time.monotonic()
+        assert policy.call("changes", send) is hedge
+        assert time.monotonic() - start < 1
+        assert not release.is_set()
+        assert policy.stats["hedged"] == 1
+        assert policy.stats["hedge_wins"] == 1
+        assert all(thread is not threading.current_thread() for thread in calls)
+
+        release.set()
+        assert closed.wait(2)
+
+    def test_requests_are_not_limited_by_the_pool(self):
+        policy = HedgingPolicy(budget=0.0, min_samples=1, min_delay=0.5, max_workers=1)
+        policy.record("changes", 0.5)
+        barrier = threading.Barrier(4, timeout=2)
+        first = make_response()
+        results = []
+
+        def send():
+            barrier.wait()
+            return first
+
+        threads = [threading.Thread(target=lambda: results.append(policy.call("changes", send)))
+                   for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert results == [first] * 4
+        policy.close()
+
+    def test_budget_limits_hedges(self):
+        policy = HedgingPolicy(budget=0.0, min_samples=1, min_delay=0.01)
+        policy.record("changes", 0.01)
+        release = threading.Event()
+        only = make_response()
+        send = MagicMock(side_effect=lambda: release.wait(0.1) and None or only)
+        assert policy.call("changes", send) is only
+        send.assert_called_once()
+        policy.close()
+
+    def test_error_of_one_request_uses_the_other(self, policy):
+        hedge = make_response()
+        calls = []
+
+        def send():
+            calls.append(1)
+            if len(calls) == 1:
+                threading.Event().wait(0.1)
+                raise ConnectionError("reset")
+            threading.Event().wait(0.2)
+            return hedge
+
+        assert policy.call("changes", send) is hedge
+
+    def test_both_fail(self, policy):
+        def send():
+            threading.Event().wait(0.05)
+            raise ConnectionError("down")
+
+        with pytest.raises(ConnectionError):
+            policy.call("changes", send)
+
+    def test_invalid_arguments(self):
+        with pytest.raises(ValueError):
+            HedgingPolicy(percentile=100)
+        with pytest.raises(ValueError):
+            HedgingPolicy(budget=2)
+
+
+class TestRequesterHedging:
+
+    def test_get_is_hedged_per_family(self):
+        hedging = MagicMock()
+        hedging.call.side_effect = lambda key, send: send()
+        session = MagicMock()
+        session.get.return_value = make_response()
+        session.post.return_value = session.get.return_value
+        requester = Requester(base_url="http://example.com", session=session, hedging=hedging)
+
+        requester.get("http://example.com/a/changes/1/revisions/1/files/x/diff")
+        requester.post("http://example.com/a/changes/1/abandon")
+        assert hedging.call.call_count == 1
+        assert hedging.call.call_args.args[0] == "changes"
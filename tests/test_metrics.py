@@ -0,0 +1,121 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+# @Author: Jialiang Shi
+"""
+Unit tests for gerrit.utils.metrics.
+"""
+import pytest
+import requests
+from unittest.mock import MagicMock
+
+from gerrit.utils.cache import ResponseCache
+from gerrit.utils.metrics import MetricsRegistry, endpoint_template, status_class
+from gerrit.utils.requester import Requester
+from gerrit.utils.retry import RetryPolicy
+from tests.conftest import make_response
+
+
+class TestEndpointTemplate:
+
+    @pytest.mark.parametrize("endpoint, template", [
+        ("/changes/", "/changes/"),
+        ("/a/changes/?q=is:open&n=25", "/changes/"),
+        ("/changes/myProject~master~I8473b95934b5732ac55d26311a706c9c2bde9940/detail",
+         "/changes/{id}/detail"),
+        ("/changes/123/revisions/current/files", "/changes/{id}/revisions/{rev}/files"),
+        ("/changes/123/revisions/1/files/src%2Fmain.py/diff?intraline",
+         "/changes/{id}/revisions/{rev}/files/{path}/diff"),
+        ("/projects/foo%2Fbar/branches/master/files/README/content",
+         "/projects/{project}/branches/{branch}/files/{path}/content"),
+        ("/accounts/self/sshkeys/1", "/accounts/{account}/sshkeys/{key}"),
+        ("/groups/12/members", "/groups/{group}/members"),
+        ("/config/server/version", "/config/server/version"),
+        ("http://example.com/a/changes/1/submit", "/changes/{id}/submit"),
+    ])
+    def test_templates(self, endpoint, template):
+        assert endpoint_template(endpoint) == template
+
+    def test_status_class(self):
+        assert status_class(204) == "2xx"
+        assert status_class(404) == "4xx"
+        assert status_class(None) == "error"
+
+
+class TestMetricsRegistry:
+
+    def test_snapshot(self):
+        metrics = MetricsRegistry(buckets=(0.1, 1.0))
+        metrics.observe("get", "/changes/1", 200, 0.05, 0, 100)
+        metrics.observe("GET", "/changes/2", 404, 0.5, 0, 10)
+        metrics.observe("GET", "/changes/3", None, 5.0)
+        metrics.retry("GET", "/changes/3")
+        metrics.cache_hit("/changes/4", "response")
+
+        entry = metrics.snapshot()["GET /changes/{id}"]
+        assert entry["count"] == 3
+        assert entry["status"] == {"2xx": 1, "4xx": 1, "error": 1}
+        assert entry["latency"]["buckets"] == {0.1: 1, 1.0: 2, float("inf"): 3}
+        assert entry["response_bytes"] == 110
+        assert entry["retries"] == 1
+        assert entry["cache_hits"] == {"response": 1}
+
+        metrics.reset()
+        assert metrics.snapshot() == {}
+
+    def test_prometheus_text(self):
+        metrics = MetricsRegistry(buckets=(0.1, 1.0))
+        metrics.observe("POST", "/changes/1/revisions/1/review", 200, 0.2, 17, 50)
+        metrics.cache_hit("/config/server/version", "etag")
+        text = metrics.to_prometheus()
+
+        labels = 'method="POST",endpoint="/changes/{id}/revisions/{rev}/review"'
+        assert "# TYPE gerrit_client_request_duration_seconds histogram" in text
+        assert f'gerrit_client_requests_total{{{labels},status="2xx"}} 1' in text
+        assert f'gerrit_client_request_duration_seconds_bucket{{{labels},le="0.1"}} 0' in text
+        assert f'gerrit_client_request_duration_seconds_bucket{{{labels},le="1.0"}} 1' in text
+        assert f'gerrit_client_request_duration_seconds_bucket{{{labels},le="+Inf"}} 1' in text
+        assert f"gerrit_client_request_bytes_total{{{labels}}} 17" in text
+        assert (
+            'gerrit_client_cache_hits_total{method="GET",endpoint="/config/server/version",'
+            'cache="etag"} 1'
+        ) in text
+        assert text.endswith("\n")
+
+
+class TestInstrumentation:
+
+    def test_requester_records_attempts_and_retries(self):
+        metrics = MetricsRegistry()
+        session = MagicMock()
+        failed, ok = make_response(503), make_response(200)
+        failed.request.body = ok.request.body = b'{"message": "hi"}'
+        session.get.side_effect = [failed, requests.exceptions.ConnectionError(), ok]
+        requester = Requester(
+            base_url="http://example.com",
+            session=session,
+            retry=RetryPolicy(total=3, sleep=MagicMock()),
+            metrics=metrics,
+        )
+
+        requester.get("http://example.com/a/changes/1/detail")
+        entry = metrics.snapshot()["GET /changes/{id}/detail"]
+        assert entry["count"] == 3
+        assert entry["status"] == {"5xx": 1, "error": 1, "2xx": 1}
+        assert entry["retries"] == 2
+        assert entry["request_bytes"] == 2 * len(b'{"message": "hi"}')
+
+    def test_client_records_cache_hits(self):
+        from gerrit import GerritClient
+        metrics = MetricsRegistry()
+        session = MagicMock()
+        session.auth = None
+        session.get.return_value = make_response(200, {"version": "3.9"})
+        client = GerritClient(
+            base_url="http://example.com", session=session, cache=ResponseCache(), metrics=metrics
+        )
+
+        client.get("/config/server/info")
+        client.get("/config/server/info")
+        entry = metrics.snapshot()["GET /config/server/info"]
+        assert entry["count"] == 1
+        assert entry["cache_hits"] == {"response": 1}
@@ -0,0 +1,95 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+# @Author: Jialiang Shi
+"""
+Tests for the adaptive page sizing of gerrit.utils.pagination.
+"""
+import pytest
+
+from gerrit import GerritClient
+from gerrit.utils.cache import ResponseCache
+from tests.fakeserver import FakeGerrit, FakeGerritServer
+from gerrit.utils.metrics import MetricsRegistry
+from gerrit.utils.pagination import AdaptivePageSizer, page_sizing, paginate
+
+
+class TestAdaptivePageSizer:
+
+    def test_grows_toward_targets(self):
+        sizer = AdaptivePageSizer(initial=25, maximum=500, target_latency=1.0)
+        assert sizer.record("/changes/", 25, 25, 0.1, 1000) == 50
+        assert sizer.record("/changes/", 50, 50, 0.1, 1000) == 100
+        assert sizer.size("/changes/") == 100
+        assert sizer.size("/projects/") == 25
+
+    def test_shrinks_on_slow_or_large_pages(self):
+        sizer = AdaptivePageSizer(initial=100, target_latency=1.0, target_bytes=1000)
+        assert sizer.record("/changes/", 100, 100, 4.0) == 50
+        assert sizer.record("/changes/", 50, 50, 0.1, 1500) == 33
+
+    def test_holds_near_target_and_on_short_pages(self):
+        sizer = AdaptivePageSizer(initial=100, target_latency=1.0)
+        assert sizer.record("/changes/", 100, 100, 0.9) == 100
+        assert sizer.record("/changes/", 100, 7, 0.01) == 100
+        assert sizer.sizes == {}
+
+    def test_bounds(self):
+        sizer = AdaptivePageSizer(initial=20, minimum=10, maximum=30)
+        assert sizer.record("/a/", 20, 20, 0.001) == 30
+        assert sizer.record("/b/", 20, 20, 100.0) == 10
+        with pytest.raises(ValueError):
+            AdaptivePageSizer(initial=5, minimum=10)
+        with pytest.raises(ValueError):
+            AdaptivePageSizer(max_step=1)
+
+    def test_paginate_with_sizer(self):
+        sizer = AdaptivePageSizer(initial=10, maximum=40, target_latency=10.0)
+        sizes = []
+
+        def fetch(limit, start):
+            sizes.append(limit)
+            return list(range(start, min(start + limit, 100)))
+
+        assert list(paginate(fetch, sizer=sizer, endpoint="/x/")) == list(range(100))
+        assert sizes == [10, 20, 40, 40]
+
+    def test_page_size_given_or_no_sizer(self, mock_gerrit):
+        assert page_sizing(mock_gerrit, None, "/changes/") == {"page_size": 25}
+        assert page_sizing(mock_gerrit, 7, "/changes/") == {"page_size": 7}
+
+
+class TestClientPageSizing:
+
+    def test_tuned_size_remembered_per_endpoint(self):
+        with FakeGerritServer(FakeGerrit().seed(changes=120, projects=3)) as server:
+            metrics = MetricsRegistry()
+            client = GerritClient(base_url=server.url, metrics=metrics,
+                                  page_sizer=AdaptivePageSizer(initial=10))
+            first = list(client.changes.iter_search("status:open"))
+            tuned = client.page_sizer.size("/changes/")
+            assert tuned > 10
+            assert client.page_sizer.size("/projects/") == 10
+
+            def count():
+                return sum(entry["count"] for entry in metrics.snapshot().values())
+
+            sent = count()
+            assert [c["_number"] for c in client.changes.iter_search("status:open")] == [
+                c["_number"] for c in first
+            ]
+            assert count() - sent <= len(first) // tuned + 1
+
+            sent = count()
+            assert len(list(client.changes.iter_search("status:open", page_size=5))) == len(first)
+            assert count() - sent >= len(first) // 5
+
+    def test_cache_hits_are_not_measured(self):
+        with FakeGerritServer(FakeGerrit().seed(changes=30)) as server:
+            client = GerritClient(base_url=server.url, cache=ResponseCache(),
+                                  page_sizer=AdaptivePageSizer(initial=10))
+            list(client.changes.iter_search("status:open"))
+            assert client.last_response_bytes() is None
+            client.changes.search("status:open", limit=10)
+            assert client.last_response_bytes() is None
+            client.changes.search("status:open", limit=11)
+            assert client.last_response_bytes() > 0
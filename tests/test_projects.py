@@ -43,6 +43,28 @@ COMMIT_DATA = {
 
 class TestGerritProjects:
 
+    def test_iter_list_projects(self, mock_gerrit):
+        mock_gerrit.get.side_effect = [
+            {"a": {"id": "a"}, "b": {"id": "b"}},
+            {"c": {"id": "c"}},
+        ]
+
+        from gerrit.projects.projects import GerritProjects
+        projects = GerritProjects(gerrit=mock_gerrit)
+        result = list(projects.iter_list(page_size=2))
+        assert [p["name"] for p in result] == ["a", "b", "c"]
+        assert mock_gerrit.get.call_count == 2
+
+    def test_iter_search_projects(self, mock_gerrit):
+        mock_gerrit.get.side_effect = [[PROJECT_DATA, PROJECT_DATA], []]
+
+        from gerrit.projects.projects import GerritProjects
+        projects = GerritProjects(gerrit=mock_gerrit)
+        result = list(projects.iter_search(query="state:active", page_size=2))
+        assert len(result) == 2
+        _, kwargs = mock_gerrit.get.call_args
+        assert kwargs["params"] == {"limit": 2, "start": 2}
+
     def test_list_projects(self, mock_gerrit):
         mock_gerrit.get.return_value = {"myProject": PROJECT_DATA}
 
@@ -120,8 +142,8 @@ class TestGerritProjects:
             projects.get(name="nonexistent")
 
     def test_create_project(self, mock_gerrit):
-        # put() succeeds; get() is called twice (projects.get → gerrit.get + GerritProject.poll)
-        mock_gerrit.get.side_effect = [PROJECT_DATA, PROJECT_DATA]
+        # put() returns no ProjectInfo; falls back to projects.get → a single gerrit.get
+        mock_gerrit.get.side_effect = [PROJECT_DATA]
 
         from gerrit.projects.projects import GerritProjects
         projects = GerritProjects(gerrit=mock_gerrit)
@@ -129,6 +151,17 @@ class TestGerritProjects:
         assert result is not None
         mock_gerrit.put.assert_called_once()
 
+    def test_create_project_hydrates_from_put_response(self, mock_gerrit):
+        mock_gerrit.put.return_value = PROJECT_DATA
+
+        from gerrit.projects.projects import GerritProjects
+        from gerrit.projects.project import GerritProject
+        projects = GerritProjects(gerrit=mock_gerrit)
+        project = projects.create("myProject", {"description": "New project"})
+        assert isinstance(project, GerritProject)
+        assert project.name == PROJECT_DATA["name"]
+        mock_gerrit.get.assert_not_called()
+
     def test_create_project_already_exists(self, mock_gerrit):
         from gerrit.projects.projects import GerritProjects
         from gerrit.utils.exceptions import ConflictError, ProjectAlreadyExistsError
@@ -285,6 +318,15 @@ class TestGerritProject:
 
 class TestGerritProjectBranches:
 
+    def test_iter_list_branches(self, mock_gerrit):
+        mock_gerrit.get.side_effect = [[BRANCH_DATA, BRANCH_DATA], [BRANCH_DATA]]
+
+        from gerrit.projects.branches import GerritProjectBranches
+        branches = GerritProjectBranches(project="myProject", gerrit=mock_gerrit)
+        assert len(list(branches.iter_list(page_size=2))) == 3
+        _, kwargs = mock_gerrit.get.call_args
+        assert kwargs["params"] == {"n": 2, "s": 2}
+
     def test_list_branches(self, mock_project):
         mock_project.gerrit.get.return_value = [BRANCH_DATA]
         branches = mock_project.branches.list()
@@ -308,8 +350,8 @@ class TestGerritProjectBranches:
             mock_project.branches.get(name="NONEXISTENT")
 
     def test_create_branch(self, mock_project):
-        # put() succeeds; branches.get() calls gerrit.get() twice (get + poll)
-        mock_project.gerrit.get.side_effect = [BRANCH_DATA, BRANCH_DATA]
+        # put() succeeds; branches.get() hydrates the branch from a single gerrit.get()
+        mock_project.gerrit.get.side_effect = [BRANCH_DATA]
 
         from gerrit.projects.branches import GerritProjectBranch
         branch = mock_project.branches.create("new-branch", {"revision": "master"})
@@ -357,6 +399,21 @@ class TestGerritProjectBranches:
         result_decoded = branch.get_file_content("README.md", decode=True)
         assert len(result_decoded) > 0
 
+    def test_branch_stream_file_content(self, mock_project):
+        import base64
+        import io
+        content = base64.b64encode(b"file content")
+        mock_project.gerrit.get.return_value = BRANCH_DATA
+        mock_project.gerrit.iter_content.return_value = iter([content[:5], content[5:]])
+        branch = mock_project.branches.get(name="master")
+
+        target = io.BytesIO()
+        assert branch.stream_file_content("docs/README.md", fileobj=target) == 12
+        assert target.getvalue() == b"file content"
+        assert mock_project.gerrit.iter_content.call_args.args[0].endswith(
+            "/files/docs%2FREADME.md/content"
+        )
+
     def test_branch_get_reflog(self, mock_project):
         mock_project.gerrit.get.return_value = BRANCH_DATA
         branch = mock_project.branches.get(name="master")
@@ -371,6 +428,14 @@ class TestGerritProjectBranches:
 
 class TestGerritProjectTags:
 
+    def test_iter_list_tags(self, mock_gerrit):
+        mock_gerrit.get.side_effect = [[TAG_DATA]]
+
+        from gerrit.projects.tags import GerritProjectTags
+        tags = GerritProjectTags(project="myProject", gerrit=mock_gerrit)
+        assert list(tags.iter_list(page_size=2)) == [TAG_DATA]
+        assert mock_gerrit.get.call_count == 1
+
     def test_list_tags(self, mock_project):
         mock_project.gerrit.get.return_value = [TAG_DATA]
         tags = mock_project.tags.list()
@@ -394,8 +459,8 @@ class TestGerritProjectTags:
             mock_project.tags.get(name="NONEXISTENT")
 
     def test_create_tag(self, mock_project):
-        # put() succeeds; tags.get() calls gerrit.get() twice (get + poll)
-        mock_project.gerrit.get.side_effect = [TAG_DATA, TAG_DATA]
+        # put() succeeds; tags.get() hydrates the tag from a single gerrit.get()
+        mock_project.gerrit.get.side_effect = [TAG_DATA]
 
         from gerrit.projects.tags import GerritProjectTag
         tag = mock_project.tags.create("v2.0", {"revision": "abc123"})
@@ -506,6 +571,53 @@ class TestGerritProjectDashboardsAndLabels:
         dashboard.set({"id": "master:closed", "commit_message": "Update dashboard"})
         mock_project.gerrit.put.assert_called()
 
+    def test_load_dashboard_sections(self, mock_project):
+        mock_project.gerrit.get.return_value = {
+            "id": "master:closed",
+            "foreach": "project:myProject",
+            "sections": [
+                {"name": "Merged", "query": "status:merged"},
+                {"name": "Abandoned", "query": "status:abandoned"},
+            ],
+        }
+        dashboard = mock_project.dashboards.get("master:closed")
+        search_many = mock_project.gerrit.changes.search_many
+        search_many.return_value = [[{"_number": 1}], []]
+
+        sections = dashboard.load(limit=10)
+
+        search_many.assert_called_once_with(
+            ["(status:merged) (project:myProject)", "(status:abandoned) (project:myProject)"],
+            options=None,
+            limit=10,
+        )
+        assert [s["name"] for s in sections] == ["Merged", "Abandoned"]
+        assert sections[0]["changes"] == [{"_number": 1}]
+
+    def test_load_templated_dashboard(self, mock_project):
+        mock_project.gerrit.get.return_value = {
+            "id": "main:review",
+            "foreach": "project:${project} status:open",
+            "sections": [
+                {"name": "Branch", "query": "branch:${branch}"},
+                {"name": "Mine", "query": "owner:self"},
+            ],
+        }
+        dashboard = mock_project.dashboards.get("main:review")
+        search_many = mock_project.gerrit.changes.search_many
+        search_many.return_value = [[], []]
+
+        dashboard.load(branch="stable")
+
+        search_many.assert_called_once_with(
+            [
+                "(branch:stable) (project:myProject status:open)",
+                "(owner:self) (project:myProject status:open)",
+            ],
+            options=None,
+            limit=None,
+        )
+
     def test_list_labels(self, mock_project):
         mock_project.gerrit.get.return_value = []
         labels = mock_project.labels.list()
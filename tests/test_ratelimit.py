@@ -0,0 +1,173 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+# @Author: Jialiang Shi
+"""
+Unit tests for gerrit.utils.ratelimit.
+"""
+import threading
+import pytest
+from unittest.mock import MagicMock
+
+from gerrit.utils.ratelimit import ConcurrencyGovernor, RateLimiter, TokenBucket
+from gerrit.utils.requester import Requester
+from tests.conftest import FakeClock, make_response
+
+
+class TestTokenBucket:
+
+    def test_burst_then_rate(self):
+        clock = FakeClock()
+        bucket = TokenBucket(rate=2, burst=3, clock=clock, sleep=clock.sleep)
+        assert [bucket.acquire() for _ in range(3)] == [0, 0, 0]
+        assert bucket.acquire() == pytest.approx(0.5)
+        assert bucket.acquire() == pytest.approx(0.5)
+        assert bucket.waited == pytest.approx(1.0)
+
+    def test_refills_up_to_burst(self):
+        clock = FakeClock()
+        bucket = TokenBucket(rate=10, burst=2, clock=clock, sleep=clock.sleep)
+        bucket.acquire()
+        bucket.acquire()
+        clock.now += 60
+        assert [bucket.acquire() for _ in range(2)] == [0, 0]
+        assert bucket.acquire() == pytest.approx(0.1)
+
+    def test_invalid_rate(self):
+        with pytest.raises(ValueError):
+            TokenBucket(rate=0)
+
+
+class TestRateLimiter:
+
+    def test_most_specific_bucket(self):
+        limiter = RateLimiter(rate=100, rates={"post": 1, "changes": 5, "GET changes": (10, 20)})
+        assert limiter.bucket_for("GET", "changes").rate == 10
+        assert limiter.bucket_for("PUT", "changes").rate == 5
+        assert limiter.bucket_for("POST", "projects").rate == 1
+        assert limiter.bucket_for("GET", "projects") is limiter.default
+
+    def test_unlimited_without_default(self):
+        limiter = RateLimiter(rates={"POST": 1})
+        assert limiter.bucket_for("GET", "changes") is None
+        assert limiter.acquire("GET", "changes") == 0.0
+
+    def test_requester_acquires_per_family(self):
+        limiter = MagicMock()
+        session = MagicMock()
+        session.get.return_value = make_response(200)
+        requester = Requester(base_url="http://example.com/r", session=session, rate_limiter=limiter)
+
+        requester.get("http://example.com/r/a/changes/?q=is:open")
+        limiter.acquire.assert_called_once_with("GET", "changes")
+
+
+class TestConcurrencyGovernor:
+
+    def test_additive_increase(self):
+        governor = ConcurrencyGovernor(initial=2, max_limit=3, latency_tolerance=None)
+        for _ in range(3):  # about one window, +1/2 then +1/2.5 then +1/2.9
+            governor.acquire()
+            governor.release(200, 0.1)
+        assert governor.limit == 3
+        for _ in range(10):
+            governor.acquire()
+            governor.release(200, 0.1)
+        assert governor.limit == 3
+
+    def test_multiplicative_decrease_on_overload(self):
+        clock = FakeClock()
+        governor = ConcurrencyGovernor(initial=16, cooldown=1.0, clock=clock)
+        governor.acquire()
+        governor.release(429, 0.1)
+        assert governor.limit == 8
+        governor.acquire()
+        governor.release(503, 0.1)
+        assert governor.limit == 8  # within the cooldown
+        clock.now += 2
+        governor.acquire()
+        governor.release(None, 0.1)
+        assert governor.limit == 4
+        assert governor.stats["decreases"] == 2
+
+    def test_decrease_on_rising_latency(self):
+        clock = FakeClock()
+        governor = ConcurrencyGovernor(initial=8, latency_tolerance=3.0, clock=clock)
+        for _ in range(5):
+            governor.acquire()
+            governor.release(200, 0.1)
+        governor.acquire()
+        governor.release(200, 1.0)  # one slow sample is smoothed out
+        assert governor.stats["decreases"] == 0
+        limit = governor.limit
+        governor.acquire()
+        governor.release(200, 1.0)
+        assert governor.limit == max(1, int(limit * 0.5))
+
+    def test_latency_baseline_per_family(self):
+        governor = ConcurrencyGovernor(initial=8, latency_tolerance=3.0, clock=FakeClock())
+        for _ in range(5):
+            governor.acquire()
+            governor.release(200, 0.01, "accounts")
+        for _ in range(5):
+            governor.acquire()
+            governor.release(200, 1.0, "changes")
+        assert governor.stats["decreases"] == 0
+        assert governor.stats["baseline"] == {"accounts": 0.01, "changes": 1.0}
+
+    def test_baseline_decays_toward_latency(self):
+        governor = ConcurrencyGovernor(initial=8, latency_tolerance=3.0, cooldown=0,
+                                       baseline_decay=0.5, clock=FakeClock())
+        governor.acquire()
+        governor.release(200, 0.1)
+        for _ in range(20):
+            governor.acquire()
+            governor.release(200, 0.4)
+        assert governor.stats["baseline"]["*"] > 0.3
+        decreases = governor.stats["decreases"]
+        governor.acquire()
+        governor.release(200, 0.4)
+        assert governor.stats["decreases"] == decreases
+
+    def test_never_below_min_limit(self):
+        clock = FakeClock()
+        governor = ConcurrencyGovernor(initial=2, min_limit=2, cooldown=0, clock=clock)
+        for _ in range(3):
+            governor.acquire()
+            governor.release(503, 0.1)
+        assert governor.limit == 2
+
+    def test_blocks_when_limit_reached(self):
+        governor = ConcurrencyGovernor(initial=1, min_limit=1)
+        assert governor.acquire()
+        assert not governor.acquire(timeout=0.01)
+
+        acquired = threading.Event()
+
+        def worker():
+            governor.acquire()
+            acquired.set()
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        assert not acquired.wait(0.05)
+        governor.release(200, 0.01)
+        thread.join(1)
+        assert acquired.is_set()
+
+    def test_requester_releases_on_error(self):
+        import requests
+        governor = ConcurrencyGovernor(initial=4, cooldown=0)
+        session = MagicMock()
+        session.get.side_effect = requests.exceptions.ConnectionError()
+        requester = Requester(base_url="http://example.com", session=session, governor=governor)
+
+        with pytest.raises(requests.exceptions.ConnectionError):
+            requester.get("http://example.com/changes/")
+        assert governor.in_flight == 0
+        assert governor.limit == 2
+
+    def test_invalid_limits(self):
+        with pytest.raises(ValueError):
+            ConcurrencyGovernor(initial=0)
+        with pytest.raises(ValueError):
+            ConcurrencyGovernor(decrease_factor=1)
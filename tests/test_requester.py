@@ -5,6 +5,7 @@ Unit tests for gerrit.utils.requester and gerrit.utils.common.
 """
 import json
 import pytest
+from email.utils import parsedate_to_datetime
 from unittest.mock import MagicMock, patch
 
 from gerrit.utils.requester import Requester
@@ -17,7 +18,15 @@ from gerrit.utils.exceptions import (
     ClientError,
     ServerError,
 )
-from gerrit.utils.common import strip_trailing_slash, decode_response, params_creator
+from gerrit.utils.common import (
+    strip_trailing_slash,
+    decode_response,
+    iter_decode_response,
+    loads_json,
+    params_creator,
+)
+from gerrit.utils.pagination import paginate, page_items
+from gerrit.utils.retry import RetryPolicy, parse_retry_after
 
 
 # ---------------------------------------------------------------------------
@@ -104,6 +113,113 @@ class TestDecodeResponse:
         result = decode_response(resp)
         assert result == data
 
+    @pytest.mark.parametrize("backend", [None, "default"])
+    def test_json_backends(self, backend):
+        data = {"subject": "\u00fcber", "labels": [1, 2.5, None, True]}
+        body = ("\n )]}'\n" + json.dumps(data) + "\n").encode("utf-8")
+        resp = _make_response(200, body=body, encoding="utf-8")
+        if backend is None:
+            with patch("gerrit.utils.common.orjson", None):
+                assert decode_response(resp) == data
+        else:
+            assert decode_response(resp) == data
+
+    def test_memoryview_without_orjson(self):
+        with patch("gerrit.utils.common.orjson", None):
+            assert loads_json(memoryview(b'[1, "a"]')) == [1, "a"]
+
+    def test_non_utf8_encoding(self):
+        body = ")]}'\n{\"name\": \"caf\u00e9\"}".encode("latin-1")
+        resp = _make_response(200, body=body, encoding="ISO-8859-1")
+        assert decode_response(resp) == {"name": "caf\u00e9"}
+
+    def test_non_json_content_type_is_not_parsed(self):
+        resp = _make_response(200, body=b'  )]}\'\n{"a": 1}  ', content_type="text/plain")
+        with patch("gerrit.utils.common.loads_json") as loads:
+            assert decode_response(resp) == ')]}\'\n{"a": 1}'
+        loads.assert_not_called()
+
+
+# ===========================================================================
+# iter_decode_response
+# ===========================================================================
+
+def _make_streamed_response(body, chunk_size, content_type="application/json"):
+    resp = _make_response(200, body=None, content_type=content_type)
+    resp.iter_content = MagicMock(
+        side_effect=lambda chunk_size=1: (body[i:i + chunk_size] for i in range(0, len(body), chunk_size))
+    )
+    return resp
+
+
+class TestIterDecodeResponse:
+
+    DATA = [{"_number": i, "subject": "\u00fcber " * i, "labels": [1, 2.5, None, True]} for i in range(20)]
+
+    @pytest.mark.parametrize("chunk_size", [1, 3, 64, 100000])
+    def test_yields_array_elements(self, chunk_size):
+        body = (")]}'\n" + json.dumps(self.DATA)).encode("utf-8")
+        resp = _make_streamed_response(body, chunk_size)
+        assert list(iter_decode_response(resp, chunk_size=chunk_size)) == self.DATA
+
+    def test_is_incremental(self):
+        body = (")]}'\n" + json.dumps(self.DATA, indent=2)).encode("utf-8")
+        chunks = iter([body[i:i + 16] for i in range(0, len(body), 16)])
+        resp = _make_response(200)
+        resp.iter_content = MagicMock(return_value=chunks)
+
+        first = next(iter_decode_response(resp, chunk_size=16))
+        assert first == self.DATA[0]
+        assert next(chunks, None) is not None
+
+    def test_trailing_number(self):
+        resp = _make_streamed_response(b"[1, 22, 333]", 1)
+        assert list(iter_decode_response(resp)) == [1, 22, 333]
+
+    def test_empty_array_and_body(self):
+        assert list(iter_decode_response(_make_streamed_response(b")]}'\n[]", 2))) == []
+        assert list(iter_decode_response(_make_streamed_response(b"", 2))) == []
+
+    def test_object_yielded_once(self):
+        resp = _make_streamed_response(b")]}'\n{\"a\": 1}", 2)
+        assert list(iter_decode_response(resp)) == [{"a": 1}]
+
+    def test_plain_text_yielded_once(self):
+        resp = _make_streamed_response(b"hello\n", 2, content_type="text/plain")
+        assert list(iter_decode_response(resp)) == ["hello"]
+
+    def test_content_type_normalised(self):
+        resp = _make_streamed_response(b"[1, 2]", 2, content_type=" Application/JSON ; charset=UTF-8")
+        assert list(iter_decode_response(resp)) == [1, 2]
+
+    @pytest.mark.parametrize("body", [b"[1, 2", b"[1, {2}]", b"[1 2]"])
+    def test_invalid_json_raises(self, body):
+        with pytest.raises(ValueError, match="Invalid json content"):
+            list(iter_decode_response(_make_streamed_response(body, 2)))
+
+
+# ===========================================================================
+# pagination
+# ===========================================================================
+
+class TestPagination:
+
+    def test_page_items_from_map(self):
+        assert page_items({"a": {"id": 1}}) == [{"id": 1, "name": "a"}]
+
+    def test_page_items_empty(self):
+        assert page_items(None) == []
+
+    def test_stops_on_short_page(self):
+        pages = {0: [1, 2], 2: [3]}
+        fetch = MagicMock(side_effect=lambda limit, skip: pages[skip])
+        assert list(paginate(fetch, page_size=2)) == [1, 2, 3]
+        assert fetch.call_count == 2
+
+    def test_invalid_page_size(self):
+        with pytest.raises(ValueError):
+            list(paginate(MagicMock(), page_size=0))
+
 
 # ===========================================================================
 # params_creator
@@ -370,3 +486,156 @@ class TestConfirmStatus:
             Requester.confirm_status(resp)
         # The fallback iso-8859-1 decoding should produce a non-empty reason in the message
         assert "Bad" in str(exc_info.value)
+
+
+# ===========================================================================
+# RetryPolicy
+# ===========================================================================
+
+def _retry_requester(policy):
+    session = MagicMock()
+    return Requester(base_url="http://example.com", session=session, timeout=5, retry=policy), session
+
+
+class TestRetryPolicy:
+
+    def test_retries_transient_status_for_get(self):
+        sleep = MagicMock()
+        attempts = []
+        policy = RetryPolicy(total=3, sleep=sleep, on_attempt=attempts.append)
+        requester, session = _retry_requester(policy)
+        session.get.side_effect = [_make_response(503), _make_response(502), _make_response(200)]
+
+        response = requester.get("http://example.com/a/changes/")
+        assert response.status_code == 200
+        assert session.get.call_count == 3
+        assert sleep.call_count == 2
+        assert [a["status"] for a in attempts] == [503, 502, 200]
+        assert [a["retry"] for a in attempts] == [True, True, False]
+        assert policy.stats == {"requests": 1, "attempts": 3, "retries": 2, "gave_up": 0}
+
+    def test_gives_up_after_total(self):
+        policy = RetryPolicy(total=2, sleep=MagicMock())
+        requester, session = _retry_requester(policy)
+        session.get.return_value = _make_response(503)
+
+        with pytest.raises(ServerError):
+            requester.get("http://example.com/a/changes/")
+        assert session.get.call_count == 3
+        assert policy.stats["gave_up"] == 1
+
+    def test_retries_connection_errors(self):
+        import requests
+        policy = RetryPolicy(total=1, sleep=MagicMock())
+        requester, session = _retry_requester(policy)
+        session.get.side_effect = [requests.exceptions.ConnectionError("reset"), _make_response(200)]
+
+        assert requester.get("http://example.com/config/server/version").status_code == 200
+
+    def test_post_retried_only_when_not_processed(self):
+        import requests
+        policy = RetryPolicy()
+        url = "http://example.com/a/changes/1/topic"
+        assert not policy.should_retry("POST", url, _make_response(502))
+        assert not policy.should_retry("POST", url, error=requests.exceptions.ReadTimeout())
+        assert policy.should_retry("POST", url, _make_response(429))
+        assert policy.should_retry("POST", url, error=requests.exceptions.ConnectTimeout())
+        assert policy.should_retry("PUT", url, _make_response(502))
+
+    @pytest.mark.parametrize("path", [
+        "/a/changes/1/revisions/current/submit",
+        "/a/changes/1/revisions/current/review",
+        "/changes/1/submit",
+    ])
+    def test_never_replays_submit_and_review(self, path):
+        import requests
+        policy = RetryPolicy(sleep=MagicMock())
+        requester, session = _retry_requester(policy)
+        session.post.side_effect = requests.exceptions.ConnectTimeout()
+
+        with pytest.raises(requests.exceptions.ConnectTimeout):
+            requester.post("http://example.com" + path)
+        session.post.assert_called_once()
+
+    def test_safe_methods_replayed_on_never_replay_endpoints(self):
+        policy = RetryPolicy(total=1, sleep=MagicMock())
+        requester, session = _retry_requester(policy)
+        session.get.side_effect = [_make_response(503), _make_response(200)]
+
+        url = "http://example.com/a/changes/1/revisions/current/review"
+        assert requester.get(url).status_code == 200
+        assert session.get.call_count == 2
+        assert not policy.is_replayable("POST", url)
+
+    def test_honors_retry_after(self):
+        sleep = MagicMock()
+        policy = RetryPolicy(sleep=sleep)
+        requester, session = _retry_requester(policy)
+        throttled = _make_response(429)
+        throttled.headers["Retry-After"] = "7"
+        session.get.side_effect = [throttled, _make_response(200)]
+
+        requester.get("http://example.com/a/accounts/self")
+        sleep.assert_called_once_with(7.0)
+        throttled.close.assert_called_once()
+
+    def test_retry_after_capped_at_max_backoff(self):
+        policy = RetryPolicy(max_backoff=30)
+        throttled = _make_response(429)
+        throttled.headers["Retry-After"] = "86400"
+        assert policy.delay(0, throttled) == 30
+
+    def test_full_jitter_backoff(self):
+        policy = RetryPolicy(backoff_factor=1, max_backoff=5)
+        with patch("gerrit.utils.retry.random.uniform", return_value=0.25) as uniform:
+            assert policy.backoff(1) == 0.25
+            uniform.assert_called_with(0, 2)
+            policy.backoff(10)
+            uniform.assert_called_with(0, 5)
+
+    def test_deadline_stops_retries(self):
+        sleep = MagicMock()
+        policy = RetryPolicy(total=5, deadline=10, sleep=sleep)
+        requester, session = _retry_requester(policy)
+        throttled = _make_response(503)
+        throttled.headers["Retry-After"] = "60"
+        session.get.return_value = throttled
+
+        with pytest.raises(ServerError):
+            requester.get("http://example.com/a/changes/")
+        session.get.assert_called_once()
+        sleep.assert_not_called()
+        assert session.get.call_args.kwargs["timeout"] <= 5
+
+    def test_deadline_spent_while_waiting(self):
+        clock = [0.0]
+        policy = RetryPolicy(total=5, deadline=10, sleep=lambda delay: clock.__setitem__(0, 11.0))
+        throttled = _make_response(503)
+        send = MagicMock(return_value=throttled)
+
+        with patch("gerrit.utils.retry.time.monotonic", side_effect=lambda: clock[0]):
+            assert policy.call("GET", "http://example.com/a/changes/", send) is throttled
+        send.assert_called_once()
+        throttled.close.assert_not_called()
+        assert policy.stats["gave_up"] == 1
+
+        import requests
+        clock[0] = 0.0
+        send = MagicMock(side_effect=requests.exceptions.ConnectionError("reset"))
+        with patch("gerrit.utils.retry.time.monotonic", side_effect=lambda: clock[0]):
+            with pytest.raises(requests.exceptions.ConnectionError):
+                policy.call("GET", "http://example.com/a/changes/", send)
+        send.assert_called_once()
+        with pytest.raises(ValueError):
+            RetryPolicy(deadline=0)
+
+    @pytest.mark.parametrize("value, expected", [
+        ("120", 120.0),
+        ("Wed, 21 Oct 2015 07:28:30 GMT", 30.0),
+        ("Wed, 21 Oct 2015 07:27:00 GMT", 0.0),
+        ("soon", None),
+        (None, None),
+    ])
+    def test_parse_retry_after(self, value, expected):
+        now = parsedate_to_datetime("Wed, 21 Oct 2015 07:28:00 GMT").timestamp()
+        assert parse_retry_after(value, now=now) == expected
@@ -115,6 +115,26 @@ class TestGerritChangeRevision:
         assert len(result) > 0
         assert isinstance(result, str)
 
+    def test_stream_patch(self, revision):
+        content = base64.encodebytes(b"diff --git a/file.py b/file.py\n" * 100)
+        revision.gerrit.iter_content.return_value = iter([content[:10], content[10:]])
+        result = b"".join(revision.stream_patch(path="file.py"))
+        assert result == b"diff --git a/file.py b/file.py\n" * 100
+        assert revision.gerrit.iter_content.call_args.args[0].endswith("/patch?path=file.py")
+
+    def test_stream_patch_zip_to_file(self, revision):
+        import io
+        import zipfile
+        archive = io.BytesIO()
+        with zipfile.ZipFile(archive, "w", compression=zipfile.ZIP_DEFLATED) as z:
+            z.writestr("abc123def456.diff", "diff --git a/file.py b/file.py\n")
+        revision.gerrit.iter_content.return_value = iter([archive.getvalue()])
+
+        target = io.BytesIO()
+        assert revision.stream_patch(zip_=True, fileobj=target) == len(target.getvalue())
+        assert target.getvalue() == b"diff --git a/file.py b/file.py\n"
+        assert revision.gerrit.iter_content.call_args.args[0].endswith("/patch?zip")
+
     def test_is_mergeable(self, revision):
         revision.gerrit.get.return_value = {"mergeable": True, "strategy": "recursive"}
         result = revision.is_mergeable()
@@ -306,6 +326,37 @@ class TestGerritChangeRevisionFiles:
         with pytest.raises(FileContentNotFoundError):
             f.get_content()
 
+    def test_file_stream_content(self, revision):
+        revision.gerrit.get.return_value = {"file.py": {}}
+        f = revision.files["file.py"]
+        revision.gerrit.iter_content.return_value = iter([b"cHJp", b"bnQo", b"J2hlbGxvJyk="])
+        assert b"".join(f.stream_content()) == b"print('hello')"
+
+    def test_file_stream_content_not_found(self, revision):
+        from gerrit.utils.exceptions import FileContentNotFoundError
+        revision.gerrit.get.return_value = {"file.py": {}}
+        f = revision.files["file.py"]
+
+        response_mock = MagicMock()
+        response_mock.status_code = 404
+        revision.gerrit.iter_content.side_effect = requests.exceptions.HTTPError(response=response_mock)
+
+        with pytest.raises(FileContentNotFoundError):
+            f.stream_content()
+
+    def test_file_stream_download_unzip(self, revision):
+        import io
+        import zipfile
+        revision.gerrit.get.return_value = {"file.py": {}}
+        f = revision.files["file.py"]
+        archive = io.BytesIO()
+        with zipfile.ZipFile(archive, "w") as z:
+            z.writestr("file-1234.py", b"\x00binary")
+        revision.gerrit.iter_content.return_value = iter([archive.getvalue()])
+
+        assert b"".join(f.stream_download(unzip=True)) == b"\x00binary"
+        assert revision.gerrit.iter_content.call_args.args[0].endswith("/download")
+
     def test_file_get_diff(self, revision):
         revision.gerrit.get.return_value = {"file.py": {}}
         f = revision.files["file.py"]
@@ -0,0 +1,126 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+# @Author: Jialiang Shi
+"""
+Unit tests for gerrit.utils.routing.
+"""
+import pytest
+import requests
+from unittest.mock import MagicMock
+
+from gerrit.utils.routing import ReplicaRouter
+from tests.conftest import FakeClock, make_response
+
+PRIMARY = "https://primary.example.com"
+REPLICAS = ["https://replica1.example.com", "https://replica2.example.com/"]
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def router(clock):
+    return ReplicaRouter(PRIMARY, REPLICAS, pin_after_write=5, retry_interval=30, clock=clock)
+
+
+def _hosts(send):
+    return [call.args[0].split("/")[2] for call in send.call_args_list]
+
+
+class TestReplicaRouter:
+
+    def test_reads_go_to_replicas_round_robin(self, router):
+        send = MagicMock(return_value=make_response())
+        for _ in range(4):
+            router.send("GET", PRIMARY + "/a/changes/?q=is:open", send)
+        assert sorted(_hosts(send)) == ["replica1.example.com"] * 2 + ["replica2.example.com"] * 2
+        assert send.call_args.args[0].endswith("/a/changes/?q=is:open")
+
+    def test_least_outstanding(self, router):
+        busy = router.choose("GET")
+        other = router.choose("GET")
+        assert busy is not other
+        busy.outstanding += 5
+        assert router.choose("GET") is other
+
+    def test_mutations_go_to_primary(self, router):
+        send = MagicMock(return_value=make_response())
+        router.send("POST", PRIMARY + "/a/changes/1/revisions/current/review", send)
+        assert _hosts(send) == ["primary.example.com"]
+
+    def test_read_your_writes(self, router, clock):
+        send = MagicMock(return_value=make_response())
+        router.send("PUT", PRIMARY + "/a/changes/1/topic", send)
+        router.send("GET", PRIMARY + "/a/changes/1/topic", send)
+        clock.now += 6
+        router.send("GET", PRIMARY + "/a/changes/1/topic", send)
+        assert _hosts(send)[:2] == ["primary.example.com", "primary.example.com"]
+        assert _hosts(send)[2].startswith("replica")
+        assert router.stats["primary_reads"] == 1
+
+    def test_failed_replica_falls_back_and_is_skipped(self, router, clock):
+        def send(url):
+            if "replica1" in url:
+                raise requests.exceptions.ConnectionError("refused")
+            return make_response()
+
+        sender = MagicMock(side_effect=send)
+        for _ in range(4):
+            assert router.send("GET", PRIMARY + "/changes/", sender).status_code == 200
+        hosts = _hosts(sender)
+        assert hosts.count("replica1.example.com") == 1
+        assert "primary.example.com" in hosts
+        assert router.stats["fallbacks"] == 1
+        assert router.stats["replicas"]["https://replica1.example.com"]["healthy"] is False
+
+        clock.now += 31
+        router.nodes[1].outstanding = 10
+        router.send("GET", PRIMARY + "/changes/", sender)
+        assert _hosts(sender)[-2:] == ["replica1.example.com", "primary.example.com"]
+
+    def test_failure_status_falls_back(self, router):
+        bad = make_response(503)
+        send = MagicMock(side_effect=[bad, make_response()])
+        assert router.send("GET", PRIMARY + "/changes/", send).status_code == 200
+        bad.close.assert_called_once()
+        assert _hosts(send)[1] == "primary.example.com"
+
+    def test_all_replicas_down(self, router):
+        for url in REPLICAS:
+            router.mark(url, False)
+        send = MagicMock(return_value=make_response())
+        router.send("GET", PRIMARY + "/changes/", send)
+        assert _hosts(send) == ["primary.example.com"]
+
+    def test_foreign_urls_untouched(self, router):
+        send = MagicMock(return_value=make_response())
+        router.send("GET", "https://elsewhere.example.com/changes/", send)
+        assert _hosts(send) == ["elsewhere.example.com"]
+
+    def test_check_health(self, router):
+        session = MagicMock()
+        session.get.side_effect = [make_response(200), requests.exceptions.ConnectTimeout()]
+        router.health_check.session = session
+        assert router.check_health() == {
+            "https://replica1.example.com": True,
+            "https://replica2.example.com": False,
+        }
+        assert session.get.call_args_list[0].args[0] == "https://replica1.example.com/config/server/version"
+
+
+class TestGerritClientReplicas:
+
+    def test_client_routes_reads(self):
+        from gerrit import GerritClient
+        session = MagicMock()
+        session.auth = ("user", "secret")
+        session.get.return_value = make_response()
+        session.post.return_value = make_response()
+        client = GerritClient(base_url=PRIMARY, session=session, replicas=REPLICAS[:1])
+
+        client.get("/changes/")
+        client.post("/changes/1/abandon")
+        assert session.get.call_args.args[0] == "https://replica1.example.com/a/changes/"
+        assert session.post.call_args.args[0] == "https://primary.example.com/a/changes/1/abandon"
@@ -0,0 +1,104 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+# @Author: Jialiang Shi
+"""
+Tests for gerrit.utils.sharding and GerritChanges.sharded_search.
+"""
+import datetime
+import pytest
+
+from gerrit import GerritClient
+from tests.fakeserver import FakeGerrit, FakeGerritServer
+from gerrit.utils.sharding import Shard, format_query_time, parse_updated, time_shards
+
+UTC = datetime.timezone.utc
+
+
+@pytest.fixture(scope="module")
+def server():
+    with FakeGerritServer(FakeGerrit().seed(changes=150, projects=3)) as server:
+        yield server
+
+
+@pytest.fixture
+def client(server):
+    return GerritClient(base_url=server.url)
+
+
+class TestShard:
+
+    def test_query(self):
+        shard = Shard("foo/bar", datetime.datetime(2024, 1, 1, tzinfo=UTC),
+                      datetime.datetime(2024, 1, 2, 3, 4, 5, 678900, tzinfo=UTC))
+        assert shard.query("is:open") == (
+            '(is:open) project:"foo/bar" after:"2024-01-01 00:00:00.000 -0000" '
+            'before:"2024-01-02 03:04:05.678 -0000"'
+        )
+        assert Shard().query("is:open") == "is:open"
+
+    def test_parse_and_format(self):
+        moment = parse_updated("2013-02-21 11:16:36.775000000")
+        assert moment == datetime.datetime(2013, 2, 21, 11, 16, 36, 775000, tzinfo=UTC)
+        assert format_query_time(moment) == '"2013-02-21 11:16:36.775 -0000"'
+
+    def test_remainder(self):
+        start = datetime.datetime(2024, 1, 1, tzinfo=UTC)
+        shard = Shard(None, start, start + datetime.timedelta(days=10))
+        halves = shard.remainder(start + datetime.timedelta(days=4))
+        assert [(s.after, s.before) for s in halves] == [
+            (start, start + datetime.timedelta(days=2)),
+            (start + datetime.timedelta(days=2), start + datetime.timedelta(days=4)),
+        ]
+        assert Shard(None, start, start).remainder(start) == []
+
+        open_ended = Shard(None, None, start + datetime.timedelta(days=10))
+        first, rest = open_ended.remainder(start + datetime.timedelta(days=7))
+        assert (first.after, first.before) == (start + datetime.timedelta(days=4), start + datetime.timedelta(days=7))
+        assert (rest.after, rest.before) == (None, start + datetime.timedelta(days=4))
+
+    def test_time_shards(self):
+        start = datetime.datetime(2024, 1, 1, tzinfo=UTC)
+        shards = time_shards(start, start + datetime.timedelta(days=4), 4, projects=["a", "b"])
+        assert len(shards) == 8
+        assert [s.project for s in shards[:4]] == ["a"] * 4
+        assert shards[3].before == start + datetime.timedelta(days=4)
+        with pytest.raises(ValueError):
+            time_shards(start, start, 0)
+
+
+class TestShardedSearch:
+
+    def test_all_changes_once(self, client, server):
+        expected = {c["_number"] for c in server.gerrit.query_changes_list("status:open")}
+        numbers = [c["_number"] for c in client.changes.sharded_search("status:open", limit=10, max_workers=4)]
+        assert len(numbers) == len(set(numbers))
+        assert set(numbers) == expected
+
+    def test_ordered_with_since_and_projects(self, client, server):
+        changes = server.gerrit.query_changes_list("is:closed")
+        since = datetime.datetime.fromtimestamp(min(c["updated"] for c in changes), UTC)
+        result = list(client.changes.sharded_search(
+            "is:closed", since=since, shards=3, projects=["project-1", "project-2", "project-3"],
+            limit=5, ordered=True,
+        ))
+        assert [c["_number"] for c in result] == [c["_number"] for c in changes]
+
+    def test_or_query(self, client, server):
+        query = "status:merged OR status:abandoned"
+        expected = {c["_number"] for c in server.gerrit.query_changes_list(query)}
+        changes = list(client.changes.sharded_search(query, limit=5, projects=["project-1", "project-2"]))
+        numbers = [c["_number"] for c in changes]
+        assert len(numbers) == len(set(numbers))
+        assert set(numbers) == {
+            n for n in expected if server.gerrit.changes[n]["project"] in ("project-1", "project-2")
+        }
+
+    def test_window_too_short_to_split(self):
+        fake = FakeGerrit().seed(changes=12)
+        tie = fake.query_changes_list("is:open")[0]["updated"]
+        for change in fake.changes.values():
+            change["updated"] = tie
+        with FakeGerritServer(fake) as server:
+            client = GerritClient(base_url=server.url)
+            numbers = [c["_number"] for c in client.changes.sharded_search("status:open", limit=3)]
+        assert sorted(numbers) == sorted(c["_number"] for c in fake.query_changes_list("status:open"))
@@ -0,0 +1,113 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+# @Author: Jialiang Shi
+"""
+Unit tests for gerrit.utils.streaming.
+"""
+import base64
+import io
+import zipfile
+import pytest
+from unittest.mock import MagicMock
+
+from gerrit.utils.streaming import (
+    iter_b64decode,
+    iter_response_content,
+    iter_unzip,
+    stream_to,
+)
+
+PAYLOAD = b"".join(b"line %d of a large generated file\n" % i for i in range(2000))
+
+
+def _split(data, size):
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+class _Unseekable(io.RawIOBase):
+    # zipfile writes a data descriptor after the entry when it cannot seek back
+    def __init__(self, buffer):
+        super().__init__()
+        self.buffer = buffer
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        return self.buffer.write(data)
+
+
+def _zip(data, compression=zipfile.ZIP_DEFLATED, seekable=True):
+    buffer = io.BytesIO()
+    target = buffer if seekable else _Unseekable(buffer)
+    with zipfile.ZipFile(target, "w", compression=compression) as archive:
+        with archive.open("abc123.diff", "w") as entry:
+            entry.write(data)
+    return buffer.getvalue()
+
+
+class TestIterB64Decode:
+
+    @pytest.mark.parametrize("chunk_size", [1, 3, 5, 76, 100000])
+    def test_decodes_any_chunk_boundary(self, chunk_size):
+        encoded = base64.encodebytes(PAYLOAD)  # with line breaks every 76 characters
+        assert b"".join(iter_b64decode(_split(encoded, chunk_size))) == PAYLOAD
+
+    def test_truncated_content(self):
+        with pytest.raises(ValueError, match="Invalid base64 content"):
+            list(iter_b64decode([base64.b64encode(b"hello")[:-1]]))
+
+
+class TestIterUnzip:
+
+    @pytest.mark.parametrize("compression", [zipfile.ZIP_DEFLATED, zipfile.ZIP_STORED])
+    @pytest.mark.parametrize("chunk_size", [1, 7, 4096, 1000000])
+    def test_unpacks_single_entry(self, compression, chunk_size):
+        archive = _zip(PAYLOAD, compression)
+        assert b"".join(iter_unzip(_split(archive, chunk_size))) == PAYLOAD
+
+    def test_unpacks_entry_with_data_descriptor(self):
+        archive = _zip(PAYLOAD, seekable=False)
+        assert archive[6] & 0x8
+        assert b"".join(iter_unzip(_split(archive, 512))) == PAYLOAD
+
+    def test_yields_before_the_archive_is_complete(self):
+        chunks = iter(_split(_zip(PAYLOAD, zipfile.ZIP_STORED), 1024))
+        first = next(iter_unzip(chunks))
+        assert PAYLOAD.startswith(first)
+        assert next(chunks, None) is not None
+
+    def test_not_a_zip(self):
+        with pytest.raises(ValueError, match="missing local file header"):
+            list(iter_unzip([b"diff --git a/file b/file\n"]))
+
+    def test_truncated_entry(self):
+        archive = _zip(PAYLOAD)
+        with pytest.raises(ValueError, match="truncated entry"):
+            list(iter_unzip([archive[:200]]))
+
+    def test_crc_mismatch(self):
+        archive = bytearray(_zip(b"hello", zipfile.ZIP_STORED))
+        data_offset = archive.index(b"hello")
+        archive[data_offset] = ord("j")
+        with pytest.raises(ValueError, match="CRC-32 mismatch"):
+            list(iter_unzip([bytes(archive)]))
+
+
+class TestStreamTo:
+
+    def test_returns_iterator_without_fileobj(self):
+        chunks = stream_to([b"a", b"bc"])
+        assert list(chunks) == [b"a", b"bc"]
+
+    def test_writes_to_fileobj(self):
+        fileobj = io.BytesIO()
+        assert stream_to(iter([b"a", b"bc"]), fileobj) == 3
+        assert fileobj.getvalue() == b"abc"
+
+    def test_response_is_closed(self):
+        response = MagicMock()
+        response.iter_content.return_value = [b"a", b"", b"b"]
+        assert list(iter_response_content(response, chunk_size=10)) == [b"a", b"b"]
+        response.iter_content.assert_called_once_with(chunk_size=10)
+        response.close.assert_called_once()
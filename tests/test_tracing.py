@@ -0,0 +1,163 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+# @Author: Jialiang Shi
+"""
+Unit tests for gerrit.utils.tracing.
+"""
+import io
+import json
+import pytest
+from unittest.mock import MagicMock
+
+from gerrit import GerritClient
+from gerrit.utils.cache import ResponseCache
+from gerrit.utils.exceptions import ServerError
+from gerrit.utils.tracing import JsonLinesExporter, Tracer, traced
+from tests.conftest import make_response
+
+
+def _client(**kwargs):
+    session = MagicMock()
+    session.auth = None
+    spans = []
+    tracer = Tracer(exporters=[spans.append])
+    client = GerritClient(base_url="http://example.com", session=session, tracer=tracer, **kwargs)
+    return client, session, spans
+
+
+class TestTracer:
+
+    def test_nested_spans(self):
+        spans = []
+        tracer = Tracer(exporters=[spans.append])
+        with tracer.span("outer", project="foo") as outer:
+            assert tracer.current() is outer
+            with tracer.span("inner", kind="http"):
+                pass
+        assert tracer.current() is None
+
+        assert spans == [outer]
+        assert [child.name for child in outer.children] == ["inner"]
+        assert outer.requests == 1
+        assert outer.status == "ok"
+        assert outer.duration >= outer.children[0].duration
+
+    def test_hooks(self):
+        events = []
+        tracer = Tracer()
+        tracer.add_hook(
+            before=lambda span: events.append(("before", span.name)),
+            after=lambda span: events.append(("after", span.name)),
+            error=lambda span, exc: events.append(("error", span.name, str(exc))),
+        )
+        with tracer.span("ok"):
+            pass
+        with pytest.raises(ValueError):
+            with tracer.span("failed"):
+                raise ValueError("boom")
+
+        assert events == [
+            ("before", "ok"), ("after", "ok"), ("before", "failed"), ("error", "failed", "boom"),
+        ]
+
+    def test_failing_hook_does_not_break_the_call(self):
+        tracer = Tracer()
+        tracer.add_hook(before=lambda span: 1 / 0)
+        with tracer.span("op") as span:
+            pass
+        assert span.status == "ok"
+
+    def test_json_lines_exporter(self, tmp_path):
+        path = tmp_path / "spans.jsonl"
+        exporter = JsonLinesExporter(str(path))
+        tracer = Tracer(exporters=[exporter])
+        with tracer.span("first"):
+            with tracer.span("GET /changes/{id}", kind="http", status=200):
+                pass
+        with pytest.raises(RuntimeError):
+            with tracer.span("second"):
+                raise RuntimeError("down")
+        exporter.close()
+
+        lines = [json.loads(line) for line in path.read_text().splitlines()]
+        assert [line["name"] for line in lines] == ["first", "second"]
+        assert lines[0]["requests"] == 1
+        assert lines[0]["children"][0]["attributes"] == {"status": 200}
+        assert lines[1]["status"] == "error"
+        assert lines[1]["error"] == "RuntimeError: down"
+
+    def test_traced_without_tracer(self):
+        class Facade:
+            gerrit = MagicMock(spec=GerritClient)
+
+            @traced
+            def run(self):
+                return 42
+
+        assert Facade().run() == 42
+
+
+class TestClientTracing:
+
+    def test_http_spans_nested_in_operation(self):
+        client, session, spans = _client()
+        session.get.return_value = make_response(200, {"id": "foo~master~I1", "_number": 1})
+        session.delete.return_value = make_response(204)
+
+        client.changes.delete("1")
+
+        assert len(spans) == 1
+        root = spans[0]
+        assert root.name == "GerritChanges.delete"
+        assert [child.name for child in root.children] == [
+            "GerritChanges.get", "DELETE /changes/{id}",
+        ]
+        assert root.children[0].children[0].name == "GET /changes/{id}/"
+        assert root.children[0].children[0].attributes["status"] == 200
+        assert root.requests == 2
+
+    def test_error_recorded_on_http_span(self):
+        client, session, spans = _client()
+        session.get.return_value = make_response(503)
+
+        with pytest.raises(ServerError):
+            client.get("/config/server/version")
+
+        assert spans[0].kind == "http"
+        assert spans[0].status == "error"
+        assert spans[0].attributes["status"] == 503
+
+    def test_cache_hits_attributed(self):
+        client, session, spans = _client(cache=ResponseCache())
+        session.get.return_value = make_response(200, {"id": "foo~master~I1", "_number": 1})
+
+        client.changes.get("1")
+        client.changes.get("1")
+
+        assert [span.requests for span in spans] == [1, 0]
+        assert spans[1].attributes["cache_hits"] == 1
+
+    def test_add_hook_creates_tracer(self):
+        session = MagicMock()
+        session.auth = None
+        session.get.return_value = make_response(200, "3.9")
+        client = GerritClient(base_url="http://example.com", session=session)
+        finished = []
+
+        client.add_hook(after=finished.append)
+        client.get("/config/server/version")
+
+        assert client.requester.tracer is client.tracer
+        assert [span.name for span in finished] == ["GET /config/server/version"]
+
+    def test_exporter_writes_client_spans(self):
+        stream = io.StringIO()
+        client, session, _ = _client()
+        client.tracer.add_exporter(JsonLinesExporter(stream))
+        session.get.return_value = make_response(200, {"id": "foo~master~I1", "_number": 1})
+
+        client.changes.get("1")
+
+        line = json.loads(stream.getvalue())
+        assert line["name"] == "GerritChanges.get"
+        assert line["children"][0]["attributes"]["endpoint"] == "/changes/1/"